@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlmodel import Session
 
-from app.core.auth import get_current_user, require_roles
+from app.core.auth import bearer_scheme, get_current_user, require_roles, revoke_access_token
 from app.core.database import get_session
 from app.core.rate_limit import check_login_rate_limit
 from app.models import AuthUser
@@ -65,6 +66,16 @@ def refresh(
     return build_login_response(session, current_user)
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    session: Session = Depends(get_session),
+) -> Response:
+    if credentials is not None:
+        revoke_access_token(session, credentials.credentials, reason="logout")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @router.get(
     "/impersonation/users",
     response_model=ImpersonationCandidateListResponse,
@@ -100,6 +111,17 @@ def impersonation_login(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error)) from error
 
 
+@router.post("/impersonation/end", status_code=status.HTTP_204_NO_CONTENT)
+def impersonation_end(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    session: Session = Depends(get_session),
+    _current_user: AuthUser = Depends(get_current_user),
+) -> Response:
+    if credentials is not None:
+        revoke_access_token(session, credentials.credentials, reason="impersonation_end")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @router.post("/social/exchange", response_model=LoginResponse)
 def social_exchange(
     payload: SocialExchangeRequest,
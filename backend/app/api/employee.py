@@ -3,6 +3,7 @@ from sqlmodel import Session
 
 from app.core.auth import get_current_user, require_roles
 from app.core.database import get_session
+from app.core.pagination import COUNT_MODE_EXACT, COUNT_MODE_PATTERN, CURSOR_DESCRIPTION
 from app.models import AuthUser
 from app.schemas.employee import (
     EmployeeBatchRequest,
@@ -11,6 +12,7 @@ from app.schemas.employee import (
     EmployeeCreateRequest,
     EmployeeDetailResponse,
     EmployeeListResponse,
+    EmployeeSearchResponse,
     EmployeeUpdateRequest,
 )
 from app.services.employee_service import (
@@ -20,6 +22,8 @@ from app.services.employee_service import (
     get_employee_by_user_id,
     list_departments,
     list_employees,
+    list_employees_keyset,
+    search_employees,
     update_employee,
 )
 from app.services.menu_service import require_menu_action_for_user
@@ -39,18 +43,46 @@ def employee_list(
     employee_no: str | None = Query(default=None),
     name: str | None = Query(default=None),
     department: str | None = Query(default=None),
+    department_id: int | None = Query(default=None),
+    include_sub_departments: bool = Query(default=False, description="department_id 하위 조직까지 포함"),
     employment_status: str | None = Query(default=None),
     active: bool | None = Query(default=None),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    count_mode: str = Query(default=COUNT_MODE_EXACT, pattern=COUNT_MODE_PATTERN),
     session: Session = Depends(get_session),
     current_user: AuthUser = Depends(get_current_user),
 ) -> EmployeeListResponse:
     require_menu_action_for_user(session, user_id=current_user.id, path="/hr/employee", action_code="query")
+    if cursor is not None:
+        employees, total_count, total_is_estimate, next_cursor = list_employees_keyset(
+            session,
+            cursor=cursor,
+            limit=limit,
+            count_mode=count_mode,
+            employee_no=employee_no,
+            name=name,
+            department=department,
+            department_id=department_id,
+            include_sub_departments=include_sub_departments,
+            employment_status=employment_status,
+            active=active,
+        )
+        return EmployeeListResponse(
+            employees=employees,
+            total_count=total_count,
+            limit=limit,
+            total_is_estimate=total_is_estimate,
+            next_cursor=next_cursor,
+        )
+
     if all:
         employees, total_count = list_employees(
             session,
             employee_no=employee_no,
             name=name,
             department=department,
+            department_id=department_id,
+            include_sub_departments=include_sub_departments,
             employment_status=employment_status,
             active=active,
         )
@@ -63,6 +95,8 @@ def employee_list(
         employee_no=employee_no,
         name=name,
         department=department,
+        department_id=department_id,
+        include_sub_departments=include_sub_departments,
         employment_status=employment_status,
         active=active,
     )
@@ -82,6 +116,20 @@ def employee_departments(
     return DepartmentListResponse(departments=list_departments(session))
 
 
+@router.get(
+    "/search",
+    response_model=EmployeeSearchResponse,
+    dependencies=[Depends(require_roles("employee", "hr_manager", "admin"))],
+)
+def employee_search(
+    q: str = Query(..., min_length=1, max_length=50, description="사번 또는 이름. 초성(ㄱㄴㄷ)도 가능"),
+    limit: int = Query(default=10, ge=1, le=50),
+    include_resigned: bool = Query(default=False),
+    session: Session = Depends(get_session),
+) -> EmployeeSearchResponse:
+    return EmployeeSearchResponse(items=search_employees(session, q, limit=limit, include_resigned=include_resigned))
+
+
 @router.post(
     "",
     response_model=EmployeeDetailResponse,
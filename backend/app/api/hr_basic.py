@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from app.core.auth import require_roles
 from app.core.database import get_session
+from app.core.export import EXPORT_FORMAT_PATTERN, export_response
+from app.core.pagination import CURSOR_DESCRIPTION, OPTIONAL_LIMIT_DESCRIPTION
 from app.schemas.hr_basic import (
     HrAdminRecordListResponse,
     HrBasicDetailResponse,
@@ -16,7 +19,9 @@ from app.services.hr_basic_service import (
     create_hr_basic_record,
     delete_hr_basic_record,
     get_hr_basic_detail,
+    iter_hr_admin_record_export,
     list_hr_admin_records,
+    normalize_category,
     update_hr_basic_profile,
     update_hr_basic_record,
 )
@@ -31,6 +36,8 @@ def hr_admin_records(
     name: str | None = Query(default=None),
     department: str | None = Query(default=None),
     employment_status: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=1000, description=OPTIONAL_LIMIT_DESCRIPTION),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
     session: Session = Depends(get_session),
 ) -> HrAdminRecordListResponse:
     return list_hr_admin_records(
@@ -40,6 +47,35 @@ def hr_admin_records(
         name=name,
         department=department,
         employment_status=employment_status,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
+@router.get("/admin-records/export", dependencies=[Depends(require_roles("hr_manager", "admin"))])
+def hr_admin_records_export(
+    category: str = Query(...),
+    export_format: str = Query(default="ndjson", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    employee_no: str | None = Query(default=None),
+    name: str | None = Query(default=None),
+    department: str | None = Query(default=None),
+    employment_status: str | None = Query(default=None),
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    filters = {
+        "category": category,
+        "employee_no": employee_no,
+        "name": name,
+        "department": department,
+        "employment_status": employment_status,
+    }
+    # 잘못된 카테고리는 스트리밍 시작 전에 400 으로 돌려준다.
+    normalize_category(category)
+    return export_response(
+        session,
+        lambda export_session: iter_hr_admin_record_export(export_session, export_format, **filters),
+        export_format,
+        "hr-admin-records",
     )
 
 
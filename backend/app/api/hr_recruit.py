@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Depends, Query, status
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.auth import require_roles
 from app.core.database import get_session
@@ -14,15 +17,19 @@ from app.schemas.hr_recruit import (
     HrRecruitFinalistUpdateRequest,
     HrRecruitGenerateEmployeeNoRequest,
     HrRecruitGenerateEmployeeNoResponse,
+    HrRecruitIfInboundRow,
     HrRecruitIfSyncRequest,
     HrRecruitIfSyncResponse,
 )
 from app.services.hr_recruit_service import (
+    IF_SYNC_CHUNK_SIZE,
+    RecruitIfSyncer,
     create_employees_from_finalists,
     create_finalist,
     delete_finalists,
     generate_employee_numbers,
     list_finalists,
+    parse_if_ndjson_line,
     sync_if_rows,
     update_finalist,
 )
@@ -93,8 +100,49 @@ def hr_recruit_finalist_if_sync(
     payload: HrRecruitIfSyncRequest,
     session: Session = Depends(get_session),
 ) -> HrRecruitIfSyncResponse:
-    inserted_count, updated_count = sync_if_rows(session, payload.rows)
-    return HrRecruitIfSyncResponse(inserted_count=inserted_count, updated_count=updated_count)
+    return sync_if_rows(session, payload.rows)
+
+
+async def _ndjson_row_batches(request: Request, batch_size: int) -> AsyncIterator[list[HrRecruitIfInboundRow]]:
+    remainder = b""
+    line_no = 0
+    batch: list[HrRecruitIfInboundRow] = []
+    async for chunk in request.stream():
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        for raw in lines:
+            line_no += 1
+            row = parse_if_ndjson_line(raw, line_no)
+            if row is not None:
+                batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    row = parse_if_ndjson_line(remainder, line_no + 1)
+    if row is not None:
+        batch.append(row)
+    if batch:
+        yield batch
+
+
+@router.post(
+    "/finalists/if-sync/ndjson",
+    response_model=HrRecruitIfSyncResponse,
+    dependencies=[Depends(require_roles("admin", "hr_manager"))],
+)
+async def hr_recruit_finalist_if_sync_ndjson(
+    request: Request,
+    session: Session = Depends(get_session),
+) -> HrRecruitIfSyncResponse:
+    """application/x-ndjson 피드(한 줄에 IF 행 하나)를 받는 대로 묶음 단위로 upsert 한다."""
+    syncer = RecruitIfSyncer(session)
+    try:
+        async for rows in _ndjson_row_batches(request, IF_SYNC_CHUNK_SIZE):
+            await run_in_threadpool(syncer.add_many, rows)
+        return await run_in_threadpool(syncer.finish)
+    except Exception:
+        await run_in_threadpool(session.rollback)
+        raise
 
 
 @router.post(
@@ -3,7 +3,7 @@ from sqlmodel import Session
 
 from app.core.auth import get_current_user, require_roles
 from app.core.database import get_session
-from app.core.pagination import paginate_items
+from app.core.pagination import PageParams
 from app.models import AuthUser
 from app.schemas.hr_retire import (
     HrRetireCaseCancelRequest,
@@ -42,10 +42,13 @@ def retire_checklist_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> HrRetireChecklistListResponse:
-    items = list_retire_checklist_items(session, include_inactive=include_inactive)
-    paged_items, total_count = paginate_items(items, page, limit)
+    items, total_count = list_retire_checklist_items(
+        session,
+        include_inactive=include_inactive,
+        page_params=PageParams(page=page, limit=limit),
+    )
     return HrRetireChecklistListResponse(
-        items=paged_items,
+        items=items,
         total_count=total_count,
         page=page,
         limit=limit,
@@ -89,9 +92,7 @@ def retire_case_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> HrRetireCaseListResponse:
-    result = list_retire_cases(session, status_filter=status)
-    paged_items, total_count = paginate_items(result.items, page, limit)
-    return HrRetireCaseListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    return list_retire_cases(session, status_filter=status, page_params=PageParams(page=page, limit=limit))
 
 
 @router.post(
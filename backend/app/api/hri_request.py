@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, Query
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from app.core.auth import get_current_user, require_roles
+from app.core.config import settings
 from app.core.database import get_session
-from app.core.pagination import paginate_items
+from app.core.event_hub import Subscription, event_hub, format_sse
+from app.core.pagination import CURSOR_DESCRIPTION, PageParams
 from app.models import AuthUser
 from app.schemas.hri_request import (
     HriRequestActionRequest,
@@ -14,13 +19,18 @@ from app.schemas.hri_request import (
     HriRequestListResponse,
     HriRequestSubmitResponse,
     HriTaskListResponse,
+    HriTaskUnreadCountResponse,
 )
 from app.services.hri_request_service import (
     approve_request,
+    count_unread_tasks,
     get_request_detail,
     list_my_approval_tasks,
+    list_my_approval_tasks_keyset,
     list_my_receive_tasks,
+    list_my_receive_tasks_keyset,
     list_my_requests,
+    mark_task_read,
     receive_complete_request,
     receive_reject_request,
     reject_request,
@@ -139,9 +149,8 @@ def my_requests(
     session: Session = Depends(get_session),
     current_user: AuthUser = Depends(get_current_user),
 ) -> HriRequestListResponse:
-    items = list_my_requests(session, current_user.id)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return HriRequestListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_my_requests(session, current_user.id, PageParams(page=page, limit=limit))
+    return HriRequestListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get(
@@ -166,12 +175,17 @@ def get_detail(
 def my_approval_tasks(
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
     session: Session = Depends(get_session),
     current_user: AuthUser = Depends(get_current_user),
 ) -> HriTaskListResponse:
-    items = list_my_approval_tasks(session, current_user.id)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return HriTaskListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    if cursor is not None:
+        items, total_count, next_cursor = list_my_approval_tasks_keyset(
+            session, current_user.id, cursor=cursor, limit=limit
+        )
+        return HriTaskListResponse(items=items, total_count=total_count, limit=limit, next_cursor=next_cursor)
+    items, total_count = list_my_approval_tasks(session, current_user.id, PageParams(page=page, limit=limit))
+    return HriTaskListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get(
@@ -182,9 +196,70 @@ def my_approval_tasks(
 def my_receive_tasks(
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
     session: Session = Depends(get_session),
     current_user: AuthUser = Depends(get_current_user),
 ) -> HriTaskListResponse:
-    items = list_my_receive_tasks(session, current_user.id)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return HriTaskListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    if cursor is not None:
+        items, total_count, next_cursor = list_my_receive_tasks_keyset(
+            session, current_user.id, cursor=cursor, limit=limit
+        )
+        return HriTaskListResponse(items=items, total_count=total_count, limit=limit, next_cursor=next_cursor)
+    items, total_count = list_my_receive_tasks(session, current_user.id, PageParams(page=page, limit=limit))
+    return HriTaskListResponse(items=items, total_count=total_count, page=page, limit=limit)
+
+
+@router.get(
+    "/tasks/unread-count",
+    response_model=HriTaskUnreadCountResponse,
+    dependencies=[Depends(require_roles("employee", "hr_manager", "admin"))],
+)
+def unread_task_count(
+    session: Session = Depends(get_session),
+    current_user: AuthUser = Depends(get_current_user),
+) -> HriTaskUnreadCountResponse:
+    return count_unread_tasks(session, current_user.id)
+
+
+@router.post(
+    "/tasks/{request_id}/read",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_roles("employee", "hr_manager", "admin"))],
+)
+def read_task(
+    request_id: int,
+    session: Session = Depends(get_session),
+    current_user: AuthUser = Depends(get_current_user),
+) -> Response:
+    mark_task_read(session, current_user.id, request_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+async def _event_stream(request: Request, subscription: Subscription) -> AsyncIterator[str]:
+    try:
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            hub_event = await subscription.get(timeout=settings.sse_keepalive_sec)
+            yield ": keepalive\n\n" if hub_event is None else format_sse(hub_event)
+    finally:
+        subscription.close()
+
+
+@router.get(
+    "/events",
+    dependencies=[Depends(require_roles("employee", "hr_manager", "admin"))],
+)
+async def request_events(
+    request: Request,
+    current_user: AuthUser = Depends(get_current_user),
+) -> StreamingResponse:
+    """본인이 신청자이거나 결재선에 있는 신청서의 상태 변경을 SSE 로 내려준다.
+
+    resync 이벤트를 받거나 재연결되면 클라이언트는 목록을 다시 조회한다.
+    """
+    subscription = event_hub.subscribe(current_user.id)
+    return StreamingResponse(
+        _event_stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
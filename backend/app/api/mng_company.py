@@ -5,7 +5,7 @@ from sqlmodel import Session
 
 from app.core.auth import get_current_user, require_roles
 from app.core.database import get_session
-from app.core.pagination import paginate_items
+from app.core.pagination import PageParams
 from app.models import AuthUser
 from app.services.menu_service import get_allowed_menu_actions_for_user
 from app.schemas.mng import (
@@ -63,9 +63,8 @@ def mng_company_list(
     current_user: AuthUser = Depends(get_current_user),
 ) -> MngCompanyListResponse:
     _require_menu_action(session, current_user, "query")
-    items = list_companies(session, search=search)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngCompanyListResponse(companies=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_companies(session, search=search, page_params=PageParams(page=page, limit=limit))
+    return MngCompanyListResponse(companies=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get(
@@ -152,9 +151,8 @@ def mng_manager_status_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngManagerCompanyListResponse:
-    items = list_manager_companies(session)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngManagerCompanyListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_manager_companies(session, PageParams(page=page, limit=limit))
+    return MngManagerCompanyListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.post(
@@ -168,8 +166,7 @@ def mng_manager_status_create(
     session: Session = Depends(get_session),
 ) -> MngManagerCompanyListResponse:
     create_manager_company(session, payload)
-    items = list_manager_companies(session)
-    total_count = len(items)
+    items, total_count = list_manager_companies(session)
     return MngManagerCompanyListResponse(items=items, total_count=total_count, page=1, limit=max(total_count, 1))
 
 
@@ -5,7 +5,7 @@ from sqlmodel import Session
 
 from app.core.auth import require_roles
 from app.core.database import get_session
-from app.core.pagination import paginate_items
+from app.core.pagination import PageParams
 from app.schemas.mng import (
     MngBulkDeleteRequest,
     MngBulkDeleteResponse,
@@ -61,9 +61,13 @@ def mng_dev_request_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngDevRequestListResponse:
-    items = list_dev_requests(session, company_id=company_id, status_code=status_code)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngDevRequestListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_dev_requests(
+        session,
+        company_id=company_id,
+        status_code=status_code,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return MngDevRequestListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get("/dev-requests/monthly-summary", response_model=MngDevRequestMonthlySummaryResponse, dependencies=_ROLES)
@@ -74,9 +78,13 @@ def mng_dev_request_monthly_summary(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngDevRequestMonthlySummaryResponse:
-    items = list_dev_request_monthly_summary(session, company_id=company_id, status_code=status_code)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngDevRequestMonthlySummaryResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_dev_request_monthly_summary(
+        session,
+        company_id=company_id,
+        status_code=status_code,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return MngDevRequestMonthlySummaryResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get("/dev-requests/{request_id}", response_model=MngDevRequestDetailResponse, dependencies=_ROLES)
@@ -108,9 +116,12 @@ def mng_dev_project_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngDevProjectListResponse:
-    items = list_dev_projects(session, company_id=company_id)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngDevProjectListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_dev_projects(
+        session,
+        company_id=company_id,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return MngDevProjectListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get("/dev-projects/{project_id}", response_model=MngDevProjectDetailResponse, dependencies=_ROLES)
@@ -143,9 +154,13 @@ def mng_dev_inquiry_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngDevInquiryListResponse:
-    items = list_dev_inquiries(session, company_id=company_id, progress_code=progress_code)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngDevInquiryListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_dev_inquiries(
+        session,
+        company_id=company_id,
+        progress_code=progress_code,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return MngDevInquiryListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get("/dev-inquiries/{inquiry_id}", response_model=MngDevInquiryDetailResponse, dependencies=_ROLES)
@@ -177,9 +192,12 @@ def mng_dev_staff_projects(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngDevStaffProjectListResponse:
-    items = list_dev_staff_projects(session, company_id=company_id)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngDevStaffProjectListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_dev_staff_projects(
+        session,
+        company_id=company_id,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return MngDevStaffProjectListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get("/dev-staff/revenue-summary", response_model=MngDevStaffRevenueSummaryResponse, dependencies=_ROLES)
@@ -189,6 +207,9 @@ def mng_dev_staff_revenue_summary(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngDevStaffRevenueSummaryResponse:
-    items = list_dev_staff_revenue_summary(session, company_id=company_id)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngDevStaffRevenueSummaryResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_dev_staff_revenue_summary(
+        session,
+        company_id=company_id,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return MngDevStaffRevenueSummaryResponse(items=items, total_count=total_count, page=page, limit=limit)
@@ -5,7 +5,7 @@ from sqlmodel import Session
 
 from app.core.auth import require_roles
 from app.core.database import get_session
-from app.core.pagination import paginate_items
+from app.core.pagination import PageParams
 from app.schemas.mng import (
     MngBulkDeleteRequest,
     MngBulkDeleteResponse,
@@ -37,16 +37,18 @@ def mng_infra_master_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngInfraMasterListResponse:
-    items = list_infra_masters(session, company_id=company_id)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngInfraMasterListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_infra_masters(
+        session,
+        company_id=company_id,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return MngInfraMasterListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.post("/infra-masters", response_model=MngInfraMasterListResponse, status_code=status.HTTP_201_CREATED, dependencies=_ROLES)
 def mng_infra_master_create(payload: MngInfraMasterCreateRequest, session: Session = Depends(get_session)) -> MngInfraMasterListResponse:
     create_infra_master(session, payload)
-    items = list_infra_masters(session)
-    total_count = len(items)
+    items, total_count = list_infra_masters(session)
     return MngInfraMasterListResponse(items=items, total_count=total_count, page=1, limit=max(total_count, 1))
 
 
@@ -64,9 +66,8 @@ def mng_infra_config_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngInfraConfigListResponse:
-    items = list_infra_configs(session, master_id)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngInfraConfigListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_infra_configs(session, master_id, PageParams(page=page, limit=limit))
+    return MngInfraConfigListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.post("/infra-configs/{master_id}", response_model=MngInfraConfigListResponse, dependencies=_ROLES)
@@ -7,7 +7,7 @@ from sqlmodel import Session
 
 from app.core.auth import require_roles
 from app.core.database import get_session
-from app.core.pagination import paginate_items
+from app.core.pagination import PageParams
 from app.schemas.mng import (
     MngBulkDeleteRequest,
     MngBulkDeleteResponse,
@@ -47,9 +47,12 @@ def mng_outsource_contract_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngOutsourceContractListResponse:
-    items = list_outsource_contracts(session, search=search)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngOutsourceContractListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_outsource_contracts(
+        session,
+        search=search,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return MngOutsourceContractListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get("/outsource-contracts/check-duplicate", response_model=MngOutsourceContractDuplicateResponse, dependencies=_ROLES)
@@ -97,9 +100,8 @@ def mng_outsource_attendance_summary(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngOutsourceAttendanceSummaryResponse:
-    items = list_outsource_attendance_summary(session)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngOutsourceAttendanceSummaryResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_outsource_attendance_summary(session, PageParams(page=page, limit=limit))
+    return MngOutsourceAttendanceSummaryResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get("/outsource-attendances/{contract_id}", response_model=MngOutsourceAttendanceListResponse, dependencies=_ROLES)
@@ -109,16 +111,14 @@ def mng_outsource_attendance_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> MngOutsourceAttendanceListResponse:
-    items = list_outsource_attendances(session, contract_id)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return MngOutsourceAttendanceListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_outsource_attendances(session, contract_id, PageParams(page=page, limit=limit))
+    return MngOutsourceAttendanceListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.post("/outsource-attendances", response_model=MngOutsourceAttendanceListResponse, status_code=status.HTTP_201_CREATED, dependencies=_ROLES)
 def mng_outsource_attendance_create(payload: MngOutsourceAttendanceCreateRequest, session: Session = Depends(get_session)) -> MngOutsourceAttendanceListResponse:
     create_outsource_attendance(session, payload)
-    items = list_outsource_attendances(session, payload.contract_id)
-    total_count = len(items)
+    items, total_count = list_outsource_attendances(session, payload.contract_id)
     return MngOutsourceAttendanceListResponse(items=items, total_count=total_count, page=1, limit=max(total_count, 1))
 
 
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from sqlmodel import Session
 
 from app.core.auth import get_current_user, require_roles
 from app.core.database import get_session
+from app.core.pagination import CURSOR_DESCRIPTION
 from app.models import AuthUser
 from app.schemas.organization import (
     OrgDeptChangeHistoryListResponse,
     OrgRestructureApplyResponse,
+    OrgRestructureDryRunResponse,
     OrgRestructurePlanCreateRequest,
     OrgRestructurePlanItem as OrgRestructurePlanItemSchema,
     OrgRestructurePlanItemCreateRequest,
@@ -26,7 +28,10 @@ from app.schemas.organization import (
     OrganizationDepartmentCreateRequest,
     OrganizationDepartmentDetailResponse,
     OrganizationDepartmentListResponse,
+    OrganizationDepartmentTreeNode,
+    OrganizationDepartmentTreeResponse,
     OrganizationDepartmentUpdateRequest,
+    OrganizationHeadcountResponse,
 )
 from app.services.org_restructure_service import (
     add_plan_item,
@@ -37,6 +42,7 @@ from app.services.org_restructure_service import (
     list_dept_change_history,
     list_plan_items,
     list_restructure_plans,
+    simulate_restructure_plan,
     update_plan_item,
     update_restructure_plan,
 )
@@ -51,6 +57,8 @@ from app.services.organization_service import (
     update_department,
 )
 from app.services.menu_service import require_menu_action_for_user
+from app.services.org_state_history_service import headcount_by_department
+from app.services.org_tree_cache_service import get_department_tree
 
 router = APIRouter(prefix="/org", tags=["organization"])
 
@@ -138,12 +146,24 @@ def organization_corporation_delete(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
 @router.get(
     "/departments",
     response_model=OrganizationDepartmentListResponse,
     dependencies=[Depends(require_roles("hr_manager", "admin"))],
 )
 def organization_departments(
+    response: Response,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=100, ge=1, le=1000),
     all: bool = Query(default=False),
@@ -152,13 +172,20 @@ def organization_departments(
     organization_type: str | None = Query(default=None),
     cost_center_code: str | None = Query(default=None),
     reference_date: date | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     session: Session = Depends(get_session),
     current_user: AuthUser = Depends(get_current_user),
 ) -> OrganizationDepartmentListResponse:
     require_menu_action_for_user(session, user_id=current_user.id, path="/org/departments", action_code="query")
+    # 같은 URL(쿼리 포함)의 응답은 스냅샷이 같으면 같으므로 스냅샷 버전을 ETag 로 쓴다.
+    snapshot = get_department_tree(session)
+    if _etag_matches(if_none_match, snapshot.etag):
+        return _not_modified(snapshot.etag)
+    response.headers["ETag"] = snapshot.etag
     if all:
         departments, total_count = list_departments(
             session,
+            snapshot=snapshot,
             code=code,
             name=name,
             organization_type=organization_type,
@@ -172,6 +199,7 @@ def organization_departments(
 
     departments, total_count = list_departments(
         session,
+        snapshot=snapshot,
         page=page,
         limit=limit,
         code=code,
@@ -188,6 +216,62 @@ def organization_departments(
     )
 
 
+@router.get(
+    "/departments/tree",
+    response_model=OrganizationDepartmentTreeResponse,
+    dependencies=[Depends(require_roles("hr_manager", "admin"))],
+)
+def organization_department_tree(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    session: Session = Depends(get_session),
+    current_user: AuthUser = Depends(get_current_user),
+) -> OrganizationDepartmentTreeResponse:
+    require_menu_action_for_user(session, user_id=current_user.id, path="/org/departments", action_code="query")
+    snapshot = get_department_tree(session)
+    if _etag_matches(if_none_match, snapshot.etag):
+        return _not_modified(snapshot.etag)
+    response.headers["ETag"] = snapshot.etag
+    return OrganizationDepartmentTreeResponse(
+        version=snapshot.version,
+        items=[
+            OrganizationDepartmentTreeNode(
+                id=node.id,
+                code=node.code,
+                name=node.name,
+                parent_id=node.parent_id,
+                depth=node.depth,
+                path=list(node.path_ids),
+                path_name=node.path_name,
+                is_active=node.is_active,
+                employee_count=node.employee_count,
+                subtree_employee_count=node.subtree_employee_count,
+            )
+            for node in snapshot.nodes
+        ],
+        total_count=len(snapshot.nodes),
+    )
+
+
+@router.get(
+    "/departments/headcount",
+    response_model=OrganizationHeadcountResponse,
+    dependencies=[Depends(require_roles("hr_manager", "admin"))],
+)
+def organization_department_headcount(
+    as_of: date = Query(...),
+    session: Session = Depends(get_session),
+    current_user: AuthUser = Depends(get_current_user),
+) -> OrganizationHeadcountResponse:
+    require_menu_action_for_user(session, user_id=current_user.id, path="/org/departments", action_code="query")
+    items = headcount_by_department(session, as_of)
+    return OrganizationHeadcountResponse(
+        as_of=as_of,
+        items=items,
+        total_headcount=sum(item.headcount for item in items),
+    )
+
+
 @router.post(
     "/departments",
     response_model=OrganizationDepartmentDetailResponse,
@@ -246,9 +330,10 @@ def organization_department_delete(
 def get_dept_change_history(
     department_id: int | None = Query(default=None),
     limit: int = Query(default=200, ge=1, le=1000),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
     session: Session = Depends(get_session),
 ) -> OrgDeptChangeHistoryListResponse:
-    return list_dept_change_history(session, department_id=department_id, limit=limit)
+    return list_dept_change_history(session, department_id=department_id, limit=limit, cursor=cursor)
 
 
 # ---------------------------------------------------------------------------
@@ -305,6 +390,18 @@ def delete_plan(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+@router.get(
+    "/restructure/plans/{plan_id}/dry-run",
+    response_model=OrgRestructureDryRunResponse,
+    dependencies=[Depends(require_roles("hr_manager", "admin"))],
+)
+def dry_run_plan(
+    plan_id: int,
+    session: Session = Depends(get_session),
+) -> OrgRestructureDryRunResponse:
+    return simulate_restructure_plan(session, plan_id)
+
+
 @router.post(
     "/restructure/plans/{plan_id}/apply",
     response_model=OrgRestructureApplyResponse,
@@ -6,6 +6,7 @@ from sqlmodel import Session, select
 
 from app.core.auth import get_current_user, require_roles
 from app.core.database import get_session
+from app.core.pagination import COUNT_MODE_EXACT, COUNT_MODE_PATTERN, CURSOR_DESCRIPTION
 from app.core.time_utils import APP_TZ, business_today
 from app.models import AuthUser, HrAttendanceDaily, HrEmployee, TimEmployeeDailySchedule, TimHoliday, TimSchedulePattern, TimWorkScheduleCode
 from app.schemas.tim_attendance_daily import (
@@ -43,9 +44,13 @@ def attendance_daily_list(
     start_date: date,
     end_date: date,
     employee_id: int | None = Query(default=None),
+    department_id: int | None = Query(default=None),
+    include_sub_departments: bool = Query(default=False, description="department_id 하위 조직까지 포함"),
     status_filter: str | None = Query(default=None, alias="status"),
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    count_mode: str = Query(default=COUNT_MODE_EXACT, pattern=COUNT_MODE_PATTERN),
     session: Session = Depends(get_session),
 ) -> TimAttendanceDailyListResponse:
     return list_attendance_daily(
@@ -56,6 +61,10 @@ def attendance_daily_list(
         status_filter=status_filter,
         page=page,
         limit=limit,
+        cursor=cursor,
+        count_mode=count_mode,
+        department_id=department_id,
+        include_sub_departments=include_sub_departments,
     )
 
 
@@ -3,7 +3,7 @@ from sqlmodel import Session, select
 
 from app.core.auth import get_current_user, require_roles
 from app.core.database import get_session
-from app.core.pagination import paginate_items
+from app.core.pagination import COUNT_MODE_EXACT, COUNT_MODE_PATTERN, CURSOR_DESCRIPTION, PageParams
 from app.core.time_utils import business_today
 from app.models import AuthUser, HrEmployee
 from app.schemas.tim_leave import (
@@ -22,6 +22,7 @@ from app.services.tim_leave_service import (
     get_or_create_annual_leave,
     list_annual_leaves,
     list_leave_requests,
+    list_leave_requests_keyset,
 )
 
 router = APIRouter(prefix="/tim", tags=["tim-leave"])
@@ -66,9 +67,14 @@ def annual_leave_list(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> TimAnnualLeaveListResponse:
-    items = list_annual_leaves(session, year=year, department_id=department_id, keyword=keyword)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return TimAnnualLeaveListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_annual_leaves(
+        session,
+        year=year,
+        department_id=department_id,
+        keyword=keyword,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return TimAnnualLeaveListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get("/leave-requests", response_model=TimLeaveRequestListResponse, dependencies=[Depends(require_roles("hr_manager", "admin"))])
@@ -77,11 +83,33 @@ def leave_requests_list(
     pending_only: bool = Query(default=False),
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    count_mode: str = Query(default=COUNT_MODE_EXACT, pattern=COUNT_MODE_PATTERN),
     session: Session = Depends(get_session),
 ) -> TimLeaveRequestListResponse:
-    items = list_leave_requests(session, status_filter=status_filter, pending_only=pending_only)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return TimLeaveRequestListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    if cursor is not None:
+        items, total_count, total_is_estimate, next_cursor = list_leave_requests_keyset(
+            session,
+            cursor=cursor,
+            limit=limit,
+            count_mode=count_mode,
+            status_filter=status_filter,
+            pending_only=pending_only,
+        )
+        return TimLeaveRequestListResponse(
+            items=items,
+            total_count=total_count,
+            limit=limit,
+            total_is_estimate=total_is_estimate,
+            next_cursor=next_cursor,
+        )
+    items, total_count = list_leave_requests(
+        session,
+        status_filter=status_filter,
+        pending_only=pending_only,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return TimLeaveRequestListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.get("/leave-requests/my", response_model=TimLeaveRequestListResponse)
@@ -89,13 +117,35 @@ def leave_requests_my(
     status_filter: str | None = Query(default=None, alias="status"),
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    count_mode: str = Query(default=COUNT_MODE_EXACT, pattern=COUNT_MODE_PATTERN),
     session: Session = Depends(get_session),
     current_user: AuthUser = Depends(get_current_user),
 ) -> TimLeaveRequestListResponse:
     employee = _current_employee(session, current_user)
-    items = list_leave_requests(session, employee_id=employee.id, status_filter=status_filter)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return TimLeaveRequestListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    if cursor is not None:
+        items, total_count, total_is_estimate, next_cursor = list_leave_requests_keyset(
+            session,
+            cursor=cursor,
+            limit=limit,
+            count_mode=count_mode,
+            employee_id=employee.id,
+            status_filter=status_filter,
+        )
+        return TimLeaveRequestListResponse(
+            items=items,
+            total_count=total_count,
+            limit=limit,
+            total_is_estimate=total_is_estimate,
+            next_cursor=next_cursor,
+        )
+    items, total_count = list_leave_requests(
+        session,
+        employee_id=employee.id,
+        status_filter=status_filter,
+        page_params=PageParams(page=page, limit=limit),
+    )
+    return TimLeaveRequestListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.post("/leave-requests")
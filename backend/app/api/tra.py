@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from app.core.auth import get_current_user, require_roles
 from app.core.database import get_session
+from app.core.export import EXPORT_FORMAT_PATTERN, export_response
+from app.core.pagination import CURSOR_DESCRIPTION, OPTIONAL_LIMIT_DESCRIPTION
 from app.models import AuthUser
 from app.schemas.tra import (
     TraApplyCyberResultsRequest,
@@ -12,6 +15,7 @@ from app.schemas.tra import (
     TraApplicationCreateRequest,
     TraApplicationListResponse,
     TraApplicationRejectRequest,
+    TraCyberApplyResponse,
     TraGenerateElearningWindowsRequest,
     TraGenerateRequiredEventsRequest,
     TraGenerateRequiredTargetsRequest,
@@ -24,11 +28,13 @@ from app.services.tra_service import (
     apply_cyber_results,
     approve_tra_application,
     batch_save_tra_resource,
+    build_tra_resource_query,
     create_tra_application,
     generate_elearning_windows,
     generate_required_events,
     generate_required_targets,
     get_my_tra_applications,
+    iter_tra_resource_export,
     list_tra_applications_detail,
     list_tra_resource,
     reject_tra_application,
@@ -47,7 +53,12 @@ def generate_required_events_api(
     payload: TraGenerateRequiredEventsRequest,
     session: Session = Depends(get_session),
 ) -> TraGenerationResponse:
-    processed = generate_required_events(session, payload.year)
+    processed = generate_required_events(
+        session,
+        payload.year,
+        job_code=payload.job_code,
+        edu_level=payload.edu_level,
+    )
     return TraGenerationResponse(processed=processed, message="Required events generated.")
 
 
@@ -60,7 +71,13 @@ def generate_required_targets_api(
     payload: TraGenerateRequiredTargetsRequest,
     session: Session = Depends(get_session),
 ) -> TraGenerationResponse:
-    processed = generate_required_targets(session, payload.year, payload.rule_code)
+    processed = generate_required_targets(
+        session,
+        payload.year,
+        payload.rule_code,
+        job_code=payload.job_code,
+        edu_level=payload.edu_level,
+    )
     return TraGenerationResponse(processed=processed, message="Required targets generated.")
 
 
@@ -79,15 +96,19 @@ def generate_elearning_windows_api(
 
 @router.post(
     "/cyber-results/apply",
-    response_model=TraGenerationResponse,
+    response_model=TraCyberApplyResponse,
     dependencies=[Depends(require_roles("hr_manager", "admin"))],
 )
 def apply_cyber_results_api(
     payload: TraApplyCyberResultsRequest,
     session: Session = Depends(get_session),
-) -> TraGenerationResponse:
-    processed = apply_cyber_results(session, payload.upload_ym)
-    return TraGenerationResponse(processed=processed, message="Cyber upload results applied.")
+) -> TraCyberApplyResponse:
+    return apply_cyber_results(
+        session,
+        payload.upload_ym,
+        chunk_size=payload.chunk_size,
+        max_chunks=payload.max_chunks,
+    )
 
 
 # ─── Write-flow endpoints ─────────────────────────────────────────────────────
@@ -244,18 +265,74 @@ def withdraw_application_api(
     return withdraw_tra_application(session, app_id, current_user)
 
 
+_RESOURCE_QUERY_PARAMS = frozenset({"year", "fields", "sort", "limit", "cursor", "format"})
+
+
+def _resource_filters(request: Request) -> dict[str, str]:
+    """예약 파라미터를 뺀 나머지 query string 을 ResourceConfig.filter_fields 조건으로 넘긴다."""
+    return {key: value for key, value in request.query_params.items() if key not in _RESOURCE_QUERY_PARAMS}
+
+
+def _split_fields(fields: str | None) -> list[str] | None:
+    if not fields:
+        return None
+    return [item.strip() for item in fields.split(",") if item.strip()]
+
+
+@router.get(
+    "/{resource}/export",
+    dependencies=[Depends(require_roles("employee", "hr_manager", "admin"))],
+)
+def export_resource_api(
+    request: Request,
+    resource: str,
+    export_format: str = Query(default="ndjson", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    year: int | None = Query(default=None, ge=2000, le=2100),
+    fields: str | None = Query(default=None, description="쉼표로 구분한 응답 컬럼. 비우면 리소스 기본 컬럼"),
+    sort: str | None = Query(default=None, description="정렬 컬럼 쉼표 목록. '-' 접두사는 내림차순"),
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    query = build_tra_resource_query(
+        resource,
+        year=year,
+        filters=_resource_filters(request),
+        fields=_split_fields(fields),
+        sort=sort,
+    )
+    return export_response(
+        session,
+        lambda export_session: iter_tra_resource_export(export_session, query, export_format),
+        export_format,
+        f"tra-{resource}",
+    )
+
+
 @router.get(
     "/{resource}",
     response_model=TraResourceListResponse,
     dependencies=[Depends(require_roles("employee", "hr_manager", "admin"))],
 )
 def list_resource_api(
+    request: Request,
     resource: str,
     year: int | None = Query(default=None, ge=2000, le=2100),
+    fields: str | None = Query(default=None, description="쉼표로 구분한 응답 컬럼. 비우면 리소스 기본 컬럼"),
+    sort: str | None = Query(default=None, description="정렬 컬럼 쉼표 목록. '-' 접두사는 내림차순"),
+    limit: int | None = Query(default=None, ge=1, le=1000, description=OPTIONAL_LIMIT_DESCRIPTION),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
     session: Session = Depends(get_session),
 ) -> TraResourceListResponse:
-    items = list_tra_resource(session, resource, year=year)
-    return TraResourceListResponse(items=items, total_count=len(items))
+    items, total_count, next_cursor = list_tra_resource(
+        session,
+        resource,
+        year=year,
+        filters=_resource_filters(request),
+        fields=_split_fields(fields),
+        sort=sort,
+        limit=limit,
+        cursor=cursor,
+    )
+    return TraResourceListResponse(items=items, total_count=total_count, limit=limit, next_cursor=next_cursor)
 
 
 @router.post(
@@ -5,7 +5,7 @@ from sqlmodel import Session
 
 from app.core.auth import get_current_user, require_roles
 from app.core.database import get_session
-from app.core.pagination import paginate_items
+from app.core.pagination import PageParams
 from app.models import AuthUser
 from app.schemas.welfare import (
     WelBenefitRequestActionResponse,
@@ -41,9 +41,8 @@ def get_wel_benefit_types(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> WelBenefitTypeListResponse:
-    items = list_wel_benefit_types(session)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return WelBenefitTypeListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_wel_benefit_types(session, PageParams(page=page, limit=limit))
+    return WelBenefitTypeListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.post(
@@ -69,9 +68,8 @@ def get_wel_benefit_requests(
     limit: int = Query(default=50, ge=1, le=200),
     session: Session = Depends(get_session),
 ) -> WelBenefitRequestListResponse:
-    items = list_wel_benefit_requests(session)
-    paged_items, total_count = paginate_items(items, page, limit)
-    return WelBenefitRequestListResponse(items=paged_items, total_count=total_count, page=page, limit=limit)
+    items, total_count = list_wel_benefit_requests(session, PageParams(page=page, limit=limit))
+    return WelBenefitRequestListResponse(items=items, total_count=total_count, page=page, limit=limit)
 
 
 @router.post(
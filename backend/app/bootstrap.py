@@ -85,6 +85,9 @@ from app.models import (
     TraElearningWindow,
     TraCyberUpload,
 )
+from app.services.hri_request_service import ensure_approval_inbox, rebuild_approval_inbox
+from app.services.org_hierarchy_service import ensure_department_closure
+from app.services.org_state_history_service import backfill_state_histories
 
 DEV_EMPLOYEE_TOTAL = 6000
 DEV_EMPLOYEE_LOGIN_PREFIX = "kr-"
@@ -686,9 +689,9 @@ MENU_TREE: list[dict] = [
                     {"code": "payroll.item-groups", "name": "항목그룹관리", "path": "/payroll/item-groups", "icon": "Calculator", "sort_order": 503, "roles": ["payroll_mgr", "admin"]},
                     {"code": "payroll.codes", "name": "급여코드관리", "path": "/payroll/codes", "icon": "Calculator", "sort_order": 504, "roles": ["payroll_mgr", "admin"]},
                     {"code": "payroll.tax-rates", "name": "세율및사회보험관리", "path": "/payroll/tax-rates", "icon": "Calculator", "sort_order": 505, "roles": ["payroll_mgr", "admin"]},
-                    {"code": "payroll.income-tax-brackets", "name": "소득세구간관리", "path": "/payroll/income-tax-brackets", "icon": "Calculator", "sort_order": 505.5, "roles": ["payroll_mgr", "admin"]},
-                    {"code": "payroll.payment-schedules", "name": "월급여일자관리", "path": "/payroll/payment-schedules", "icon": "CalendarDays", "sort_order": 506, "roles": ["payroll_mgr", "admin"]},
-                    {"code": "payroll.employee-profiles", "name": "직원급여프로필관리", "path": "/payroll/employee-profiles", "icon": "Users", "sort_order": 507, "roles": ["payroll_mgr", "admin"]}
+                    {"code": "payroll.income-tax-brackets", "name": "소득세구간관리", "path": "/payroll/income-tax-brackets", "icon": "Calculator", "sort_order": 506, "roles": ["payroll_mgr", "admin"]},
+                    {"code": "payroll.payment-schedules", "name": "월급여일자관리", "path": "/payroll/payment-schedules", "icon": "CalendarDays", "sort_order": 507, "roles": ["payroll_mgr", "admin"]},
+                    {"code": "payroll.employee-profiles", "name": "직원급여프로필관리", "path": "/payroll/employee-profiles", "icon": "Users", "sort_order": 508, "roles": ["payroll_mgr", "admin"]}
                 ],
             },
             {
@@ -1030,6 +1033,8 @@ def ensure_departments(session: Session) -> list[OrgDepartment]:
                 session.commit()
                 session.refresh(department)
         departments.append(department)
+    if ensure_department_closure(session):
+        session.commit()
     return departments
 
 
@@ -4833,6 +4838,11 @@ def ensure_hri_request_samples(session: Session) -> None:
     session.commit()
 
 
+def ensure_hri_approval_inbox(session: Session) -> None:
+    # 결재함은 스냅샷에서 파생되는 비정규화 테이블이므로 시드 후 전체 재구성한다.
+    rebuild_approval_inbox(session)
+
+
 def ensure_pay_tax_rates(session: Session) -> None:
     for year, rate_type, emp_rate, empl_rate, min_l, max_l in PAY_TAX_RATE_SEEDS:
         existing = session.exec(select(PayTaxRate).where(
@@ -5790,11 +5800,25 @@ def ensure_hr_appointment_schema(session: Session) -> None:
     session.commit()
 
 
+def _is_postgres(session: Session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def ensure_read_models(session: Session) -> None:
+    # 원본에서 파생되는 조회용 테이블을 기동 시 보정한다. 시드 여부와 관계없이 매 기동마다 호출된다.
+    changed = ensure_department_closure(session)
+    if backfill_state_histories(session) or changed:
+        session.commit()
+    ensure_approval_inbox(session)
+
+
 def seed_initial_data(session: Session) -> None:
-    ensure_auth_user_login_id_schema(session)
-    ensure_tim_leave_schema(session)
-    ensure_hri_schema(session)
-    ensure_hr_appointment_schema(session)
+    # 기존 Postgres 스키마 보정용. create_all 로 막 만든 스키마(SQLite 벤치 등)에서는 불필요하다.
+    if _is_postgres(session):
+        ensure_auth_user_login_id_schema(session)
+        ensure_tim_leave_schema(session)
+        ensure_hri_schema(session)
+        ensure_hr_appointment_schema(session)
     ensure_roles(session)
     ensure_corporations(session)
     departments = ensure_departments(session)
@@ -5871,6 +5895,7 @@ def seed_initial_data(session: Session) -> None:
     ensure_hri_form_type_template_maps(session)
     ensure_wel_benefit_types(session)
     ensure_hri_request_samples(session)
+    ensure_hri_approval_inbox(session)
     ensure_wel_benefit_requests(session)
     ensure_payroll_run_result_samples(session)
     ensure_tra_seed_data(session)
@@ -1,3 +1,4 @@
+import secrets
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 
@@ -8,11 +9,15 @@ from jwt import InvalidTokenError
 from sqlmodel import Session, select
 
 from app.core.config import settings
-from app.core.database import get_session
+from app.core.database import engine, get_session
+from app.core.token_cache import TokenPayloadCache, TokenRevocationList
 from app.models import AuthRole, AuthUser, AuthUserRole
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+token_payload_cache = TokenPayloadCache(settings.auth_token_cache_size)
+token_revocation_list = TokenRevocationList(settings.auth_token_revocation_refresh_sec)
+
 
 def build_access_token(user_id: int, expires_min: int | None = None) -> str:
     now = datetime.now(timezone.utc)
@@ -22,6 +27,7 @@ def build_access_token(user_id: int, expires_min: int | None = None) -> str:
         "iat": int(now.timestamp()),
         "exp": int((now + timedelta(minutes=ttl_min)).timestamp()),
         "iss": settings.auth_token_issuer,
+        "jti": secrets.token_hex(16),
     }
     return jwt.encode(
         payload,
@@ -30,7 +36,7 @@ def build_access_token(user_id: int, expires_min: int | None = None) -> str:
     )
 
 
-def parse_access_token_payload(token: str) -> dict | None:
+def _decode_access_token(token: str) -> dict | None:
     try:
         payload = jwt.decode(
             token,
@@ -44,6 +50,57 @@ def parse_access_token_payload(token: str) -> dict | None:
     return payload if isinstance(payload, dict) else None
 
 
+def _is_payload_revoked(payload: dict) -> bool:
+    if not settings.auth_token_revocation_enabled:
+        return False
+    jti = payload.get("jti")
+    if not isinstance(jti, str):
+        return False
+    with Session(engine) as session:
+        return token_revocation_list.is_revoked(session, jti)
+
+
+def parse_access_token_payload(token: str) -> dict | None:
+    """토큰을 검증해 payload 를 반환한다.
+
+    검증된 토큰은 exp 까지 LRU 캐시에 보관해 같은 토큰의 반복 decode 를 생략한다.
+    폐기 목록이 켜져 있으면 캐시 적중 여부와 무관하게 jti 를 확인한다.
+    """
+    payload = token_payload_cache.get(token)
+    if payload is None:
+        payload = _decode_access_token(token)
+        if payload is None:
+            return None
+        token_payload_cache.put(token, payload)
+
+    if _is_payload_revoked(payload):
+        token_payload_cache.discard(token)
+        return None
+    return payload
+
+
+def revoke_access_token(session: Session, token: str, *, reason: str = "logout") -> bool:
+    """토큰을 폐기 목록에 등록한다. jti 가 없는 토큰은 등록하지 않는다."""
+    payload = _decode_access_token(token)
+    token_payload_cache.discard(token)
+    if payload is None or not settings.auth_token_revocation_enabled:
+        return False
+
+    jti = payload.get("jti")
+    user_id_str = payload.get("sub")
+    if not isinstance(jti, str) or not isinstance(user_id_str, str) or not user_id_str.isdigit():
+        return False
+
+    token_revocation_list.revoke(
+        session,
+        jti=jti,
+        user_id=int(user_id_str),
+        expires_at=datetime.fromtimestamp(int(payload["exp"]), tz=timezone.utc),
+        reason=reason,
+    )
+    return True
+
+
 def parse_access_token(token: str) -> int | None:
     payload = parse_access_token_payload(token)
     if payload is None:
@@ -0,0 +1,118 @@
+"""요청 단위 배치 로더 (DataLoader 스타일).
+
+목록 API 에서 행마다 ``session.get`` 으로 FK 를 따라가면 N+1 쿼리가 된다.
+BatchLoader 는 필요한 키를 먼저 모아두었다가(prime) 처음 조회(get)될 때
+엔티티/컬럼별로 IN 쿼리 한 번에 해석한다. 세션에 붙어 있으므로 요청(세션)이
+끝나면 함께 사라지고, 커밋/롤백 시에는 캐시를 비운다.
+
+Usage example::
+
+    loader = get_batch_loader(session)
+    loader.prime(HriFormType, [row.form_type_id for row in rows])
+    for row in rows:
+        form_type = loader.get(HriFormType, row.form_type_id)  # 첫 호출에서 한 번만 조회
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+T = TypeVar("T")
+
+_SESSION_INFO_KEY = "batch_loader"
+_IN_CHUNK_SIZE = 1000
+
+# (모델, 키 컬럼명, 1:N 여부)
+_LoaderKey = tuple[type, str, bool]
+
+
+class BatchLoader:
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._pending: dict[_LoaderKey, set[Any]] = defaultdict(set)
+        self._resolved: dict[_LoaderKey, dict[Any, Any]] = defaultdict(dict)
+
+    def prime(self, model: type[T], keys: Iterable[Any], *, by: str = "id") -> None:
+        """단건(유니크 키) 조회 대상 키를 등록한다."""
+        self._queue((model, by, False), keys)
+
+    def prime_related(self, model: type[T], keys: Iterable[Any], *, by: str) -> None:
+        """1:N 조회 대상 키를 등록한다. (예: request_id 별 결재 단계 목록)"""
+        self._queue((model, by, True), keys)
+
+    def get(self, model: type[T], key: Any, *, by: str = "id") -> T | None:
+        loader_key = (model, by, False)
+        return self._lookup(loader_key, key)
+
+    def get_related(self, model: type[T], key: Any, *, by: str) -> list[T]:
+        loader_key = (model, by, True)
+        return self._lookup(loader_key, key) or []
+
+    def load_many(self, model: type[T], keys: Iterable[Any], *, by: str = "id") -> dict[Any, T]:
+        """키 목록을 한 번에 해석해 {key: 엔티티} 로 반환한다. 없는 키는 제외된다."""
+        key_list = [key for key in keys if key is not None]
+        self.prime(model, key_list, by=by)
+        result: dict[Any, T] = {}
+        for key in key_list:
+            value = self.get(model, key, by=by)
+            if value is not None:
+                result[key] = value
+        return result
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self._resolved.clear()
+
+    def _queue(self, loader_key: _LoaderKey, keys: Iterable[Any]) -> None:
+        resolved = self._resolved[loader_key]
+        pending = self._pending[loader_key]
+        for key in keys:
+            if key is not None and key not in resolved:
+                pending.add(key)
+
+    def _lookup(self, loader_key: _LoaderKey, key: Any) -> Any:
+        if key is None:
+            return None
+        resolved = self._resolved[loader_key]
+        if key not in resolved:
+            self._pending[loader_key].add(key)
+            self._dispatch(loader_key)
+        return resolved.get(key)
+
+    def _dispatch(self, loader_key: _LoaderKey) -> None:
+        model, column_name, grouped = loader_key
+        keys = list(self._pending.pop(loader_key, set()))
+        if not keys:
+            return
+
+        resolved = self._resolved[loader_key]
+        column = getattr(model, column_name)
+        for start in range(0, len(keys), _IN_CHUNK_SIZE):
+            chunk = keys[start:start + _IN_CHUNK_SIZE]
+            rows = self._session.exec(select(model).where(column.in_(chunk))).all()
+            if grouped:
+                for key in chunk:
+                    resolved.setdefault(key, [])
+                for row in rows:
+                    resolved[getattr(row, column_name)].append(row)
+            else:
+                for key in chunk:
+                    resolved.setdefault(key, None)
+                for row in rows:
+                    resolved[getattr(row, column_name)] = row
+
+
+def get_batch_loader(session: Session) -> BatchLoader:
+    """세션에 묶인 BatchLoader 를 반환한다. 없으면 새로 만든다."""
+    loader = session.info.get(_SESSION_INFO_KEY)
+    if loader is None:
+        loader = BatchLoader(session)
+        session.info[_SESSION_INFO_KEY] = loader
+        event.listen(session, "after_commit", lambda _session: loader.clear())
+        event.listen(session, "after_rollback", lambda _session: loader.clear())
+    return loader
@@ -0,0 +1,68 @@
+"""대량 쓰기 공용 헬퍼.
+
+- dialect_insert: ON CONFLICT 를 지원하는 방언(Postgres/SQLite)의 insert 구성자.
+- chunked: 이터러블을 고정 크기 묶음으로 나눈다. 입력을 끝까지 메모리에 올리지 않는다.
+- bulk_update_by_pk: 기본키별로 다른 값을 한 번에 갱신한다.
+  Postgres 는 ``UPDATE ... FROM (VALUES ...)`` 한 문장, 그 밖의 방언은 executemany.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, TypeVar
+
+from sqlalchemy import column, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session
+
+T = TypeVar("T")
+
+_INSERT_BY_DIALECT = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+# VALUES 한 문장의 최대 행 수. 바인드 파라미터 한도(65535)를 넘지 않게 자른다.
+BULK_UPDATE_BATCH_SIZE = 1000
+
+
+def dialect_insert(session: Session, model: Any):
+    """on_conflict_do_nothing / on_conflict_do_update 를 쓸 수 있는 insert. 미지원 방언이면 None."""
+    constructor = _INSERT_BY_DIALECT.get(session.get_bind().dialect.name)
+    return constructor(model) if constructor is not None else None
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, max(1, size))):
+        yield chunk
+
+
+def bulk_update_by_pk(session: Session, model: Any, rows: list[dict[str, Any]], *, key: str = "id") -> int:
+    """rows 의 각 dict 는 기본키(key)와 바꿀 컬럼을 같은 키 집합으로 담는다. 갱신한 행 수를 반환한다.
+
+    세션에 올라와 있는 해당 객체는 만료시켜 다음 접근 때 새 값을 읽게 한다.
+    """
+    if not rows:
+        return 0
+    table = model.__table__
+    names = list(rows[0])
+    if session.get_bind().dialect.name == "postgresql":
+        updated = 0
+        for chunk in chunked(rows, BULK_UPDATE_BATCH_SIZE):
+            source = values(*(column(name, table.c[name].type) for name in names), name="bulk_values").data(
+                [tuple(row[name] for name in names) for row in chunk]
+            )
+            result = session.exec(
+                update(table)
+                .where(table.c[key] == source.c[key])
+                .values({name: source.c[name] for name in names if name != key})
+            )
+            updated += result.rowcount
+    else:
+        session.exec(update(model), params=rows)
+        updated = len(rows)
+
+    for row in rows:
+        instance = session.identity_map.get(Session.identity_key(model, row[key]))
+        if instance is not None:
+            session.expire(instance)
+    return updated
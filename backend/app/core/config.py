@@ -18,7 +18,21 @@ class Settings(BaseSettings):
     auth_token_algorithm: str = "HS256"
     auth_token_expires_min: int = 480
     auth_token_issuer: str = "vibe-hr"
+    auth_token_cache_size: int = 2048
+    auth_token_revocation_enabled: bool = False
+    auth_token_revocation_refresh_sec: int = 5
     auto_seed_on_start: bool = False
+    approver_index_ttl_sec: int = 60
+    hr_basic_detail_cache_size: int = 2000
+    hr_basic_detail_cache_ttl_sec: int = 300
+    employee_directory_refresh_sec: int = 30
+    org_tree_cache_ttl_sec: int = 300
+    sse_keepalive_sec: int = 15
+    sse_queue_size: int = 100
+    event_bridge_enabled: bool = True
+    event_notify_channel: str = "vibe_hr_events"
+    query_metrics_enabled: bool = True
+    slow_query_threshold_ms: int = 500
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -4,6 +4,8 @@ from sqlalchemy import text
 from sqlmodel import Session, SQLModel, create_engine
 
 from app.core.config import settings
+from app.core.query_metrics import install_query_hooks
+from app.core.search import backfill_display_name_chosung, ensure_search_indexes
 
 engine = create_engine(
     settings.database_url,
@@ -13,6 +15,40 @@ engine = create_engine(
     pool_pre_ping=True,
     pool_recycle=3600,
 )
+install_query_hooks(engine)
+
+# Postgres 전용 (인덱스 이름, 테이블, GiST 키). 기간 겹침(&&)/포함(@>) 조회를 인덱스 탐색 한 번으로 끝낸다.
+RANGE_GIST_INDEXES: tuple[tuple[str, str, str], ...] = (
+    (
+        "ix_hr_appointment_order_items_employee_period",
+        "hr_appointment_order_items",
+        "employee_id, daterange(start_date, end_date, '[]')",
+    ),
+    (
+        "ix_hr_employee_state_histories_department_period",
+        "hr_employee_state_histories",
+        "department_id, daterange(valid_from, valid_to, '[)')",
+    ),
+    (
+        "ix_hr_employee_state_histories_employee_period",
+        "hr_employee_state_histories",
+        "employee_id, daterange(valid_from, valid_to, '[)')",
+    ),
+    (
+        "ix_org_department_state_histories_period",
+        "org_department_state_histories",
+        "department_id, daterange(valid_from, valid_to, '[)')",
+    ),
+)
+
+
+def ensure_range_indexes(connection) -> None:
+    """btree_gist 확장과 기간 GiST 인덱스를 만든다. Postgres 가 아니면 아무것도 하지 않는다."""
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+    for index_name, table, keys in RANGE_GIST_INDEXES:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gist ({keys})"))
 
 
 def init_db() -> None:
@@ -28,6 +64,10 @@ def init_db() -> None:
                         EXECUTE 'ALTER TABLE org_departments ADD COLUMN IF NOT EXISTS description VARCHAR(500)';
                     END IF;
 
+                    IF to_regclass('public.auth_users') IS NOT NULL THEN
+                        EXECUTE 'ALTER TABLE auth_users ADD COLUMN IF NOT EXISTS display_name_chosung VARCHAR(100)';
+                    END IF;
+
                     IF to_regclass('public.pap_appraisal_masters') IS NOT NULL
                        AND to_regclass('public."PAP_APPRAISAL_MASTERS"') IS NULL THEN
                         EXECUTE 'ALTER TABLE pap_appraisal_masters RENAME TO "PAP_APPRAISAL_MASTERS"';
@@ -57,6 +97,10 @@ def init_db() -> None:
             ),
         )
     SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        backfill_display_name_chosung(conn)
+        ensure_search_indexes(conn)
+        ensure_range_indexes(conn)
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -0,0 +1,267 @@
+"""SSE 용 인프로세스 pub/sub 허브와 Postgres LISTEN/NOTIFY 브리지.
+
+- 서비스는 ``publish_after_commit(session, event)`` 로 이벤트를 세션에 적어 두고,
+  트랜잭션이 커밋된 뒤에만 구독자에게 전달된다. 롤백되면 버린다.
+- Postgres 브리지가 켜져 있으면 커밋 직전에 같은 트랜잭션 안에서 ``pg_notify`` 를
+  실행한다. 알림은 커밋 시점에 모든 워커(자기 자신 포함)의 LISTEN 연결로 전달되고,
+  각 워커는 받은 이벤트를 자기 구독자에게만 뿌린다.
+- 구독 큐가 가득 차면 이벤트를 버리고 다음 읽기에서 ``resync`` 이벤트를 한 번 보낸다.
+  클라이언트는 resync 를 받으면 목록을 다시 조회한다.
+- 사용자 구독과 별개로 ``add_handler`` 로 이벤트 이름별 인프로세스 처리기를 둘 수 있다.
+  처리기가 있는 이벤트는 수신 사용자가 없어도 발행된다(캐시 무효화 전파 등).
+
+Usage example::
+
+    publish_after_commit(session, HubEvent("hri.request", {"request_id": 1}, frozenset({2, 3})))
+    session.commit()  # 여기서 사용자 2, 3 의 구독 큐로 전달된다
+
+    subscription = event_hub.subscribe(user_id)
+    event = await subscription.get(timeout=15)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "event_hub_pending"
+RESYNC_EVENT = "resync"
+
+
+@dataclass(frozen=True)
+class HubEvent:
+    event: str
+    data: dict[str, Any]
+    user_ids: frozenset[int] = field(default_factory=frozenset)
+
+    def to_payload(self) -> str:
+        return json.dumps(
+            {"event": self.event, "data": self.data, "user_ids": sorted(self.user_ids)},
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+
+    @classmethod
+    def from_payload(cls, payload: str) -> HubEvent:
+        raw = json.loads(payload)
+        return cls(event=str(raw["event"]), data=dict(raw.get("data") or {}), user_ids=frozenset(int(v) for v in raw["user_ids"]))
+
+
+def format_sse(hub_event: HubEvent) -> str:
+    """text/event-stream 한 건. 수신자 목록은 내려보내지 않는다."""
+    data = json.dumps(hub_event.data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return f"event: {hub_event.event}\ndata: {data}\n\n"
+
+
+class Subscription:
+    """한 SSE 연결의 이벤트 큐. 구독을 만든 이벤트 루프에서만 읽는다."""
+
+    def __init__(self, hub: EventHub, user_id: int, loop: asyncio.AbstractEventLoop, max_size: int) -> None:
+        self.hub = hub
+        self.user_id = user_id
+        self._loop = loop
+        self._queue: asyncio.Queue[HubEvent] = asyncio.Queue(maxsize=max(1, max_size))
+        self._overflowed = False
+
+    def _offer(self, hub_event: HubEvent) -> None:
+        try:
+            self._queue.put_nowait(hub_event)
+        except asyncio.QueueFull:
+            self._overflowed = True
+
+    def deliver(self, hub_event: HubEvent) -> None:
+        """임의 스레드에서 호출 가능. 루프가 이미 닫혔으면 조용히 버린다."""
+        try:
+            self._loop.call_soon_threadsafe(self._offer, hub_event)
+        except RuntimeError:
+            self.close()
+
+    async def get(self, timeout: float | None = None) -> HubEvent | None:
+        """다음 이벤트. timeout 안에 없으면 None(keepalive 용)."""
+        if self._overflowed:
+            self._overflowed = False
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            return HubEvent(RESYNC_EVENT, {}, frozenset({self.user_id}))
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class EventHub:
+    """사용자 id 별 구독자 집합. dispatch 는 수신 대상 사용자의 구독자에게만 전달한다."""
+
+    def __init__(self, queue_size: int = 100) -> None:
+        self._queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._handlers: dict[str, list[Callable[[HubEvent], None]]] = {}
+        # Postgres 브리지가 LISTEN 중인 채널. None 이면 커밋 후 로컬로 바로 전달한다.
+        self.notify_channel: str | None = None
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(self, user_id, asyncio.get_running_loop(), self._queue_size)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.user_id]
+
+    def add_handler(self, event_name: str, handler: Callable[[HubEvent], None]) -> None:
+        with self._lock:
+            self._handlers.setdefault(event_name, []).append(handler)
+
+    def has_handler(self, event_name: str) -> bool:
+        return event_name in self._handlers
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(items) for items in self._subscribers.values())
+
+    def dispatch(self, hub_event: HubEvent) -> None:
+        with self._lock:
+            targets = [
+                subscription
+                for user_id in hub_event.user_ids
+                for subscription in self._subscribers.get(user_id, ())
+            ]
+            handlers = list(self._handlers.get(hub_event.event, ()))
+        for subscription in targets:
+            subscription.deliver(hub_event)
+        for handler in handlers:
+            try:
+                handler(hub_event)
+            except Exception:  # noqa: BLE001
+                logger.exception("event hub handler failed: %s", hub_event.event)
+
+
+event_hub = EventHub(settings.sse_queue_size)
+
+
+def publish_after_commit(session: OrmSession, hub_event: HubEvent) -> None:
+    """현재 트랜잭션이 커밋되면 발행할 이벤트를 등록한다. 수신자도 처리기도 없으면 무시한다."""
+    if hub_event.user_ids or event_hub.has_handler(hub_event.event):
+        session.info.setdefault(_PENDING_KEY, []).append(hub_event)
+
+
+# ---------------------------------------------------------------------------
+# 세션 훅: 커밋 직전 NOTIFY(브리지 사용 시) / 커밋 후 로컬 전달 / 롤백 시 폐기
+# ---------------------------------------------------------------------------
+
+
+@event.listens_for(OrmSession, "before_commit")
+def _notify_before_commit(session: OrmSession) -> None:
+    channel = event_hub.notify_channel
+    if channel is None or not session.info.get(_PENDING_KEY):
+        return
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    for hub_event in session.info.pop(_PENDING_KEY):
+        session.execute(select(func.pg_notify(channel, hub_event.to_payload())))
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _dispatch_after_commit(session: OrmSession) -> None:
+    for hub_event in session.info.pop(_PENDING_KEY, ()):
+        event_hub.dispatch(hub_event)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _discard_on_rollback(session: OrmSession) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ---------------------------------------------------------------------------
+# Postgres LISTEN 브리지
+# ---------------------------------------------------------------------------
+
+
+class PgNotifyListener(threading.Thread):
+    """전용 autocommit 연결로 채널을 LISTEN 하며 받은 이벤트를 허브로 넘긴다.
+
+    연결이 끊기면 재접속한다. 끊긴 동안의 알림은 유실되므로 클라이언트는 SSE 재연결 시
+    목록을 다시 조회해야 한다.
+    """
+
+    def __init__(self, hub: EventHub, conninfo: str, channel: str, reconnect_sec: float = 3.0) -> None:
+        super().__init__(name="event-hub-listener", daemon=True)
+        self._hub = hub
+        self._conninfo = conninfo
+        self._channel = channel
+        self._reconnect_sec = reconnect_sec
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        import psycopg
+        from psycopg import sql
+
+        while not self._stopped.is_set():
+            try:
+                with psycopg.connect(self._conninfo, autocommit=True) as conn:
+                    conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self._channel)))
+                    while not self._stopped.is_set():
+                        for notify in conn.notifies(timeout=1.0):
+                            self._handle(notify.payload)
+            except Exception:  # noqa: BLE001
+                logger.warning("event hub listener disconnected; reconnecting", exc_info=True)
+                self._stopped.wait(self._reconnect_sec)
+
+    def _handle(self, payload: str) -> None:
+        try:
+            hub_event = HubEvent.from_payload(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("event hub ignored malformed payload")
+            return
+        self._hub.dispatch(hub_event)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+_listener: PgNotifyListener | None = None
+
+
+def start_event_bridge(engine: Engine, channel: str) -> bool:
+    """Postgres 엔진이면 LISTEN 브리지를 시작하고 True. 그 외에는 로컬 전달만 사용한다."""
+    global _listener
+    if engine.dialect.name != "postgresql" or _listener is not None:
+        return False
+    conninfo = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    _listener = PgNotifyListener(event_hub, conninfo, channel)
+    _listener.start()
+    event_hub.notify_channel = channel
+    return True
+
+
+def stop_event_bridge() -> None:
+    global _listener
+    event_hub.notify_channel = None
+    if _listener is not None:
+        _listener.stop()
+        _listener.join(timeout=5)
+        _listener = None
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import base64
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
 from math import ceil
-from typing import Sequence, TypeVar
+from typing import Any, Sequence, TypeVar
 
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
 from sqlmodel import Session, func, select
 from sqlmodel.sql.expression import SelectOfScalar
 
 T = TypeVar("T")
 
+COUNT_MODE_EXACT = "exact"
+COUNT_MODE_ESTIMATE = "estimate"
+COUNT_MODE_PATTERN = "^(exact|estimate)$"
+CURSOR_DESCRIPTION = "keyset 페이지네이션 cursor. 빈 값이면 첫 페이지"
+OPTIONAL_LIMIT_DESCRIPTION = "비우면 조건에 맞는 전체를 반환"
+
 
 def count_query(session: Session, base_stmt) -> int:
     """SELECT COUNT(*) 를 이용해 전체 건수를 반환한다.
@@ -28,6 +41,30 @@ def count_query(session: Session, base_stmt) -> int:
     return session.exec(count_stmt).one()
 
 
+def estimate_count(session: Session, base_stmt) -> int:
+    """플래너 통계(pg_class.reltuples / pg_statistic) 기반 추정 건수를 반환한다.
+
+    EXPLAIN 만 실행하므로 대형 테이블에서도 COUNT 스캔이 없다.
+    Postgres 가 아니면 정확한 COUNT 로 대체한다.
+    """
+    bind = session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return count_query(session, base_stmt)
+
+    compiled = base_stmt.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+    plan = session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return max(0, int(plan[0]["Plan"]["Plan Rows"]))
+
+
+def resolve_total_count(session: Session, base_stmt, count_mode: str = COUNT_MODE_EXACT) -> tuple[int, bool]:
+    """(전체 건수, 추정치 여부) 를 반환한다."""
+    if count_mode == COUNT_MODE_ESTIMATE:
+        return estimate_count(session, base_stmt), True
+    return count_query(session, base_stmt), False
+
+
 def calc_total_pages(total_count: int, limit: int) -> int:
     """전체 건수와 페이지 크기로 총 페이지 수를 계산한다."""
     if limit <= 0:
@@ -45,3 +82,136 @@ def paginate_items(items: Sequence[T], page: int, limit: int) -> tuple[list[T],
     start = (safe_page - 1) * limit
     end = start + limit
     return list(items[start:end]), total_count
+
+
+# ---------------------------------------------------------------------------
+# Query-level OFFSET pagination
+# ---------------------------------------------------------------------------
+# 서비스 함수가 PageParams 를 받아 LIMIT/OFFSET 과 COUNT 를 DB 에서 처리한다.
+# 응답 item 은 현재 페이지 행에 대해서만 만든다.
+
+
+@dataclass(frozen=True)
+class PageParams:
+    """OFFSET 페이지 요청. limit 이 0 이하면 전체 조회."""
+
+    page: int = 1
+    limit: int = 0
+
+    @property
+    def offset(self) -> int:
+        if self.limit <= 0:
+            return 0
+        return (max(1, self.page) - 1) * self.limit
+
+
+ALL_ROWS = PageParams()
+
+
+def fetch_page(session: Session, stmt: SelectOfScalar | Any, params: PageParams) -> tuple[list[Any], int]:
+    """where/order_by 까지 적용된 stmt 를 페이지 단위로 조회해 (rows, total_count) 를 반환한다.
+
+    마지막 페이지가 limit 보다 적게 채워지면 offset + len(rows) 가 곧 전체 건수이므로
+    COUNT 쿼리를 생략한다.
+    """
+    if params.limit <= 0:
+        rows = list(session.exec(stmt).all())
+        return rows, len(rows)
+
+    rows = list(session.exec(stmt.offset(params.offset).limit(params.limit)).all())
+    if rows and len(rows) < params.limit:
+        return rows, params.offset + len(rows)
+    if not rows and params.offset == 0:
+        return rows, 0
+    return rows, count_query(session, stmt.order_by(None))
+
+
+# ---------------------------------------------------------------------------
+# Keyset(cursor) pagination
+# ---------------------------------------------------------------------------
+# 정렬 키 값을 불투명 cursor 로 인코딩해 다음 페이지를 WHERE (정렬키) > (마지막 값) 으로 조회한다.
+# OFFSET 과 달리 깊은 페이지에서도 인덱스 범위 탐색만 하므로 비용이 일정하다.
+# 정렬 컬럼의 마지막 항목은 반드시 유일 키(id 등)여야 한다.
+
+
+@dataclass(frozen=True)
+class KeysetColumn:
+    column: Any
+    descending: bool = False
+
+    def order_clause(self):
+        return self.column.desc() if self.descending else self.column.asc()
+
+
+def _encode_value(value: Any) -> list[Any]:
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    return ["v", value]
+
+
+def _decode_value(item: list[Any]) -> Any:
+    tag, value = item
+    if tag == "dt":
+        return datetime.fromisoformat(value)
+    if tag == "d":
+        return date.fromisoformat(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """cursor 를 정렬 키 값 목록으로 되돌린다. 형식이 잘못되면 400."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        items = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        if not isinstance(items, list):
+            raise ValueError("cursor payload must be a list")
+        return [_decode_value(item) for item in items]
+    except (ValueError, TypeError, KeyError) as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 cursor 입니다.") from error
+
+
+def apply_keyset(stmt, columns: Sequence[KeysetColumn], cursor: str | None):
+    """정렬과 cursor 이후 조건을 적용한다. cursor 가 비어 있으면 첫 페이지."""
+    stmt = stmt.order_by(*[column.order_clause() for column in columns])
+    if not cursor:
+        return stmt
+
+    values = decode_cursor(cursor)
+    if len(values) != len(columns):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 cursor 입니다.")
+
+    # (a, b, c) > (va, vb, vc) 를 방향이 섞여도 동작하도록 OR 전개한다.
+    # 값이 NULL 이면 그 컬럼에서 더 나아간 행은 없다고 본다. NULL 이 될 수 있는 컬럼은
+    # 앞에 NULL 여부 키를 두어 NULL 그룹 밖의 행이 그 키에서 이어지게 한다.
+    clauses = []
+    for index, column in enumerate(columns):
+        if values[index] is None:
+            continue
+        equals = [columns[i].column == values[i] for i in range(index)]
+        beyond = column.column < values[index] if column.descending else column.column > values[index]
+        clauses.append(and_(*equals, beyond))
+    return stmt.where(or_(*clauses))
+
+
+def fetch_keyset_page(
+    session: Session,
+    stmt: SelectOfScalar | Any,
+    columns: Sequence[KeysetColumn],
+    *,
+    cursor: str | None,
+    limit: int,
+    key: Callable[[Any], Sequence[Any]],
+) -> tuple[list[Any], str | None]:
+    """limit+1 건을 읽어 다음 페이지 존재 여부를 판단하고 (rows, next_cursor) 를 반환한다."""
+    rows = list(session.exec(apply_keyset(stmt, columns, cursor).limit(limit + 1)).all())
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(key(rows[-1]))
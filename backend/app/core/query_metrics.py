@@ -0,0 +1,182 @@
+"""요청 단위 SQL 쿼리 수/DB 시간 계측.
+
+- SQLAlchemy cursor 이벤트로 현재 요청(ContextVar)의 쿼리 수, DB 시간, 반환 행 수를 누적한다.
+- QueryMetricsMiddleware 가 요청마다 집계를 시작하고, 응답에 Server-Timing 헤더를 붙인 뒤
+  라우트 템플릿 기준으로 프로세스 메트릭에 합산한다. (/metrics 에서 Prometheus 텍스트로 노출)
+- threshold 를 넘는 statement 는 slow query 로그로 남긴다.
+
+테스트에서는 capture_queries() 로 쿼리 예산을 검증할 수 있다::
+
+    with capture_queries() as stats:
+        list_employees(session)
+    assert stats.statement_count <= 3
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.sql.slow")
+
+_QUERY_START_KEY = "query_metrics_start"
+
+
+@dataclass
+class QueryStats:
+    statement_count: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+    statements: list[str] = field(default_factory=list)
+    record_statements: bool = False
+
+    def record(self, statement: str, elapsed: float, rowcount: int) -> None:
+        self.statement_count += 1
+        self.db_seconds += elapsed
+        self.rows += max(rowcount, 0)
+        if self.record_statements:
+            self.statements.append(statement)
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
+
+
+@contextmanager
+def capture_queries(*, record_statements: bool = False) -> Iterator[QueryStats]:
+    """블록 안에서 실행된 SQL 을 집계한다. (중첩 시 바깥 집계와 별개로 센다)"""
+    stats = QueryStats(record_statements=record_statements)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+    conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+    starts = conn.info.get(_QUERY_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed, getattr(cursor, "rowcount", 0) or 0)
+
+    threshold_ms = settings.slow_query_threshold_ms
+    if threshold_ms > 0 and elapsed * 1000 >= threshold_ms:
+        logger.warning("slow query %.1fms: %s", elapsed * 1000, " ".join(statement.split())[:1000])
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """엔진에 계측 이벤트를 등록한다. 여러 번 호출해도 한 번만 등록된다."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ---------------------------------------------------------------------------
+# 프로세스 메트릭 (route 템플릿 단위 누적)
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _RouteMetrics:
+    requests: int = 0
+    wall_seconds: float = 0.0
+    statements: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+
+
+_metrics_lock = Lock()
+_route_metrics: dict[tuple[str, str], _RouteMetrics] = {}
+
+
+def record_request_metrics(method: str, route: str, stats: QueryStats, wall_seconds: float) -> None:
+    with _metrics_lock:
+        metrics = _route_metrics.setdefault((method, route), _RouteMetrics())
+        metrics.requests += 1
+        metrics.wall_seconds += wall_seconds
+        metrics.statements += stats.statement_count
+        metrics.db_seconds += stats.db_seconds
+        metrics.rows += stats.rows
+
+
+def reset_request_metrics() -> None:
+    with _metrics_lock:
+        _route_metrics.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus_metrics() -> str:
+    series = (
+        ("vibe_hr_http_requests_total", "HTTP requests handled.", lambda m: m.requests),
+        ("vibe_hr_http_request_seconds_total", "Wall time spent handling requests.", lambda m: m.wall_seconds),
+        ("vibe_hr_db_statements_total", "SQL statements executed by requests.", lambda m: m.statements),
+        ("vibe_hr_db_seconds_total", "Time spent in SQL statements.", lambda m: m.db_seconds),
+        ("vibe_hr_db_rows_total", "Rows returned or affected by SQL statements.", lambda m: m.rows),
+    )
+    with _metrics_lock:
+        snapshot = sorted(_route_metrics.items())
+
+    lines: list[str] = []
+    for name, help_text, getter in series:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for (method, route), metrics in snapshot:
+            labels = f'method="{_escape_label(method)}",route="{_escape_label(route)}"'
+            lines.append(f"{name}{{{labels}}} {getter(metrics)}")
+    return "\n".join(lines) + "\n"
+
+
+def _route_template(request: Request) -> str:
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else "__unmatched__"
+
+
+class QueryMetricsMiddleware(BaseHTTPMiddleware):
+    """요청마다 쿼리 수/DB 시간/벽시계 시간을 집계해 Server-Timing 헤더로 내려준다."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:  # noqa: ANN001
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            _current_stats.reset(token)
+        wall_seconds = time.perf_counter() - started
+
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.statement_count} queries", '
+            f"app;dur={wall_seconds * 1000:.1f}"
+        )
+        response.headers["X-Query-Count"] = str(stats.statement_count)
+        record_request_metrics(request.method, _route_template(request), stats, wall_seconds)
+        return response
@@ -0,0 +1,115 @@
+"""목록 검색 공용 헬퍼 (부분 일치 + 유사도 정렬 + 초성 검색).
+
+- 부분 일치는 ``ILIKE '%term%'`` 그대로 쓰되, Postgres 에서는 init_db 가 만드는
+  pg_trgm GIN 인덱스(SEARCH_TRGM_INDEXES)가 받쳐 주어 순차 스캔 없이 찾는다.
+- 정렬은 Postgres 에서 ``similarity()`` 로, 그 밖의 방언에서는 일치/접두/부분 순으로 매긴다.
+- 검색어에 한글 자모(ㄱ~ㅎ)가 섞이면 초성 검색으로 본다. 이름의 초성은
+  ``auth_users.display_name_chosung`` 에 미리 계산해 두고 같은 방식으로 비교한다.
+
+Usage example::
+
+    stmt = stmt.where(contains(AuthUser.display_name, name, chosung_column=AuthUser.display_name_chosung))
+    stmt = stmt.order_by(similarity_rank(session, AuthUser.display_name, name).desc())
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import case, func, literal, text
+from sqlalchemy.engine import Connection
+from sqlmodel import Session
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNGSEONG_JONGSEONG = 21 * 28
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSUNG_SET = frozenset(_CHOSUNG)
+
+# (인덱스 이름, 테이블, 컬럼). init_db 가 Postgres 에서 gin_trgm_ops 인덱스로 만든다.
+SEARCH_TRGM_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("ix_hr_employees_employee_no_trgm", "hr_employees", "employee_no"),
+    ("ix_auth_users_display_name_trgm", "auth_users", "display_name"),
+    ("ix_auth_users_display_name_chosung_trgm", "auth_users", "display_name_chosung"),
+    ("ix_org_departments_name_trgm", "org_departments", "name"),
+    ("ix_org_departments_code_trgm", "org_departments", "code"),
+)
+
+
+def to_chosung(value: str | None) -> str | None:
+    """한글 음절은 초성으로 바꾸고 공백은 없애며 나머지 문자는 소문자로 둔다. '홍 길동' → 'ㅎㄱㄷ'."""
+    if value is None:
+        return None
+    chars: list[str] = []
+    for char in value:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            chars.append(_CHOSUNG[(code - _HANGUL_BASE) // _JUNGSEONG_JONGSEONG])
+        elif not char.isspace():
+            chars.append(char.lower())
+    return "".join(chars)
+
+
+def is_chosung_query(term: str) -> bool:
+    return any(char in _CHOSUNG_SET for char in term)
+
+
+def normalize_term(term: str | None) -> str | None:
+    if term is None:
+        return None
+    stripped = term.strip()
+    return stripped or None
+
+
+def contains(column: Any, term: str, *, chosung_column: Any = None):
+    """부분 일치 조건. 초성 검색어이고 chosung_column 이 있으면 초성 컬럼과 비교한다."""
+    if chosung_column is not None and is_chosung_query(term):
+        return chosung_column.contains(to_chosung(term), autoescape=True)
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+
+def similarity_rank(session: Session, column: Any, term: str, *, chosung_column: Any = None):
+    """높을수록 검색어에 가까운 정렬용 점수(0~1)."""
+    if chosung_column is not None and is_chosung_query(term):
+        column, term = chosung_column, to_chosung(term)
+    if session.get_bind().dialect.name == "postgresql":
+        return func.similarity(column, term)
+    lowered = func.lower(column)
+    needle = term.lower()
+    return case(
+        (lowered == needle, literal(1.0)),
+        (lowered.startswith(needle, autoescape=True), literal(0.5)),
+        else_=literal(0.1),
+    )
+
+
+def ensure_search_indexes(connection: Connection) -> None:
+    """pg_trgm 확장과 GIN 인덱스를 만든다. Postgres 가 아니면 아무것도 하지 않는다."""
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for index_name, table, column in SEARCH_TRGM_INDEXES:
+        connection.execute(
+            text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gin ({column} gin_trgm_ops)")
+        )
+
+
+def backfill_display_name_chosung(connection: Connection, *, batch_size: int = 1000) -> int:
+    """display_name_chosung 이 비어 있는 사용자 행을 채운다. 컬럼 추가 직후 1회 필요."""
+    updated = 0
+    while True:
+        rows = connection.execute(
+            text(
+                "SELECT id, display_name FROM auth_users "
+                "WHERE display_name_chosung IS NULL ORDER BY id LIMIT :limit"
+            ),
+            {"limit": batch_size},
+        ).all()
+        if not rows:
+            return updated
+        connection.execute(
+            text("UPDATE auth_users SET display_name_chosung = :chosung WHERE id = :id"),
+            [{"id": row.id, "chosung": to_chosung(row.display_name) or ""} for row in rows],
+        )
+        updated += len(rows)
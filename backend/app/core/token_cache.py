@@ -0,0 +1,185 @@
+"""액세스 토큰 검증 캐시와 폐기(revocation) 목록.
+
+- TokenPayloadCache: 서명/issuer/필수 claim 검증을 통과한 payload 를 토큰 해시 기준으로
+  보관하는 LRU. exp 가 지난 항목은 조회 시 버린다.
+- TokenRevocationList: auth_revoked_tokens 테이블을 블룸 필터로 메모리에 올려두고,
+  필터에 걸린 jti 만 DB 로 확인한다. 다른 워커에서 폐기한 토큰은 refresh 주기마다
+  revoked_at 워터마크 이후 행만 읽어 반영한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+
+from sqlmodel import Session, select
+
+from app.models import AuthRevokedToken
+
+
+def token_digest(token: str) -> str:
+    """토큰 원문 대신 캐시 키로 사용할 SHA-256 해시."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenPayloadCache:
+    """검증된 토큰 payload 의 bounded LRU."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max(0, max_size)
+        self._items: OrderedDict[str, dict] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, token: str, now: float | None = None) -> dict | None:
+        if self._max_size == 0:
+            return None
+        key = token_digest(token)
+        current = time.time() if now is None else now
+        with self._lock:
+            payload = self._items.get(key)
+            if payload is None:
+                return None
+            if int(payload.get("exp", 0)) <= current:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return dict(payload)
+
+    def put(self, token: str, payload: dict) -> None:
+        if self._max_size == 0:
+            return
+        key = token_digest(token)
+        with self._lock:
+            self._items[key] = dict(payload)
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            self._items.pop(token_digest(token), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class BloomFilter:
+    """고정 크기 블룸 필터. 거짓 양성은 있지만 거짓 음성은 없다."""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001) -> None:
+        self.capacity = max(1, capacity)
+        bit_count = math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._bit_count = max(8, bit_count)
+        self._hash_count = max(1, round(self._bit_count / self.capacity * math.log(2)))
+        self._bits = bytearray((self._bit_count + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str) -> list[int]:
+        digest = hashlib.sha256(value.encode("utf-8")).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        return [(h1 + i * h2) % self._bit_count for i in range(self._hash_count)]
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class TokenRevocationList:
+    """auth_revoked_tokens 기반 토큰 폐기 목록."""
+
+    def __init__(self, refresh_sec: int = 5, capacity: int = 100_000) -> None:
+        self._refresh_sec = max(0, refresh_sec)
+        self._capacity = capacity
+        self._bloom = BloomFilter(capacity)
+        self._watermark: datetime | None = None
+        self._loaded_at = 0.0
+        self._lock = Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bloom = BloomFilter(self._capacity)
+            self._watermark = None
+            self._loaded_at = 0.0
+
+    def refresh(self, session: Session, *, force: bool = False) -> None:
+        """워터마크 이후 폐기된 jti 를 필터에 반영한다."""
+        now_mono = time.monotonic()
+        if not force and self._watermark is not None and now_mono - self._loaded_at < self._refresh_sec:
+            return
+
+        with self._lock:
+            now = datetime.now(timezone.utc)
+            stmt = select(AuthRevokedToken.jti, AuthRevokedToken.revoked_at).where(
+                AuthRevokedToken.expires_at > now
+            )
+            if self._watermark is not None:
+                # 커밋 순서와 워커 간 시계 차이를 흡수하도록 refresh 주기만큼 겹쳐 읽는다.
+                overlap = timedelta(seconds=max(self._refresh_sec, 1))
+                stmt = stmt.where(AuthRevokedToken.revoked_at >= self._watermark - overlap)
+            rows = session.exec(stmt).all()
+
+            if self._bloom.count + len(rows) > self._capacity:
+                # 만료되지 않은 jti 로 다시 채우고, 곧바로 다시 넘치지 않도록 늘린 크기를 기억한다.
+                rows = session.exec(
+                    select(AuthRevokedToken.jti, AuthRevokedToken.revoked_at).where(
+                        AuthRevokedToken.expires_at > now
+                    )
+                ).all()
+                self._capacity = max(self._capacity, len(rows) * 2)
+                self._bloom = BloomFilter(self._capacity)
+
+            watermark = self._watermark
+            for jti, revoked_at in rows:
+                self._bloom.add(jti)
+                revoked_at = _as_utc(revoked_at)
+                if watermark is None or revoked_at > watermark:
+                    watermark = revoked_at
+            self._watermark = watermark or now
+            self._loaded_at = now_mono
+
+    def is_revoked(self, session: Session, jti: str) -> bool:
+        self.refresh(session)
+        if jti not in self._bloom:
+            return False
+        return session.get(AuthRevokedToken, jti) is not None
+
+    def revoke(
+        self,
+        session: Session,
+        *,
+        jti: str,
+        user_id: int,
+        expires_at: datetime,
+        reason: str = "logout",
+    ) -> None:
+        if session.get(AuthRevokedToken, jti) is None:
+            session.add(
+                AuthRevokedToken(
+                    jti=jti,
+                    user_id=user_id,
+                    reason=reason,
+                    expires_at=expires_at,
+                )
+            )
+            session.commit()
+        with self._lock:
+            self._bloom.add(jti)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
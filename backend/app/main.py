@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from sqlmodel import Session
 
 from app.api.auth import router as auth_router
@@ -37,19 +38,26 @@ from app.api.mng_infra import router as mng_infra_router
 from app.api.welfare import router as welfare_router
 from app.api.tra import router as tra_router
 from app.api.system_setting import router as system_setting_router
-from app.bootstrap import seed_initial_data
+from app.bootstrap import ensure_read_models, seed_initial_data
 from app.core.config import settings
 from app.core.database import engine, init_db
+from app.core.event_hub import start_event_bridge, stop_event_bridge
+from app.core.query_metrics import QueryMetricsMiddleware, render_prometheus_metrics
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     settings.validate_security_settings()
     init_db()
+    with Session(engine) as session:
+        ensure_read_models(session)
     if settings.auto_seed_on_start:
         with Session(engine) as session:
             seed_initial_data(session)
+    if settings.event_bridge_enabled:
+        start_event_bridge(engine, settings.event_notify_channel)
     yield
+    stop_event_bridge()
 
 
 app = FastAPI(
@@ -66,6 +74,9 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type", "Accept"],
 )
 
+if settings.query_metrics_enabled:
+    app.add_middleware(QueryMetricsMiddleware)
+
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(dashboard_router, prefix="/api/v1")
 app.include_router(employee_router, prefix="/api/v1")
@@ -106,3 +117,7 @@ app.include_router(system_setting_router, prefix="/api/v1")
 def health() -> dict[str, str]:
     return {"status": "ok"}
 
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_prometheus_metrics(), media_type="text/plain; version=0.0.4")
@@ -7,11 +7,15 @@ from app.models.entities import (
     AppRoleMenuAction,
     AppSystemSetting,
     AppSystemSettingHistory,
+    AppSequenceCounter,
+    AuthRevokedToken,
     AuthRole,
     AuthUser,
     AuthUserRole,
     OrgCorporation,
     OrgDeptChangeHistory,
+    OrgDepartmentClosure,
+    OrgDepartmentStateHistory,
     OrgRestructurePlan,
     OrgRestructurePlanItem,
     HrAttendanceDaily,
@@ -26,6 +30,7 @@ from app.models.entities import (
     HrAppointmentOrder,
     HrAppointmentOrderItem,
     HrPersonnelHistory,
+    HrEmployeeStateHistory,
     HrRetireChecklistItem,
     HrRetireCase,
     HrRetireCaseItem,
@@ -64,6 +69,7 @@ from app.models.entities import (
     HriApprovalActorRule,
     HriRequestMaster,
     HriRequestStepSnapshot,
+    HriApprovalInbox,
     HriRequestHistory,
     HriRequestAttachment,
     HriRequestCounter,
@@ -110,11 +116,15 @@ __all__ = [
     "AppRoleMenuAction",
     "AppSystemSetting",
     "AppSystemSettingHistory",
+    "AppSequenceCounter",
+    "AuthRevokedToken",
     "AuthRole",
     "AuthUser",
     "AuthUserRole",
     "OrgCorporation",
     "OrgDeptChangeHistory",
+    "OrgDepartmentClosure",
+    "OrgDepartmentStateHistory",
     "OrgDepartment",
     "OrgRestructurePlan",
     "OrgRestructurePlanItem",
@@ -129,6 +139,7 @@ __all__ = [
     "HrAppointmentOrder",
     "HrAppointmentOrderItem",
     "HrPersonnelHistory",
+    "HrEmployeeStateHistory",
     "HrRetireChecklistItem",
     "HrRetireCase",
     "HrRetireCaseItem",
@@ -167,6 +178,7 @@ __all__ = [
     "HriApprovalActorRule",
     "HriRequestMaster",
     "HriRequestStepSnapshot",
+    "HriApprovalInbox",
     "HriRequestHistory",
     "HriRequestAttachment",
     "HriRequestCounter",
@@ -3,9 +3,11 @@ from __future__ import annotations
 from datetime import date, datetime, timezone
 from typing import Optional
 
-from sqlalchemy import JSON, CheckConstraint, Column, Index, UniqueConstraint
+from sqlalchemy import JSON, CheckConstraint, Column, Index, UniqueConstraint, event
 from sqlmodel import Field, SQLModel
 
+from app.core.search import to_chosung
+
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -19,12 +21,24 @@ class AuthUser(SQLModel, table=True):
     email: str = Field(index=True, unique=True, max_length=320)
     password_hash: str
     display_name: str = Field(max_length=100)
+    # 초성 검색용 표시명 정규화 값 (app.core.search.to_chosung). 직접 쓰지 않는다.
+    display_name_chosung: Optional[str] = Field(
+        default=None,
+        max_length=100,
+        sa_column_kwargs={"default": lambda context: to_chosung(context.get_current_parameters().get("display_name"))},
+    )
     is_active: bool = Field(default=True)
     last_login_at: Optional[datetime] = None
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime = Field(default_factory=utc_now)
 
 
+@event.listens_for(AuthUser, "before_insert")
+@event.listens_for(AuthUser, "before_update")
+def _sync_display_name_chosung(_mapper, _connection, target: AuthUser) -> None:
+    target.display_name_chosung = to_chosung(target.display_name)
+
+
 class AuthRole(SQLModel, table=True):
     __tablename__ = "auth_roles"
 
@@ -42,6 +56,21 @@ class AuthUserRole(SQLModel, table=True):
     assigned_at: datetime = Field(default_factory=utc_now)
 
 
+class AuthRevokedToken(SQLModel, table=True):
+    """로그아웃/전환 종료로 무효화된 액세스 토큰(jti) 목록."""
+
+    __tablename__ = "auth_revoked_tokens"
+    __table_args__ = (
+        Index("ix_auth_revoked_tokens_revoked_at", "revoked_at"),
+    )
+
+    jti: str = Field(primary_key=True, max_length=64)
+    user_id: int = Field(foreign_key="auth_users.id", index=True)
+    reason: str = Field(default="logout", max_length=30)
+    expires_at: datetime
+    revoked_at: datetime = Field(default_factory=utc_now)
+
+
 class OrgDepartment(SQLModel, table=True):
     __tablename__ = "org_departments"
 
@@ -96,6 +125,38 @@ class OrgDeptChangeHistory(SQLModel, table=True):
     changed_at: datetime = Field(default_factory=utc_now, index=True)
 
 
+class OrgDepartmentClosure(SQLModel, table=True):
+    """부서 계층 closure. 자기 자신(depth 0)을 포함한 모든 조상-자손 쌍을 한 행씩 둔다."""
+
+    __tablename__ = "org_department_closures"
+    __table_args__ = (Index("ix_org_department_closures_descendant_depth", "descendant_id", "depth"),)
+
+    ancestor_id: int = Field(foreign_key="org_departments.id", primary_key=True)
+    descendant_id: int = Field(foreign_key="org_departments.id", primary_key=True)
+    depth: int = Field(default=0)
+
+
+class OrgDepartmentStateHistory(SQLModel, table=True):
+    """부서 시점 상태 (org_dept_change_histories 에서 파생). 구간은 [valid_from, valid_to), valid_to 가 NULL 이면 현재."""
+
+    __tablename__ = "org_department_state_histories"
+    __table_args__ = (
+        Index("ix_org_department_state_histories_dept_valid", "department_id", "valid_from"),
+        Index("ix_org_department_state_histories_valid", "valid_from", "valid_to"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # 부서를 삭제하면 커밋 시 구간을 다시 만들면서 그 부서의 구간도 함께 지운다.
+    # 부서 행이 먼저 삭제된 뒤에 구간을 정리하므로 외래키를 두지 않는다.
+    department_id: int
+    code: str = Field(max_length=30)
+    name: str = Field(max_length=100)
+    parent_id: Optional[int] = None
+    is_active: bool = Field(default=True)
+    valid_from: date
+    valid_to: Optional[date] = None
+
+
 class OrgRestructurePlan(SQLModel, table=True):
     """조직개편안 헤더 (A안: 초안→검토→적용)."""
 
@@ -329,6 +390,16 @@ class AppSystemSettingHistory(SQLModel, table=True):
     changed_at: datetime = Field(default_factory=utc_now)
 
 
+class AppSequenceCounter(SQLModel, table=True):
+    """Shared document-number sequence. One row per counter key."""
+
+    __tablename__ = "app_sequence_counters"
+
+    counter_key: str = Field(primary_key=True, max_length=80)
+    last_seq: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+
 class HrEmployeeBasicProfile(SQLModel, table=True):
     __tablename__ = "hr_employee_basic_profiles"
     __table_args__ = (UniqueConstraint("employee_id", name="uq_hr_employee_basic_profiles_employee_id"),)
@@ -610,6 +681,25 @@ class HrPersonnelHistory(SQLModel, table=True):
     created_at: datetime = Field(default_factory=utc_now)
 
 
+class HrEmployeeStateHistory(SQLModel, table=True):
+    """사원 시점 상태 (hr_personnel_histories 에서 파생). 구간은 [valid_from, valid_to), valid_to 가 NULL 이면 현재."""
+
+    __tablename__ = "hr_employee_state_histories"
+    __table_args__ = (
+        Index("ix_hr_employee_state_histories_employee_valid", "employee_id", "valid_from"),
+        Index("ix_hr_employee_state_histories_department_valid", "department_id", "valid_from"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # 파생 데이터라 외래키를 두지 않는다. 쓰기 시 사원 단위로 다시 만든다.
+    employee_id: int
+    department_id: Optional[int] = None
+    position_title: Optional[str] = Field(default=None, max_length=80)
+    employment_status: Optional[str] = Field(default=None, max_length=20)
+    valid_from: date
+    valid_to: Optional[date] = None
+
+
 class HrRetireChecklistItem(SQLModel, table=True):
     __tablename__ = "hr_retire_checklist_items"
     __table_args__ = (
@@ -1453,6 +1543,53 @@ class HriRequestStepSnapshot(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=utc_now)
 
 
+class HriApprovalInbox(SQLModel, table=True):
+    """Denormalized per-actor task inbox for waiting approval/receive steps."""
+
+    __tablename__ = "hri_approval_inbox"
+    __table_args__ = (
+        UniqueConstraint(
+            "actor_user_id",
+            "request_id",
+            "step_order",
+            name="uq_hri_approval_inbox_actor_request_step",
+        ),
+        CheckConstraint(
+            "step_type IN ('APPROVAL', 'RECEIVE')",
+            name="ck_hri_approval_inbox_step_type",
+        ),
+        Index(
+            "ix_hri_approval_inbox_actor_type_requested",
+            "actor_user_id",
+            "step_type",
+            "requested_at",
+            "request_id",
+            "step_order",
+        ),
+        Index(
+            "ix_hri_approval_inbox_actor_type_read",
+            "actor_user_id",
+            "step_type",
+            "is_read",
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    actor_user_id: int = Field(foreign_key="auth_users.id")
+    request_id: int = Field(foreign_key="hri_request_masters.id", index=True)
+    step_order: int
+    step_type: str = Field(max_length=20)
+    form_type_id: int = Field(foreign_key="hri_form_types.id")
+    form_name: Optional[str] = Field(default=None, max_length=100)
+    request_no: str = Field(max_length=40)
+    title: str = Field(max_length=200)
+    requester_id: int = Field(foreign_key="auth_users.id")
+    requested_at: datetime
+    status_code: str = Field(max_length=30)
+    is_read: bool = Field(default=False)
+    created_at: datetime = Field(default_factory=utc_now)
+
+
 class HriRequestHistory(SQLModel, table=True):
     """Request lifecycle audit trail."""
 
@@ -1492,7 +1629,7 @@ class HriRequestAttachment(SQLModel, table=True):
 
 
 class HriRequestCounter(SQLModel, table=True):
-    """Monthly sequence allocator for request number."""
+    """Legacy monthly request-number counter. Read once to seed AppSequenceCounter."""
 
     __tablename__ = "hri_request_counters"
 
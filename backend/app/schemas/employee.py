@@ -35,6 +35,21 @@ class EmployeeListResponse(BaseModel):
     total_count: int
     page: int | None = None
     limit: int | None = None
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
+
+
+class EmployeeSearchItem(BaseModel):
+    id: int
+    employee_no: str
+    display_name: str
+    department_name: str
+    position_title: str
+    employment_status: str
+
+
+class EmployeeSearchResponse(BaseModel):
+    items: list[EmployeeSearchItem]
 
 
 class EmployeeDetailResponse(BaseModel):
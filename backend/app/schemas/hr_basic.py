@@ -104,3 +104,6 @@ class HrAdminRecordItem(BaseModel):
 
 class HrAdminRecordListResponse(BaseModel):
     items: list[HrAdminRecordItem]
+    total_count: int = 0
+    limit: int | None = None
+    next_cursor: str | None = None
@@ -97,6 +97,8 @@ class HrRecruitIfSyncRequest(BaseModel):
 class HrRecruitIfSyncResponse(BaseModel):
     inserted_count: int
     updated_count: int
+    chunk_count: int = 0
+    elapsed_ms: float = 0.0
 
 
 class HrRecruitGenerateEmployeeNoRequest(BaseModel):
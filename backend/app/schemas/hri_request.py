@@ -40,13 +40,21 @@ class HriTaskItem(BaseModel):
     requester_id: int
     requested_at: datetime
     form_name: str | None = None
+    is_read: bool = False
 
 
 class HriTaskListResponse(BaseModel):
     items: list[HriTaskItem]
     total_count: int
-    page: int
+    page: int | None = None
     limit: int
+    next_cursor: str | None = None
+
+
+class HriTaskUnreadCountResponse(BaseModel):
+    approval_count: int
+    receive_count: int
+    total_count: int
 
 
 class HriRequestDraftUpsertRequest(BaseModel):
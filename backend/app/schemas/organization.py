@@ -15,11 +15,32 @@ class OrganizationDepartmentItem(BaseModel):
     cost_center_code: str | None = None
     description: str | None = None
     employee_count: int = 0
+    # 하위 조직 포함 인원
+    subtree_employee_count: int = 0
     is_active: bool
     created_at: datetime
     updated_at: datetime
 
 
+class OrganizationDepartmentTreeNode(BaseModel):
+    id: int
+    code: str
+    name: str
+    parent_id: int | None
+    depth: int
+    path: list[int]
+    path_name: str
+    is_active: bool
+    employee_count: int = 0
+    subtree_employee_count: int = 0
+
+
+class OrganizationDepartmentTreeResponse(BaseModel):
+    version: str
+    items: list[OrganizationDepartmentTreeNode]
+    total_count: int
+
+
 class OrganizationDepartmentListResponse(BaseModel):
     departments: list[OrganizationDepartmentItem]
     total_count: int
@@ -28,6 +49,20 @@ class OrganizationDepartmentListResponse(BaseModel):
     limit: int | None = None
 
 
+class OrganizationHeadcountItem(BaseModel):
+    department_id: int
+    code: str | None = None
+    name: str | None = None
+    parent_id: int | None = None
+    headcount: int
+
+
+class OrganizationHeadcountResponse(BaseModel):
+    as_of: date
+    items: list[OrganizationHeadcountItem]
+    total_headcount: int
+
+
 class OrganizationDepartmentDetailResponse(BaseModel):
     department: OrganizationDepartmentItem
 
@@ -121,6 +156,7 @@ class OrgDeptChangeHistoryItem(BaseModel):
 class OrgDeptChangeHistoryListResponse(BaseModel):
     items: list[OrgDeptChangeHistoryItem]
     total_count: int
+    next_cursor: str | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -216,3 +252,25 @@ class OrgRestructureApplyResponse(BaseModel):
     applied_count: int
     skipped_count: int
     messages: list[str] = []
+
+
+class OrgRestructureDryRunDepartment(BaseModel):
+    id: int | None = None  # None 이면 적용 시 새로 만들어질 부서
+    code: str
+    name: str
+    parent_id: int | None = None
+    parent_code: str | None = None
+    depth: int = 0
+    is_active: bool
+    changed_fields: list[str] = []
+
+
+class OrgRestructureDryRunConflict(BaseModel):
+    item_id: int
+    action_type: str
+    detail: str
+
+
+class OrgRestructureDryRunResponse(OrgRestructureApplyResponse):
+    conflicts: list[OrgRestructureDryRunConflict] = []
+    departments: list[OrgRestructureDryRunDepartment] = []
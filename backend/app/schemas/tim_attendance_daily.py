@@ -34,6 +34,8 @@ class TimAttendanceDailyListResponse(BaseModel):
     page: int
     limit: int
     total_pages: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 
 class TimAttendanceTodayResponse(BaseModel):
@@ -63,8 +63,10 @@ class TimLeaveRequestItem(BaseModel):
 class TimLeaveRequestListResponse(BaseModel):
     items: list[TimLeaveRequestItem]
     total_count: int
-    page: int
+    page: int | None = None
     limit: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 
 class TimLeaveRequestCreateRequest(BaseModel):
@@ -9,6 +9,8 @@ from pydantic import BaseModel, ConfigDict, Field
 class TraResourceListResponse(BaseModel):
     items: list[dict[str, Any]]
     total_count: int
+    limit: int | None = None
+    next_cursor: str | None = None
 
 
 class TraBatchRowInput(BaseModel):
@@ -30,11 +32,15 @@ class TraResourceBatchResponse(BaseModel):
 
 class TraGenerateRequiredEventsRequest(BaseModel):
     year: int = Field(ge=2000, le=2100)
+    job_code: str | None = Field(default=None, max_length=30)
+    edu_level: str | None = Field(default=None, max_length=30)
 
 
 class TraGenerateRequiredTargetsRequest(BaseModel):
     year: int = Field(ge=2000, le=2100)
     rule_code: str | None = Field(default=None, max_length=30)
+    job_code: str | None = Field(default=None, max_length=30)
+    edu_level: str | None = Field(default=None, max_length=30)
 
 
 class TraGenerateElearningWindowsRequest(BaseModel):
@@ -44,6 +50,8 @@ class TraGenerateElearningWindowsRequest(BaseModel):
 
 class TraApplyCyberResultsRequest(BaseModel):
     upload_ym: str | None = Field(default=None, pattern=r"^\d{6}$")
+    chunk_size: int = Field(default=1000, ge=1, le=5000)
+    max_chunks: int | None = Field(default=None, ge=1)
 
 
 class TraGenerationResponse(BaseModel):
@@ -51,6 +59,12 @@ class TraGenerationResponse(BaseModel):
     message: str
 
 
+class TraCyberApplyResponse(TraGenerationResponse):
+    chunk_count: int = 0
+    last_upload_id: int | None = None
+    has_more: bool = False
+
+
 # ─── Write-flow schemas ───────────────────────────────────────────────────────
 
 
@@ -13,6 +13,7 @@ from app.schemas.auth import (
     LoginUser,
     SocialExchangeRequest,
 )
+from app.services.employee_service_shared import generate_employee_no
 from app.services.system_setting_service import get_auth_session_policy
 
 
@@ -191,19 +192,9 @@ def social_exchange_login(session: Session, payload: SocialExchangeRequest) -> L
         if department is None:
             raise ValueError("활성 부서를 찾을 수 없습니다.")
 
-        employee_no = None
-        for seq in range(1, 999999):
-            candidate = f"EMP-{seq:06d}"
-            exists = session.exec(select(HrEmployee.id).where(HrEmployee.employee_no == candidate)).first()
-            if exists is None:
-                employee_no = candidate
-                break
-        if employee_no is None:
-            raise ValueError("사번을 생성할 수 없습니다.")
-
         employee = HrEmployee(
             user_id=user.id,
-            employee_no=employee_no,
+            employee_no=generate_employee_no(session),
             department_id=department.id,
             position_title="사원",
             hire_date=business_today(),
@@ -18,6 +18,7 @@ from app.models import (
     HrEmployee,
     HrEmployeeBasicProfile,
     HrEmployeeInfoRecord,
+    HrEmployeeStateHistory,
     HrLeaveRequest,
     HrPersonnelHistory,
     OrgDepartment,
@@ -31,6 +32,31 @@ from app.services.employee_service_shared import (
 )
 
 
+# 발령 없이 직접 수정해도 시점 상태(org_state_history_service)가 이어지도록 인사이력을 남기는 필드.
+_DIRECT_EDIT_HISTORY_FIELDS = ("department_id", "position_title", "employment_status")
+
+
+def _add_direct_edit_histories(session: Session, employee: HrEmployee, before_state: dict[str, object]) -> None:
+    for field_name, before_value in before_state.items():
+        after_value = getattr(employee, field_name)
+        if after_value == before_value:
+            continue
+        session.add(
+            HrPersonnelHistory(
+                employee_id=employee.id or 0,
+                history_type="직접수정",
+                source_table="hr_employees",
+                source_id=employee.id or 0,
+                effective_date=business_today(),
+                field_name=field_name,
+                before_value=None if before_value is None else str(before_value),
+                after_value=None if after_value is None else str(after_value),
+                description="사원정보 직접 수정",
+                created_at=utc_now(),
+            )
+        )
+
+
 def create_employee(session: Session, payload: EmployeeCreateRequest) -> EmployeeItem:
     item = create_employee_no_commit(session, payload)
     session.commit()
@@ -117,6 +143,8 @@ def update_employee_no_commit(session: Session, employee_id: int, payload: Emplo
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee user not found.")
 
+    before_state = {field_name: getattr(employee, field_name) for field_name in _DIRECT_EDIT_HISTORY_FIELDS}
+
     if payload.department_id is not None:
         department = session.get(OrgDepartment, payload.department_id)
         if department is None:
@@ -152,6 +180,7 @@ def update_employee_no_commit(session: Session, employee_id: int, payload: Emplo
 
     session.add(user)
     session.add(employee)
+    _add_direct_edit_histories(session, employee, before_state)
     session.flush()
 
     department = session.get(OrgDepartment, employee.department_id)
@@ -198,6 +227,7 @@ def delete_employees_no_commit(session: Session, employee_ids: list[int]) -> int
     session.exec(sa_delete(HrAnnualLeave).where(HrAnnualLeave.employee_id.in_(target_ids)))
     session.exec(sa_delete(HrAttendanceDaily).where(HrAttendanceDaily.employee_id.in_(target_ids)))
     session.exec(sa_delete(HrPersonnelHistory).where(HrPersonnelHistory.employee_id.in_(target_ids)))
+    session.exec(sa_delete(HrEmployeeStateHistory).where(HrEmployeeStateHistory.employee_id.in_(target_ids)))
     session.exec(sa_delete(HrEmployeeInfoRecord).where(HrEmployeeInfoRecord.employee_id.in_(target_ids)))
     session.exec(sa_delete(HrEmployeeBasicProfile).where(HrEmployeeBasicProfile.employee_id.in_(target_ids)))
     session.exec(sa_delete(HrAppointmentOrderItem).where(HrAppointmentOrderItem.employee_id.in_(target_ids)))
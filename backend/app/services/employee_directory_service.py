@@ -0,0 +1,373 @@
+"""프로세스 로컬 사원 디렉터리 (사번/표시명/부서명 조회용).
+
+목록 API 대부분이 사번·이름·부서명만 얻으려고 HrEmployee → AuthUser → OrgDepartment 를
+조인한다. 이 값들을 사원 id / 사용자 id / 사번으로 찾을 수 있게 메모리에 두고,
+목록 쿼리는 본 테이블만 읽은 뒤 페이지의 사원 id 로 여기서 채운다.
+
+- 처음 조회할 때 한 번에 적재한다.
+- 이 프로세스의 쓰기는 flush 시 세션에 id 를 표시해 두었다가 커밋 후 해당 항목만 다시 읽는다.
+- 다른 워커의 쓰기는 커밋 시 이벤트 허브(Postgres NOTIFY)로 받은 id 를 같은 방식으로 처리한다.
+- 알림을 놓친 쓰기(스크립트, 직접 SQL)는 ``employee_directory_refresh_sec`` 마다
+  updated_at 워터마크 이후 행을 다시 읽어 반영한다. 없는 id 는 조회 시 DB 에서 채운다.
+
+Usage example::
+
+    entries = lookup_employees(session, [row.employee_id for row in rows])
+    entry = entries.get(row.employee_id)
+    employee_no, employee_name = entry.employee_no, entry.display_name
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import event, or_
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.event_hub import HubEvent, event_hub, publish_after_commit
+from app.models import AuthUser, HrEmployee, OrgDepartment
+
+_SESSION_DIRTY_KEY = "employee_directory_dirty"
+_TRACKED_TABLES = frozenset(model.__tablename__ for model in (HrEmployee, AuthUser, OrgDepartment))
+CHANGE_EVENT = "employee_directory.changed"
+# NOTIFY 페이로드(8000 바이트) 안에 들어가도록 id 가 많으면 전체 재적재로 알린다.
+_MAX_NOTIFY_IDS = 300
+
+
+@dataclass(frozen=True, slots=True)
+class EmployeeEntry:
+    id: int
+    user_id: int
+    employee_no: str
+    display_name: str
+    department_id: int
+    department_name: str
+    position_title: str
+    employment_status: str
+
+
+@dataclass
+class _Changes:
+    employee_ids: set[int] = field(default_factory=set)
+    user_ids: set[int] = field(default_factory=set)
+    department_ids: set[int] = field(default_factory=set)
+    everything: bool = False
+
+    def __bool__(self) -> bool:
+        return self.everything or bool(self.employee_ids or self.user_ids or self.department_ids)
+
+    def merge(self, other: _Changes) -> None:
+        self.employee_ids |= other.employee_ids
+        self.user_ids |= other.user_ids
+        self.department_ids |= other.department_ids
+        self.everything = self.everything or other.everything
+
+    def to_event_data(self) -> dict[str, object]:
+        if self.everything or len(self.employee_ids) + len(self.user_ids) + len(self.department_ids) > _MAX_NOTIFY_IDS:
+            return {"everything": True}
+        return {
+            "employee_ids": sorted(self.employee_ids),
+            "user_ids": sorted(self.user_ids),
+            "department_ids": sorted(self.department_ids),
+        }
+
+    @classmethod
+    def from_event_data(cls, data: dict[str, object]) -> _Changes:
+        return cls(
+            employee_ids={int(value) for value in data.get("employee_ids") or ()},
+            user_ids={int(value) for value in data.get("user_ids") or ()},
+            department_ids={int(value) for value in data.get("department_ids") or ()},
+            everything=bool(data.get("everything")),
+        )
+
+
+def _entry_statement():
+    return (
+        select(
+            HrEmployee.id,
+            HrEmployee.user_id,
+            HrEmployee.employee_no,
+            AuthUser.display_name,
+            HrEmployee.department_id,
+            OrgDepartment.name,
+            HrEmployee.position_title,
+            HrEmployee.employment_status,
+            HrEmployee.updated_at,
+            AuthUser.updated_at,
+            OrgDepartment.updated_at,
+        )
+        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
+        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
+    )
+
+
+def _read_entries(session: Session, statement) -> tuple[list[EmployeeEntry], datetime | None]:
+    entries: list[EmployeeEntry] = []
+    watermark: datetime | None = None
+    for row in session.exec(statement):
+        entries.append(EmployeeEntry(*row[:8]))
+        for updated_at in row[8:]:
+            if updated_at is not None and (watermark is None or updated_at > watermark):
+                watermark = updated_at
+    return entries, watermark
+
+
+class EmployeeDirectory:
+    def __init__(self, refresh_sec: int) -> None:
+        self._refresh_sec = refresh_sec
+        self._lock = threading.RLock()
+        self._by_id: dict[int, EmployeeEntry] = {}
+        self._id_by_user_id: dict[int, int] = {}
+        self._id_by_employee_no: dict[str, int] = {}
+        self._loaded = False
+        self._watermark: datetime | None = None
+        self._checked_at = 0.0
+        self._pending = _Changes()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def mark_changed(
+        self,
+        employee_ids: Iterable[int] = (),
+        *,
+        user_ids: Iterable[int] = (),
+        department_ids: Iterable[int] = (),
+        everything: bool = False,
+    ) -> None:
+        """다음 조회 때 다시 읽을 항목을 표시한다."""
+        with self._lock:
+            self._pending.merge(
+                _Changes(set(employee_ids), set(user_ids), set(department_ids), everything)
+            )
+
+    def _put(self, entry: EmployeeEntry) -> None:
+        previous = self._by_id.get(entry.id)
+        if previous is not None:
+            self._drop(previous.id)
+        self._by_id[entry.id] = entry
+        # 사용자당 사원은 하나지만, 중복 데이터가 있으면 id 가 작은 쪽을 남긴다.
+        if self._id_by_user_id.get(entry.user_id, entry.id) >= entry.id:
+            self._id_by_user_id[entry.user_id] = entry.id
+        self._id_by_employee_no[entry.employee_no] = entry.id
+
+    def _drop(self, employee_id: int) -> None:
+        entry = self._by_id.pop(employee_id, None)
+        if entry is None:
+            return
+        if self._id_by_user_id.get(entry.user_id) == employee_id:
+            del self._id_by_user_id[entry.user_id]
+        if self._id_by_employee_no.get(entry.employee_no) == employee_id:
+            del self._id_by_employee_no[entry.employee_no]
+
+    def _reload_all(self, session: Session) -> None:
+        entries, watermark = _read_entries(session, _entry_statement())
+        self._by_id.clear()
+        self._id_by_user_id.clear()
+        self._id_by_employee_no.clear()
+        for entry in entries:
+            self._put(entry)
+        self._watermark = watermark
+        self._loaded = True
+
+    def _apply(self, session: Session, changes: _Changes) -> None:
+        conditions = []
+        if changes.employee_ids:
+            conditions.append(HrEmployee.id.in_(changes.employee_ids))
+        if changes.user_ids:
+            conditions.append(HrEmployee.user_id.in_(changes.user_ids))
+        if changes.department_ids:
+            conditions.append(HrEmployee.department_id.in_(changes.department_ids))
+        entries, _ = _read_entries(session, _entry_statement().where(or_(*conditions)))
+        found = {entry.id for entry in entries}
+        # 삭제됐거나 사용자/부서 연결이 끊긴 항목은 버린다.
+        stale = set(changes.employee_ids) | {
+            employee_id
+            for employee_id, entry in self._by_id.items()
+            if entry.user_id in changes.user_ids or entry.department_id in changes.department_ids
+        }
+        for employee_id in stale - found:
+            self._drop(employee_id)
+        for entry in entries:
+            self._put(entry)
+
+    def _refresh_from_watermark(self, session: Session) -> None:
+        if self._watermark is None:
+            self._reload_all(session)
+            return
+        watermark = self._watermark
+        # 같은 시각의 쓰기를 놓치지 않도록 워터마크와 같은 행도 다시 읽는다.
+        entries, latest = _read_entries(
+            session,
+            _entry_statement().where(
+                or_(
+                    HrEmployee.updated_at >= watermark,
+                    AuthUser.updated_at >= watermark,
+                    OrgDepartment.updated_at >= watermark,
+                )
+            ),
+        )
+        for entry in entries:
+            self._put(entry)
+        if latest is not None and latest > watermark:
+            self._watermark = latest
+
+    def sync(self, session: Session) -> None:
+        """적재/표시된 변경/주기적 워터마크 갱신을 반영한다."""
+        with self._lock:
+            now = time.monotonic()
+            pending, self._pending = self._pending, _Changes()
+            if not self._loaded or pending.everything:
+                self._reload_all(session)
+            else:
+                if pending:
+                    self._apply(session, pending)
+                if self._refresh_sec > 0 and now - self._checked_at >= self._refresh_sec:
+                    self._refresh_from_watermark(session)
+                else:
+                    return
+            self._checked_at = now
+
+    def lookup(self, session: Session, employee_ids: Iterable[int]) -> dict[int, EmployeeEntry]:
+        self.sync(session)
+        wanted = {employee_id for employee_id in employee_ids if employee_id is not None}
+        with self._lock:
+            found = {employee_id: self._by_id[employee_id] for employee_id in wanted if employee_id in self._by_id}
+            missing = wanted - found.keys()
+            if missing:
+                # 다른 프로세스에서 막 생긴 사원일 수 있으므로 DB 에서 채운다.
+                entries, _ = _read_entries(session, _entry_statement().where(HrEmployee.id.in_(missing)))
+                for entry in entries:
+                    self._put(entry)
+                    found[entry.id] = entry
+        return found
+
+    def by_user_id(self, session: Session, user_id: int) -> EmployeeEntry | None:
+        self.sync(session)
+        with self._lock:
+            employee_id = self._id_by_user_id.get(user_id)
+            return self._by_id.get(employee_id) if employee_id is not None else None
+
+    def by_employee_no(self, session: Session, employee_no: str) -> EmployeeEntry | None:
+        self.sync(session)
+        with self._lock:
+            employee_id = self._id_by_employee_no.get(employee_no)
+            return self._by_id.get(employee_id) if employee_id is not None else None
+
+
+_lock = threading.Lock()
+_directories: "weakref.WeakKeyDictionary[Engine, EmployeeDirectory]" = weakref.WeakKeyDictionary()
+
+
+def _engine_of(session: OrmSession) -> Engine:
+    bind = session.get_bind()
+    return bind.engine if hasattr(bind, "engine") else bind
+
+
+def get_employee_directory(session: Session) -> EmployeeDirectory:
+    engine = _engine_of(session)
+    with _lock:
+        directory = _directories.get(engine)
+        if directory is None:
+            directory = EmployeeDirectory(settings.employee_directory_refresh_sec)
+            _directories[engine] = directory
+        return directory
+
+
+def lookup_employees(session: Session, employee_ids: Iterable[int]) -> dict[int, EmployeeEntry]:
+    """사원 id → 디렉터리 항목. 세션에 미커밋 사원/사용자/부서 변경이 있으면 DB 에서 바로 읽는다."""
+    ids = {employee_id for employee_id in employee_ids if employee_id is not None}
+    if not ids:
+        return {}
+    if session.info.get(_SESSION_DIRTY_KEY):
+        entries, _ = _read_entries(session, _entry_statement().where(HrEmployee.id.in_(ids)))
+        return {entry.id: entry for entry in entries}
+    return get_employee_directory(session).lookup(session, ids)
+
+
+# ---------------------------------------------------------------------------
+# 변경 전파: flush 로 바뀐 id 를 모아 커밋 시 이 프로세스에 반영하고 다른 워커에 알린다.
+# ---------------------------------------------------------------------------
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _collect_changes_on_flush(session: OrmSession, _flush_context) -> None:
+    changes: _Changes | None = None
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, HrEmployee):
+            key, target = instance.id, "employee_ids"
+        elif isinstance(instance, AuthUser):
+            key, target = instance.id, "user_ids"
+        elif isinstance(instance, OrgDepartment):
+            key, target = instance.id, "department_ids"
+        else:
+            continue
+        if key is None:
+            continue
+        if changes is None:
+            changes = session.info.setdefault(_SESSION_DIRTY_KEY, _Changes())
+        getattr(changes, target).add(key)
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _collect_changes_on_bulk_dml(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and getattr(table, "name", None) in _TRACKED_TABLES:
+        orm_execute_state.session.info.setdefault(_SESSION_DIRTY_KEY, _Changes()).everything = True
+
+
+# 이벤트 허브의 before_commit(NOTIFY) 보다 먼저 돌아야 하므로 앞에 끼워 넣는다.
+@event.listens_for(OrmSession, "before_commit", insert=True)
+def _publish_before_commit(session: OrmSession) -> None:
+    # 커밋 중 자동 flush 는 before_commit 이후에 일어나므로 여기서 먼저 flush 해 변경을 모은다.
+    session.flush()
+    changes: _Changes | None = session.info.get(_SESSION_DIRTY_KEY)
+    if changes:
+        publish_after_commit(session, HubEvent(CHANGE_EVENT, changes.to_event_data()))
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _apply_on_commit(session: OrmSession) -> None:
+    changes: _Changes | None = session.info.pop(_SESSION_DIRTY_KEY, None)
+    if not changes:
+        return
+    with _lock:
+        directory = _directories.get(_engine_of(session))
+    if directory is not None:
+        directory.mark_changed(
+            changes.employee_ids,
+            user_ids=changes.user_ids,
+            department_ids=changes.department_ids,
+            everything=changes.everything,
+        )
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _clear_on_rollback(session: OrmSession) -> None:
+    session.info.pop(_SESSION_DIRTY_KEY, None)
+
+
+def _on_change_event(hub_event: HubEvent) -> None:
+    changes = _Changes.from_event_data(hub_event.data)
+    with _lock:
+        directories = list(_directories.values())
+    for directory in directories:
+        directory.mark_changed(
+            changes.employee_ids,
+            user_ids=changes.user_ids,
+            department_ids=changes.department_ids,
+            everything=changes.everything,
+        )
+
+
+event_hub.add_handler(CHANGE_EVENT, _on_change_event)
@@ -1,46 +1,78 @@
 from __future__ import annotations
 
 from fastapi import HTTPException, status
-from sqlalchemy import func
+from sqlalchemy import func, or_
 from sqlmodel import Session, select
 
+from app.core.pagination import COUNT_MODE_EXACT, KeysetColumn, fetch_keyset_page, resolve_total_count
+from app.core.search import contains, normalize_term, similarity_rank
 from app.models import AuthUser, HrEmployee, OrgDepartment
-from app.schemas.employee import DepartmentItem, EmployeeItem
+from app.schemas.employee import DepartmentItem, EmployeeItem, EmployeeSearchItem
+from app.services.org_hierarchy_service import subtree_department_ids
+from app.services.org_tree_cache_service import get_department_tree
 from app.services.employee_service_shared import build_employee_item
 
 
 def list_departments(session: Session) -> list[DepartmentItem]:
-    rows = session.exec(select(OrgDepartment).order_by(OrgDepartment.code)).all()
-    return [DepartmentItem(id=row.id, code=row.code, name=row.name) for row in rows]
+    return [DepartmentItem(id=node.id, code=node.code, name=node.name) for node in get_department_tree(session).by_code]
 
 
-def list_employees(
-    session: Session,
+def _build_employee_list_stmt(
     *,
-    page: int | None = None,
-    limit: int | None = None,
     employee_no: str | None = None,
     name: str | None = None,
     department: str | None = None,
+    department_id: int | None = None,
+    include_sub_departments: bool = False,
     employment_status: str | None = None,
     active: bool | None = None,
-) -> tuple[list[EmployeeItem], int]:
+):
     stmt = (
         select(HrEmployee, AuthUser, OrgDepartment)
         .join(AuthUser, HrEmployee.user_id == AuthUser.id)
         .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
     )
 
-    if employee_no:
-        stmt = stmt.where(HrEmployee.employee_no.ilike(f"%{employee_no.strip()}%"))
-    if name:
-        stmt = stmt.where(AuthUser.display_name.ilike(f"%{name.strip()}%"))
-    if department:
-        stmt = stmt.where(OrgDepartment.name.ilike(f"%{department.strip()}%"))
+    if employee_no := normalize_term(employee_no):
+        stmt = stmt.where(contains(HrEmployee.employee_no, employee_no))
+    if name := normalize_term(name):
+        stmt = stmt.where(contains(AuthUser.display_name, name, chosung_column=AuthUser.display_name_chosung))
+    if department := normalize_term(department):
+        stmt = stmt.where(contains(OrgDepartment.name, department))
+    if department_id is not None:
+        if include_sub_departments:
+            stmt = stmt.where(HrEmployee.department_id.in_(subtree_department_ids(department_id)))
+        else:
+            stmt = stmt.where(HrEmployee.department_id == department_id)
     if employment_status:
         stmt = stmt.where(HrEmployee.employment_status == employment_status)
     if active is not None:
         stmt = stmt.where(AuthUser.is_active == active)  # noqa: E712
+    return stmt
+
+
+def list_employees(
+    session: Session,
+    *,
+    page: int | None = None,
+    limit: int | None = None,
+    employee_no: str | None = None,
+    name: str | None = None,
+    department: str | None = None,
+    department_id: int | None = None,
+    include_sub_departments: bool = False,
+    employment_status: str | None = None,
+    active: bool | None = None,
+) -> tuple[list[EmployeeItem], int]:
+    stmt = _build_employee_list_stmt(
+        employee_no=employee_no,
+        name=name,
+        department=department,
+        department_id=department_id,
+        include_sub_departments=include_sub_departments,
+        employment_status=employment_status,
+        active=active,
+    )
 
     total_count: int = session.exec(select(func.count()).select_from(stmt.subquery())).one()
 
@@ -53,6 +85,90 @@ def list_employees(
     return ([build_employee_item(employee, user, department) for employee, user, department in rows], total_count)
 
 
+def list_employees_keyset(
+    session: Session,
+    *,
+    cursor: str | None,
+    limit: int,
+    count_mode: str = COUNT_MODE_EXACT,
+    employee_no: str | None = None,
+    name: str | None = None,
+    department: str | None = None,
+    department_id: int | None = None,
+    include_sub_departments: bool = False,
+    employment_status: str | None = None,
+    active: bool | None = None,
+) -> tuple[list[EmployeeItem], int, bool, str | None]:
+    """사원 목록 keyset 조회. (items, total_count, total_is_estimate, next_cursor) 를 반환한다."""
+    stmt = _build_employee_list_stmt(
+        employee_no=employee_no,
+        name=name,
+        department=department,
+        department_id=department_id,
+        include_sub_departments=include_sub_departments,
+        employment_status=employment_status,
+        active=active,
+    )
+    total_count, total_is_estimate = resolve_total_count(session, stmt, count_mode)
+    rows, next_cursor = fetch_keyset_page(
+        session,
+        stmt,
+        [KeysetColumn(HrEmployee.id)],
+        cursor=cursor,
+        limit=limit,
+        key=lambda row: (row[0].id,),
+    )
+    items = [build_employee_item(employee, user, department) for employee, user, department in rows]
+    return items, total_count, total_is_estimate, next_cursor
+
+
+def search_employees(
+    session: Session,
+    q: str,
+    *,
+    limit: int = 10,
+    include_resigned: bool = False,
+) -> list[EmployeeSearchItem]:
+    """사번/이름(초성 포함) 자동완성. 유사도가 높은 순으로 limit 건만 한 번에 읽는다."""
+    term = normalize_term(q)
+    if term is None:
+        return []
+
+    name_match = contains(AuthUser.display_name, term, chosung_column=AuthUser.display_name_chosung)
+    rank = similarity_rank(session, AuthUser.display_name, term, chosung_column=AuthUser.display_name_chosung) + (
+        similarity_rank(session, HrEmployee.employee_no, term)
+    )
+    stmt = (
+        select(
+            HrEmployee.id,
+            HrEmployee.employee_no,
+            AuthUser.display_name,
+            OrgDepartment.name,
+            HrEmployee.position_title,
+            HrEmployee.employment_status,
+        )
+        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
+        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
+        .where(or_(contains(HrEmployee.employee_no, term), name_match))
+        .order_by(rank.desc(), HrEmployee.employee_no.asc())
+        .limit(limit)
+    )
+    if not include_resigned:
+        stmt = stmt.where(HrEmployee.employment_status != "resigned")
+
+    return [
+        EmployeeSearchItem(
+            id=employee_id,
+            employee_no=employee_no,
+            display_name=display_name,
+            department_name=department_name,
+            position_title=position_title,
+            employment_status=employment_status,
+        )
+        for employee_id, employee_no, display_name, department_name, position_title, employment_status in session.exec(stmt)
+    ]
+
+
 def get_employee_by_user_id(session: Session, user_id: int) -> EmployeeItem:
     row = session.exec(
         select(HrEmployee, AuthUser, OrgDepartment)
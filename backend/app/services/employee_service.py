@@ -1,6 +1,12 @@
 from app.services.employee_batch_service import batch_save_employees
 from app.services.employee_command_service import create_employee, delete_employee, update_employee
-from app.services.employee_query_service import get_employee_by_user_id, list_departments, list_employees
+from app.services.employee_query_service import (
+    get_employee_by_user_id,
+    list_departments,
+    list_employees,
+    list_employees_keyset,
+    search_employees,
+)
 from app.services.employee_service_shared import chunked as _chunked
 
 __all__ = [
@@ -11,5 +17,7 @@ __all__ = [
     "get_employee_by_user_id",
     "list_departments",
     "list_employees",
+    "list_employees_keyset",
+    "search_employees",
     "update_employee",
 ]
@@ -7,7 +7,8 @@ import string
 from fastapi import HTTPException, status
 from sqlmodel import Session, select
 
-from app.models import AuthUser, HrEmployee, OrgDepartment
+from app.core.sequence import allocate_sequence_block, max_suffix_seq
+from app.models import AuthUser, HrEmployee, HrRecruitFinalist, OrgDepartment
 from app.schemas.employee import EmployeeItem
 
 
@@ -33,13 +34,25 @@ def generate_login_id(session: Session) -> str:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to generate login_id.")
 
 
+def allocate_employee_nos(session: Session, count: int) -> list[str]:
+    """EMP-NNNNNN 사번 count 개. 사번을 만드는 모든 경로가 같은 "EMP" 카운터를 쓴다.
+
+    최초 시작값은 사원/채용합격자 양쪽의 최대 사번.
+    """
+    block = allocate_sequence_block(
+        session,
+        "EMP",
+        count,
+        initial=lambda: max(
+            max_suffix_seq(session, HrEmployee.employee_no, "EMP-"),
+            max_suffix_seq(session, HrRecruitFinalist.employee_no, "EMP-"),
+        ),
+    )
+    return [f"EMP-{seq:06d}" for seq in block]
+
+
 def generate_employee_no(session: Session) -> str:
-    for _ in range(30):
-        employee_no = f"EMP-{secrets.randbelow(1_000_000):06d}"
-        exists = session.exec(select(HrEmployee.id).where(HrEmployee.employee_no == employee_no)).first()
-        if exists is None:
-            return employee_no
-    raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to generate employee_no.")
+    return allocate_employee_nos(session, 1)[0]
 
 
 def build_employee_item(employee: HrEmployee, user: AuthUser, department: OrgDepartment) -> EmployeeItem:
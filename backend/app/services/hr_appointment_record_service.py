@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
 
 from fastapi import HTTPException, status
-from sqlalchemy import or_
+from sqlalchemy import insert as sa_insert
+from sqlalchemy import and_, func, or_
+from sqlalchemy import update as sa_update
 from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
+from app.core.bulk import bulk_update_by_pk
+from app.core.sequence import max_suffix_seq, next_sequence
 from app.models import (
     AppCode,
     AppCodeGroup,
@@ -30,6 +35,8 @@ APPOINTMENT_CODE_GROUP = "HR_APPOINTMENT_CODE"
 VALID_ORDER_STATUSES = {"draft", "confirmed", "cancelled"}
 VALID_APPOINTMENT_KINDS = {"permanent", "temporary"}
 VALID_EMPLOYMENT_STATUSES = {"active", "leave", "resigned"}
+# 확정할 항목이 이 수 이상이면 일괄 경로(_apply_items_bulk)로 처리한다.
+BULK_CONFIRM_MIN_ITEMS = 50
 
 
 def _utc_now() -> datetime:
@@ -114,20 +121,12 @@ def _ensure_order_editable(order: HrAppointmentOrder) -> None:
 def _next_appointment_no(session: Session) -> str:
     today = datetime.now(timezone.utc).strftime("%Y%m%d")
     prefix = f"APT-{today}-"
-    rows = session.exec(
-        select(HrAppointmentOrder.appointment_no)
-        .where(HrAppointmentOrder.appointment_no.like(f"{prefix}%"))
-        .order_by(HrAppointmentOrder.appointment_no.desc()),
-    ).all()
-
-    max_seq = 0
-    for appointment_no in rows:
-        if not appointment_no:
-            continue
-        suffix = appointment_no.replace(prefix, "", 1)
-        if suffix.isdigit():
-            max_seq = max(max_seq, int(suffix))
-    return f"{prefix}{max_seq + 1:04d}"
+    seq = next_sequence(
+        session,
+        f"APT-{today}",
+        initial=lambda: max_suffix_seq(session, HrAppointmentOrder.appointment_no, prefix),
+    )
+    return f"{prefix}{seq:04d}"
 
 
 def _auto_resolve_employment_status(
@@ -149,62 +148,62 @@ def _auto_resolve_employment_status(
     return None
 
 
-def _ensure_no_overlapping_appointments(
-    session: Session,
-    employee_id: int,
-    start_date,
-    end_date,
-    exclude_item_id: int | None = None,
-) -> None:
-    """같은 직원에게 날짜가 겹치는 draft/confirmed 발령이 이미 있으면 에러."""
-    stmt = (
-        select(HrAppointmentOrderItem.id)
-        .join(HrAppointmentOrder, HrAppointmentOrder.id == HrAppointmentOrderItem.order_id)
-        .where(
-            HrAppointmentOrderItem.employee_id == employee_id,
-            HrAppointmentOrder.status.in_(["draft", "confirmed"]),
+@dataclass(frozen=True, slots=True)
+class _AppointmentPeriod:
+    """겹침 검사 대상 기간. item_id 는 수정 중인 항목(자기 자신은 비교에서 뺀다)."""
+
+    employee_id: int
+    start_date: date
+    end_date: date | None
+    item_id: int | None = None
+
+
+def _overlap_conflict(existing_start: date, existing_end: date | None) -> HTTPException:
+    if existing_end is None:
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="해당 직원에게 겹치는 발령이 이미 존재합니다. 기존 발령을 취소한 후 진행하세요.",
         )
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"해당 직원의 기존 발령 기간({existing_start}~{existing_end})과 겹칩니다.",
+    )
+
+
+def _period_overlap_condition(session: Session, period: _AppointmentPeriod):
+    # 기존 발령이 종료일 없음(permanent) → 무조건 겹침. 그 밖에는 양 끝을 포함한 기간이 겹치는지 본다.
+    if session.get_bind().dialect.name == "postgresql":
+        # ensure_range_indexes 의 (employee_id, daterange) GiST 인덱스를 타는 형태.
+        existing = func.daterange(HrAppointmentOrderItem.start_date, HrAppointmentOrderItem.end_date, "[]")
+        overlap = existing.op("&&")(func.daterange(period.start_date, period.end_date, "[]"))
+    else:
+        overlap = HrAppointmentOrderItem.end_date >= period.start_date
+        if period.end_date is not None:
+            overlap = and_(overlap, HrAppointmentOrderItem.start_date <= period.end_date)
+    return and_(
+        HrAppointmentOrderItem.employee_id == period.employee_id,
+        or_(HrAppointmentOrderItem.end_date.is_(None), overlap),
     )
-    if exclude_item_id is not None:
-        stmt = stmt.where(HrAppointmentOrderItem.id != exclude_item_id)
 
-    existing_items = session.exec(stmt).all()
-    if not existing_items:
-        return
 
-    # 실제 날짜 범위 비교
-    existing_date_rows = session.exec(
+def _ensure_no_overlapping_appointments(session: Session, period: _AppointmentPeriod) -> None:
+    """같은 직원에게 날짜가 겹치는 draft/confirmed 발령이 있으면 409. 겹치는 행이 있는지만 쿼리 한 번으로 본다."""
+    stmt = (
         select(HrAppointmentOrderItem.start_date, HrAppointmentOrderItem.end_date)
         .join(HrAppointmentOrder, HrAppointmentOrder.id == HrAppointmentOrderItem.order_id)
         .where(
-            HrAppointmentOrderItem.employee_id == employee_id,
             HrAppointmentOrder.status.in_(["draft", "confirmed"]),
-            *(
-                [HrAppointmentOrderItem.id != exclude_item_id]
-                if exclude_item_id is not None
-                else []
-            ),
+            _period_overlap_condition(session, period),
         )
-    ).all()
+        .order_by(HrAppointmentOrderItem.start_date, HrAppointmentOrderItem.id)
+        .limit(1)
+    )
+    if period.item_id is not None:
+        stmt = stmt.where(HrAppointmentOrderItem.id != period.item_id)
 
-    for existing_start, existing_end in existing_date_rows:
-        # 기존 발령이 종료일 없음(permanent) → 무조건 겹침
-        if existing_end is None:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="해당 직원에게 겹치는 발령이 이미 존재합니다. 기존 발령을 취소한 후 진행하세요.",
-            )
-        # 날짜 범위 겹침 체크: new_start <= existing_end AND new_end(or ∞) >= existing_start
-        new_end = end_date
-        if new_end is None:
-            overlap = start_date <= existing_end
-        else:
-            overlap = start_date <= existing_end and new_end >= existing_start
-        if overlap:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"해당 직원의 기존 발령 기간({existing_start}~{existing_end})과 겹칩니다.",
-            )
+    conflict = session.exec(stmt).first()
+    if conflict is not None:
+        raise _overlap_conflict(*conflict)
 
 
 def _ensure_appointment_no_unique(session: Session, appointment_no: str, exclude_order_id: int | None = None) -> None:
@@ -402,7 +401,7 @@ def create_appointment_record(
 
     # 날짜 중복 발령 방지
     _ensure_no_overlapping_appointments(
-        session, employee.id or 0, payload.start_date, payload.end_date
+        session, _AppointmentPeriod(employee.id or 0, payload.start_date, payload.end_date)
     )
 
     appointment_no = _normalize_text(payload.appointment_no) or _next_appointment_no(session)
@@ -513,7 +512,7 @@ def update_appointment_record(
     _ensure_end_date_rule(item.appointment_kind, item.end_date)
     _ensure_date_range(item.start_date, item.end_date)
     _ensure_no_overlapping_appointments(
-        session, item.employee_id, item.start_date, item.end_date, exclude_item_id=item.id
+        session, _AppointmentPeriod(item.employee_id, item.start_date, item.end_date, item_id=item.id)
     )
 
     order.updated_at = _utc_now()
@@ -548,6 +547,211 @@ def delete_appointment_record(session: Session, item_id: int) -> None:
     session.commit()
 
 
+def _apply_field_changes(item: HrAppointmentOrderItem, employee) -> list[tuple[str, str | None, str | None]]:
+    """발령 항목의 변경값을 employee(HrEmployee 또는 _EmployeeState)에 반영하고 (필드, 전, 후) 목록을 돌려준다."""
+    changes: list[tuple[str, str | None, str | None]] = []
+
+    if item.to_department_id is not None and item.to_department_id != employee.department_id:
+        changes.append(("department_id", str(employee.department_id), str(item.to_department_id)))
+        employee.department_id = item.to_department_id
+
+    if item.to_position_title is not None and item.to_position_title != employee.position_title:
+        changes.append(("position_title", employee.position_title, item.to_position_title))
+        employee.position_title = item.to_position_title
+
+    if item.to_employment_status is not None and item.to_employment_status != employee.employment_status:
+        changes.append(("employment_status", employee.employment_status, item.to_employment_status))
+        employee.employment_status = item.to_employment_status
+
+    return changes
+
+
+def _history_rows(
+    order: HrAppointmentOrder,
+    item: HrAppointmentOrderItem,
+    employee_id: int,
+    changes: list[tuple[str, str | None, str | None]],
+    user_id: int,
+    now: datetime,
+) -> list[dict]:
+    # 바뀐 필드가 없어도 발령 사실은 한 줄 남긴다.
+    return [
+        {
+            "employee_id": employee_id,
+            "history_type": item.action_type,
+            "source_table": "hr_appointment_order_items",
+            "source_id": item.id or 0,
+            "appointment_order_id": order.id,
+            "effective_date": item.start_date,
+            "field_name": field_name,
+            "before_value": before_value,
+            "after_value": after_value,
+            "description": f"{order.appointment_no} {item.action_type}",
+            "created_by": user_id,
+            "created_at": now,
+        }
+        for field_name, before_value, after_value in (changes or [(None, None, None)])
+    ]
+
+
+def _appointment_info_record_row(
+    order: HrAppointmentOrder,
+    item: HrAppointmentOrderItem,
+    employee_id: int,
+    organization: str | None,
+    now: datetime,
+) -> dict:
+    return {
+        "employee_id": employee_id,
+        "category": "appointment",
+        "record_date": item.start_date,
+        "title": order.title,
+        "type": item.action_type,
+        "organization": organization,
+        "value": item.to_position_title or item.to_employment_status or order.appointment_no,
+        "note": item.note,
+        "created_at": now,
+    }
+
+
+def _mark_item_applied(session: Session, item: HrAppointmentOrderItem, now: datetime) -> None:
+    item.apply_status = "applied"
+    item.applied_at = now
+    item.updated_at = now
+    session.add(item)
+
+
+def _apply_item(
+    session: Session,
+    order: HrAppointmentOrder,
+    item: HrAppointmentOrderItem,
+    user_id: int,
+    now: datetime,
+) -> None:
+    """발령 항목 하나를 ORM 객체 단위로 반영한다. 소규모 발령에 쓴다."""
+    employee = session.get(HrEmployee, item.employee_id)
+    if employee is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
+
+    changes = _apply_field_changes(item, employee)
+    if changes:
+        employee.updated_at = now
+        session.add(employee)
+
+    for row in _history_rows(order, item, employee.id or 0, changes, user_id, now):
+        session.add(HrPersonnelHistory(**row))
+    organization = _resolve_department_name(session, item.to_department_id or employee.department_id)
+    session.add(HrEmployeeInfoRecord(**_appointment_info_record_row(order, item, employee.id or 0, organization, now)))
+
+    _sync_related_finalists_appointed(session, employee, now)
+    _mark_item_applied(session, item, now)
+
+
+@dataclass(slots=True)
+class _EmployeeState:
+    """일괄 확정 중 메모리에서 비교/갱신하는 사원 값."""
+
+    id: int
+    user_id: int
+    employee_no: str
+    department_id: int
+    position_title: str
+    employment_status: str
+    changed: bool = False
+
+
+def _sync_finalists_appointed_bulk(session: Session, employees: list[_EmployeeState], now: datetime) -> int:
+    """_sync_related_finalists_appointed 의 일괄판. 사번/로그인 id 를 모아 UPDATE 한 번으로 처리한다."""
+    employee_nos = {employee.employee_no for employee in employees if employee.employee_no}
+    login_ids = {
+        login_id
+        for login_id in session.exec(
+            select(AuthUser.login_id).where(AuthUser.id.in_({employee.user_id for employee in employees}))
+        ).all()
+        if login_id
+    }
+    conditions = []
+    if employee_nos:
+        conditions.append(HrRecruitFinalist.employee_no.in_(employee_nos))
+    if login_ids:
+        conditions.append(HrRecruitFinalist.login_id.in_(login_ids))
+    if not conditions:
+        return 0
+
+    result = session.exec(
+        sa_update(HrRecruitFinalist)
+        .where(or_(*conditions), HrRecruitFinalist.status_code != "appointed")
+        .values(status_code="appointed", updated_at=now)
+    )
+    return result.rowcount
+
+
+def _apply_items_bulk(
+    session: Session,
+    order: HrAppointmentOrder,
+    items: list[HrAppointmentOrderItem],
+    user_id: int,
+    now: datetime,
+) -> None:
+    """_apply_item 과 같은 결과를 IN 조회 몇 번과 일괄 INSERT/UPDATE 로 만든다.
+
+    사원/부서/합격자는 한 번씩 미리 읽고, 필드 비교는 메모리에서 항목 순서대로 한다.
+    사원 갱신은 bulk_update_by_pk(Postgres 에서는 UPDATE ... FROM VALUES)로 한 번에 쓴다.
+    """
+    employee_rows = session.exec(
+        select(
+            HrEmployee.id,
+            HrEmployee.user_id,
+            HrEmployee.employee_no,
+            HrEmployee.department_id,
+            HrEmployee.position_title,
+            HrEmployee.employment_status,
+        ).where(HrEmployee.id.in_({item.employee_id for item in items}))
+    ).all()
+    employees = {row[0]: _EmployeeState(*row) for row in employee_rows}
+    if any(item.employee_id not in employees for item in items):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
+
+    history_rows: list[dict] = []
+    organization_by_item: list[tuple[HrAppointmentOrderItem, int]] = []
+    for item in items:
+        employee = employees[item.employee_id]
+        changes = _apply_field_changes(item, employee)
+        employee.changed = employee.changed or bool(changes)
+        history_rows.extend(_history_rows(order, item, employee.id, changes, user_id, now))
+        organization_by_item.append((item, item.to_department_id or employee.department_id))
+
+    department_ids = {department_id for _, department_id in organization_by_item if department_id is not None}
+    department_names = dict(
+        session.exec(select(OrgDepartment.id, OrgDepartment.name).where(OrgDepartment.id.in_(department_ids))).all()
+    )
+    info_rows = [
+        _appointment_info_record_row(order, item, item.employee_id, department_names.get(department_id), now)
+        for item, department_id in organization_by_item
+    ]
+
+    bulk_update_by_pk(
+        session,
+        HrEmployee,
+        [
+            {
+                "id": employee.id,
+                "department_id": employee.department_id,
+                "position_title": employee.position_title,
+                "employment_status": employee.employment_status,
+                "updated_at": now,
+            }
+            for employee in employees.values()
+            if employee.changed
+        ],
+    )
+    session.exec(sa_insert(HrPersonnelHistory).execution_options(render_nulls=True), params=history_rows)
+    session.exec(sa_insert(HrEmployeeInfoRecord).execution_options(render_nulls=True), params=info_rows)
+    _sync_finalists_appointed_bulk(session, list(employees.values()), now)
+    for item in items:
+        _mark_item_applied(session, item, now)
+
+
 def confirm_appointment_order(
     session: Session,
     order_id: int,
@@ -568,97 +772,13 @@ def confirm_appointment_order(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No appointment items to confirm.")
 
     now = _utc_now()
-    applied_count = 0
-
-    for item in items:
-        if item.apply_status == "cancelled":
-            continue
-
-        employee = session.get(HrEmployee, item.employee_id)
-        if employee is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
-
-        changes: list[tuple[str, str | None, str | None]] = []
-
-        if item.to_department_id is not None and item.to_department_id != employee.department_id:
-            before = str(employee.department_id)
-            after = str(item.to_department_id)
-            employee.department_id = item.to_department_id
-            changes.append(("department_id", before, after))
-
-        if item.to_position_title is not None and item.to_position_title != employee.position_title:
-            before = employee.position_title
-            after = item.to_position_title
-            employee.position_title = item.to_position_title
-            changes.append(("position_title", before, after))
-
-        if item.to_employment_status is not None and item.to_employment_status != employee.employment_status:
-            before = employee.employment_status
-            after = item.to_employment_status
-            employee.employment_status = item.to_employment_status
-            changes.append(("employment_status", before, after))
-
-        if changes:
-            employee.updated_at = now
-            session.add(employee)
-
-        for field_name, before_value, after_value in changes:
-            session.add(
-                HrPersonnelHistory(
-                    employee_id=employee.id or 0,
-                    history_type=item.action_type,
-                    source_table="hr_appointment_order_items",
-                    source_id=item.id or 0,
-                    appointment_order_id=order.id,
-                    effective_date=item.start_date,
-                    field_name=field_name,
-                    before_value=before_value,
-                    after_value=after_value,
-                    description=f"{order.appointment_no} {item.action_type}",
-                    created_by=user_id,
-                    created_at=now,
-                )
-            )
-
-        if not changes:
-            session.add(
-                HrPersonnelHistory(
-                    employee_id=employee.id or 0,
-                    history_type=item.action_type,
-                    source_table="hr_appointment_order_items",
-                    source_id=item.id or 0,
-                    appointment_order_id=order.id,
-                    effective_date=item.start_date,
-                    field_name=None,
-                    before_value=None,
-                    after_value=None,
-                    description=f"{order.appointment_no} {item.action_type}",
-                    created_by=user_id,
-                    created_at=now,
-                )
-            )
-
-        session.add(
-            HrEmployeeInfoRecord(
-                employee_id=employee.id or 0,
-                category="appointment",
-                record_date=item.start_date,
-                title=order.title,
-                type=item.action_type,
-                organization=_resolve_department_name(session, item.to_department_id or employee.department_id),
-                value=item.to_position_title or item.to_employment_status or order.appointment_no,
-                note=item.note,
-                created_at=now,
-            )
-        )
-
-        _sync_related_finalists_appointed(session, employee, now)
-
-        item.apply_status = "applied"
-        item.applied_at = now
-        item.updated_at = now
-        session.add(item)
-        applied_count += 1
+    pending_items = [item for item in items if item.apply_status != "cancelled"]
+    if len(pending_items) >= BULK_CONFIRM_MIN_ITEMS:
+        _apply_items_bulk(session, order, pending_items, user_id, now)
+    else:
+        for item in pending_items:
+            _apply_item(session, order, item, user_id, now)
+    applied_count = len(pending_items)
 
     order.status = "confirmed"
     order.confirmed_at = now
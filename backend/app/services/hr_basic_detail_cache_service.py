@@ -0,0 +1,247 @@
+"""인사기본 카드(HrBasicDetailResponse) 의 사원별 인메모리 캐시.
+
+카드는 자주 열리지만 잘 바뀌지 않으므로 조립된 응답을 사원 id 별로 LRU 에 둔다.
+
+- 사원 id 별 버전을 두고, 적재를 시작할 때의 버전과 저장 시점의 버전이 다르면
+  저장하지 않는다. 적재 중에 커밋된 변경이 옛 카드로 덮이지 않는다.
+- 인사기본 테이블(프로필/기록/연락처/경력/자격/병역/상벌)과 사원 행 쓰기는 flush 시
+  세션에 사원 id 로 표시해 두었다가 커밋 후 해당 카드만 무효화한다.
+  사용자 표시명이나 부서명 변경은 그 사용자/부서를 참조하는 카드를 버린다.
+- 다른 프로세스의 쓰기는 ``hr_basic_detail_cache_ttl_sec`` 경과 후 재적재로 반영한다.
+
+Usage example::
+
+    cache = get_hr_basic_detail_cache(session)
+    detail = cache.get_or_load(session, employee_id, lambda: load_detail(session, employee_id))
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models import (
+    AuthUser,
+    HrCareer,
+    HrContactPoint,
+    HrEmployee,
+    HrEmployeeBasicProfile,
+    HrEmployeeInfoRecord,
+    HrLicense,
+    HrMilitary,
+    HrRewardPunish,
+    OrgDepartment,
+)
+from app.schemas.hr_basic import HrBasicDetailResponse
+
+_SESSION_DIRTY_KEY = "hr_basic_detail_dirty"
+# employee_id 컬럼으로 카드에 매달린 모델
+_SECTION_MODELS = (
+    HrEmployeeBasicProfile,
+    HrEmployeeInfoRecord,
+    HrContactPoint,
+    HrCareer,
+    HrLicense,
+    HrMilitary,
+    HrRewardPunish,
+)
+_TRACKED_TABLES = frozenset(
+    model.__tablename__ for model in (*_SECTION_MODELS, HrEmployee, AuthUser, OrgDepartment)
+)
+
+
+@dataclass(frozen=True)
+class LoadedDetail:
+    """적재 결과. user_id / department_id 는 표시명·부서명 변경 무효화에 쓴다."""
+
+    detail: HrBasicDetailResponse
+    user_id: int
+    department_id: int
+
+
+@dataclass
+class _Entry:
+    loaded: LoadedDetail
+    built_at: float
+
+
+@dataclass
+class _DirtyMarks:
+    employee_ids: set[int] = field(default_factory=set)
+    user_ids: set[int] = field(default_factory=set)
+    department_ids: set[int] = field(default_factory=set)
+    everything: bool = False
+
+    def touches(self, employee_id: int) -> bool:
+        # user/department 변경은 어떤 사원 카드인지 세션 안에서 알 수 없으므로 보수적으로 본다.
+        return self.everything or bool(self.user_ids or self.department_ids) or employee_id in self.employee_ids
+
+
+class HrBasicDetailCache:
+    def __init__(self, max_size: int, ttl_sec: int) -> None:
+        self._max_size = max(0, max_size)
+        self._ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._versions: dict[int, int] = {}
+        # 여러 카드를 한꺼번에 무효화할 때 올리는 전역 세대
+        self._generation = 0
+
+    def _version(self, employee_id: int) -> tuple[int, int]:
+        return self._generation, self._versions.get(employee_id, 0)
+
+    def get(self, employee_id: int) -> HrBasicDetailResponse | None:
+        with self._lock:
+            entry = self._entries.get(employee_id)
+            if entry is None:
+                return None
+            if self._ttl_sec > 0 and time.monotonic() - entry.built_at >= self._ttl_sec:
+                del self._entries[employee_id]
+                return None
+            self._entries.move_to_end(employee_id)
+            return entry.loaded.detail.model_copy(deep=True)
+
+    def get_or_load(
+        self,
+        session: Session,
+        employee_id: int,
+        loader: Callable[[], LoadedDetail],
+    ) -> HrBasicDetailResponse:
+        marks: _DirtyMarks | None = session.info.get(_SESSION_DIRTY_KEY)
+        if marks is not None and marks.touches(employee_id):
+            # 이 세션의 미커밋 변경이 보이는 카드는 공유 캐시에 올리지 않는다.
+            return loader().detail
+
+        cached = self.get(employee_id)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            version = self._version(employee_id)
+        loaded = loader()
+        marks = session.info.get(_SESSION_DIRTY_KEY)
+        if self._max_size > 0 and not (marks is not None and marks.touches(employee_id)):
+            with self._lock:
+                if self._version(employee_id) == version:
+                    self._entries[employee_id] = _Entry(loaded=loaded, built_at=time.monotonic())
+                    self._entries.move_to_end(employee_id)
+                    while len(self._entries) > self._max_size:
+                        self._entries.popitem(last=False)
+        return loaded.detail.model_copy(deep=True)
+
+    def invalidate(
+        self,
+        employee_ids: Iterable[int] = (),
+        *,
+        user_ids: Iterable[int] = (),
+        department_ids: Iterable[int] = (),
+    ) -> None:
+        user_id_set = set(user_ids)
+        department_id_set = set(department_ids)
+        with self._lock:
+            for employee_id in employee_ids:
+                self._versions[employee_id] = self._versions.get(employee_id, 0) + 1
+                self._entries.pop(employee_id, None)
+            if user_id_set or department_id_set:
+                self._generation += 1
+                stale = [
+                    employee_id
+                    for employee_id, entry in self._entries.items()
+                    if entry.loaded.user_id in user_id_set or entry.loaded.department_id in department_id_set
+                ]
+                for employee_id in stale:
+                    del self._entries[employee_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._versions.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_lock = threading.Lock()
+_caches: "weakref.WeakKeyDictionary[Engine, HrBasicDetailCache]" = weakref.WeakKeyDictionary()
+
+
+def _engine_of(session: OrmSession) -> Engine:
+    bind = session.get_bind()
+    return bind.engine if hasattr(bind, "engine") else bind
+
+
+def get_hr_basic_detail_cache(session: Session) -> HrBasicDetailCache:
+    engine = _engine_of(session)
+    with _lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            cache = HrBasicDetailCache(settings.hr_basic_detail_cache_size, settings.hr_basic_detail_cache_ttl_sec)
+            _caches[engine] = cache
+        return cache
+
+
+# ---------------------------------------------------------------------------
+# 무효화 훅: 카드에 영향을 주는 쓰기를 세션에 표시해 두었다가 커밋 시 해당 카드를 버린다.
+# ---------------------------------------------------------------------------
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _mark_dirty_on_flush(session: OrmSession, _flush_context) -> None:
+    marks: _DirtyMarks | None = None
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, _SECTION_MODELS):
+            key, target = instance.employee_id, "employee_ids"
+        elif isinstance(instance, HrEmployee):
+            key, target = instance.id, "employee_ids"
+        elif isinstance(instance, AuthUser):
+            key, target = instance.id, "user_ids"
+        elif isinstance(instance, OrgDepartment):
+            key, target = instance.id, "department_ids"
+        else:
+            continue
+        if key is None:
+            continue
+        if marks is None:
+            marks = session.info.setdefault(_SESSION_DIRTY_KEY, _DirtyMarks())
+        getattr(marks, target).add(key)
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _mark_dirty_on_bulk_dml(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and getattr(table, "name", None) in _TRACKED_TABLES:
+        session = orm_execute_state.session
+        session.info.setdefault(_SESSION_DIRTY_KEY, _DirtyMarks()).everything = True
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _invalidate_on_commit(session: OrmSession) -> None:
+    marks: _DirtyMarks | None = session.info.pop(_SESSION_DIRTY_KEY, None)
+    if marks is None:
+        return
+    with _lock:
+        cache = _caches.get(_engine_of(session))
+    if cache is None:
+        return
+    if marks.everything:
+        cache.clear()
+    else:
+        cache.invalidate(marks.employee_ids, user_ids=marks.user_ids, department_ids=marks.department_ids)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _clear_dirty_on_rollback(session: OrmSession) -> None:
+    session.info.pop(_SESSION_DIRTY_KEY, None)
@@ -1,8 +1,16 @@
 ﻿from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
 from fastapi import HTTPException, status
+from sqlalchemy import case, func, literal, true, union_all
 from sqlmodel import Session, select
 
+from app.core.export import EXPORT_BATCH_SIZE, stream_rows
+from app.core.pagination import KeysetColumn, apply_keyset, count_query, fetch_keyset_page
+from app.core.search import contains, normalize_term
 from app.models import (
     AuthUser,
     HrCareer,
@@ -25,6 +33,8 @@ from app.schemas.hr_basic import (
     HrBasicRecordItem,
     HrBasicRecordUpdateRequest,
 )
+from app.services.hr_basic_detail_cache_service import LoadedDetail, get_hr_basic_detail_cache
+from app.services.employee_directory_service import lookup_employees
 
 CATEGORY_ALIAS_MAP = {
     "appointment": "appointment",
@@ -158,80 +168,213 @@ def _to_reward_record(item: HrRewardPunish) -> HrBasicRecordItem:
     )
 
 
-def get_hr_basic_detail(session: Session, employee_id: int) -> HrBasicDetailResponse:
-    employee, user, department = _get_employee_row(session, employee_id)
-    extra = session.exec(select(HrEmployeeBasicProfile).where(HrEmployeeBasicProfile.employee_id == employee.id)).first()
+# 카드의 기록 섹션들을 한 번에 읽기 위한 UNION ALL 공통 형태.
+# record_date 는 화면 표시용(대체 날짜 포함), sort_date 는 기존 섹션별 정렬 기준이다.
+_LEGACY_SECTION = "legacy"
 
-    profile = HrBasicProfile(
-        employee_id=employee.id,
-        employee_no=employee.employee_no,
-        full_name=user.display_name,
-        gender=extra.gender if extra else None,
-        resident_no_masked=extra.resident_no_masked if extra else None,
-        birth_date=extra.birth_date if extra else None,
-        hire_date=employee.hire_date,
-        retire_date=extra.retire_date if extra else None,
-        blood_type=extra.blood_type if extra else None,
-        marital_status=extra.marital_status if extra else None,
-        mbti=extra.mbti if extra else None,
-        probation_end_date=extra.probation_end_date if extra else None,
-        department_name=department.name,
-        position_title=employee.position_title,
-        job_family=extra.job_family if extra else None,
-        job_role=extra.job_role if extra else employee.position_title,
-        grade=extra.grade if extra else None,
-    )
 
-    legacy_records = session.exec(
-        select(HrEmployeeInfoRecord)
-        .where(HrEmployeeInfoRecord.employee_id == employee.id)
-        .order_by(HrEmployeeInfoRecord.record_date.desc(), HrEmployeeInfoRecord.id.desc())
+def _record_section(
+    section: str,
+    model,
+    employee_id: int,
+    *,
+    title,
+    type_,
+    organization,
+    value,
+    record_date=None,
+    sort_date=None,
+    category=None,
+):
+    sort_column = sort_date if sort_date is not None else model.record_date
+    return select(
+        literal(section).label("section"),
+        model.id.label("record_id"),
+        (category if category is not None else literal(section)).label("category"),
+        (record_date if record_date is not None else sort_column).label("record_date"),
+        title.label("title"),
+        type_.label("type"),
+        organization.label("organization"),
+        value.label("value"),
+        model.note.label("note"),
+        model.created_at.label("created_at"),
+        sort_column.label("sort_date"),
+    ).where(model.employee_id == employee_id)
+
+
+def _detail_records_subquery(employee_id: int):
+    return union_all(
+        _record_section(
+            _LEGACY_SECTION,
+            HrEmployeeInfoRecord,
+            employee_id,
+            category=HrEmployeeInfoRecord.category,
+            title=HrEmployeeInfoRecord.title,
+            type_=HrEmployeeInfoRecord.type,
+            organization=HrEmployeeInfoRecord.organization,
+            value=HrEmployeeInfoRecord.value,
+        ),
+        _record_section(
+            "contact_points",
+            HrContactPoint,
+            employee_id,
+            record_date=func.coalesce(HrContactPoint.record_date, HrContactPoint.valid_from),
+            title=HrContactPoint.contact_type,
+            # _to_contact_record 의 `a or b or c` 와 같게 빈 문자열도 건너뛴다.
+            type_=func.coalesce(
+                func.nullif(HrContactPoint.phone_mobile, ""),
+                func.nullif(HrContactPoint.phone_home, ""),
+                HrContactPoint.phone_work,
+            ),
+            organization=HrContactPoint.email,
+            value=HrContactPoint.addr1,
+        ),
+        _record_section(
+            "careers",
+            HrCareer,
+            employee_id,
+            record_date=func.coalesce(HrCareer.record_date, HrCareer.start_date),
+            title=HrCareer.company_name,
+            type_=HrCareer.career_scope,
+            organization=HrCareer.department_name,
+            value=func.coalesce(func.nullif(HrCareer.position_title, ""), HrCareer.job_title),
+        ),
+        _record_section(
+            "licenses",
+            HrLicense,
+            employee_id,
+            record_date=func.coalesce(HrLicense.record_date, HrLicense.issued_date),
+            title=HrLicense.license_name,
+            type_=HrLicense.license_type,
+            organization=HrLicense.issued_org,
+            value=HrLicense.license_no,
+        ),
+        _record_section(
+            "military",
+            HrMilitary,
+            employee_id,
+            record_date=func.coalesce(HrMilitary.record_date, HrMilitary.service_start_date),
+            title=HrMilitary.military_type,
+            type_=HrMilitary.branch,
+            organization=HrMilitary.rank,
+            value=HrMilitary.discharge_type,
+        ),
+        _record_section(
+            "reward_punish",
+            HrRewardPunish,
+            employee_id,
+            sort_date=HrRewardPunish.action_date,
+            title=HrRewardPunish.title,
+            type_=HrRewardPunish.reward_punish_type,
+            organization=HrRewardPunish.office_name,
+            value=HrRewardPunish.reason,
+        ),
+    ).subquery("records")
+
+
+def _load_hr_basic_detail(session: Session, employee_id: int) -> LoadedDetail:
+    """사원/프로필과 모든 기록 섹션을 한 번의 쿼리로 읽어 카드로 조립한다.
+
+    사원 행에 기록 UNION ALL 을 LEFT JOIN 하므로 기록이 없어도 사원 행 하나는 나온다.
+    """
+    records = _detail_records_subquery(employee_id)
+    rows = session.exec(
+        select(
+            HrEmployee.id,
+            HrEmployee.user_id,
+            HrEmployee.department_id,
+            HrEmployee.employee_no,
+            HrEmployee.hire_date,
+            HrEmployee.position_title,
+            AuthUser.display_name,
+            OrgDepartment.name.label("department_name"),
+            HrEmployeeBasicProfile.id.label("profile_id"),
+            HrEmployeeBasicProfile.gender,
+            HrEmployeeBasicProfile.resident_no_masked,
+            HrEmployeeBasicProfile.birth_date,
+            HrEmployeeBasicProfile.retire_date,
+            HrEmployeeBasicProfile.blood_type,
+            HrEmployeeBasicProfile.marital_status,
+            HrEmployeeBasicProfile.mbti,
+            HrEmployeeBasicProfile.probation_end_date,
+            HrEmployeeBasicProfile.job_family,
+            HrEmployeeBasicProfile.job_role,
+            HrEmployeeBasicProfile.grade,
+            *records.c,
+        )
+        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
+        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
+        .outerjoin(HrEmployeeBasicProfile, HrEmployeeBasicProfile.employee_id == HrEmployee.id)
+        .outerjoin(records, true())
+        .where(HrEmployee.id == employee_id)
+        .order_by(records.c.section, records.c.sort_date.desc(), records.c.record_id.desc())
     ).all()
+    if not rows:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found.")
 
-    contacts = session.exec(
-        select(HrContactPoint)
-        .where(HrContactPoint.employee_id == employee.id)
-        .order_by(HrContactPoint.record_date.desc(), HrContactPoint.id.desc())
-    ).all()
-    careers = session.exec(
-        select(HrCareer)
-        .where(HrCareer.employee_id == employee.id)
-        .order_by(HrCareer.record_date.desc(), HrCareer.id.desc())
-    ).all()
-    licenses = session.exec(
-        select(HrLicense)
-        .where(HrLicense.employee_id == employee.id)
-        .order_by(HrLicense.record_date.desc(), HrLicense.id.desc())
-    ).all()
-    military = session.exec(
-        select(HrMilitary)
-        .where(HrMilitary.employee_id == employee.id)
-        .order_by(HrMilitary.record_date.desc(), HrMilitary.id.desc())
-    ).all()
-    rewards = session.exec(
-        select(HrRewardPunish)
-        .where(HrRewardPunish.employee_id == employee.id)
-        .order_by(HrRewardPunish.action_date.desc(), HrRewardPunish.id.desc())
-    ).all()
+    head = rows[0]
+    has_extra = head.profile_id is not None
+    profile = HrBasicProfile(
+        employee_id=head.id,
+        employee_no=head.employee_no,
+        full_name=head.display_name,
+        gender=head.gender,
+        resident_no_masked=head.resident_no_masked,
+        birth_date=head.birth_date,
+        hire_date=head.hire_date,
+        retire_date=head.retire_date,
+        blood_type=head.blood_type,
+        marital_status=head.marital_status,
+        mbti=head.mbti,
+        probation_end_date=head.probation_end_date,
+        department_name=head.department_name,
+        position_title=head.position_title,
+        job_family=head.job_family,
+        job_role=head.job_role if has_extra else head.position_title,
+        grade=head.grade,
+    )
 
-    def map_legacy(category: str) -> list[HrBasicRecordItem]:
-        return [
-            _to_record(item)
-            for item in legacy_records
-            if normalize_category(item.category, strict=False) == category
-        ]
+    # 레거시 기록은 (legacy, 정규화 카테고리) 로, 나머지는 섹션 이름으로 모은다.
+    sections: dict[tuple[str, str], list[HrBasicRecordItem]] = {}
+    for row in rows:
+        if row.record_id is None:
+            continue
+        category = normalize_category(row.category, strict=False) if row.section == _LEGACY_SECTION else row.category
+        sections.setdefault((row.section, category), []).append(
+            HrBasicRecordItem(
+                id=row.record_id,
+                category=category,
+                record_date=row.record_date,
+                title=row.title,
+                type=row.type,
+                organization=row.organization,
+                value=row.value,
+                note=row.note,
+                created_at=row.created_at,
+            )
+        )
 
-    return HrBasicDetailResponse(
+    detail = HrBasicDetailResponse(
         profile=profile,
-        appointments=map_legacy("appointment"),
-        rewards_penalties=[_to_reward_record(item) for item in rewards],
-        contacts=[_to_contact_record(item) for item in contacts],
-        educations=map_legacy("education"),
-        careers=[_to_career_record(item) for item in careers],
-        certificates=[_to_license_record(item) for item in licenses],
-        military=[_to_military_record(item) for item in military],
-        evaluations=map_legacy("evaluation"),
+        appointments=sections.get((_LEGACY_SECTION, "appointment"), []),
+        rewards_penalties=sections.get(("reward_punish", "reward_punish"), []),
+        contacts=sections.get(("contact_points", "contact_points"), []),
+        educations=sections.get((_LEGACY_SECTION, "education"), []),
+        careers=sections.get(("careers", "careers"), []),
+        certificates=sections.get(("licenses", "licenses"), []),
+        military=sections.get(("military", "military"), []),
+        evaluations=sections.get((_LEGACY_SECTION, "evaluation"), []),
     )
+    return LoadedDetail(detail=detail, user_id=head.user_id, department_id=head.department_id)
+
+
+def get_hr_basic_detail(session: Session, employee_id: int) -> HrBasicDetailResponse:
+    """인사기본 카드. 사원별 캐시에 없으면 한 번의 쿼리로 적재한다.
+
+    카드 관련 쓰기(기록 생성/수정/삭제, 프로필 수정 등)는 커밋 시 캐시에서 해당 카드를 버린다.
+    """
+    cache = get_hr_basic_detail_cache(session)
+    return cache.get_or_load(session, employee_id, lambda: _load_hr_basic_detail(session, employee_id))
 
 
 def update_hr_basic_profile(session: Session, employee_id: int, payload: HrBasicProfileUpdateRequest) -> HrBasicProfile:
@@ -544,139 +687,162 @@ def delete_hr_basic_record(session: Session, employee_id: int, record_id: int, *
     session.commit()
 
 
-def list_hr_admin_records(
-    session: Session,
-    *,
+ADMIN_RECORD_EXPORT_BATCH_SIZE = EXPORT_BATCH_SIZE
+ADMIN_RECORD_EXPORT_FIELDS = tuple(HrAdminRecordItem.model_fields)
+
+# 관리자 목록 카테고리별 (원천 모델, 정렬 날짜 속성, 행 매핑). 정렬 날짜는 인사기본 카드와 같다.
+_ADMIN_RECORD_SOURCES: dict[str, tuple[type, str, Callable[[Any], HrBasicRecordItem]]] = {
+    "contact_points": (HrContactPoint, "record_date", _to_contact_record),
+    "careers": (HrCareer, "record_date", _to_career_record),
+    "licenses": (HrLicense, "record_date", _to_license_record),
+    "military": (HrMilitary, "record_date", _to_military_record),
+    "reward_punish": (HrRewardPunish, "action_date", _to_reward_record),
+}
+
+
+@dataclass(frozen=True)
+class _AdminRecordQuery:
+    statement: Any
+    keyset: list[KeysetColumn]
+    sort_date_attr: str
+    to_record: Callable[[Any], HrBasicRecordItem]
+
+    def row_key(self, row) -> list[Any]:
+        record, employee_no = row
+        sort_date = getattr(record, self.sort_date_attr)
+        return [employee_no, 1 if sort_date is None else 0, sort_date, record.id]
+
+    def to_items(self, session: Session, rows) -> list[HrAdminRecordItem]:
+        """사원 표시 정보는 사원 디렉터리에서 채운다. 사원 정보가 없는 행은 내부 조인처럼 뺀다."""
+        employees = lookup_employees(session, (record.employee_id for record, _ in rows))
+        items: list[HrAdminRecordItem] = []
+        for record, _ in rows:
+            employee = employees.get(record.employee_id)
+            if employee is None:
+                continue
+            items.append(
+                HrAdminRecordItem(
+                    **self.to_record(record).model_dump(),
+                    employee_id=employee.id,
+                    employee_no=employee.employee_no,
+                    display_name=employee.display_name,
+                    department_name=employee.department_name,
+                    employment_status=employee.employment_status,
+                )
+            )
+        return items
+
+
+def _admin_record_query(
     category: str,
+    *,
     employee_no: str | None = None,
     name: str | None = None,
     department: str | None = None,
     employment_status: str | None = None,
-) -> HrAdminRecordListResponse:
+) -> _AdminRecordQuery:
     normalized = normalize_category(category)
 
     if normalized in LEGACY_RECORD_CATEGORIES:
-        stmt = (
-            select(HrEmployeeInfoRecord, HrEmployee, AuthUser, OrgDepartment)
-            .join(HrEmployee, HrEmployeeInfoRecord.employee_id == HrEmployee.id)
-            .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-            .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-            .where(HrEmployeeInfoRecord.category == normalized)
-        )
+        model, sort_date_attr, to_record = HrEmployeeInfoRecord, "record_date", _to_record
+    elif normalized in _ADMIN_RECORD_SOURCES:
+        model, sort_date_attr, to_record = _ADMIN_RECORD_SOURCES[normalized]
+    else:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid category.")
 
-        if employee_no:
-            stmt = stmt.where(HrEmployee.employee_no.ilike(f"%{employee_no.strip()}%"))
-        if name:
-            stmt = stmt.where(AuthUser.display_name.ilike(f"%{name.strip()}%"))
-        if department:
-            stmt = stmt.where(OrgDepartment.name.ilike(f"%{department.strip()}%"))
-        if employment_status:
-            stmt = stmt.where(HrEmployee.employment_status == employment_status)
-
-        rows = session.exec(
-            stmt.order_by(HrEmployee.employee_no.asc(), HrEmployeeInfoRecord.record_date.desc(), HrEmployeeInfoRecord.id.desc())
-        ).all()
-
-        items = [
-            HrAdminRecordItem(
-                id=record.id,
-                category=normalize_category(record.category, strict=False),
-                record_date=record.record_date,
-                title=record.title,
-                type=record.type,
-                organization=record.organization,
-                value=record.value,
-                note=record.note,
-                created_at=record.created_at,
-                employee_id=employee.id,
-                employee_no=employee.employee_no,
-                display_name=user.display_name,
-                department_name=department_row.name,
-                employment_status=employee.employment_status,
-            )
-            for record, employee, user, department_row in rows
-        ]
-        return HrAdminRecordListResponse(items=items)
+    # 사번 정렬/필터에 필요한 HrEmployee 만 조인하고, 이름/부서 조인은 해당 필터가 있을 때만 붙인다.
+    stmt = select(model, HrEmployee.employee_no).join(HrEmployee, model.employee_id == HrEmployee.id)
+    if model is HrEmployeeInfoRecord:
+        stmt = stmt.where(HrEmployeeInfoRecord.category == normalized)
 
-    if normalized == "contact_points":
-        stmt = (
-            select(HrContactPoint, HrEmployee, AuthUser, OrgDepartment)
-            .join(HrEmployee, HrContactPoint.employee_id == HrEmployee.id)
-            .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-            .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        )
-    elif normalized == "careers":
-        stmt = (
-            select(HrCareer, HrEmployee, AuthUser, OrgDepartment)
-            .join(HrEmployee, HrCareer.employee_id == HrEmployee.id)
-            .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-            .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        )
-    elif normalized == "licenses":
-        stmt = (
-            select(HrLicense, HrEmployee, AuthUser, OrgDepartment)
-            .join(HrEmployee, HrLicense.employee_id == HrEmployee.id)
-            .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-            .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
+    if employee_no := normalize_term(employee_no):
+        stmt = stmt.where(contains(HrEmployee.employee_no, employee_no))
+    if name := normalize_term(name):
+        stmt = stmt.join(AuthUser, HrEmployee.user_id == AuthUser.id).where(
+            contains(AuthUser.display_name, name, chosung_column=AuthUser.display_name_chosung)
         )
-    elif normalized == "military":
-        stmt = (
-            select(HrMilitary, HrEmployee, AuthUser, OrgDepartment)
-            .join(HrEmployee, HrMilitary.employee_id == HrEmployee.id)
-            .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-            .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
+    if department := normalize_term(department):
+        stmt = stmt.join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id).where(
+            contains(OrgDepartment.name, department)
         )
-    elif normalized == "reward_punish":
-        stmt = (
-            select(HrRewardPunish, HrEmployee, AuthUser, OrgDepartment)
-            .join(HrEmployee, HrRewardPunish.employee_id == HrEmployee.id)
-            .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-            .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        )
-    else:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid category.")
-
-    if employee_no:
-        stmt = stmt.where(HrEmployee.employee_no.ilike(f"%{employee_no.strip()}%"))
-    if name:
-        stmt = stmt.where(AuthUser.display_name.ilike(f"%{name.strip()}%"))
-    if department:
-        stmt = stmt.where(OrgDepartment.name.ilike(f"%{department.strip()}%"))
     if employment_status:
         stmt = stmt.where(HrEmployee.employment_status == employment_status)
 
-    rows = session.exec(stmt.order_by(HrEmployee.employee_no.asc())).all()
-
-    items: list[HrAdminRecordItem] = []
-    for record, employee, user, department_row in rows:
-        if normalized == "contact_points":
-            mapped = _to_contact_record(record)
-        elif normalized == "careers":
-            mapped = _to_career_record(record)
-        elif normalized == "licenses":
-            mapped = _to_license_record(record)
-        elif normalized == "military":
-            mapped = _to_military_record(record)
-        else:
-            mapped = _to_reward_record(record)
-
-        items.append(
-            HrAdminRecordItem(
-                id=mapped.id,
-                category=mapped.category,
-                record_date=mapped.record_date,
-                title=mapped.title,
-                type=mapped.type,
-                organization=mapped.organization,
-                value=mapped.value,
-                note=mapped.note,
-                created_at=mapped.created_at,
-                employee_id=employee.id,
-                employee_no=employee.employee_no,
-                display_name=user.display_name,
-                department_name=department_row.name,
-                employment_status=employee.employment_status,
-            )
-        )
+    # 사번 → 날짜 최신순 → id 최신순. cursor 가 NULL 날짜에서 끊기지 않도록 NULL 여부 키를 둔다.
+    sort_date = getattr(model, sort_date_attr)
+    keyset = [
+        KeysetColumn(HrEmployee.employee_no),
+        KeysetColumn(case((sort_date.is_(None), 1), else_=0), descending=True),
+        KeysetColumn(sort_date, descending=True),
+        KeysetColumn(model.id, descending=True),
+    ]
+    return _AdminRecordQuery(statement=stmt, keyset=keyset, sort_date_attr=sort_date_attr, to_record=to_record)
+
+
+def list_hr_admin_records(
+    session: Session,
+    *,
+    category: str,
+    employee_no: str | None = None,
+    name: str | None = None,
+    department: str | None = None,
+    employment_status: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> HrAdminRecordListResponse:
+    """카테고리별 관리자 기록 목록. limit 을 주면 keyset 페이지로, 없으면 전체를 반환한다."""
+    query = _admin_record_query(
+        category,
+        employee_no=employee_no,
+        name=name,
+        department=department,
+        employment_status=employment_status,
+    )
+    if limit is None:
+        rows = session.exec(apply_keyset(query.statement, query.keyset, None)).all()
+        items = query.to_items(session, rows)
+        return HrAdminRecordListResponse(items=items, total_count=len(items))
+
+    rows, next_cursor = fetch_keyset_page(
+        session, query.statement, query.keyset, cursor=cursor, limit=limit, key=query.row_key
+    )
+    total_count = len(rows) if not cursor and next_cursor is None else count_query(session, query.statement)
+    return HrAdminRecordListResponse(
+        items=query.to_items(session, rows),
+        total_count=total_count,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
+
+
+def iter_hr_admin_record_export(
+    session: Session,
+    export_format: str,
+    *,
+    category: str,
+    employee_no: str | None = None,
+    name: str | None = None,
+    department: str | None = None,
+    employment_status: str | None = None,
+) -> Iterator[str]:
+    """관리자 기록을 yield_per 묶음으로 읽어 NDJSON 줄 또는 CSV 행을 묶음마다 내보낸다.
+
+    목록 전체를 응답 모델로 만들지 않으므로 메모리는 묶음 크기만큼만 쓴다.
+    Postgres 에서는 서버 측 커서로 읽는다.
+    """
+    query = _admin_record_query(
+        category,
+        employee_no=employee_no,
+        name=name,
+        department=department,
+        employment_status=employment_status,
+    )
+    statement = apply_keyset(query.statement, query.keyset, None).execution_options(
+        yield_per=ADMIN_RECORD_EXPORT_BATCH_SIZE
+    )
+
+    def batches() -> Iterator[list[dict[str, Any]]]:
+        for partition in session.exec(statement).partitions():
+            yield [record_item.model_dump(mode="json") for record_item in query.to_items(session, partition)]
 
-    return HrAdminRecordListResponse(items=items)
+    return stream_rows(batches(), ADMIN_RECORD_EXPORT_FIELDS, export_format)
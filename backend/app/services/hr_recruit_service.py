@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import secrets
 import string
+import time
+from collections.abc import Iterable
 from datetime import date, datetime, timezone
 
 from fastapi import HTTPException, status
 from pydantic import EmailStr, TypeAdapter, ValidationError
 from sqlmodel import Session, select
 
+from app.core.bulk import dialect_insert
+from app.core.sequence import allocate_sequence_block, max_suffix_seq
 from app.models import AuthUser, HrEmployee, HrEmployeeBasicProfile, HrRecruitFinalist, OrgDepartment
 from app.schemas.employee import EmployeeCreateRequest
 from app.schemas.hr_recruit import (
@@ -17,8 +21,10 @@ from app.schemas.hr_recruit import (
     HrRecruitFinalistItem,
     HrRecruitFinalistUpdateRequest,
     HrRecruitIfInboundRow,
+    HrRecruitIfSyncResponse,
 )
 from app.services.employee_command_service import create_employee_no_commit
+from app.services.employee_service_shared import allocate_employee_nos
 
 _EMAIL_ADAPTER = TypeAdapter(EmailStr)
 
@@ -97,42 +103,19 @@ def _build_item(row: HrRecruitFinalist) -> HrRecruitFinalistItem:
     )
 
 
-def _next_candidate_no(session: Session) -> str:
+def _allocate_candidate_nos(session: Session, count: int) -> list[str]:
     prefix = datetime.now(timezone.utc).strftime("RC%Y%m%d")
-    max_seq = 0
-    rows = session.exec(
-        select(HrRecruitFinalist.candidate_no).where(HrRecruitFinalist.candidate_no.like(f"{prefix}-%"))
-    ).all()
-    for value in rows:
-        if not value:
-            continue
-        parts = value.split("-")
-        if len(parts) != 2:
-            continue
-        try:
-            max_seq = max(max_seq, int(parts[1]))
-        except ValueError:
-            continue
-    return f"{prefix}-{max_seq + 1:04d}"
+    block = allocate_sequence_block(
+        session,
+        prefix,
+        count,
+        initial=lambda: max_suffix_seq(session, HrRecruitFinalist.candidate_no, f"{prefix}-"),
+    )
+    return [f"{prefix}-{seq:04d}" for seq in block]
 
 
-def _next_employee_no(session: Session) -> str:
-    max_seq = 0
-    employee_rows = session.exec(
-        select(HrEmployee.employee_no).where(HrEmployee.employee_no.like("EMP-%"))
-    ).all()
-    finalist_rows = session.exec(
-        select(HrRecruitFinalist.employee_no).where(HrRecruitFinalist.employee_no.like("EMP-%"))
-    ).all()
-    for value in [*employee_rows, *finalist_rows]:
-        if not value:
-            continue
-        suffix = value.replace("EMP-", "", 1)
-        try:
-            max_seq = max(max_seq, int(suffix))
-        except ValueError:
-            continue
-    return f"EMP-{max_seq + 1:06d}"
+def _next_candidate_no(session: Session) -> str:
+    return _allocate_candidate_nos(session, 1)[0]
 
 
 def _find_recruit_staging_department(session: Session) -> OrgDepartment:
@@ -344,50 +327,143 @@ def delete_finalists(session: Session, ids: list[int]) -> int:
     return len(rows)
 
 
-def sync_if_rows(session: Session, inbound_rows: list[HrRecruitIfInboundRow]) -> tuple[int, int]:
-    if not inbound_rows:
-        return 0, 0
-
-    inserted_count = 0
-    updated_count = 0
-
-    for inbound in inbound_rows:
-        existing = session.exec(
-            select(HrRecruitFinalist).where(HrRecruitFinalist.external_key == inbound.external_key)
-        ).first()
-        if existing is None:
-            row = HrRecruitFinalist(
-                candidate_no=_next_candidate_no(session),
-                source_type="if",
-                external_key=inbound.external_key,
-                full_name=inbound.full_name.strip(),
-                phone_mobile=_strip_or_none(inbound.phone_mobile),
-                email=_strip_or_none(inbound.email),
-                hire_type=inbound.hire_type,
-                expected_join_date=inbound.expected_join_date,
-                note=_strip_or_none(inbound.note),
-                status_code="draft",
-                is_active=True,
-                created_at=_utc_now(),
-                updated_at=_utc_now(),
+# ---------------------------------------------------------------------------
+# 채용 시스템 인터페이스(IF) 동기화
+# ---------------------------------------------------------------------------
+# 피드를 IF_SYNC_CHUNK_SIZE 단위로 나눠 묶음마다
+#   1) 기존 합격자 키/후보번호를 한 번에 조회하고
+#   2) 신규 건수만큼 후보번호를 블록으로 예약한 뒤
+#   3) INSERT ... ON CONFLICT (external_key) DO UPDATE 한 문장으로 반영한다.
+# 전체 피드는 한 트랜잭션이며 finish() 에서 커밋한다.
+# ---------------------------------------------------------------------------
+
+IF_SYNC_CHUNK_SIZE = 1000
+_IF_SYNC_UPDATE_FIELDS = ("source_type", "full_name", "phone_mobile", "email", "hire_type", "expected_join_date", "note", "updated_at")
+
+
+class RecruitIfSyncer:
+    """IF 행을 받아 묶음 단위로 upsert 한다. JSON 본문과 NDJSON 스트림이 같이 쓴다."""
+
+    def __init__(self, session: Session, chunk_size: int = IF_SYNC_CHUNK_SIZE) -> None:
+        self._session = session
+        self._chunk_size = max(1, chunk_size)
+        self._pending: dict[str, HrRecruitIfInboundRow] = {}
+        self._started = time.perf_counter()
+        self.inserted_count = 0
+        self.updated_count = 0
+        self.chunk_count = 0
+
+    def add(self, inbound: HrRecruitIfInboundRow) -> None:
+        # 같은 묶음 안의 중복 키는 마지막 행을 반영한다.
+        self._pending.pop(inbound.external_key, None)
+        self._pending[inbound.external_key] = inbound
+        if len(self._pending) >= self._chunk_size:
+            self.flush()
+
+    def add_many(self, inbound_rows: Iterable[HrRecruitIfInboundRow]) -> None:
+        for inbound in inbound_rows:
+            self.add(inbound)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        session = self._session
+        rows = list(self._pending.values())
+        self._pending = {}
+
+        existing = dict(
+            session.exec(
+                select(HrRecruitFinalist.external_key, HrRecruitFinalist.candidate_no).where(
+                    HrRecruitFinalist.external_key.in_([row.external_key for row in rows])
+                )
+            ).all()
+        )
+        new_candidate_nos = iter(_allocate_candidate_nos(session, sum(1 for row in rows if row.external_key not in existing)))
+        now = _utc_now()
+        values = [
+            {
+                "candidate_no": existing[row.external_key] if row.external_key in existing else next(new_candidate_nos),
+                "source_type": "if",
+                "external_key": row.external_key,
+                "full_name": row.full_name.strip(),
+                "phone_mobile": _strip_or_none(row.phone_mobile),
+                "email": _strip_or_none(row.email),
+                "hire_type": row.hire_type,
+                "expected_join_date": row.expected_join_date,
+                "note": _strip_or_none(row.note),
+                "status_code": "draft",
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for row in rows
+        ]
+
+        insert_stmt = dialect_insert(session, HrRecruitFinalist)
+        if insert_stmt is None:
+            self._apply_with_orm(values, existing)
+        else:
+            session.exec(
+                insert_stmt.values(values).on_conflict_do_update(
+                    index_elements=["external_key"],
+                    set_={field: getattr(insert_stmt.excluded, field) for field in _IF_SYNC_UPDATE_FIELDS},
+                )
             )
+        self.updated_count += len(existing)
+        self.inserted_count += len(rows) - len(existing)
+        self.chunk_count += 1
+
+    def _apply_with_orm(self, values: list[dict], existing: dict[str, str]) -> None:
+        """ON CONFLICT 를 지원하지 않는 방언용 대체 경로."""
+        session = self._session
+        current = {
+            row.external_key: row
+            for row in session.exec(
+                select(HrRecruitFinalist).where(HrRecruitFinalist.external_key.in_(list(existing)))
+            ).all()
+        }
+        for value in values:
+            row = current.get(value["external_key"])
+            if row is None:
+                session.add(HrRecruitFinalist(**value))
+                continue
+            for field in _IF_SYNC_UPDATE_FIELDS:
+                setattr(row, field, value[field])
             session.add(row)
-            inserted_count += 1
-            continue
-
-        existing.source_type = "if"
-        existing.full_name = inbound.full_name.strip()
-        existing.phone_mobile = _strip_or_none(inbound.phone_mobile)
-        existing.email = _strip_or_none(inbound.email)
-        existing.hire_type = inbound.hire_type
-        existing.expected_join_date = inbound.expected_join_date
-        existing.note = _strip_or_none(inbound.note)
-        existing.updated_at = _utc_now()
-        session.add(existing)
-        updated_count += 1
+        session.flush()
+
+    def finish(self) -> HrRecruitIfSyncResponse:
+        self.flush()
+        self._session.commit()
+        return HrRecruitIfSyncResponse(
+            inserted_count=self.inserted_count,
+            updated_count=self.updated_count,
+            chunk_count=self.chunk_count,
+            elapsed_ms=round((time.perf_counter() - self._started) * 1000, 1),
+        )
 
-    session.commit()
-    return inserted_count, updated_count
+
+def parse_if_ndjson_line(raw: bytes | str, line_no: int) -> HrRecruitIfInboundRow | None:
+    """NDJSON 한 줄을 IF 행으로 검증한다. 빈 줄은 None."""
+    if not raw.strip():
+        return None
+    try:
+        return HrRecruitIfInboundRow.model_validate_json(raw)
+    except ValidationError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{line_no}번째 줄 형식이 올바르지 않습니다: {error.errors()[0].get('msg', 'invalid')}",
+        ) from error
+
+
+def sync_if_rows(
+    session: Session,
+    inbound_rows: Iterable[HrRecruitIfInboundRow],
+    chunk_size: int = IF_SYNC_CHUNK_SIZE,
+) -> HrRecruitIfSyncResponse:
+    syncer = RecruitIfSyncer(session, chunk_size)
+    syncer.add_many(inbound_rows)
+    return syncer.finish()
 
 
 def generate_employee_numbers(session: Session, ids: list[int]) -> tuple[int, int]:
@@ -402,12 +478,9 @@ def generate_employee_numbers(session: Session, ids: list[int]) -> tuple[int, in
     skipped_count = len(rows) - len(needs_no)
 
     if needs_no:
-        # 루프 전에 기준 시퀀스를 한 번만 계산 → 배치 내 중복 방지
-        base_no = _next_employee_no(session)
-        base_seq = int(base_no.replace("EMP-", ""))
-
-        for offset, row in enumerate(needs_no):
-            row.employee_no = f"EMP-{base_seq + offset:06d}"
+        # 필요한 개수만큼 한 번에 예약 → 배치 내/동시 요청 간 중복 방지
+        for row, employee_no in zip(needs_no, allocate_employee_nos(session, len(needs_no))):
+            row.employee_no = employee_no
             if not row.login_id:
                 row.login_id = row.employee_no.lower().replace("-", "")
             if row.status_code == "draft":
@@ -437,14 +510,14 @@ def create_employees_from_finalists(
     skipped_count = 0
     error_count = 0
 
-    base_seq = int(_next_employee_no(session).replace("EMP-", ""))
-    next_seq = base_seq
+    # 아래 루프는 건별로 커밋/롤백하므로 예약한 사번 블록을 먼저 확정해 둔다.
+    new_employee_nos = iter(allocate_employee_nos(session, sum(1 for finalist in finalists if not finalist.employee_no)))
+    session.commit()
 
     for finalist in finalists:
         try:
             if not finalist.employee_no:
-                finalist.employee_no = f"EMP-{next_seq:06d}"
-                next_seq += 1
+                finalist.employee_no = next(new_employee_nos)
 
             if not finalist.login_id:
                 finalist.login_id = _next_login_id_from_employee_no(session, finalist.employee_no)
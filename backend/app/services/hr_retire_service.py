@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from fastapi import HTTPException, status
 from sqlmodel import Session, select
 
+from app.core.pagination import ALL_ROWS, PageParams, fetch_page
 from app.models import (
     AuthUser,
     HrEmployee,
@@ -54,12 +55,17 @@ def list_retire_checklist_items(
     session: Session,
     *,
     include_inactive: bool = False,
-) -> list[HrRetireChecklistItemResponse]:
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[HrRetireChecklistItemResponse], int]:
     stmt = select(HrRetireChecklistItem)
     if not include_inactive:
         stmt = stmt.where(HrRetireChecklistItem.is_active == True)
-    rows = session.exec(stmt.order_by(HrRetireChecklistItem.sort_order.asc(), HrRetireChecklistItem.id.asc())).all()
-    return [_as_checklist_item(row) for row in rows]
+    rows, total_count = fetch_page(
+        session,
+        stmt.order_by(HrRetireChecklistItem.sort_order.asc(), HrRetireChecklistItem.id.asc()),
+        page_params,
+    )
+    return [_as_checklist_item(row) for row in rows], total_count
 
 
 def create_retire_checklist_item(
@@ -161,6 +167,7 @@ def list_retire_cases(
     session: Session,
     *,
     status_filter: str | None = None,
+    page_params: PageParams = ALL_ROWS,
 ) -> HrRetireCaseListResponse:
     stmt = (
         select(HrRetireCase, HrEmployee, AuthUser, OrgDepartment)
@@ -171,7 +178,11 @@ def list_retire_cases(
     if status_filter:
         stmt = stmt.where(HrRetireCase.status == status_filter)
 
-    rows = session.exec(stmt.order_by(HrRetireCase.created_at.desc(), HrRetireCase.id.desc())).all()
+    rows, total_count = fetch_page(
+        session,
+        stmt.order_by(HrRetireCase.created_at.desc(), HrRetireCase.id.desc()),
+        page_params,
+    )
 
     items = [
         HrRetireCaseListItem(
@@ -193,9 +204,9 @@ def list_retire_cases(
 
     return HrRetireCaseListResponse(
         items=items,
-        total_count=len(items),
-        page=1,
-        limit=max(len(items), 1),
+        total_count=total_count,
+        page=max(1, page_params.page),
+        limit=page_params.limit if page_params.limit > 0 else max(len(items), 1),
     )
 
 
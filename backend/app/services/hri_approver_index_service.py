@@ -0,0 +1,233 @@
+"""결재자 해석용 인메모리 조직/직위 인덱스.
+
+ROLE_BASED 결재 단계는 신청자 부서에서 상위 부서로 올라가며 직위 키워드
+(position_title ILIKE) 에 맞는 재직자를 찾는다. 단계·부서 단계마다 키워드 스캔을
+하지 않도록 부서 조상 체인과 (부서, 정규화 키워드) → 재직자 목록을 메모리에 둔다.
+
+- 조직/사원 쓰기(발령 반영 포함)가 커밋되면 해당 엔진의 인덱스를 무효화한다.
+- 다른 프로세스의 쓰기는 ``approver_index_ttl_sec`` 경과 후 재적재로 반영한다.
+- 키워드별 맵은 처음 조회될 때 만들어 인덱스 수명 동안 재사용한다.
+
+Usage example::
+
+    index = get_approver_index(session)
+    requester = index.employee_by_user_id(requester_user_id)
+    actor = index.find_in_chain(requester.department_id, ["팀장"], exclude_user_id=requester_user_id)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models import HrEmployee, OrgDepartment
+
+_SESSION_DIRTY_KEY = "approver_index_dirty"
+_TRACKED_MODELS = (OrgDepartment, HrEmployee)
+_TRACKED_TABLES = frozenset(model.__tablename__ for model in _TRACKED_MODELS)
+
+
+@dataclass(frozen=True)
+class IndexedEmployee:
+    employee_id: int
+    user_id: int
+    department_id: int | None
+    position_title: str
+    is_active: bool
+
+
+def _normalize_keyword(value: str) -> str:
+    return value.strip().casefold()
+
+
+class ApproverIndex:
+    """한 시점의 조직/재직자 스냅샷. 생성 후 부서·사원 데이터는 바뀌지 않는다."""
+
+    def __init__(self, departments: Iterable[tuple[int, int | None]], employees: Iterable[IndexedEmployee]) -> None:
+        self.built_at = time.monotonic()
+        self._parent_by_department = dict(departments)
+        self._chains: dict[int, tuple[int, ...]] = {}
+        self._by_user_id: dict[int, IndexedEmployee] = {}
+        self._active: list[IndexedEmployee] = []
+        for employee in sorted(employees, key=lambda item: item.employee_id):
+            # 사용자당 사원은 하나지만, 중복 데이터가 있으면 기존 쿼리(.first())처럼 id 가 작은 쪽을 쓴다.
+            self._by_user_id.setdefault(employee.user_id, employee)
+            if employee.is_active:
+                self._active.append(employee)
+        self._keyword_lock = threading.Lock()
+        self._by_keyword: dict[str, dict[int | None, tuple[IndexedEmployee, ...]]] = {}
+
+    def employee_by_user_id(self, user_id: int) -> IndexedEmployee | None:
+        return self._by_user_id.get(user_id)
+
+    def department_chain(self, department_id: int | None) -> tuple[int, ...]:
+        """자기 부서부터 최상위까지의 부서 id. 순환 참조는 처음 반복 지점에서 끊는다."""
+        if department_id is None:
+            return ()
+        cached = self._chains.get(department_id)
+        if cached is not None:
+            return cached
+
+        chain: list[int] = []
+        visited: set[int] = set()
+        current: int | None = department_id
+        while current is not None and current not in visited and current in self._parent_by_department:
+            visited.add(current)
+            chain.append(current)
+            current = self._parent_by_department[current]
+        result = tuple(chain)
+        self._chains[department_id] = result
+        return result
+
+    def _keyword_map(self, keyword: str) -> dict[int | None, tuple[IndexedEmployee, ...]]:
+        mapped = self._by_keyword.get(keyword)
+        if mapped is not None:
+            return mapped
+        with self._keyword_lock:
+            mapped = self._by_keyword.get(keyword)
+            if mapped is None:
+                grouped: dict[int | None, list[IndexedEmployee]] = {}
+                for employee in self._active:
+                    if keyword in employee.position_title:
+                        grouped.setdefault(employee.department_id, []).append(employee)
+                mapped = {department_id: tuple(items) for department_id, items in grouped.items()}
+                self._by_keyword[keyword] = mapped
+        return mapped
+
+    def _first_match(
+        self,
+        keywords: Sequence[str],
+        exclude_user_id: int | None,
+        department_id: int | None = None,
+        *,
+        company_wide: bool = False,
+    ) -> IndexedEmployee | None:
+        best: IndexedEmployee | None = None
+        for keyword in {_normalize_keyword(keyword) for keyword in keywords if keyword.strip()}:
+            mapped = self._keyword_map(keyword)
+            groups = mapped.values() if company_wide else (mapped.get(department_id, ()),)
+            for employees in groups:
+                # 각 목록은 employee_id 오름차순이므로 제외 대상이 아닌 첫 항목만 비교하면 된다.
+                candidate = next((item for item in employees if item.user_id != exclude_user_id), None)
+                if candidate is not None and (best is None or candidate.employee_id < best.employee_id):
+                    best = candidate
+        return best
+
+    def find_in_chain(
+        self,
+        department_id: int | None,
+        keywords: Sequence[str],
+        *,
+        exclude_user_id: int | None = None,
+    ) -> IndexedEmployee | None:
+        """ORG_CHAIN: 자기 부서부터 상위로 올라가며 키워드에 맞는 첫 재직자(id 순)."""
+        for chain_department_id in self.department_chain(department_id):
+            found = self._first_match(keywords, exclude_user_id, chain_department_id)
+            if found is not None:
+                return found
+        return None
+
+    def find_company_wide(self, keywords: Sequence[str], *, exclude_user_id: int | None = None) -> IndexedEmployee | None:
+        """JOB_POSITION: 전사에서 키워드에 맞는 첫 재직자(id 순)."""
+        return self._first_match(keywords, exclude_user_id, company_wide=True)
+
+
+def build_approver_index(session: Session) -> ApproverIndex:
+    departments = session.exec(select(OrgDepartment.id, OrgDepartment.parent_id)).all()
+    employees = session.exec(
+        select(HrEmployee.id, HrEmployee.user_id, HrEmployee.department_id, HrEmployee.position_title, HrEmployee.employment_status)
+    ).all()
+    return ApproverIndex(
+        ((int(department_id), parent_id) for department_id, parent_id in departments),
+        (
+            IndexedEmployee(
+                employee_id=int(employee_id),
+                user_id=int(user_id),
+                department_id=department_id,
+                position_title=_normalize_keyword(position_title or ""),
+                is_active=employment_status == "active",
+            )
+            for employee_id, user_id, department_id, position_title, employment_status in employees
+        ),
+    )
+
+
+_lock = threading.Lock()
+_indexes: "weakref.WeakKeyDictionary[Engine, ApproverIndex]" = weakref.WeakKeyDictionary()
+
+
+def _engine_of(session: Session) -> Engine:
+    bind = session.get_bind()
+    return bind.engine if hasattr(bind, "engine") else bind
+
+
+def invalidate_approver_index(engine: Engine | None = None) -> None:
+    """엔진의 인덱스를 버린다. engine 이 없으면 전체."""
+    with _lock:
+        if engine is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(engine, None)
+
+
+def get_approver_index(session: Session) -> ApproverIndex:
+    """커밋된 조직/사원 상태 기준 인덱스를 반환한다.
+
+    세션에 아직 커밋되지 않은 조직/사원 변경이 있으면 그 변경이 보이는 임시 인덱스를
+    만들어 반환하고 공유 캐시에는 올리지 않는다.
+    """
+    engine = _engine_of(session)
+    ttl = settings.approver_index_ttl_sec
+    if not session.info.get(_SESSION_DIRTY_KEY):
+        index = _indexes.get(engine)
+        if index is not None and (ttl <= 0 or time.monotonic() - index.built_at < ttl):
+            return index
+
+    index = build_approver_index(session)
+    # 적재 중 autoflush 로 미커밋 변경이 보였을 수 있으므로 적재 후에 다시 확인한다.
+    if not session.info.get(_SESSION_DIRTY_KEY):
+        with _lock:
+            _indexes[engine] = index
+    return index
+
+
+# ---------------------------------------------------------------------------
+# 무효화 훅: 조직/사원 쓰기를 세션에 표시해 두었다가 커밋 시 인덱스를 버린다.
+# ---------------------------------------------------------------------------
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _mark_dirty_on_flush(session: OrmSession, _flush_context) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, _TRACKED_MODELS):
+            session.info[_SESSION_DIRTY_KEY] = True
+            return
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _mark_dirty_on_bulk_dml(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and getattr(table, "name", None) in _TRACKED_TABLES:
+        orm_execute_state.session.info[_SESSION_DIRTY_KEY] = True
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _invalidate_on_commit(session: OrmSession) -> None:
+    if session.info.pop(_SESSION_DIRTY_KEY, False):
+        invalidate_approver_index(_engine_of(session))
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _clear_dirty_on_rollback(session: OrmSession) -> None:
+    session.info.pop(_SESSION_DIRTY_KEY, None)
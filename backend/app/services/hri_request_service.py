@@ -4,17 +4,24 @@ import json
 from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import case, or_
+from sqlalchemy import case, func, literal, or_
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import insert as sa_insert
+from sqlalchemy import update as sa_update
 from sqlmodel import Session, select
 
+from app.core.batch_loader import get_batch_loader
+from app.core.event_hub import HubEvent, publish_after_commit
+from app.core.pagination import ALL_ROWS, KeysetColumn, PageParams, count_query, fetch_keyset_page, fetch_page
+from app.core.sequence import next_sequence
 from app.core.time_utils import business_today, now_utc
-
 from app.models import (
     AuthRole,
     AuthUser,
     AuthUserRole,
     HrEmployee,
     HriApprovalActorRule,
+    HriApprovalInbox,
     HriApprovalLineStep,
     HriApprovalLineTemplate,
     HriFormType,
@@ -38,7 +45,9 @@ from app.schemas.hri_request import (
     HriRequestStepSnapshotItem,
     HriRequestSubmitResponse,
     HriTaskItem,
+    HriTaskUnreadCountResponse,
 )
+from app.services.hri_approver_index_service import get_approver_index
 
 EDITABLE_REQUEST_STATUSES = {"DRAFT", "APPROVAL_REJECTED", "RECEIVE_REJECTED"}
 
@@ -353,6 +362,166 @@ def _sync_domain_projection(session: Session, request: HriRequestMaster) -> None
         _sync_welfare_request_projection(session, request)
 
 
+# ---------------------------------------------------------------------------
+# 결재함(inbox) 비정규화 테이블
+# ---------------------------------------------------------------------------
+# 진행 중 신청서의 WAITING 단계를 결재자별 한 행으로 유지한다.
+# 상신/승인/반려/회수/수신 처리와 같은 트랜잭션에서 갱신하므로 목록 조회는
+# 스냅샷·마스터·양식 조인 없이 결재함 인덱스만 읽는다.
+# ---------------------------------------------------------------------------
+
+_INBOX_STEP_TYPE_BY_STATUS = {
+    "APPROVAL_IN_PROGRESS": "APPROVAL",
+    "RECEIVE_IN_PROGRESS": "RECEIVE",
+}
+
+
+def _sync_inbox(session: Session, request: HriRequestMaster) -> None:
+    """신청서의 결재함 행을 현재 WAITING 단계와 맞춘다. 커밋은 호출자가 한다.
+
+    남아 있는 단계의 행은 그대로 두어 읽음 여부를 보존한다.
+    """
+    step_type = _INBOX_STEP_TYPE_BY_STATUS.get(request.status_code)
+    wanted: set[tuple[int, int]] = set()
+    if step_type is not None:
+        wanted = {
+            (int(actor_user_id), int(step_order))
+            for actor_user_id, step_order in session.exec(
+                select(HriRequestStepSnapshot.actor_user_id, HriRequestStepSnapshot.step_order).where(
+                    HriRequestStepSnapshot.request_id == request.id,
+                    HriRequestStepSnapshot.step_type == step_type,
+                    HriRequestStepSnapshot.action_status == "WAITING",
+                )
+            ).all()
+        }
+
+    existing = session.exec(
+        select(HriApprovalInbox.id, HriApprovalInbox.actor_user_id, HriApprovalInbox.step_order).where(
+            HriApprovalInbox.request_id == request.id
+        )
+    ).all()
+    stale_ids = [inbox_id for inbox_id, actor_user_id, step_order in existing if (actor_user_id, step_order) not in wanted]
+    if stale_ids:
+        session.exec(sa_delete(HriApprovalInbox).where(HriApprovalInbox.id.in_(stale_ids)))
+
+    missing = sorted(wanted - {(actor_user_id, step_order) for _id, actor_user_id, step_order in existing})
+    if not missing:
+        return
+    form_type = session.get(HriFormType, request.form_type_id)
+    session.exec(
+        sa_insert(HriApprovalInbox).execution_options(render_nulls=True),
+        params=[
+            {
+                "actor_user_id": actor_user_id,
+                "request_id": request.id,
+                "step_order": step_order,
+                "step_type": step_type,
+                "form_type_id": request.form_type_id,
+                "form_name": form_type.form_name_ko if form_type else None,
+                "request_no": request.request_no,
+                "title": request.title,
+                "requester_id": request.requester_id,
+                "requested_at": request.created_at,
+                "status_code": request.status_code,
+                "is_read": False,
+                "created_at": now_utc(),
+            }
+            for actor_user_id, step_order in missing
+        ],
+    )
+
+
+REQUEST_EVENT = "hri.request"
+
+
+def _publish_request_event(session: Session, request: HriRequestMaster, action: str) -> None:
+    """신청자와 결재선 참여자에게 상태 변경 이벤트를 커밋 후 발행한다."""
+    actor_user_ids = session.exec(
+        select(HriRequestStepSnapshot.actor_user_id).where(HriRequestStepSnapshot.request_id == request.id).distinct()
+    ).all()
+    publish_after_commit(
+        session,
+        HubEvent(
+            REQUEST_EVENT,
+            {
+                "action": action,
+                "request_id": request.id,
+                "request_no": request.request_no,
+                "status_code": request.status_code,
+                "current_step_order": request.current_step_order,
+            },
+            frozenset({request.requester_id, *(int(user_id) for user_id in actor_user_ids)}),
+        ),
+    )
+
+
+def rebuild_approval_inbox(session: Session) -> int:
+    """결재함 전체를 스냅샷에서 다시 만든다(초기 적재/시드 보정용). 적재 건수를 반환한다."""
+    session.exec(sa_delete(HriApprovalInbox))
+    step_type_match = or_(
+        (HriRequestMaster.status_code == "APPROVAL_IN_PROGRESS") & (HriRequestStepSnapshot.step_type == "APPROVAL"),
+        (HriRequestMaster.status_code == "RECEIVE_IN_PROGRESS") & (HriRequestStepSnapshot.step_type == "RECEIVE"),
+    )
+    source = (
+        select(
+            HriRequestStepSnapshot.actor_user_id,
+            HriRequestStepSnapshot.request_id,
+            HriRequestStepSnapshot.step_order,
+            HriRequestStepSnapshot.step_type,
+            HriRequestMaster.form_type_id,
+            HriFormType.form_name_ko,
+            HriRequestMaster.request_no,
+            HriRequestMaster.title,
+            HriRequestMaster.requester_id,
+            HriRequestMaster.created_at,
+            HriRequestMaster.status_code,
+            literal(False),
+            literal(now_utc()),
+        )
+        .join(HriRequestMaster, HriRequestMaster.id == HriRequestStepSnapshot.request_id)
+        .outerjoin(HriFormType, HriFormType.id == HriRequestMaster.form_type_id)
+        .where(HriRequestStepSnapshot.action_status == "WAITING", step_type_match)
+    )
+    result = session.exec(
+        sa_insert(HriApprovalInbox).from_select(
+            [
+                "actor_user_id",
+                "request_id",
+                "step_order",
+                "step_type",
+                "form_type_id",
+                "form_name",
+                "request_no",
+                "title",
+                "requester_id",
+                "requested_at",
+                "status_code",
+                "is_read",
+                "created_at",
+            ],
+            source,
+        )
+    )
+    session.commit()
+    return max(0, result.rowcount or 0)
+
+
+def ensure_approval_inbox(session: Session) -> bool:
+    """결재함이 비어 있는데 진행 중 신청서가 있으면 스냅샷에서 다시 만든다. 다시 만들었으면 True.
+
+    결재함 도입 전부터 쓰던 DB 는 기동 시 이 함수로 한 번 채워지고, 이후로는 _sync_inbox 가 유지한다.
+    """
+    if session.exec(select(HriApprovalInbox.id).limit(1)).first() is not None:
+        return False
+    in_progress = session.exec(
+        select(HriRequestMaster.id).where(HriRequestMaster.status_code.in_(list(_INBOX_STEP_TYPE_BY_STATUS))).limit(1)
+    ).first()
+    if in_progress is None:
+        return False
+    rebuild_approval_inbox(session)
+    return True
+
+
 def _resolve_requester_org_id(session: Session, user_id: int) -> int | None:
     department_id = session.exec(
         select(HrEmployee.department_id).where(HrEmployee.user_id == user_id)
@@ -394,22 +563,6 @@ def _parse_keywords(keywords_json: str | None) -> list[str]:
     return []
 
 
-def _collect_department_chain_ids(session: Session, department_id: int | None) -> list[int]:
-    chain_ids: list[int] = []
-    visited: set[int] = set()
-    current_id = department_id
-
-    while current_id is not None and current_id not in visited:
-        visited.add(current_id)
-        chain_ids.append(current_id)
-        department = session.get(OrgDepartment, current_id)
-        if department is None or department.parent_id is None:
-            break
-        current_id = int(department.parent_id)
-
-    return chain_ids
-
-
 def _resolve_role_actor_user_id_legacy(session: Session, requester_user_id: int, role_code: str) -> int:
     """HriApprovalActorRule 설정 테이블을 기반으로 결재자 user_id를 결정한다.
 
@@ -505,9 +658,8 @@ def _resolve_role_actor_user_id(session: Session, requester_user_id: int, role_c
         )
 
     keywords = _parse_keywords(rule.position_keywords_json)
-    requester_emp = session.exec(
-        select(HrEmployee).where(HrEmployee.user_id == requester_user_id)
-    ).first()
+    index = get_approver_index(session)
+    requester_emp = index.employee_by_user_id(requester_user_id)
     if requester_emp is None:
         return _apply_fallback(session, role_code, rule.fallback_rule, "신청자 사원 정보를 찾을 수 없습니다.")
 
@@ -522,36 +674,13 @@ def _resolve_role_actor_user_id(session: Session, requester_user_id: int, role_c
             f"역할 '{role_code}'의 position_keywords 설정이 비어 있습니다.",
         )
 
-    keyword_conditions = [HrEmployee.position_title.ilike(f"%{kw}%") for kw in keywords]
-    found: HrEmployee | None = None
-
+    found = None
     if rule.resolve_method == "ORG_CHAIN":
-        department_ids = _collect_department_chain_ids(session, requester_emp.department_id)
-        for department_id in department_ids:
-            found = session.exec(
-                select(HrEmployee)
-                .where(
-                    HrEmployee.department_id == department_id,
-                    HrEmployee.user_id != requester_user_id,
-                    HrEmployee.employment_status == "active",
-                    or_(*keyword_conditions),
-                )
-                .order_by(HrEmployee.id)
-            ).first()
-            if found is not None:
-                return found.user_id
+        found = index.find_in_chain(requester_emp.department_id, keywords, exclude_user_id=requester_user_id)
     elif rule.resolve_method == "JOB_POSITION":
-        found = session.exec(
-            select(HrEmployee)
-            .where(
-                HrEmployee.user_id != requester_user_id,
-                HrEmployee.employment_status == "active",
-                or_(*keyword_conditions),
-            )
-            .order_by(HrEmployee.id)
-        ).first()
-        if found is not None:
-            return found.user_id
+        found = index.find_company_wide(keywords, exclude_user_id=requester_user_id)
+    if found is not None:
+        return found.user_id
 
     return _apply_fallback(
         session,
@@ -593,16 +722,30 @@ def _record_history(
     session.add(history)
 
 
+def _prime_request_refs(session: Session, rows: list[HriRequestMaster]) -> None:
+    """목록 행들의 신청서 유형/현재 단계를 배치 로더에 등록한다."""
+    loader = get_batch_loader(session)
+    loader.prime(HriFormType, [row.form_type_id for row in rows])
+    loader.prime_related(
+        HriRequestStepSnapshot,
+        [row.id for row in rows if row.current_step_order is not None],
+        by="request_id",
+    )
+
+
 def _build_request_item(session: Session, row: HriRequestMaster) -> HriRequestItem:
-    form_type = session.get(HriFormType, row.form_type_id)
+    loader = get_batch_loader(session)
+    form_type = loader.get(HriFormType, row.form_type_id)
     current_actor_name: str | None = None
     if row.current_step_order is not None:
-        current_step = session.exec(
-            select(HriRequestStepSnapshot).where(
-                HriRequestStepSnapshot.request_id == row.id,
-                HriRequestStepSnapshot.step_order == row.current_step_order,
-            )
-        ).first()
+        current_step = next(
+            (
+                step
+                for step in loader.get_related(HriRequestStepSnapshot, row.id, by="request_id")
+                if step.step_order == row.current_step_order
+            ),
+            None,
+        )
         if current_step is not None:
             current_actor_name = current_step.actor_name
 
@@ -626,16 +769,14 @@ def _build_request_item(session: Session, row: HriRequestMaster) -> HriRequestIt
 
 def _next_request_no(session: Session, form_type: HriFormType) -> str:
     now = now_utc()
-    counter_key = f"{now:%Y%m}:{form_type.form_code.upper()}"
-    counter = session.get(HriRequestCounter, counter_key)
-    if counter is None:
-        counter = HriRequestCounter(counter_key=counter_key, last_seq=1, updated_at=now)
-    else:
-        counter.last_seq += 1
-        counter.updated_at = now
-    session.add(counter)
-    session.flush()
-    return f"HRI-{now:%Y%m}-{counter.last_seq:06d}"
+    legacy_key = f"{now:%Y%m}:{form_type.form_code.upper()}"
+
+    def initial() -> int:
+        legacy = session.get(HriRequestCounter, legacy_key)
+        return legacy.last_seq if legacy is not None else 0
+
+    seq = next_sequence(session, f"HRI:{legacy_key}", initial=initial)
+    return f"HRI-{now:%Y%m}-{seq:06d}"
 
 
 def _select_approval_template(session: Session, form_type_id: int) -> HriApprovalLineTemplate:
@@ -678,11 +819,27 @@ def _select_approval_template(session: Session, form_type_id: int) -> HriApprova
 
 
 def _reset_snapshot(session: Session, request_id: int) -> None:
-    rows = session.exec(
-        select(HriRequestStepSnapshot).where(HriRequestStepSnapshot.request_id == request_id)
-    ).all()
-    for row in rows:
-        session.delete(row)
+    session.exec(sa_delete(HriRequestStepSnapshot).where(HriRequestStepSnapshot.request_id == request_id))
+
+
+def _load_actor_refs(session: Session, actor_user_ids: list[int]) -> tuple[dict[int, str], dict[int, int]]:
+    """결재자 표시명과 소속 부서를 IN 쿼리 두 번으로 읽어 ({user_id: 이름}, {user_id: 부서 id}) 로 반환한다."""
+    unique_ids = sorted(set(actor_user_ids))
+    names = {
+        int(user_id): display_name
+        for user_id, display_name in session.exec(
+            select(AuthUser.id, AuthUser.display_name).where(AuthUser.id.in_(unique_ids))
+        ).all()
+    }
+    org_ids: dict[int, int] = {}
+    for user_id, department_id in session.exec(
+        select(HrEmployee.user_id, HrEmployee.department_id)
+        .where(HrEmployee.user_id.in_(unique_ids))
+        .order_by(HrEmployee.id)
+    ).all():
+        if department_id is not None:
+            org_ids.setdefault(int(user_id), int(department_id))
+    return names, org_ids
 
 
 def _create_snapshot_from_template(
@@ -691,6 +848,11 @@ def _create_snapshot_from_template(
     requester_user_id: int,
     template_id: int,
 ) -> HriRequestStepSnapshot | None:
+    """템플릿 단계를 결재선 스냅샷으로 만든다.
+
+    결재자 해석 후 이름/부서를 일괄 조회하고, 스냅샷은 다중 행 INSERT 한 번으로 넣는다.
+    첫 WAITING 단계는 재조회 없이 메모리에서 고른다 (반환 객체는 세션에 붙지 않은 값 객체).
+    """
     template_steps = session.exec(
         select(HriApprovalLineStep)
         .where(HriApprovalLineStep.template_id == template_id)
@@ -702,47 +864,51 @@ def _create_snapshot_from_template(
             detail="The selected approval template has no steps.",
         )
 
+    role_actor_ids: dict[str, int] = {}
+    admin_fallback_id: int | None = None
+    actor_user_ids: list[int] = []
     for template_step in template_steps:
         actor_user_id = template_step.actor_user_id
         if template_step.actor_resolve_type == "ROLE_BASED":
             role_code = template_step.actor_role_code or "TEAM_LEADER"
-            actor_user_id = _resolve_role_actor_user_id(session, requester_user_id, role_code)
+            if role_code not in role_actor_ids:
+                role_actor_ids[role_code] = _resolve_role_actor_user_id(session, requester_user_id, role_code)
+            actor_user_id = role_actor_ids[role_code]
         if actor_user_id is None:
-            actor_user_id = _resolve_admin_fallback_user_id(session)
-
-        actor_user = session.get(AuthUser, actor_user_id)
-        actor_name = actor_user.display_name if actor_user else f"USER-{actor_user_id}"
-        actor_org_id = _resolve_requester_org_id(session, actor_user_id)
+            if admin_fallback_id is None:
+                admin_fallback_id = _resolve_admin_fallback_user_id(session)
+            actor_user_id = admin_fallback_id
+        actor_user_ids.append(actor_user_id)
 
+    names, org_ids = _load_actor_refs(session, actor_user_ids)
+    now = now_utc()
+    snapshots: list[HriRequestStepSnapshot] = []
+    for template_step, actor_user_id in zip(template_steps, actor_user_ids):
         action_status = "RECEIVED" if template_step.step_type == "REFERENCE" else "WAITING"
-        acted_at = now_utc() if action_status == "RECEIVED" else None
-        comment = "AUTO_REFERENCE" if action_status == "RECEIVED" else None
-        snapshot = HriRequestStepSnapshot(
-            request_id=request_id,
-            step_order=template_step.step_order,
-            step_type=template_step.step_type,
-            actor_user_id=actor_user_id,
-            actor_name=actor_name,
-            actor_org_id=actor_org_id,
-            actor_role_code=template_step.actor_role_code,
-            action_status=action_status,
-            acted_at=acted_at,
-            comment=comment,
-            created_at=now_utc(),
-            updated_at=now_utc(),
+        snapshots.append(
+            HriRequestStepSnapshot(
+                request_id=request_id,
+                step_order=template_step.step_order,
+                step_type=template_step.step_type,
+                actor_user_id=actor_user_id,
+                actor_name=names.get(actor_user_id, f"USER-{actor_user_id}"),
+                actor_org_id=org_ids.get(actor_user_id),
+                actor_role_code=template_step.actor_role_code,
+                action_status=action_status,
+                acted_at=now if action_status == "RECEIVED" else None,
+                comment="AUTO_REFERENCE" if action_status == "RECEIVED" else None,
+                created_at=now,
+                updated_at=now,
+            )
         )
-        session.add(snapshot)
 
-    session.flush()
-    first_waiting = session.exec(
-        select(HriRequestStepSnapshot)
-        .where(
-            HriRequestStepSnapshot.request_id == request_id,
-            HriRequestStepSnapshot.action_status == "WAITING",
-        )
-        .order_by(HriRequestStepSnapshot.step_order, HriRequestStepSnapshot.id)
-    ).first()
-    return first_waiting
+    # render_nulls: None 컬럼 때문에 행마다 INSERT 가 나뉘지 않도록 한 문장으로 묶는다.
+    session.exec(
+        sa_insert(HriRequestStepSnapshot).execution_options(render_nulls=True),
+        params=[snapshot.model_dump(exclude={"id"}) for snapshot in snapshots],
+    )
+    # 같은 step_order 가 여러 개면 기존 재조회(step_order, id 순)와 동일하게 먼저 삽입된 행을 고른다.
+    return next((snapshot for snapshot in snapshots if snapshot.action_status == "WAITING"), None)
 
 
 def upsert_request_draft(
@@ -864,7 +1030,9 @@ def submit_request(session: Session, requester_user_id: int, request_id: int) ->
         payload={"template_id": template.id},
     )
     _sync_domain_projection(session, row)
+    _sync_inbox(session, row)
 
+    _publish_request_event(session, row, "SUBMIT")
     session.commit()
     return HriRequestSubmitResponse(
         request_id=row.id,
@@ -919,7 +1087,9 @@ def withdraw_request(session: Session, requester_user_id: int, request_id: int)
         to_status=row.status_code,
     )
     _sync_domain_projection(session, row)
+    _sync_inbox(session, row)
 
+    _publish_request_event(session, row, "WITHDRAW")
     session.commit()
     return HriRequestActionResponse(request_id=row.id, status_code=row.status_code)
 
@@ -1028,7 +1198,9 @@ def approve_request(
         payload={"comment": comment},
     )
     _sync_domain_projection(session, request)
+    _sync_inbox(session, request)
 
+    _publish_request_event(session, request, "APPROVE")
     session.commit()
     return HriRequestActionResponse(request_id=request.id, status_code=request.status_code)
 
@@ -1078,7 +1250,9 @@ def reject_request(
         payload={"comment": comment},
     )
     _sync_domain_projection(session, request)
+    _sync_inbox(session, request)
 
+    _publish_request_event(session, request, "REJECT")
     session.commit()
     return HriRequestActionResponse(request_id=request.id, status_code=request.status_code)
 
@@ -1143,7 +1317,9 @@ def receive_complete_request(
         payload={"comment": comment},
     )
     _sync_domain_projection(session, request)
+    _sync_inbox(session, request)
 
+    _publish_request_event(session, request, "RECEIVE_COMPLETE")
     session.commit()
     return HriRequestActionResponse(request_id=request.id, status_code=request.status_code)
 
@@ -1193,7 +1369,9 @@ def receive_reject_request(
         payload={"comment": comment},
     )
     _sync_domain_projection(session, request)
+    _sync_inbox(session, request)
 
+    _publish_request_event(session, request, "RECEIVE_REJECT")
     session.commit()
     return HriRequestActionResponse(request_id=request.id, status_code=request.status_code)
 
@@ -1303,74 +1481,165 @@ def get_request_detail(session: Session, request_id: int, requester_user_id: int
     )
 
 
-def list_my_requests(session: Session, requester_user_id: int) -> list[HriRequestItem]:
-    rows = session.exec(
+def list_my_requests(
+    session: Session,
+    requester_user_id: int,
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[HriRequestItem], int]:
+    rows, total_count = fetch_page(
+        session,
         select(HriRequestMaster)
         .where(HriRequestMaster.requester_id == requester_user_id)
-        .order_by(HriRequestMaster.created_at.desc(), HriRequestMaster.id.desc())
-    ).all()
-    return [_build_request_item(session, row) for row in rows]
+        .order_by(HriRequestMaster.created_at.desc(), HriRequestMaster.id.desc()),
+        page_params,
+    )
+    _prime_request_refs(session, rows)
+    return [_build_request_item(session, row) for row in rows], total_count
 
 
-def list_my_approval_tasks(session: Session, actor_user_id: int) -> list[HriTaskItem]:
-    rows = session.exec(
-        select(HriRequestStepSnapshot, HriRequestMaster)
-        .join(HriRequestMaster, HriRequestMaster.id == HriRequestStepSnapshot.request_id)
-        .where(
-            HriRequestStepSnapshot.actor_user_id == actor_user_id,
-            HriRequestStepSnapshot.step_type == "APPROVAL",
-            HriRequestStepSnapshot.action_status == "WAITING",
-            HriRequestMaster.status_code == "APPROVAL_IN_PROGRESS",
-        )
-        .order_by(HriRequestMaster.created_at.desc(), HriRequestStepSnapshot.step_order)
-    ).all()
+_INBOX_KEYSET = [
+    KeysetColumn(HriApprovalInbox.requested_at, descending=True),
+    KeysetColumn(HriApprovalInbox.request_id, descending=True),
+    KeysetColumn(HriApprovalInbox.step_order),
+]
 
-    items: list[HriTaskItem] = []
-    for step, request in rows:
-        form_type = session.get(HriFormType, request.form_type_id)
-        items.append(
-            HriTaskItem(
-                request_id=request.id,
-                request_no=request.request_no,
-                title=request.title,
-                status_code=request.status_code,
-                step_order=step.step_order,
-                step_type=step.step_type,
-                requester_id=request.requester_id,
-                requested_at=request.created_at,
-                form_name=form_type.form_name_ko if form_type else None,
-            )
-        )
-    return items
 
+def _inbox_query(actor_user_id: int, step_type: str):
+    return select(HriApprovalInbox).where(
+        HriApprovalInbox.actor_user_id == actor_user_id,
+        HriApprovalInbox.step_type == step_type,
+    )
+
+
+def _to_task_item(row: HriApprovalInbox) -> HriTaskItem:
+    return HriTaskItem(
+        request_id=row.request_id,
+        request_no=row.request_no,
+        title=row.title,
+        status_code=row.status_code,
+        step_order=row.step_order,
+        step_type=row.step_type,
+        requester_id=row.requester_id,
+        requested_at=row.requested_at,
+        form_name=row.form_name,
+        is_read=row.is_read,
+    )
+
+
+def _list_waiting_tasks(
+    session: Session,
+    actor_user_id: int,
+    *,
+    step_type: str,
+    page_params: PageParams,
+) -> tuple[list[HriTaskItem], int]:
+    rows, total_count = fetch_page(
+        session,
+        _inbox_query(actor_user_id, step_type).order_by(*[column.order_clause() for column in _INBOX_KEYSET]),
+        page_params,
+    )
+    return [_to_task_item(row) for row in rows], total_count
 
-def list_my_receive_tasks(session: Session, actor_user_id: int) -> list[HriTaskItem]:
-    rows = session.exec(
-        select(HriRequestStepSnapshot, HriRequestMaster)
-        .join(HriRequestMaster, HriRequestMaster.id == HriRequestStepSnapshot.request_id)
-        .where(
-            HriRequestStepSnapshot.actor_user_id == actor_user_id,
-            HriRequestStepSnapshot.step_type == "RECEIVE",
-            HriRequestStepSnapshot.action_status == "WAITING",
-            HriRequestMaster.status_code == "RECEIVE_IN_PROGRESS",
-        )
-        .order_by(HriRequestMaster.created_at.desc(), HriRequestStepSnapshot.step_order)
-    ).all()
 
-    items: list[HriTaskItem] = []
-    for step, request in rows:
-        form_type = session.get(HriFormType, request.form_type_id)
-        items.append(
-            HriTaskItem(
-                request_id=request.id,
-                request_no=request.request_no,
-                title=request.title,
-                status_code=request.status_code,
-                step_order=step.step_order,
-                step_type=step.step_type,
-                requester_id=request.requester_id,
-                requested_at=request.created_at,
-                form_name=form_type.form_name_ko if form_type else None,
+def _list_waiting_tasks_keyset(
+    session: Session,
+    actor_user_id: int,
+    *,
+    step_type: str,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[HriTaskItem], int, str | None]:
+    query = _inbox_query(actor_user_id, step_type)
+    total_count = count_query(session, query)
+    rows, next_cursor = fetch_keyset_page(
+        session,
+        query,
+        _INBOX_KEYSET,
+        cursor=cursor,
+        limit=limit,
+        key=lambda row: (row.requested_at, row.request_id, row.step_order),
+    )
+    return [_to_task_item(row) for row in rows], total_count, next_cursor
+
+
+def list_my_approval_tasks(
+    session: Session,
+    actor_user_id: int,
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[HriTaskItem], int]:
+    return _list_waiting_tasks(
+        session,
+        actor_user_id,
+        step_type="APPROVAL",
+        page_params=page_params,
+    )
+
+
+def list_my_receive_tasks(
+    session: Session,
+    actor_user_id: int,
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[HriTaskItem], int]:
+    return _list_waiting_tasks(
+        session,
+        actor_user_id,
+        step_type="RECEIVE",
+        page_params=page_params,
+    )
+
+
+def list_my_approval_tasks_keyset(
+    session: Session,
+    actor_user_id: int,
+    *,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[HriTaskItem], int, str | None]:
+    return _list_waiting_tasks_keyset(session, actor_user_id, step_type="APPROVAL", cursor=cursor, limit=limit)
+
+
+def list_my_receive_tasks_keyset(
+    session: Session,
+    actor_user_id: int,
+    *,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[HriTaskItem], int, str | None]:
+    return _list_waiting_tasks_keyset(session, actor_user_id, step_type="RECEIVE", cursor=cursor, limit=limit)
+
+
+def count_unread_tasks(session: Session, actor_user_id: int) -> HriTaskUnreadCountResponse:
+    """결재/수신 대기 중 읽지 않은 건수. (actor, step_type, is_read) 인덱스만으로 집계된다."""
+    counts = dict(
+        session.exec(
+            select(HriApprovalInbox.step_type, func.count())
+            .where(
+                HriApprovalInbox.actor_user_id == actor_user_id,
+                HriApprovalInbox.is_read == False,  # noqa: E712
             )
+            .group_by(HriApprovalInbox.step_type)
+        ).all()
+    )
+    approval_count = int(counts.get("APPROVAL", 0))
+    receive_count = int(counts.get("RECEIVE", 0))
+    return HriTaskUnreadCountResponse(
+        approval_count=approval_count,
+        receive_count=receive_count,
+        total_count=approval_count + receive_count,
+    )
+
+
+def mark_task_read(session: Session, actor_user_id: int, request_id: int) -> None:
+    """결재함에서 해당 신청서를 읽음 처리한다. 대기 중인 항목이 없으면 404."""
+    result = session.exec(
+        sa_update(HriApprovalInbox)
+        .where(
+            HriApprovalInbox.actor_user_id == actor_user_id,
+            HriApprovalInbox.request_id == request_id,
         )
-    return items
+        .values(is_read=True)
+    )
+    if not result.rowcount:
+        session.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found.")
+    session.commit()
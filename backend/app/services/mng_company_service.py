@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from fastapi import HTTPException, status
 from sqlmodel import Session, select
 
+from app.core.pagination import ALL_ROWS, PageParams, fetch_page
 from app.models import (
     AuthUser,
     HrEmployee,
@@ -49,15 +50,16 @@ def list_companies(
     session: Session,
     *,
     search: str | None = None,
-) -> list[MngCompanyItem]:
-    stmt = select(MngCompany).where(MngCompany.is_active == True).order_by(MngCompany.company_code)
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngCompanyItem], int]:
+    stmt = select(MngCompany).where(MngCompany.is_active == True).order_by(MngCompany.company_code, MngCompany.id)
     if search:
         keyword = f"%{search.strip()}%"
         stmt = stmt.where(
             MngCompany.company_name.ilike(keyword) | MngCompany.company_code.ilike(keyword)
         )
-    rows = session.exec(stmt).all()
-    return [_build_company_item(r) for r in rows]
+    rows, total_count = fetch_page(session, stmt, page_params)
+    return [_build_company_item(r) for r in rows], total_count
 
 
 def get_company(session: Session, company_id: int) -> MngCompanyItem:
@@ -157,17 +159,20 @@ def _build_manager_item(mc: MngManagerCompany, emp_name: str | None, comp_name:
     )
 
 
-def list_manager_companies(session: Session) -> list[MngManagerCompanyItem]:
+def list_manager_companies(
+    session: Session,
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngManagerCompanyItem], int]:
     stmt = (
         select(MngManagerCompany, AuthUser.display_name, MngCompany.company_name)
         .join(HrEmployee, MngManagerCompany.employee_id == HrEmployee.id)
         .join(AuthUser, HrEmployee.user_id == AuthUser.id)
         .join(MngCompany, MngManagerCompany.company_id == MngCompany.id)
         .where(MngManagerCompany.is_active == True)
-        .order_by(AuthUser.display_name)
+        .order_by(AuthUser.display_name, MngManagerCompany.id)
     )
-    rows = session.exec(stmt).all()
-    return [_build_manager_item(mc, emp_name, comp_name) for mc, emp_name, comp_name in rows]
+    rows, total_count = fetch_page(session, stmt, page_params)
+    return [_build_manager_item(mc, emp_name, comp_name) for mc, emp_name, comp_name in rows], total_count
 
 
 def create_manager_company(session: Session, payload: MngManagerCompanyCreateRequest) -> MngManagerCompanyItem:
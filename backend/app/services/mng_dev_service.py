@@ -5,8 +5,10 @@ from __future__ import annotations
 from datetime import date
 
 from fastapi import HTTPException, status
-from sqlmodel import Session, select
+from sqlalchemy import Integer, case, extract
+from sqlmodel import Session, func, select
 
+from app.core.pagination import ALL_ROWS, PageParams, fetch_page
 from app.core.time_utils import business_today, now_utc
 
 from app.models import (
@@ -151,16 +153,17 @@ def list_dev_requests(
     *,
     company_id: int | None = None,
     status_code: str | None = None,
-) -> list[MngDevRequestItem]:
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngDevRequestItem], int]:
     stmt = select(MngDevRequest).order_by(MngDevRequest.id.desc())
     if company_id:
         stmt = stmt.where(MngDevRequest.company_id == company_id)
     if status_code:
         stmt = stmt.where(MngDevRequest.status_code == status_code)
-    rows = session.exec(stmt).all()
+    rows, total_count = fetch_page(session, stmt, page_params)
 
     if not rows:
-        return []
+        return [], total_count
 
     # N+1 방지: 사용되는 ID를 미리 수집해 일괄 로드
     company_ids = list({r.company_id for r in rows if r.company_id is not None})
@@ -173,7 +176,7 @@ def list_dev_requests(
     company_map = _load_company_name_map(session, company_ids)
     employee_map = _load_employee_display_name_map(session, employee_ids)
 
-    return [_build_dev_request_item_from_maps(r, company_map, employee_map) for r in rows]
+    return [_build_dev_request_item_from_maps(r, company_map, employee_map) for r in rows], total_count
 
 
 def get_dev_request(session: Session, request_id: int) -> MngDevRequestItem:
@@ -252,33 +255,36 @@ def list_dev_request_monthly_summary(
     *,
     company_id: int | None = None,
     status_code: str | None = None,
-) -> list[MngDevRequestMonthlySummaryItem]:
-    stmt = select(MngDevRequest).order_by(MngDevRequest.request_ym.desc())
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngDevRequestMonthlySummaryItem], int]:
+    year_col = extract("year", MngDevRequest.request_ym)
+    month_col = extract("month", MngDevRequest.request_ym)
+    stmt = select(
+        year_col,
+        month_col,
+        func.count(MngDevRequest.id),
+        func.sum(case((MngDevRequest.is_paid == True, 1), else_=0)),
+        func.sum(func.coalesce(MngDevRequest.paid_man_months, 0)),
+        func.sum(func.coalesce(MngDevRequest.actual_man_months, 0)),
+    )
     if company_id:
         stmt = stmt.where(MngDevRequest.company_id == company_id)
     if status_code:
         stmt = stmt.where(MngDevRequest.status_code == status_code)
-    rows = session.exec(stmt).all()
-
-    bucket: dict[date, MngDevRequestMonthlySummaryItem] = {}
-    for row in rows:
-        month = date(row.request_ym.year, row.request_ym.month, 1)
-        if month not in bucket:
-            bucket[month] = MngDevRequestMonthlySummaryItem(
-                request_ym=month,
-                total_count=0,
-                paid_count=0,
-                paid_man_months_total=0.0,
-                actual_man_months_total=0.0,
-            )
-        summary = bucket[month]
-        summary.total_count += 1
-        if row.is_paid:
-            summary.paid_count += 1
-        summary.paid_man_months_total += float(row.paid_man_months or 0)
-        summary.actual_man_months_total += float(row.actual_man_months or 0)
-
-    return sorted(bucket.values(), key=lambda item: item.request_ym, reverse=True)
+    stmt = stmt.group_by(year_col, month_col).order_by(year_col.desc(), month_col.desc())
+    rows, total_count = fetch_page(session, stmt, page_params)
+
+    items = [
+        MngDevRequestMonthlySummaryItem(
+            request_ym=date(int(year), int(month), 1),
+            total_count=int(total or 0),
+            paid_count=int(paid or 0),
+            paid_man_months_total=float(paid_mm or 0),
+            actual_man_months_total=float(actual_mm or 0),
+        )
+        for year, month, total, paid, paid_mm, actual_mm in rows
+    ]
+    return items, total_count
 
 
 # ──────────────────────────────────────────────
@@ -333,19 +339,20 @@ def list_dev_projects(
     session: Session,
     *,
     company_id: int | None = None,
-) -> list[MngDevProjectItem]:
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngDevProjectItem], int]:
     stmt = select(MngDevProject).order_by(MngDevProject.id.desc())
     if company_id:
         stmt = stmt.where(MngDevProject.company_id == company_id)
-    rows = session.exec(stmt).all()
+    rows, total_count = fetch_page(session, stmt, page_params)
 
     if not rows:
-        return []
+        return [], total_count
 
     company_ids = list({p.company_id for p in rows if p.company_id is not None})
     company_map = _load_company_name_map(session, company_ids)
 
-    return [_build_dev_project_item_from_map(p, company_map) for p in rows]
+    return [_build_dev_project_item_from_map(p, company_map) for p in rows], total_count
 
 
 def get_dev_project(session: Session, project_id: int) -> MngDevProjectItem:
@@ -452,21 +459,22 @@ def list_dev_inquiries(
     *,
     company_id: int | None = None,
     progress_code: str | None = None,
-) -> list[MngDevInquiryItem]:
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngDevInquiryItem], int]:
     stmt = select(MngDevInquiry).order_by(MngDevInquiry.id.desc())
     if company_id:
         stmt = stmt.where(MngDevInquiry.company_id == company_id)
     if progress_code:
         stmt = stmt.where(MngDevInquiry.progress_code == progress_code)
-    rows = session.exec(stmt).all()
+    rows, total_count = fetch_page(session, stmt, page_params)
 
     if not rows:
-        return []
+        return [], total_count
 
     company_ids = list({q.company_id for q in rows if q.company_id is not None})
     company_map = _load_company_name_map(session, company_ids)
 
-    return [_build_dev_inquiry_item_from_map(q, company_map) for q in rows]
+    return [_build_dev_inquiry_item_from_map(q, company_map) for q in rows], total_count
 
 
 def get_dev_inquiry(session: Session, inquiry_id: int) -> MngDevInquiryItem:
@@ -528,14 +536,15 @@ def list_dev_staff_projects(
     session: Session,
     *,
     company_id: int | None = None,
-) -> list[MngDevStaffProjectItem]:
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngDevStaffProjectItem], int]:
     stmt = select(MngDevProject).order_by(MngDevProject.id.desc())
     if company_id:
         stmt = stmt.where(MngDevProject.company_id == company_id)
-    rows = session.exec(stmt).all()
+    rows, total_count = fetch_page(session, stmt, page_params)
 
     if not rows:
-        return []
+        return [], total_count
 
     company_ids = list({row.company_id for row in rows if row.company_id is not None})
     company_map = _load_company_name_map(session, company_ids)
@@ -555,39 +564,44 @@ def list_dev_staff_projects(
             contract_amount=row.contract_amount,
         )
         for row in rows
-    ]
-
-
-def _to_month(value: date | None) -> date:
-    if value is None:
-        today = business_today()
-        return date(today.year, today.month, 1)
-    return date(value.year, value.month, 1)
+    ], total_count
 
 
 def list_dev_staff_revenue_summary(
     session: Session,
     *,
     company_id: int | None = None,
-) -> list[MngDevStaffRevenueItem]:
-    stmt = select(MngDevProject).order_by(MngDevProject.id.desc())
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngDevStaffRevenueItem], int]:
+    # 기준일이 모두 비어 있는 프로젝트는 당월로 집계한다.
+    today = business_today()
+    basis = func.coalesce(
+        MngDevProject.contract_end_date,
+        MngDevProject.dev_end_date,
+        MngDevProject.contract_start_date,
+        MngDevProject.dev_start_date,
+    )
+    year_col = func.coalesce(extract("year", basis).cast(Integer), today.year)
+    month_col = func.coalesce(extract("month", basis).cast(Integer), today.month)
+    stmt = select(
+        year_col,
+        month_col,
+        func.count(MngDevProject.id),
+        func.sum(func.coalesce(MngDevProject.contract_amount, 0)),
+        func.sum(func.coalesce(MngDevProject.actual_man_months, 0)),
+    )
     if company_id:
         stmt = stmt.where(MngDevProject.company_id == company_id)
-    rows = session.exec(stmt).all()
-
-    bucket: dict[date, MngDevStaffRevenueItem] = {}
-    for row in rows:
-        month_key = _to_month(row.contract_end_date or row.dev_end_date or row.contract_start_date or row.dev_start_date)
-        if month_key not in bucket:
-            bucket[month_key] = MngDevStaffRevenueItem(
-                month=month_key,
-                project_count=0,
-                contract_amount_total=0,
-                actual_man_months_total=0.0,
-            )
-        item = bucket[month_key]
-        item.project_count += 1
-        item.contract_amount_total += int(row.contract_amount or 0)
-        item.actual_man_months_total += float(row.actual_man_months or 0)
-
-    return sorted(bucket.values(), key=lambda item: item.month, reverse=True)
+    stmt = stmt.group_by(year_col, month_col).order_by(year_col.desc(), month_col.desc())
+    rows, total_count = fetch_page(session, stmt, page_params)
+
+    items = [
+        MngDevStaffRevenueItem(
+            month=date(int(year), int(month), 1),
+            project_count=int(project_count or 0),
+            contract_amount_total=int(amount or 0),
+            actual_man_months_total=float(actual_mm or 0),
+        )
+        for year, month, project_count, amount, actual_mm in rows
+    ]
+    return items, total_count
@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from fastapi import HTTPException, status
 from sqlmodel import Session, select
 
+from app.core.batch_loader import get_batch_loader
+from app.core.pagination import ALL_ROWS, PageParams, fetch_page
 from app.models import MngCompany, MngInfraConfig, MngInfraMaster
 from app.schemas.mng import (
     MngInfraConfigItem,
@@ -21,7 +23,7 @@ def _utc_now() -> datetime:
 
 
 def _resolve_company_name(session: Session, company_id: int) -> str | None:
-    c = session.get(MngCompany, company_id)
+    c = get_batch_loader(session).get(MngCompany, company_id)
     return c.company_name if c else None
 
 
@@ -44,12 +46,14 @@ def list_infra_masters(
     session: Session,
     *,
     company_id: int | None = None,
-) -> list[MngInfraMasterItem]:
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngInfraMasterItem], int]:
     stmt = select(MngInfraMaster).where(MngInfraMaster.is_active == True).order_by(MngInfraMaster.id.desc())
     if company_id:
         stmt = stmt.where(MngInfraMaster.company_id == company_id)
-    rows = session.exec(stmt).all()
-    return [_build_master_item(m, session) for m in rows]
+    rows, total_count = fetch_page(session, stmt, page_params)
+    get_batch_loader(session).prime(MngCompany, [m.company_id for m in rows])
+    return [_build_master_item(m, session) for m in rows], total_count
 
 
 def create_infra_master(session: Session, payload: MngInfraMasterCreateRequest) -> MngInfraMasterItem:
@@ -90,13 +94,19 @@ def delete_infra_masters(session: Session, ids: list[int]) -> int:
 
 # ── 인프라 구성 상세 ──
 
-def list_infra_configs(session: Session, master_id: int) -> list[MngInfraConfigItem]:
-    rows = session.exec(
+def list_infra_configs(
+    session: Session,
+    master_id: int,
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngInfraConfigItem], int]:
+    rows, total_count = fetch_page(
+        session,
         select(MngInfraConfig)
         .where(MngInfraConfig.master_id == master_id)
-        .order_by(MngInfraConfig.section, MngInfraConfig.sort_order)
-    ).all()
-    return [
+        .order_by(MngInfraConfig.section, MngInfraConfig.sort_order, MngInfraConfig.id),
+        page_params,
+    )
+    items = [
         MngInfraConfigItem(
             id=c.id,
             master_id=c.master_id,
@@ -109,6 +119,7 @@ def list_infra_configs(session: Session, master_id: int) -> list[MngInfraConfigI
         )
         for c in rows
     ]
+    return items, total_count
 
 
 def upsert_infra_configs(session: Session, master_id: int, payload: MngInfraConfigUpsertRequest) -> list[MngInfraConfigItem]:
@@ -142,7 +153,8 @@ def upsert_infra_configs(session: Session, master_id: int, payload: MngInfraConf
             ))
 
     session.commit()
-    return list_infra_configs(session, master_id)
+    items, _total_count = list_infra_configs(session, master_id)
+    return items
 
 
 def delete_infra_config(session: Session, config_id: int) -> None:
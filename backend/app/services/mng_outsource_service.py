@@ -5,8 +5,10 @@ from __future__ import annotations
 from datetime import date, datetime, timezone
 
 from fastapi import HTTPException, status
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 
+from app.core.batch_loader import get_batch_loader
+from app.core.pagination import ALL_ROWS, PageParams, fetch_page
 from app.models import (
     AuthUser,
     HrEmployee,
@@ -27,11 +29,19 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _prime_emps(session: Session, employee_ids: list[int]) -> None:
+    """사원/사용자를 IN 쿼리 두 번으로 미리 적재한다."""
+    loader = get_batch_loader(session)
+    employees = loader.load_many(HrEmployee, employee_ids)
+    loader.prime(AuthUser, [emp.user_id for emp in employees.values()])
+
+
 def _resolve_emp(session: Session, employee_id: int) -> tuple[str | None, str | None]:
-    emp = session.get(HrEmployee, employee_id)
+    loader = get_batch_loader(session)
+    emp = loader.get(HrEmployee, employee_id)
     if emp is None:
         return None, None
-    user = session.get(AuthUser, emp.user_id)
+    user = loader.get(AuthUser, emp.user_id)
     return (user.display_name if user else None), emp.employee_no
 
 
@@ -59,19 +69,19 @@ def list_outsource_contracts(
     session: Session,
     *,
     search: str | None = None,
-) -> list[MngOutsourceContractItem]:
-    stmt = select(MngOutsourceContract).where(MngOutsourceContract.is_active == True).order_by(MngOutsourceContract.id.desc())
-    rows = session.exec(stmt).all()
-    items = [_build_contract_item(c, session) for c in rows]
-
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngOutsourceContractItem], int]:
+    stmt = select(MngOutsourceContract).where(MngOutsourceContract.is_active == True)
     if search:
-        keyword = search.strip().lower()
-        items = [
-            it for it in items
-            if (it.employee_name and keyword in it.employee_name.lower())
-            or (it.employee_no and keyword in it.employee_no.lower())
-        ]
-    return items
+        keyword = f"%{search.strip()}%"
+        stmt = (
+            stmt.join(HrEmployee, MngOutsourceContract.employee_id == HrEmployee.id)
+            .join(AuthUser, HrEmployee.user_id == AuthUser.id)
+            .where(AuthUser.display_name.ilike(keyword) | HrEmployee.employee_no.ilike(keyword))
+        )
+    rows, total_count = fetch_page(session, stmt.order_by(MngOutsourceContract.id.desc()), page_params)
+    _prime_emps(session, [c.employee_id for c in rows])
+    return [_build_contract_item(c, session) for c in rows], total_count
 
 
 def get_outsource_contract(session: Session, contract_id: int) -> MngOutsourceContractItem:
@@ -146,16 +156,31 @@ def has_duplicate_outsource_contract(
 
 # ── 외주 근태 ──
 
-def list_outsource_attendance_summary(session: Session) -> list[MngOutsourceAttendanceSummaryItem]:
-    contracts = session.exec(
-        select(MngOutsourceContract).where(MngOutsourceContract.is_active == True).order_by(MngOutsourceContract.id.desc())
-    ).all()
+def list_outsource_attendance_summary(
+    session: Session,
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngOutsourceAttendanceSummaryItem], int]:
+    contracts, total_count = fetch_page(
+        session,
+        select(MngOutsourceContract).where(MngOutsourceContract.is_active == True).order_by(MngOutsourceContract.id.desc()),
+        page_params,
+    )
+    contract_ids = [c.id for c in contracts]
+    used_by_contract: dict[int, float] = {}
+    if contract_ids:
+        used_by_contract = {
+            contract_id: used or 0
+            for contract_id, used in session.exec(
+                select(MngOutsourceAttendance.contract_id, func.sum(MngOutsourceAttendance.apply_count))
+                .where(MngOutsourceAttendance.contract_id.in_(contract_ids))
+                .group_by(MngOutsourceAttendance.contract_id)
+            ).all()
+        }
+    _prime_emps(session, [c.employee_id for c in contracts])
+
     result: list[MngOutsourceAttendanceSummaryItem] = []
     for c in contracts:
-        att_rows = session.exec(
-            select(MngOutsourceAttendance).where(MngOutsourceAttendance.contract_id == c.id)
-        ).all()
-        used = sum((a.apply_count or 0) for a in att_rows)
+        used = used_by_contract.get(c.id, 0)
         total = c.total_leave_count + c.extra_leave_count
         name, no = _resolve_emp(session, c.employee_id)
         result.append(MngOutsourceAttendanceSummaryItem(
@@ -170,16 +195,22 @@ def list_outsource_attendance_summary(session: Session) -> list[MngOutsourceAtte
             remain_count=max(total - used, 0),
             note=c.note,
         ))
-    return result
+    return result, total_count
 
 
-def list_outsource_attendances(session: Session, contract_id: int) -> list[MngOutsourceAttendanceItem]:
-    rows = session.exec(
+def list_outsource_attendances(
+    session: Session,
+    contract_id: int,
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[MngOutsourceAttendanceItem], int]:
+    rows, total_count = fetch_page(
+        session,
         select(MngOutsourceAttendance)
         .where(MngOutsourceAttendance.contract_id == contract_id)
-        .order_by(MngOutsourceAttendance.start_date.desc())
-    ).all()
-    return [
+        .order_by(MngOutsourceAttendance.start_date.desc(), MngOutsourceAttendance.id.desc()),
+        page_params,
+    )
+    items = [
         MngOutsourceAttendanceItem(
             id=a.id,
             contract_id=a.contract_id,
@@ -196,6 +227,7 @@ def list_outsource_attendances(session: Session, contract_id: int) -> list[MngOu
         )
         for a in rows
     ]
+    return items, total_count
 
 
 def create_outsource_attendance(session: Session, payload: MngOutsourceAttendanceCreateRequest) -> MngOutsourceAttendanceItem:
@@ -0,0 +1,167 @@
+"""부서 계층 closure 테이블(org_department_closures).
+
+자기 자신(depth 0)을 포함한 모든 (조상, 자손) 쌍을 한 행씩 둔다. 조상 체인, 하위 부서 전체,
+"A 가 B 의 하위인가" 를 parent_id 를 한 단계씩 따라가지 않고 인덱스 조회 한 번으로 답한다.
+
+- 부서 생성/상위 변경/삭제(organization_service, org_restructure_service)가 같은 트랜잭션에서
+  add/move/remove_department_node 로 갱신한다.
+- 시드나 직접 SQL 처럼 그 밖의 경로로 parent_id 가 바뀐 경우 ``ensure_department_closure`` 가
+  parent_id 기준으로 다시 만든다(bootstrap.ensure_read_models, 부서 시드 후 호출).
+
+Usage example::
+
+    statement = statement.where(HrEmployee.department_id.in_(subtree_department_ids(department_id)))
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import delete, exists, func, insert, literal, or_, true
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, select
+
+from app.core.bulk import chunked
+from app.models import HrEmployee, OrgDepartment, OrgDepartmentClosure
+
+REBUILD_BATCH_SIZE = 1000
+
+
+def subtree_department_ids(department_id: int):
+    """department_id 와 그 하위 부서 전체의 id 서브쿼리. ``column.in_(...)`` 에 넣어 쓴다."""
+    return select(OrgDepartmentClosure.descendant_id).where(OrgDepartmentClosure.ancestor_id == department_id)
+
+
+def ancestor_ids(session: Session, department_id: int) -> list[int]:
+    """자기 부서부터 최상위까지의 부서 id (가까운 순)."""
+    return list(
+        session.exec(
+            select(OrgDepartmentClosure.ancestor_id)
+            .where(OrgDepartmentClosure.descendant_id == department_id)
+            .order_by(OrgDepartmentClosure.depth)
+        ).all()
+    )
+
+
+def is_in_subtree(session: Session, ancestor_id: int, department_id: int) -> bool:
+    """department_id 가 ancestor_id 자신이거나 그 하위 부서이면 True."""
+    return (
+        session.exec(
+            select(OrgDepartmentClosure.depth).where(
+                OrgDepartmentClosure.ancestor_id == ancestor_id,
+                OrgDepartmentClosure.descendant_id == department_id,
+            )
+        ).first()
+        is not None
+    )
+
+
+def subtree_headcount(session: Session, department_id: int, *, employment_statuses: Iterable[str] | None = None) -> int:
+    """department_id 와 그 하위 부서 전체의 인원."""
+    statement = (
+        select(func.count(HrEmployee.id))
+        .join(OrgDepartmentClosure, HrEmployee.department_id == OrgDepartmentClosure.descendant_id)
+        .where(OrgDepartmentClosure.ancestor_id == department_id)
+    )
+    if employment_statuses is not None:
+        statement = statement.where(HrEmployee.employment_status.in_(list(employment_statuses)))
+    return int(session.exec(statement).one())
+
+
+def add_department_node(session: Session, department_id: int, parent_id: int | None) -> None:
+    """새 부서의 closure 행(자기 자신 + 상위 부서의 모든 조상)을 만든다. 부서는 flush 된 뒤여야 한다."""
+    session.add(OrgDepartmentClosure(ancestor_id=department_id, descendant_id=department_id, depth=0))
+    session.flush()
+    if parent_id is None:
+        return
+    session.exec(
+        insert(OrgDepartmentClosure).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(
+                OrgDepartmentClosure.ancestor_id,
+                literal(department_id),
+                OrgDepartmentClosure.depth + 1,
+            ).where(OrgDepartmentClosure.descendant_id == parent_id),
+        )
+    )
+
+
+def move_department_node(session: Session, department_id: int, new_parent_id: int | None) -> None:
+    """department_id 서브트리를 new_parent_id 아래로 옮긴다. 순환 여부는 호출 측에서 먼저 확인한다."""
+    subtree = subtree_department_ids(department_id)
+    session.exec(
+        delete(OrgDepartmentClosure).where(
+            OrgDepartmentClosure.descendant_id.in_(subtree),
+            OrgDepartmentClosure.ancestor_id.not_in(subtree),
+        )
+    )
+    if new_parent_id is None:
+        return
+    above = aliased(OrgDepartmentClosure)
+    below = aliased(OrgDepartmentClosure)
+    session.exec(
+        insert(OrgDepartmentClosure).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            # 새 상위의 조상 전체 × 옮길 서브트리 전체
+            select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+            .select_from(above)
+            .join(below, true())
+            .where(above.descendant_id == new_parent_id, below.ancestor_id == department_id),
+        )
+    )
+
+
+def remove_department_node(session: Session, department_id: int) -> None:
+    session.exec(
+        delete(OrgDepartmentClosure).where(
+            or_(OrgDepartmentClosure.ancestor_id == department_id, OrgDepartmentClosure.descendant_id == department_id)
+        )
+    )
+
+
+def _closure_rows(parents: dict[int, int | None]) -> list[dict[str, int]]:
+    rows: list[dict[str, int]] = []
+    for department_id in parents:
+        # 순환 참조는 처음 반복 지점에서 끊는다(hri_approver_index_service.department_chain 과 같은 규칙).
+        visited: set[int] = set()
+        current: int | None = department_id
+        depth = 0
+        while current is not None and current not in visited and current in parents:
+            visited.add(current)
+            rows.append({"ancestor_id": current, "descendant_id": department_id, "depth": depth})
+            current = parents[current]
+            depth += 1
+    return rows
+
+
+def rebuild_department_closure(session: Session) -> int:
+    """parent_id 로부터 closure 전체를 다시 만든다. 만든 행 수를 반환한다(커밋은 호출 측)."""
+    parents = {int(department_id): parent_id for department_id, parent_id in session.exec(select(OrgDepartment.id, OrgDepartment.parent_id)).all()}
+    rows = _closure_rows(parents)
+    session.exec(delete(OrgDepartmentClosure))
+    for batch in chunked(rows, REBUILD_BATCH_SIZE):
+        session.exec(insert(OrgDepartmentClosure), params=batch)
+    return len(rows)
+
+
+def ensure_department_closure(session: Session) -> bool:
+    """closure 가 parent_id 와 어긋나 있으면 다시 만든다. 다시 만들었으면 True.
+
+    부서마다 자기 행(depth 0)과 상위 부서 행(depth 1)이 (id, parent_id) 와 맞는지 anti-join 으로 보므로
+    직접 SQL 로 상위 부서만 바꾼 경우도 잡는다. 삭제된 부서의 행은 같은 쿼리의 건수 비교로 잡는다.
+    """
+    self_row = aliased(OrgDepartmentClosure)
+    parent_row = aliased(OrgDepartmentClosure)
+    mismatched = (
+        select(OrgDepartment.id)
+        .outerjoin(self_row, (self_row.descendant_id == OrgDepartment.id) & (self_row.ancestor_id == OrgDepartment.id))
+        .outerjoin(parent_row, (parent_row.descendant_id == OrgDepartment.id) & (parent_row.depth == 1))
+        .where(or_(self_row.depth.is_(None), parent_row.ancestor_id.is_distinct_from(OrgDepartment.parent_id)))
+    )
+    expected_count = select(func.count(OrgDepartment.id) + func.count(OrgDepartment.parent_id)).scalar_subquery()
+    link_count = select(func.count()).select_from(OrgDepartmentClosure).where(OrgDepartmentClosure.depth <= 1).scalar_subquery()
+    is_stale = session.exec(select(or_(exists(mismatched), link_count != expected_count))).one()
+    if not is_stale:
+        return False
+    rebuild_department_closure(session)
+    return True
@@ -1,11 +1,16 @@
 """조직개편 서비스 (A안: 개편안 관리 + B안: 직접 수정 이력은 organization_service.py에서 호출)."""
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 from fastapi import HTTPException, status
+from sqlalchemy import insert as sa_insert
 from sqlmodel import Session, select
 
+from app.core.bulk import bulk_update_by_pk
+from app.core.pagination import KeysetColumn, fetch_keyset_page
 from app.models import (
     AuthUser,
     OrgDeptChangeHistory,
@@ -13,10 +18,14 @@ from app.models import (
     OrgRestructurePlan,
     OrgRestructurePlanItem,
 )
+from app.services.org_hierarchy_service import rebuild_department_closure
 from app.schemas.organization import (
     OrgDeptChangeHistoryItem,
     OrgDeptChangeHistoryListResponse,
     OrgRestructureApplyResponse,
+    OrgRestructureDryRunConflict,
+    OrgRestructureDryRunDepartment,
+    OrgRestructureDryRunResponse,
     OrgRestructurePlanCreateRequest,
     OrgRestructurePlanItem as OrgRestructurePlanItemSchema,
     OrgRestructurePlanItemCreateRequest,
@@ -94,12 +103,28 @@ def list_dept_change_history(
     session: Session,
     department_id: int | None = None,
     limit: int = 200,
+    cursor: str | None = None,
 ) -> OrgDeptChangeHistoryListResponse:
-    stmt = select(OrgDeptChangeHistory).order_by(OrgDeptChangeHistory.changed_at.desc())
+    """부서 변경 이력. cursor 가 주어지면(빈 문자열 포함) (changed_at, id) keyset 으로 다음 페이지를 조회한다."""
+    stmt = select(OrgDeptChangeHistory)
     if department_id is not None:
         stmt = stmt.where(OrgDeptChangeHistory.department_id == department_id)
-    stmt = stmt.limit(limit)
-    rows = session.exec(stmt).all()
+
+    next_cursor: str | None = None
+    if cursor is not None:
+        rows, next_cursor = fetch_keyset_page(
+            session,
+            stmt,
+            [
+                KeysetColumn(OrgDeptChangeHistory.changed_at, descending=True),
+                KeysetColumn(OrgDeptChangeHistory.id, descending=True),
+            ],
+            cursor=cursor,
+            limit=limit,
+            key=lambda row: (row.changed_at, row.id),
+        )
+    else:
+        rows = session.exec(stmt.order_by(OrgDeptChangeHistory.changed_at.desc()).limit(limit)).all()
 
     items = [
         OrgDeptChangeHistoryItem(
@@ -116,7 +141,7 @@ def list_dept_change_history(
         )
         for row in rows
     ]
-    return OrgDeptChangeHistoryListResponse(items=items, total_count=len(items))
+    return OrgDeptChangeHistoryListResponse(items=items, total_count=len(items), next_cursor=next_cursor)
 
 
 # ---------------------------------------------------------------------------
@@ -384,9 +409,358 @@ def _validate_plan_item_payload(
 
 
 # ---------------------------------------------------------------------------
-# A안: 개편안 일괄 적용
+# A안: 개편안 시뮬레이션(dry-run) / 일괄 적용
+#
+# 부서 그래프를 한 번 읽어 pending 항목을 순서대로 메모리에서 적용해 본다(순환 검사 포함).
+# dry-run 은 그 결과 조직도와 충돌 항목을 돌려주고, 적용은 같은 결과를 부서 갱신·변경 이력·
+# 항목 상태별로 한 번씩 일괄 기록한다. 항목 수가 늘어도 쿼리 수는 늘지 않는다.
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True)
+class _SimDepartment:
+    """시뮬레이션 중인 부서. 개편안으로 새로 만들 부서는 id 가 None 이고 key 가 음수다."""
+
+    key: int
+    id: int | None
+    code: str
+    name: str
+    parent_key: int | None
+    is_active: bool
+    organization_type: str | None = None
+    cost_center_code: str | None = None
+    changed_fields: set[str] = field(default_factory=set)
+
+
+@dataclass(slots=True)
+class _ItemOutcome:
+    item: OrgRestructurePlanItem
+    message: str | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class _DeptChange:
+    department_key: int
+    field_name: str
+    before_value: str | None
+    after_value: str | None
+
+
+class _RestructureSimulator:
+    """개편 항목을 메모리의 부서 그래프에 순서대로 적용한다. 항목 검증 실패는 HTTPException 으로 건너뛴다."""
+
+    def __init__(self, departments: Iterable[_SimDepartment]) -> None:
+        self.departments = {department.key: department for department in departments}
+        self.key_by_code = {department.code: department.key for department in self.departments.values()}
+        self.outcomes: list[_ItemOutcome] = []
+        self.changes: list[_DeptChange] = []
+        self.structure_changed = False
+        self._next_new_key = -1
+
+    @classmethod
+    def load(cls, session: Session) -> "_RestructureSimulator":
+        rows = session.exec(
+            select(
+                OrgDepartment.id,
+                OrgDepartment.code,
+                OrgDepartment.name,
+                OrgDepartment.parent_id,
+                OrgDepartment.is_active,
+                OrgDepartment.organization_type,
+                OrgDepartment.cost_center_code,
+            )
+        ).all()
+        return cls(
+            _SimDepartment(
+                key=department_id,
+                id=department_id,
+                code=code,
+                name=name,
+                parent_key=parent_id,
+                is_active=is_active,
+                organization_type=organization_type,
+                cost_center_code=cost_center_code,
+            )
+            for department_id, code, name, parent_id, is_active, organization_type, cost_center_code in rows
+        )
+
+    @property
+    def applied_count(self) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.error is None)
+
+    @property
+    def skipped_count(self) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.error is not None)
+
+    def messages(self) -> list[str]:
+        messages: list[str] = []
+        for outcome in self.outcomes:
+            if outcome.error is not None:
+                messages.append(f"[SKIP] {outcome.item.action_type} id={outcome.item.id}: {outcome.error}")
+            elif outcome.message:
+                messages.append(outcome.message)
+        return messages
+
+    def run(self, items: Iterable[OrgRestructurePlanItem]) -> None:
+        for item in items:
+            try:
+                self.outcomes.append(_ItemOutcome(item, message=self._apply(item)))
+            except HTTPException as exc:
+                self.outcomes.append(_ItemOutcome(item, error=str(exc.detail)))
+
+    def _get(self, dept_id: int | None) -> _SimDepartment:
+        if dept_id is None:
+            raise HTTPException(status_code=400, detail="부서 ID가 없습니다.")
+        dept = self.departments.get(dept_id) if dept_id > 0 else None
+        if dept is None:
+            raise HTTPException(status_code=404, detail=f"부서 id={dept_id}를 찾을 수 없습니다.")
+        return dept
+
+    def _ensure_code_free(self, code: str, dept: _SimDepartment | None = None) -> None:
+        owner = self.key_by_code.get(code)
+        if owner is not None and (dept is None or owner != dept.key):
+            raise HTTPException(status_code=409, detail=f"코드 '{code}'가 이미 존재합니다.")
+
+    def _ensure_no_cycle(self, dept: _SimDepartment, new_parent: _SimDepartment) -> None:
+        """새 부모가 자기 자신이거나 자신의 하위 부서이면 에러."""
+        if dept.key == new_parent.key:
+            raise HTTPException(status_code=400, detail="자기 자신을 상위 부서로 지정할 수 없습니다.")
+        visited: set[int] = set()
+        current: int | None = new_parent.key
+        while current is not None and current not in visited:
+            if current == dept.key:
+                raise HTTPException(status_code=400, detail="순환 부서 구조를 만들 수 없습니다.")
+            visited.add(current)
+            parent = self.departments.get(current)
+            current = parent.parent_key if parent is not None else None
+
+    def _record(self, dept: _SimDepartment, field_name: str, before_value: str | None, after_value: str | None) -> None:
+        """record_dept_change 와 같은 규칙: before == after 이면 기록하지 않는다."""
+        if before_value == after_value:
+            return
+        self.changes.append(_DeptChange(dept.key, field_name, before_value, after_value))
+        dept.changed_fields.add(field_name)
+
+    def _apply(self, item: OrgRestructurePlanItem) -> str | None:
+        action = item.action_type
+
+        if action == "move":
+            dept = self._get(item.target_dept_id)
+            new_parent = self._get(item.new_parent_id)
+            self._ensure_no_cycle(dept, new_parent)
+            self._record(dept, "parent_id", str(dept.parent_key), str(new_parent.key))
+            if dept.parent_key != new_parent.key:
+                self.structure_changed = True
+            dept.parent_key = new_parent.key
+            return f"[MOVE] {dept.name} → 상위부서 변경"
+
+        if action == "rename":
+            dept = self._get(item.target_dept_id)
+            old_name = dept.name
+            new_name = (item.new_name or "").strip()
+            if item.new_code:
+                new_code = item.new_code.upper()
+                self._ensure_code_free(new_code, dept)
+                self._record(dept, "code", dept.code, new_code)
+                del self.key_by_code[dept.code]
+                self.key_by_code[new_code] = dept.key
+                dept.code = new_code
+            self._record(dept, "name", old_name, new_name)
+            dept.name = new_name
+            return f"[RENAME] {old_name} → {dept.name}"
+
+        if action == "create":
+            code = (item.new_code or "").upper().strip()
+            if not code:
+                raise HTTPException(status_code=400, detail="create 액션에 new_code가 없습니다.")
+            self._ensure_code_free(code)
+            parent = self._get(item.new_parent_id) if item.new_parent_id is not None else None
+            dept = _SimDepartment(
+                key=self._next_new_key,
+                id=None,
+                code=code,
+                name=(item.new_name or code).strip(),
+                parent_key=parent.key if parent is not None else None,
+                is_active=True,
+                organization_type=item.new_organization_type,
+                cost_center_code=item.new_cost_center_code,
+            )
+            self._next_new_key -= 1
+            self.departments[dept.key] = dept
+            self.key_by_code[code] = dept.key
+            self._record(dept, "created", None, code)
+            self.structure_changed = True
+            return f"[CREATE] {dept.name} ({code})"
+
+        if action in ("deactivate", "reactivate"):
+            dept = self._get(item.target_dept_id)
+            is_active = action == "reactivate"
+            # 기존 동작대로 현재 값과 관계없이 전환 이력을 남긴다.
+            self._record(dept, "is_active", str(not is_active), str(is_active))
+            dept.is_active = is_active
+            return f"[{action.upper()}] {dept.name}"
+
+        return None
+
+    def projected_tree(self) -> list[OrgRestructureDryRunDepartment]:
+        """결과 조직도를 최상위부터 전위 순회(같은 레벨은 코드 순)로 펼친다."""
+        children: dict[int | None, list[_SimDepartment]] = {}
+        for dept in self.departments.values():
+            parent_key = dept.parent_key if dept.parent_key in self.departments else None
+            children.setdefault(parent_key, []).append(dept)
+        for siblings in children.values():
+            siblings.sort(key=lambda dept: dept.code)
+
+        result: list[OrgRestructureDryRunDepartment] = []
+        visited: set[int] = set()
+
+        def walk(parent_key: int | None, depth: int) -> None:
+            stack = [(dept, depth) for dept in reversed(children.get(parent_key, []))]
+            while stack:
+                dept, level = stack.pop()
+                if dept.key in visited:
+                    continue
+                visited.add(dept.key)
+                parent = self.departments.get(dept.parent_key) if dept.parent_key is not None else None
+                result.append(
+                    OrgRestructureDryRunDepartment(
+                        id=dept.id,
+                        code=dept.code,
+                        name=dept.name,
+                        parent_id=parent.id if parent is not None else None,
+                        parent_code=parent.code if parent is not None else None,
+                        depth=level,
+                        is_active=dept.is_active,
+                        changed_fields=sorted(dept.changed_fields),
+                    )
+                )
+                stack.extend((child, level + 1) for child in reversed(children.get(dept.key, [])))
+
+        walk(None, 0)
+        # 기존 데이터에 이미 순환이 있으면 최상위에서 닿지 않는다. 빠뜨리지 않도록 뒤에 붙인다.
+        for dept in sorted(self.departments.values(), key=lambda dept: dept.code):
+            if dept.key not in visited:
+                walk(dept.parent_key, 0)
+        return result
+
+
+def _pending_plan_items(session: Session, plan_id: int) -> list[OrgRestructurePlanItem]:
+    return list(
+        session.exec(
+            select(OrgRestructurePlanItem)
+            .where(
+                OrgRestructurePlanItem.plan_id == plan_id,
+                OrgRestructurePlanItem.item_status == "pending",
+            )
+            .order_by(OrgRestructurePlanItem.sort_order, OrgRestructurePlanItem.id)
+        ).all()
+    )
+
+
+def simulate_restructure_plan(session: Session, plan_id: int) -> OrgRestructureDryRunResponse:
+    """개편안을 적용했을 때의 조직도와 건너뛸 항목을 미리 본다. DB 에는 아무것도 쓰지 않는다."""
+    _get_plan_or_404(session, plan_id)
+    simulator = _RestructureSimulator.load(session)
+    simulator.run(_pending_plan_items(session, plan_id))
+    return OrgRestructureDryRunResponse(
+        plan_id=plan_id,
+        applied_count=simulator.applied_count,
+        skipped_count=simulator.skipped_count,
+        messages=simulator.messages(),
+        conflicts=[
+            OrgRestructureDryRunConflict(item_id=outcome.item.id or 0, action_type=outcome.item.action_type, detail=outcome.error)
+            for outcome in simulator.outcomes
+            if outcome.error is not None
+        ],
+        departments=simulator.projected_tree(),
+    )
+
+
+def _write_simulation(session: Session, simulator: _RestructureSimulator, *, plan_id: int, user_id: int, now: datetime) -> None:
+    updated = [dept for dept in simulator.departments.values() if dept.key > 0 and dept.changed_fields]
+    # 앞 항목이 비운 코드를 뒤 항목이 다시 쓸 수 있다. 코드가 바뀌는 부서는 먼저 임시 코드로 비켜 두어
+    # 갱신 순서와 관계없이 유니크 제약에 걸리지 않게 한다.
+    recoded = [dept for dept in updated if "code" in dept.changed_fields]
+    if recoded:
+        bulk_update_by_pk(session, OrgDepartment, [{"id": dept.id, "code": f"~{dept.id}"} for dept in recoded])
+
+    bulk_update_by_pk(
+        session,
+        OrgDepartment,
+        [
+            {
+                "id": dept.id,
+                "code": dept.code,
+                "name": dept.name,
+                "parent_id": dept.parent_key,
+                "is_active": dept.is_active,
+                "updated_at": now,
+            }
+            for dept in updated
+        ],
+    )
+
+    # 새 부서는 기존 부서의 코드 변경이 끝난 뒤에 넣는다.
+    created = [dept for dept in simulator.departments.values() if dept.id is None]
+    if created:
+        session.exec(
+            sa_insert(OrgDepartment).execution_options(render_nulls=True),
+            params=[
+                {
+                    "code": dept.code,
+                    "name": dept.name,
+                    "parent_id": dept.parent_key,
+                    "organization_type": dept.organization_type,
+                    "cost_center_code": dept.cost_center_code,
+                    "description": None,
+                    "is_active": dept.is_active,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for dept in created
+            ],
+        )
+        id_by_code = dict(
+            session.exec(select(OrgDepartment.code, OrgDepartment.id).where(OrgDepartment.code.in_([dept.code for dept in created]))).all()
+        )
+        for dept in created:
+            dept.id = id_by_code[dept.code]
+
+    if simulator.changes:
+        change_reason = f"조직개편 plan_id={plan_id}"
+        session.exec(
+            sa_insert(OrgDeptChangeHistory).execution_options(render_nulls=True),
+            params=[
+                {
+                    "department_id": simulator.departments[change.department_key].id,
+                    "changed_by": user_id,
+                    "field_name": change.field_name,
+                    "before_value": change.before_value,
+                    "after_value": change.after_value,
+                    "change_reason": change_reason,
+                    "changed_at": now,
+                }
+                for change in simulator.changes
+            ],
+        )
+
+    bulk_update_by_pk(
+        session,
+        OrgRestructurePlanItem,
+        [
+            {
+                "id": outcome.item.id,
+                "item_status": "skipped" if outcome.error is not None else "applied",
+                "applied_at": None if outcome.error is not None else now,
+            }
+            for outcome in simulator.outcomes
+        ],
+    )
+
+    if simulator.structure_changed:
+        rebuild_department_closure(session)
+
+
 def apply_restructure_plan(
     session: Session,
     plan_id: int,
@@ -398,34 +772,10 @@ def apply_restructure_plan(
     if plan.status == "cancelled":
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="취소된 개편안은 적용할 수 없습니다.")
 
-    items = session.exec(
-        select(OrgRestructurePlanItem)
-        .where(
-            OrgRestructurePlanItem.plan_id == plan_id,
-            OrgRestructurePlanItem.item_status == "pending",
-        )
-        .order_by(OrgRestructurePlanItem.sort_order, OrgRestructurePlanItem.id)
-    ).all()
-
-    applied = 0
-    skipped = 0
-    messages: list[str] = []
+    simulator = _RestructureSimulator.load(session)
+    simulator.run(_pending_plan_items(session, plan_id))
     now = _utc_now()
-
-    for item in items:
-        try:
-            msg = _apply_single_item(session, item, user_id, now)
-            item.item_status = "applied"
-            item.applied_at = now
-            session.add(item)
-            applied += 1
-            if msg:
-                messages.append(msg)
-        except HTTPException as exc:
-            item.item_status = "skipped"
-            session.add(item)
-            skipped += 1
-            messages.append(f"[SKIP] {item.action_type} id={item.id}: {exc.detail}")
+    _write_simulation(session, simulator, plan_id=plan_id, user_id=user_id, now=now)
 
     plan.status = "applied"
     plan.applied_at = now
@@ -436,108 +786,7 @@ def apply_restructure_plan(
 
     return OrgRestructureApplyResponse(
         plan_id=plan_id,
-        applied_count=applied,
-        skipped_count=skipped,
-        messages=messages,
+        applied_count=simulator.applied_count,
+        skipped_count=simulator.skipped_count,
+        messages=simulator.messages(),
     )
-
-
-def _apply_single_item(
-    session: Session,
-    item: OrgRestructurePlanItem,
-    user_id: int,
-    now: datetime,
-) -> str | None:
-    """단일 개편 항목 실행. 변경 이력 자동 기록."""
-    action = item.action_type
-
-    if action == "move":
-        dept = _get_dept_or_raise(session, item.target_dept_id)
-        new_parent = _get_dept_or_raise(session, item.new_parent_id)
-        old_parent_id = dept.parent_id
-        _ensure_no_cycle(session, dept.id or 0, new_parent.id or 0)
-        record_dept_change(session, department_id=dept.id or 0, changed_by=user_id, field_name="parent_id", before_value=str(old_parent_id), after_value=str(new_parent.id), change_reason=f"조직개편 plan_id={item.plan_id}")
-        dept.parent_id = new_parent.id
-        dept.updated_at = now
-        session.add(dept)
-        return f"[MOVE] {dept.name} → 상위부서 변경"
-
-    if action == "rename":
-        dept = _get_dept_or_raise(session, item.target_dept_id)
-        old_name = dept.name
-        dept.name = (item.new_name or "").strip()
-        if item.new_code:
-            old_code = dept.code
-            record_dept_change(session, department_id=dept.id or 0, changed_by=user_id, field_name="code", before_value=old_code, after_value=item.new_code, change_reason=f"조직개편 plan_id={item.plan_id}")
-            dept.code = item.new_code.upper()
-        record_dept_change(session, department_id=dept.id or 0, changed_by=user_id, field_name="name", before_value=old_name, after_value=dept.name, change_reason=f"조직개편 plan_id={item.plan_id}")
-        dept.updated_at = now
-        session.add(dept)
-        return f"[RENAME] {old_name} → {dept.name}"
-
-    if action == "create":
-        code = (item.new_code or "").upper().strip()
-        if not code:
-            raise HTTPException(status_code=400, detail="create 액션에 new_code가 없습니다.")
-        existing = session.exec(select(OrgDepartment).where(OrgDepartment.code == code)).first()
-        if existing:
-            raise HTTPException(status_code=409, detail=f"코드 '{code}'가 이미 존재합니다.")
-        new_dept = OrgDepartment(
-            code=code,
-            name=(item.new_name or code).strip(),
-            parent_id=item.new_parent_id,
-            organization_type=item.new_organization_type,
-            cost_center_code=item.new_cost_center_code,
-            is_active=True,
-            created_at=now,
-            updated_at=now,
-        )
-        session.add(new_dept)
-        session.flush()
-        record_dept_change(session, department_id=new_dept.id or 0, changed_by=user_id, field_name="created", before_value=None, after_value=code, change_reason=f"조직개편 plan_id={item.plan_id}")
-        return f"[CREATE] {new_dept.name} ({code})"
-
-    if action == "deactivate":
-        dept = _get_dept_or_raise(session, item.target_dept_id)
-        record_dept_change(session, department_id=dept.id or 0, changed_by=user_id, field_name="is_active", before_value="True", after_value="False", change_reason=f"조직개편 plan_id={item.plan_id}")
-        dept.is_active = False
-        dept.updated_at = now
-        session.add(dept)
-        return f"[DEACTIVATE] {dept.name}"
-
-    if action == "reactivate":
-        dept = _get_dept_or_raise(session, item.target_dept_id)
-        record_dept_change(session, department_id=dept.id or 0, changed_by=user_id, field_name="is_active", before_value="False", after_value="True", change_reason=f"조직개편 plan_id={item.plan_id}")
-        dept.is_active = True
-        dept.updated_at = now
-        session.add(dept)
-        return f"[REACTIVATE] {dept.name}"
-
-    return None
-
-
-def _get_dept_or_raise(session: Session, dept_id: int | None) -> OrgDepartment:
-    if dept_id is None:
-        raise HTTPException(status_code=400, detail="부서 ID가 없습니다.")
-    dept = session.get(OrgDepartment, dept_id)
-    if dept is None:
-        raise HTTPException(status_code=404, detail=f"부서 id={dept_id}를 찾을 수 없습니다.")
-    return dept
-
-
-def _ensure_no_cycle(session: Session, dept_id: int, new_parent_id: int) -> None:
-    """새 부모가 자기 자신이거나 자신의 하위 부서이면 에러."""
-    if dept_id == new_parent_id:
-        raise HTTPException(status_code=400, detail="자기 자신을 상위 부서로 지정할 수 없습니다.")
-    visited = {new_parent_id}
-    current_id: int | None = new_parent_id
-    while current_id is not None:
-        parent = session.get(OrgDepartment, current_id)
-        if parent is None or parent.parent_id is None:
-            break
-        if parent.parent_id == dept_id:
-            raise HTTPException(status_code=400, detail="순환 부서 구조를 만들 수 없습니다.")
-        if parent.parent_id in visited:
-            break
-        visited.add(parent.parent_id)
-        current_id = parent.parent_id
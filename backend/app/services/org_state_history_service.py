@@ -0,0 +1,391 @@
+"""사원/부서 시점(as-of) 상태 저장소.
+
+인사이력(hr_personnel_histories)과 부서 변경 이력(org_dept_change_histories)을 기간 행으로
+펼쳐 hr_employee_state_histories / org_department_state_histories 에 둔다.
+"D 일자 기준 부서·직위·재직상태", "D 일자 기준 부서별 인원"은 이벤트를 다시 재생하지 않고
+구간 조회(valid_from <= D < valid_to) 한 번으로 답한다.
+
+- 쓰기: 세션 flush 에서 바뀐 사원/부서 id 를 모았다가 커밋 직전에 해당 id 의 구간만 다시 만든다.
+  이력의 첫 before 값을 최초 상태로, 각 after 값을 적용일부터의 상태로 본다.
+  이력 없이 직접 수정된 값은 마지막 수정일(updated_at)부터 유효한 것으로 본다.
+- 최초 기동: bootstrap.ensure_read_models 가 저장소가 비어 있으면 전체를 한 번 채운다(backfill_state_histories).
+  쓰기 반영은 backfill_state_histories 를 거친(저장소 테이블이 있는) 엔진에서만 동작한다.
+- Postgres 에서는 RANGE_GIST_INDEXES 의 daterange GiST 인덱스로 구간을 찾는다.
+
+Usage example::
+
+    states = employee_states_as_of(session, date(2026, 3, 31), employee_ids=[1, 2])
+    department_id = states[1].department_id
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import and_, delete, event, func, insert, or_
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from app.core.bulk import chunked
+from app.models import (
+    HrEmployee,
+    HrEmployeeStateHistory,
+    HrPersonnelHistory,
+    OrgDepartment,
+    OrgDepartmentStateHistory,
+    OrgDeptChangeHistory,
+)
+from app.schemas.organization import OrganizationHeadcountItem
+
+_SESSION_KEY = "org_state_history_changes"
+EMPLOYEE_STATE_FIELDS = ("department_id", "position_title", "employment_status")
+DEPARTMENT_STATE_FIELDS = ("code", "name", "parent_id", "is_active")
+REBUILD_BATCH_SIZE = 500
+HEADCOUNT_STATUSES = ("active", "leave")
+
+_Interval = tuple[date, date | None, dict[str, Any]]
+
+_lock = threading.Lock()
+_tracked_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+def _engine_of(session: OrmSession) -> Engine:
+    bind = session.get_bind()
+    return bind.engine if hasattr(bind, "engine") else bind
+
+
+def _is_tracked(session: OrmSession) -> bool:
+    return _engine_of(session) in _tracked_engines
+
+
+def _as_int(value: str | None) -> int | None:
+    if value is None or value.strip() in ("", "None"):
+        return None
+    return int(value)
+
+
+def _as_bool(value: str | None) -> bool:
+    return (value or "").strip().lower() in ("true", "1", "y")
+
+
+_EMPLOYEE_VALUE_PARSERS = {"department_id": _as_int}
+_DEPARTMENT_VALUE_PARSERS = {"parent_id": _as_int, "is_active": _as_bool}
+
+
+def _as_date(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _replay_intervals(
+    *,
+    start: date,
+    current: dict[str, Any],
+    current_since: date,
+    changes: list[tuple[date, str, Any, Any]],
+) -> list[_Interval]:
+    """(적용일, 필드, 전, 후) 순서 목록을 [valid_from, valid_to) 구간으로 펼친다. 같은 상태가 이어지면 합친다."""
+    state = dict(current)
+    initialized: set[str] = set()
+    for _, field_name, before_value, _ in changes:
+        if field_name not in initialized:
+            initialized.add(field_name)
+            state[field_name] = before_value
+    if changes:
+        start = min(start, changes[0][0])
+
+    intervals: list[_Interval] = []
+    valid_from = start
+    for effective_date, field_name, _, after_value in changes:
+        if effective_date > valid_from:
+            intervals.append((valid_from, effective_date, dict(state)))
+            valid_from = effective_date
+        state[field_name] = after_value
+
+    # 이력 없이 바뀐 값(직접 수정)은 마지막 수정일부터 유효한 것으로 본다.
+    if state != current:
+        since = max(valid_from, current_since)
+        if since > valid_from:
+            intervals.append((valid_from, since, dict(state)))
+            valid_from = since
+        state = dict(current)
+    intervals.append((valid_from, None, state))
+
+    merged: list[_Interval] = []
+    for interval in intervals:
+        if merged and merged[-1][2] == interval[2]:
+            merged[-1] = (merged[-1][0], interval[1], interval[2])
+        else:
+            merged.append(interval)
+    return merged
+
+
+def rebuild_employee_states(session: Session, employee_ids: Iterable[int]) -> int:
+    """사원별 상태 구간을 인사이력에서 다시 만든다. 만든 구간 수를 반환한다."""
+    created = 0
+    for ids in chunked(sorted(set(employee_ids)), REBUILD_BATCH_SIZE):
+        employees = session.exec(
+            select(
+                HrEmployee.id,
+                HrEmployee.hire_date,
+                HrEmployee.updated_at,
+                *(getattr(HrEmployee, name) for name in EMPLOYEE_STATE_FIELDS),
+            ).where(HrEmployee.id.in_(ids))
+        ).all()
+        changes_by_employee: dict[int, list[tuple[date, str, Any, Any]]] = {}
+        for employee_id, effective_date, field_name, before_value, after_value in session.exec(
+            select(
+                HrPersonnelHistory.employee_id,
+                HrPersonnelHistory.effective_date,
+                HrPersonnelHistory.field_name,
+                HrPersonnelHistory.before_value,
+                HrPersonnelHistory.after_value,
+            )
+            .where(HrPersonnelHistory.employee_id.in_(ids), HrPersonnelHistory.field_name.in_(EMPLOYEE_STATE_FIELDS))
+            .order_by(HrPersonnelHistory.employee_id, HrPersonnelHistory.effective_date, HrPersonnelHistory.id)
+        ).all():
+            parse = _EMPLOYEE_VALUE_PARSERS.get(field_name, lambda value: value)
+            changes_by_employee.setdefault(employee_id, []).append(
+                (effective_date, field_name, parse(before_value), parse(after_value))
+            )
+
+        rows: list[dict[str, Any]] = []
+        for employee_id, hire_date, updated_at, *values in employees:
+            for valid_from, valid_to, state in _replay_intervals(
+                start=hire_date,
+                current=dict(zip(EMPLOYEE_STATE_FIELDS, values)),
+                current_since=_as_date(updated_at),
+                changes=changes_by_employee.get(employee_id, []),
+            ):
+                rows.append({"employee_id": employee_id, "valid_from": valid_from, "valid_to": valid_to, **state})
+
+        session.exec(delete(HrEmployeeStateHistory).where(HrEmployeeStateHistory.employee_id.in_(ids)))
+        if rows:
+            session.exec(insert(HrEmployeeStateHistory).execution_options(render_nulls=True), params=rows)
+        created += len(rows)
+    return created
+
+
+def rebuild_department_states(session: Session, department_ids: Iterable[int]) -> int:
+    """부서별 상태 구간을 부서 변경 이력에서 다시 만든다. 만든 구간 수를 반환한다."""
+    created = 0
+    for ids in chunked(sorted(set(department_ids)), REBUILD_BATCH_SIZE):
+        departments = session.exec(
+            select(
+                OrgDepartment.id,
+                OrgDepartment.created_at,
+                OrgDepartment.updated_at,
+                *(getattr(OrgDepartment, name) for name in DEPARTMENT_STATE_FIELDS),
+            ).where(OrgDepartment.id.in_(ids))
+        ).all()
+        changes_by_department: dict[int, list[tuple[date, str, Any, Any]]] = {}
+        for department_id, changed_at, field_name, before_value, after_value in session.exec(
+            select(
+                OrgDeptChangeHistory.department_id,
+                OrgDeptChangeHistory.changed_at,
+                OrgDeptChangeHistory.field_name,
+                OrgDeptChangeHistory.before_value,
+                OrgDeptChangeHistory.after_value,
+            )
+            .where(
+                OrgDeptChangeHistory.department_id.in_(ids),
+                OrgDeptChangeHistory.field_name.in_(DEPARTMENT_STATE_FIELDS),
+            )
+            .order_by(OrgDeptChangeHistory.department_id, OrgDeptChangeHistory.changed_at, OrgDeptChangeHistory.id)
+        ).all():
+            parse = _DEPARTMENT_VALUE_PARSERS.get(field_name, lambda value: value)
+            changes_by_department.setdefault(department_id, []).append(
+                (_as_date(changed_at), field_name, parse(before_value), parse(after_value))
+            )
+
+        rows: list[dict[str, Any]] = []
+        for department_id, created_at, updated_at, *values in departments:
+            for valid_from, valid_to, state in _replay_intervals(
+                start=_as_date(created_at),
+                current=dict(zip(DEPARTMENT_STATE_FIELDS, values)),
+                current_since=_as_date(updated_at),
+                changes=changes_by_department.get(department_id, []),
+            ):
+                rows.append({"department_id": department_id, "valid_from": valid_from, "valid_to": valid_to, **state})
+
+        session.exec(delete(OrgDepartmentStateHistory).where(OrgDepartmentStateHistory.department_id.in_(ids)))
+        if rows:
+            session.exec(insert(OrgDepartmentStateHistory).execution_options(render_nulls=True), params=rows)
+        created += len(rows)
+    return created
+
+
+def backfill_state_histories(session: Session) -> bool:
+    """저장소가 비어 있으면 전체 사원/부서 구간을 만든다. 채웠으면 True.
+
+    이후 이 엔진의 세션 쓰기는 커밋 시 구간에 반영된다.
+    """
+    with _lock:
+        _tracked_engines.add(_engine_of(session))
+    filled = False
+    if session.exec(select(HrEmployeeStateHistory.id).limit(1)).first() is None:
+        rebuild_employee_states(session, session.exec(select(HrEmployee.id)).all())
+        filled = True
+    if session.exec(select(OrgDepartmentStateHistory.id).limit(1)).first() is None:
+        rebuild_department_states(session, session.exec(select(OrgDepartment.id)).all())
+        filled = True
+    return filled
+
+
+# ---------------------------------------------------------------------------
+# as-of 조회
+# ---------------------------------------------------------------------------
+
+
+def _valid_on(session: Session, model: Any, as_of: date):
+    if session.get_bind().dialect.name == "postgresql":
+        # RANGE_GIST_INDEXES 의 daterange(valid_from, valid_to, '[)') 인덱스를 타는 형태.
+        return func.daterange(model.valid_from, model.valid_to, "[)").op("@>")(as_of)
+    return and_(model.valid_from <= as_of, or_(model.valid_to.is_(None), model.valid_to > as_of))
+
+
+def employee_states_as_of(
+    session: Session,
+    as_of: date,
+    *,
+    employee_ids: Iterable[int] | None = None,
+) -> dict[int, HrEmployeeStateHistory]:
+    """사원 id → as_of 일자의 상태 구간. 입사 전이거나 구간이 없는 사원은 빠진다."""
+    stmt = select(HrEmployeeStateHistory).where(_valid_on(session, HrEmployeeStateHistory, as_of))
+    if employee_ids is not None:
+        ids = sorted(set(employee_ids))
+        if not ids:
+            return {}
+        stmt = stmt.where(HrEmployeeStateHistory.employee_id.in_(ids))
+    return {row.employee_id: row for row in session.exec(stmt).all()}
+
+
+def department_states_as_of(
+    session: Session,
+    as_of: date,
+    *,
+    department_ids: Iterable[int] | None = None,
+) -> dict[int, OrgDepartmentStateHistory]:
+    """부서 id → as_of 일자의 상태 구간(코드/이름/상위부서/사용여부)."""
+    stmt = select(OrgDepartmentStateHistory).where(_valid_on(session, OrgDepartmentStateHistory, as_of))
+    if department_ids is not None:
+        ids = sorted(set(department_ids))
+        if not ids:
+            return {}
+        stmt = stmt.where(OrgDepartmentStateHistory.department_id.in_(ids))
+    return {row.department_id: row for row in session.exec(stmt).all()}
+
+
+def headcount_by_department(
+    session: Session,
+    as_of: date,
+    *,
+    employment_statuses: Iterable[str] = HEADCOUNT_STATUSES,
+) -> list[OrganizationHeadcountItem]:
+    """as_of 일자 기준 부서별 인원. 부서 정보도 그 일자의 코드/이름/상위부서로 채운다."""
+    counts = session.exec(
+        select(HrEmployeeStateHistory.department_id, func.count())
+        .where(
+            _valid_on(session, HrEmployeeStateHistory, as_of),
+            HrEmployeeStateHistory.department_id.is_not(None),
+            HrEmployeeStateHistory.employment_status.in_(list(employment_statuses)),
+        )
+        .group_by(HrEmployeeStateHistory.department_id)
+    ).all()
+    count_by_department = dict(counts)
+    departments = department_states_as_of(session, as_of, department_ids=count_by_department)
+
+    items: list[OrganizationHeadcountItem] = []
+    for department_id, headcount in count_by_department.items():
+        department = departments.get(department_id)
+        items.append(
+            OrganizationHeadcountItem(
+                department_id=department_id,
+                code=department.code if department else None,
+                name=department.name if department else None,
+                parent_id=department.parent_id if department else None,
+                headcount=headcount,
+            )
+        )
+    items.sort(key=lambda item: (item.code or "", item.department_id))
+    return items
+
+
+# ---------------------------------------------------------------------------
+# 쓰기 반영: flush 로 바뀐 사원/부서 id 를 모아 커밋 직전에 구간을 다시 만든다.
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Changes:
+    employee_ids: set[int] = field(default_factory=set)
+    department_ids: set[int] = field(default_factory=set)
+
+
+def _changes(session: OrmSession) -> _Changes:
+    return session.info.setdefault(_SESSION_KEY, _Changes())
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _collect_on_flush(session: OrmSession, _flush_context) -> None:
+    if not _is_tracked(session):
+        return
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, HrEmployee) and instance.id is not None:
+            _changes(session).employee_ids.add(instance.id)
+        elif isinstance(instance, HrPersonnelHistory) and instance.field_name in EMPLOYEE_STATE_FIELDS:
+            _changes(session).employee_ids.add(instance.employee_id)
+        elif isinstance(instance, OrgDepartment) and instance.id is not None:
+            _changes(session).department_ids.add(instance.id)
+        elif isinstance(instance, OrgDeptChangeHistory) and instance.field_name in DEPARTMENT_STATE_FIELDS:
+            _changes(session).department_ids.add(instance.department_id)
+
+
+# (테이블, 파라미터 키, 대상) - executemany 로 들어온 일괄 쓰기에서 id 를 모은다.
+_BULK_KEYS = {
+    HrPersonnelHistory.__tablename__: ("employee_id", "employee_ids"),
+    HrEmployee.__tablename__: ("id", "employee_ids"),
+    OrgDeptChangeHistory.__tablename__: ("department_id", "department_ids"),
+    OrgDepartment.__tablename__: ("id", "department_ids"),
+}
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _collect_on_bulk_dml(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_insert or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    keys = _BULK_KEYS.get(getattr(table, "name", None))
+    if keys is None or not _is_tracked(orm_execute_state.session):
+        return
+    parameters = orm_execute_state.parameters
+    rows = parameters if isinstance(parameters, list) else [parameters] if parameters else []
+    key, target = keys
+    ids = {row[key] for row in rows if row.get(key) is not None}
+    if ids:
+        getattr(_changes(orm_execute_state.session), target).update(ids)
+
+
+@event.listens_for(OrmSession, "before_commit", insert=True)
+def _rebuild_before_commit(session: OrmSession) -> None:
+    if not _is_tracked(session):
+        return
+    # 커밋 중 자동 flush 는 before_commit 이후에 일어나므로 여기서 먼저 flush 해 변경을 모은다.
+    session.flush()
+    changes: _Changes | None = session.info.pop(_SESSION_KEY, None)
+    if changes is None:
+        return
+    if changes.employee_ids:
+        rebuild_employee_states(session, changes.employee_ids)
+    if changes.department_ids:
+        rebuild_department_states(session, changes.department_ids)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _clear_on_rollback(session: OrmSession) -> None:
+    session.info.pop(_SESSION_KEY, None)
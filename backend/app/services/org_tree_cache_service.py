@@ -0,0 +1,335 @@
+"""부서 트리 스냅샷 인메모리 캐시.
+
+조직 선택기와 부서 목록은 자주 불리지만 잘 바뀌지 않는다. 부서 전체를 한 번 읽어
+깊이·경로·직속/하위 포함 인원까지 계산한 스냅샷을 엔진별로 두고, 목록의 필터와
+페이지는 스냅샷 위에서 처리한다.
+
+- 스냅샷의 ``version`` 은 내용 해시라 워커가 달라도 같은 트리면 같은 값이다(ETag 로 쓴다).
+- 부서 쓰기는 커밋 후 해당 부서 행만, 사원 쓰기는 부서별 인원 집계만 다음 조회 때 다시 읽고
+  나머지(깊이·경로·하위 인원)는 메모리에서 다시 계산한다. 일괄 DML 은 전체를 다시 읽는다.
+- 다른 프로세스의 쓰기는 ``org_tree_cache_ttl_sec`` 경과 후 재적재로 반영한다.
+- 세션에 아직 커밋되지 않은 부서/사원 변경이 있으면 그 변경이 보이는 스냅샷을 만들어
+  반환하고 공유 캐시에는 올리지 않는다.
+
+Usage example::
+
+    snapshot = get_department_tree(session)
+    response.headers["ETag"] = snapshot.etag
+    nodes = snapshot.nodes
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import weakref
+from collections.abc import Iterable
+from dataclasses import astuple, dataclass, field
+from datetime import datetime
+
+from sqlalchemy import event, func
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models import HrEmployee, OrgDepartment
+
+_SESSION_DIRTY_KEY = "org_tree_dirty"
+_TRACKED_TABLES = frozenset(model.__tablename__ for model in (OrgDepartment, HrEmployee))
+PATH_SEPARATOR = " > "
+
+
+@dataclass(frozen=True, slots=True)
+class _DepartmentRow:
+    id: int
+    code: str
+    name: str
+    parent_id: int | None
+    organization_type: str | None
+    cost_center_code: str | None
+    description: str | None
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+_ROW_COLUMNS = tuple(getattr(OrgDepartment, name) for name in _DepartmentRow.__slots__)
+
+
+@dataclass(frozen=True, slots=True)
+class DepartmentNode:
+    id: int
+    code: str
+    name: str
+    parent_id: int | None
+    parent_name: str | None
+    depth: int
+    path_ids: tuple[int, ...]
+    path_name: str
+    organization_type: str | None
+    cost_center_code: str | None
+    description: str | None
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    employee_count: int
+    subtree_employee_count: int
+
+
+@dataclass(frozen=True)
+class DepartmentTreeSnapshot:
+    """nodes 는 최상위부터 전위 순회(같은 레벨은 코드 순), by_code 는 코드 순."""
+
+    version: str
+    nodes: tuple[DepartmentNode, ...]
+    by_code: tuple[DepartmentNode, ...]
+    by_id: dict[int, DepartmentNode]
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+
+def _build_snapshot(rows: dict[int, _DepartmentRow], direct_counts: dict[int, int]) -> DepartmentTreeSnapshot:
+    children: dict[int | None, list[_DepartmentRow]] = {}
+    for row in rows.values():
+        parent_id = row.parent_id if row.parent_id in rows else None
+        children.setdefault(parent_id, []).append(row)
+    for siblings in children.values():
+        siblings.sort(key=lambda row: row.code)
+
+    order: list[tuple[_DepartmentRow, int, tuple[int, ...], str]] = []
+    visited: set[int] = set()
+
+    def walk(parent_id: int | None, depth: int, path_ids: tuple[int, ...], path_name: str) -> None:
+        stack = [(row, depth, path_ids, path_name) for row in reversed(children.get(parent_id, []))]
+        while stack:
+            row, level, parent_path_ids, parent_path_name = stack.pop()
+            if row.id in visited:
+                continue
+            visited.add(row.id)
+            row_path_ids = (*parent_path_ids, row.id)
+            row_path_name = f"{parent_path_name}{PATH_SEPARATOR}{row.name}" if parent_path_name else row.name
+            order.append((row, level, row_path_ids, row_path_name))
+            stack.extend(
+                (child, level + 1, row_path_ids, row_path_name) for child in reversed(children.get(row.id, []))
+            )
+
+    walk(None, 0, (), "")
+    # 기존 데이터에 순환이 있으면 최상위에서 닿지 않는다. 빠뜨리지 않도록 뒤에 붙인다.
+    for row in sorted(rows.values(), key=lambda row: row.code):
+        if row.id not in visited:
+            walk(row.parent_id, 0, (), "")
+
+    subtree_counts = {row.id: direct_counts.get(row.id, 0) for row in rows.values()}
+    # 전위 순회의 역순이면 자식이 항상 부모보다 먼저 끝난다.
+    for row, _, path_ids, _ in reversed(order):
+        if len(path_ids) > 1:
+            subtree_counts[path_ids[-2]] += subtree_counts[row.id]
+
+    nodes = tuple(
+        DepartmentNode(
+            id=row.id,
+            code=row.code,
+            name=row.name,
+            parent_id=row.parent_id,
+            parent_name=rows[row.parent_id].name if row.parent_id in rows else None,
+            depth=depth,
+            path_ids=path_ids,
+            path_name=path_name,
+            organization_type=row.organization_type,
+            cost_center_code=row.cost_center_code,
+            description=row.description,
+            is_active=row.is_active,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            employee_count=direct_counts.get(row.id, 0),
+            subtree_employee_count=subtree_counts[row.id],
+        )
+        for row, depth, path_ids, path_name in order
+    )
+    version = hashlib.blake2b(repr([astuple(node) for node in nodes]).encode(), digest_size=10).hexdigest()
+    return DepartmentTreeSnapshot(
+        version=version,
+        nodes=nodes,
+        by_code=tuple(sorted(nodes, key=lambda node: node.code)),
+        by_id={node.id: node for node in nodes},
+    )
+
+
+def _load_rows(session: Session, department_ids: Iterable[int] | None = None) -> dict[int, _DepartmentRow]:
+    statement = select(*_ROW_COLUMNS)
+    if department_ids is not None:
+        statement = statement.where(OrgDepartment.id.in_(list(department_ids)))
+    return {int(values[0]): _DepartmentRow(*values) for values in session.exec(statement).all()}
+
+
+def _load_direct_counts(session: Session) -> dict[int, int]:
+    rows = session.exec(
+        select(HrEmployee.department_id, func.count(HrEmployee.id)).group_by(HrEmployee.department_id)
+    ).all()
+    return {int(department_id): int(count) for department_id, count in rows if department_id is not None}
+
+
+def build_department_tree(session: Session) -> DepartmentTreeSnapshot:
+    return _build_snapshot(_load_rows(session), _load_direct_counts(session))
+
+
+@dataclass
+class _Changes:
+    department_ids: set[int] = field(default_factory=set)
+    headcount: bool = False
+    everything: bool = False
+
+    def merge(self, other: "_Changes") -> None:
+        self.department_ids |= other.department_ids
+        self.headcount = self.headcount or other.headcount
+        self.everything = self.everything or other.everything
+
+
+class DepartmentTreeCache:
+    def __init__(self, ttl_sec: int) -> None:
+        self._ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        # 적재는 한 번에 하나만. 읽기는 만들어진 스냅샷을 잠금 없이 돌려준다.
+        self._refresh_lock = threading.Lock()
+        self._rows: dict[int, _DepartmentRow] = {}
+        self._direct_counts: dict[int, int] = {}
+        self._snapshot: DepartmentTreeSnapshot | None = None
+        self._loaded_at = 0.0
+        self._pending = _Changes()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and not self._pending.everything
+            and not self._pending.department_ids
+            and not self._pending.headcount
+            and (self._ttl_sec <= 0 or time.monotonic() - self._loaded_at < self._ttl_sec)
+        )
+
+    def get(self, session: Session) -> DepartmentTreeSnapshot:
+        if session.info.get(_SESSION_DIRTY_KEY):
+            return build_department_tree(session)
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh():
+            return snapshot
+
+        with self._refresh_lock:
+            with self._lock:
+                if self._is_fresh():
+                    return self._snapshot
+                pending, self._pending = self._pending, _Changes()
+                full = self._snapshot is None or pending.everything or (
+                    self._ttl_sec > 0 and time.monotonic() - self._loaded_at >= self._ttl_sec
+                )
+            try:
+                if full:
+                    rows = _load_rows(session)
+                    direct_counts = _load_direct_counts(session)
+                    loaded_at = time.monotonic()
+                else:
+                    rows = dict(self._rows)
+                    if pending.department_ids:
+                        for department_id in pending.department_ids:
+                            rows.pop(department_id, None)
+                        rows.update(_load_rows(session, pending.department_ids))
+                    direct_counts = _load_direct_counts(session) if pending.headcount else self._direct_counts
+                    loaded_at = self._loaded_at
+                snapshot = _build_snapshot(rows, direct_counts)
+            except Exception:
+                with self._lock:
+                    self._pending.merge(pending)
+                raise
+
+            # 적재 중 autoflush 로 미커밋 변경이 보였을 수 있으므로 적재 후에 다시 확인한다.
+            if session.info.get(_SESSION_DIRTY_KEY):
+                with self._lock:
+                    self._pending.merge(pending)
+                return snapshot
+            with self._lock:
+                self._rows = rows
+                self._direct_counts = direct_counts
+                self._snapshot = snapshot
+                self._loaded_at = loaded_at
+            return snapshot
+
+    def mark_changed(self, changes: _Changes) -> None:
+        with self._lock:
+            self._pending.merge(changes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._rows = {}
+            self._direct_counts = {}
+            self._pending = _Changes()
+
+
+_lock = threading.Lock()
+_caches: "weakref.WeakKeyDictionary[Engine, DepartmentTreeCache]" = weakref.WeakKeyDictionary()
+
+
+def _engine_of(session: OrmSession) -> Engine:
+    bind = session.get_bind()
+    return bind.engine if hasattr(bind, "engine") else bind
+
+
+def get_department_tree(session: Session) -> DepartmentTreeSnapshot:
+    engine = _engine_of(session)
+    with _lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            cache = DepartmentTreeCache(settings.org_tree_cache_ttl_sec)
+            _caches[engine] = cache
+    return cache.get(session)
+
+
+# ---------------------------------------------------------------------------
+# 갱신 훅: 부서/사원 쓰기를 세션에 표시해 두었다가 커밋 후 캐시에 넘긴다.
+# ---------------------------------------------------------------------------
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _mark_dirty_on_flush(session: OrmSession, _flush_context) -> None:
+    changes: _Changes | None = None
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, OrgDepartment) and instance.id is not None:
+            changes = changes or session.info.setdefault(_SESSION_DIRTY_KEY, _Changes())
+            changes.department_ids.add(instance.id)
+        elif isinstance(instance, HrEmployee):
+            changes = changes or session.info.setdefault(_SESSION_DIRTY_KEY, _Changes())
+            changes.headcount = True
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _mark_dirty_on_bulk_dml(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    name = getattr(table, "name", None)
+    if name not in _TRACKED_TABLES:
+        return
+    changes = orm_execute_state.session.info.setdefault(_SESSION_DIRTY_KEY, _Changes())
+    if name == HrEmployee.__tablename__:
+        changes.headcount = True
+    else:
+        changes.everything = True
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _apply_on_commit(session: OrmSession) -> None:
+    changes: _Changes | None = session.info.pop(_SESSION_DIRTY_KEY, None)
+    if changes is None:
+        return
+    with _lock:
+        cache = _caches.get(_engine_of(session))
+    if cache is not None:
+        cache.mark_changed(changes)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _clear_dirty_on_rollback(session: OrmSession) -> None:
+    session.info.pop(_SESSION_DIRTY_KEY, None)
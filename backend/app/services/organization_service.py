@@ -6,8 +6,17 @@ from fastapi import HTTPException, status
 from sqlalchemy import func
 from sqlmodel import Session, select
 
+from app.core.search import normalize_term
 from app.models import HrEmployee, OrgCorporation, OrgDepartment
+from app.services.org_hierarchy_service import (
+    add_department_node,
+    is_in_subtree,
+    move_department_node,
+    remove_department_node,
+    subtree_headcount,
+)
 from app.services.org_restructure_service import record_dept_change
+from app.services.org_tree_cache_service import DepartmentNode, DepartmentTreeSnapshot, get_department_tree
 from app.schemas.organization import (
     OrganizationCorporationCreateRequest,
     OrganizationCorporationItem,
@@ -26,6 +35,7 @@ def _build_department_item(
     department: OrgDepartment,
     parent_name_map: dict[int, str],
     employee_count_map: dict[int, int],
+    subtree_count_map: dict[int, int] | None = None,
 ) -> OrganizationDepartmentItem:
     return OrganizationDepartmentItem(
         id=department.id,
@@ -37,6 +47,7 @@ def _build_department_item(
         cost_center_code=department.cost_center_code,
         description=department.description,
         employee_count=employee_count_map.get(department.id or 0, 0),
+        subtree_employee_count=(subtree_count_map or {}).get(department.id or 0, 0),
         is_active=department.is_active,
         created_at=department.created_at,
         updated_at=department.updated_at,
@@ -53,20 +64,31 @@ def _ensure_parent_exists(session: Session, parent_id: int | None) -> OrgDepartm
 
 
 def _ensure_no_cycle(session: Session, department_id: int, parent_id: int | None) -> None:
-    current_parent_id = parent_id
-    visited: set[int] = set()
+    if parent_id is not None and is_in_subtree(session, department_id, parent_id):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cyclic parent relation is not allowed.")
+
 
-    while current_parent_id is not None:
-        if current_parent_id == department_id:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cyclic parent relation is not allowed.")
-        if current_parent_id in visited:
-            break
-        visited.add(current_parent_id)
+def _matches(value: str | None, term: str | None) -> bool:
+    """contains()/ILIKE 와 같은 대소문자 무시 부분 일치."""
+    return term is None or (value is not None and term.casefold() in value.casefold())
 
-        parent = session.get(OrgDepartment, current_parent_id)
-        if parent is None:
-            break
-        current_parent_id = parent.parent_id
+
+def _node_to_item(node: DepartmentNode) -> OrganizationDepartmentItem:
+    return OrganizationDepartmentItem(
+        id=node.id,
+        code=node.code,
+        name=node.name,
+        parent_id=node.parent_id,
+        parent_name=node.parent_name,
+        organization_type=node.organization_type,
+        cost_center_code=node.cost_center_code,
+        description=node.description,
+        employee_count=node.employee_count,
+        subtree_employee_count=node.subtree_employee_count,
+        is_active=node.is_active,
+        created_at=node.created_at,
+        updated_at=node.updated_at,
+    )
 
 
 def list_departments(
@@ -78,38 +100,29 @@ def list_departments(
     name: str | None = None,
     organization_type: str | None = None,
     cost_center_code: str | None = None,
+    snapshot: DepartmentTreeSnapshot | None = None,
 ) -> tuple[list[OrganizationDepartmentItem], int]:
-    statement = select(OrgDepartment).order_by(OrgDepartment.code)
-    if code:
-        statement = statement.where(OrgDepartment.code.ilike(f"%{code.strip()}%"))
-    if name:
-        statement = statement.where(OrgDepartment.name.ilike(f"%{name.strip()}%"))
-    if organization_type:
-        statement = statement.where(OrgDepartment.organization_type.ilike(f"%{organization_type.strip()}%"))
-    if cost_center_code:
-        statement = statement.where(OrgDepartment.cost_center_code.ilike(f"%{cost_center_code.strip()}%"))
-
-    departments = session.exec(statement).all()
-    total_count = len(departments)
+    """부서 목록(코드 순). 필터와 페이지는 캐시된 부서 트리 스냅샷 위에서 처리한다."""
+    snapshot = snapshot or get_department_tree(session)
+    code = normalize_term(code)
+    name = normalize_term(name)
+    organization_type = organization_type.strip() if organization_type else None
+    cost_center_code = cost_center_code.strip() if cost_center_code else None
+
+    nodes = [
+        node
+        for node in snapshot.by_code
+        if _matches(node.code, code)
+        and _matches(node.name, name)
+        and _matches(node.organization_type, organization_type)
+        and _matches(node.cost_center_code, cost_center_code)
+    ]
+    total_count = len(nodes)
     if page is not None and limit is not None and limit > 0:
         offset = max(0, (page - 1) * limit)
-        departments = departments[offset : offset + limit]
-
-    parent_name_rows = session.exec(select(OrgDepartment.id, OrgDepartment.name)).all()
-    parent_name_map = {department_id: department_name for department_id, department_name in parent_name_rows}
-    employee_count_rows = session.exec(
-        select(HrEmployee.department_id, func.count(HrEmployee.id)).group_by(HrEmployee.department_id)
-    ).all()
-    employee_count_map = {
-        department_id: int(employee_count)
-        for department_id, employee_count in employee_count_rows
-        if department_id is not None
-    }
-
-    return (
-        [_build_department_item(department, parent_name_map, employee_count_map) for department in departments],
-        total_count,
-    )
+        nodes = nodes[offset : offset + limit]
+
+    return [_node_to_item(node) for node in nodes], total_count
 
 
 def create_department(
@@ -137,6 +150,8 @@ def create_department(
         updated_at=_utc_now(),
     )
     session.add(department)
+    session.flush()
+    add_department_node(session, department.id, department.parent_id)
     session.commit()
     session.refresh(department)
 
@@ -193,6 +208,8 @@ def update_department(
         _ensure_parent_exists(session, next_parent_id)
         _ensure_no_cycle(session, department.id, next_parent_id)
         record_dept_change(session, department_id=department_id, changed_by=changed_by, field_name="parent_id", before_value=str(department.parent_id), after_value=str(next_parent_id))
+        if next_parent_id != department.parent_id:
+            move_department_node(session, department.id, next_parent_id)
         department.parent_id = next_parent_id
 
     if payload.is_active is not None:
@@ -213,7 +230,13 @@ def update_department(
     employee_count = session.exec(
         select(func.count(HrEmployee.id)).where(HrEmployee.department_id == department.id)
     ).one()
-    return _build_department_item(department, parent_name_map, {department.id: int(employee_count or 0)})
+    subtree_count = subtree_headcount(session, department.id)
+    return _build_department_item(
+        department,
+        parent_name_map,
+        {department.id: int(employee_count or 0)},
+        {department.id: subtree_count},
+    )
 
 
 def delete_department(session: Session, department_id: int) -> None:
@@ -235,6 +258,7 @@ def delete_department(session: Session, department_id: int) -> None:
             detail="Cannot delete department linked to employees.",
         )
 
+    remove_department_node(session, department_id)
     session.delete(department)
     session.commit()
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from calendar import monthrange
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, or_
+from sqlalchemy import delete, insert, or_
 from sqlmodel import Session, select
 
 from app.models import (
@@ -50,6 +51,8 @@ from app.schemas.payroll_phase2 import (
     PayVariableInputBatchResponse,
     PayVariableInputItem,
 )
+from app.services.employee_directory_service import EmployeeEntry, lookup_employees
+from app.services.org_state_history_service import department_states_as_of, employee_states_as_of
 
 
 def _utc_now() -> datetime:
@@ -104,13 +107,27 @@ def _select_active_payroll_profiles(
     return profile_by_employee
 
 
+@dataclass(frozen=True)
+class _PayrollTarget:
+    """급여 대상자. 부서/직위/재직상태는 기간 말일 기준 값이다."""
+
+    employee: HrEmployee
+    profile: PayEmployeeProfile
+    employee_name: str | None
+    department_id: int | None
+    department_name: str | None
+    position_title: str | None
+    employment_status: str | None
+    retire_date: date | None
+
+
 def _resolve_payroll_targets(
     session: Session,
     *,
     run: PayPayrollRun,
     period_start: date,
     period_end: date,
-) -> list[tuple[HrEmployee, PayEmployeeProfile, str | None, str | None, date | None]]:
+) -> list[_PayrollTarget]:
     profile_by_employee = _select_active_payroll_profiles(
         session,
         payroll_code_id=run.payroll_code_id,
@@ -134,16 +151,31 @@ def _resolve_payroll_targets(
     ).all()
     user_name_map = {user.id: user.display_name for user in user_rows}
 
-    department_ids = sorted({employee.department_id for employee in employee_rows})
-    department_rows = session.exec(select(OrgDepartment).where(OrgDepartment.id.in_(department_ids))).all() if department_ids else []
-    department_name_map = {department.id: department.name for department in department_rows}
+    # 발령 이력을 다시 훑지 않고 시점 상태 저장소에서 기간 말일 기준 상태를 읽는다. 구간이 없으면 현재 값.
+    state_map = employee_states_as_of(session, period_end, employee_ids=employee_map)
+    department_id_map = {
+        employee.id: state_map[employee.id].department_id if employee.id in state_map else employee.department_id
+        for employee in employee_rows
+    }
+    department_ids = sorted({department_id for department_id in department_id_map.values() if department_id is not None})
+    department_name_map = {
+        department_id: state.name
+        for department_id, state in department_states_as_of(session, period_end, department_ids=department_ids).items()
+    }
+    missing_department_ids = [department_id for department_id in department_ids if department_id not in department_name_map]
+    if missing_department_ids:
+        department_name_map.update(
+            session.exec(
+                select(OrgDepartment.id, OrgDepartment.name).where(OrgDepartment.id.in_(missing_department_ids))
+            ).all()
+        )
 
     basic_profiles = session.exec(
         select(HrEmployeeBasicProfile).where(HrEmployeeBasicProfile.employee_id.in_(employee_ids))
     ).all()
     retire_date_map = {profile.employee_id: profile.retire_date for profile in basic_profiles}
 
-    targets: list[tuple[HrEmployee, PayEmployeeProfile, str | None, str | None, date | None]] = []
+    targets: list[_PayrollTarget] = []
     for employee_id in employee_ids:
         employee = employee_map.get(employee_id)
         if employee is None:
@@ -153,13 +185,18 @@ def _resolve_payroll_targets(
         if retire_date is not None and retire_date < period_start:
             continue
 
+        state = state_map.get(employee_id)
+        department_id = department_id_map[employee_id]
         targets.append(
-            (
-                employee,
-                profile_by_employee[employee_id],
-                user_name_map.get(employee.user_id),
-                department_name_map.get(employee.department_id),
-                retire_date,
+            _PayrollTarget(
+                employee=employee,
+                profile=profile_by_employee[employee_id],
+                employee_name=user_name_map.get(employee.user_id),
+                department_id=department_id,
+                department_name=department_name_map.get(department_id),
+                position_title=state.position_title if state else employee.position_title,
+                employment_status=state.employment_status if state else employee.employment_status,
+                retire_date=retire_date,
             )
         )
 
@@ -168,24 +205,21 @@ def _resolve_payroll_targets(
 
 def _build_run_target_snapshot(
     *,
-    employee: HrEmployee,
-    profile: PayEmployeeProfile,
-    employee_name: str | None,
-    department_name: str | None,
-    retire_date: date | None,
+    target: _PayrollTarget,
     period_start: date,
     period_end: date,
 ) -> dict[str, object]:
+    employee, profile = target.employee, target.profile
     return {
         "employee_id": employee.id or 0,
         "employee_no": employee.employee_no,
-        "employee_name": employee_name,
-        "department_id": employee.department_id,
-        "department_name": department_name,
-        "position_title": employee.position_title,
+        "employee_name": target.employee_name,
+        "department_id": target.department_id,
+        "department_name": target.department_name,
+        "position_title": target.position_title,
         "hire_date": _as_date_text(employee.hire_date),
-        "employment_status": employee.employment_status,
-        "retire_date": _as_date_text(retire_date),
+        "employment_status": target.employment_status,
+        "retire_date": _as_date_text(target.retire_date),
         "profile_id": profile.id,
         "payroll_code_id": profile.payroll_code_id,
         "item_group_id": profile.item_group_id,
@@ -449,19 +483,15 @@ def _materialize_payroll_targets(
         return 0, 0
 
     run_targets: list[PayPayrollRunTarget] = []
-    for employee, profile, employee_name, department_name, retire_date in targets:
+    for target in targets:
         run_target = PayPayrollRunTarget(
             run_id=run.id or 0,
-            employee_id=employee.id or 0,
-            profile_id=profile.id,
+            employee_id=target.employee.id or 0,
+            profile_id=target.profile.id,
             event_count=0,
             review_required=False,
             snapshot_json=_build_run_target_snapshot(
-                employee=employee,
-                profile=profile,
-                employee_name=employee_name,
-                department_name=department_name,
-                retire_date=retire_date,
+                target=target,
                 period_start=period_start,
                 period_end=period_end,
             ),
@@ -764,16 +794,10 @@ def _snapshot_value(snapshot: dict[str, object], key: str, default: object = Non
     return snapshot.get(key, default)
 
 
-def _build_employee_maps(session: Session, employee_ids: list[int]) -> tuple[dict[int, HrEmployee], dict[int, str]]:
-    if not employee_ids:
-        return {}, {}
-
-    employees = session.exec(select(HrEmployee).where(HrEmployee.id.in_(employee_ids))).all()
-    users = session.exec(select(AuthUser).where(AuthUser.id.in_([e.user_id for e in employees]))).all()
-    user_name_map = {u.id: u.display_name for u in users}
-
-    emp_map = {e.id: e for e in employees}
-    emp_name_map = {e.id: user_name_map.get(e.user_id, "") for e in employees}
+def _build_employee_maps(session: Session, employee_ids: list[int]) -> tuple[dict[int, EmployeeEntry], dict[int, str]]:
+    """사원 id → 디렉터리 항목/표시명. 사번·이름만 필요하므로 사원 디렉터리에서 채운다."""
+    emp_map = lookup_employees(session, employee_ids)
+    emp_name_map = {employee_id: entry.display_name for employee_id, entry in emp_map.items()}
     return emp_map, emp_name_map
 
 
@@ -850,7 +874,7 @@ def get_run_target_detail(session: Session, run_id: int, employee_id: int) -> Pa
 
 def _build_profile_item(
     profile: PayEmployeeProfile,
-    employee_map: dict[int, HrEmployee],
+    employee_map: dict[int, EmployeeEntry],
     employee_name_map: dict[int, str],
     payroll_code_name_map: dict[int, str],
     item_group_name_map: dict[int, str],
@@ -981,7 +1005,7 @@ def batch_save_employee_profiles(
 
 def _build_variable_item(
     row: PayVariableInput,
-    employee_map: dict[int, HrEmployee],
+    employee_map: dict[int, EmployeeEntry],
     employee_name_map: dict[int, str],
     item_name_map: dict[str, str],
 ) -> PayVariableInputItem:
@@ -1388,7 +1412,7 @@ def _build_welfare_request_map(
     session: Session,
     *,
     run: PayPayrollRun,
-    employee_map: dict[int, HrEmployee],
+    employee_map: dict[int, EmployeeEntry],
 ) -> dict[int, list[tuple[WelBenefitRequest, WelBenefitType]]]:
     if not employee_map:
         return {}
@@ -1438,7 +1462,7 @@ def _build_welfare_request_map(
 
 def _to_run_employee_item(
     row: PayPayrollRunEmployee,
-    employee_map: dict[int, HrEmployee],
+    employee_map: dict[int, EmployeeEntry],
     employee_name_map: dict[int, str],
     snapshot_map: dict[int, dict[str, object]] | None = None,
 ) -> PayPayrollRunEmployeeItem:
@@ -1524,6 +1548,8 @@ def calculate_payroll_run(session: Session, run_id: int) -> PayPayrollRunActionR
     total_employees = 0
 
     review_target_count = 0
+    # 사원별 결과와 항목은 세션에 넣지 않고 모아 두었다가 루프가 끝난 뒤 executemany 로 insert 한다.
+    pending: list[tuple[PayPayrollRunEmployee, list[PayPayrollRunItem]]] = []
 
     for target in run_targets:
         employee_id = target.employee_id
@@ -1559,12 +1585,10 @@ def calculate_payroll_run(session: Session, run_id: int) -> PayPayrollRunActionR
             created_at=_utc_now(),
             updated_at=_utc_now(),
         )
-        session.add(run_employee)
-        session.flush()
+        employee_items: list[PayPayrollRunItem] = []
 
-        session.add(
+        employee_items.append(
             PayPayrollRunItem(
-                run_employee_id=run_employee.id,
                 item_code="BSC",
                 item_name="기본급",
                 direction="earning",
@@ -1591,9 +1615,8 @@ def calculate_payroll_run(session: Session, run_id: int) -> PayPayrollRunActionR
                 deduction_amount=deduction_amount,
             )
 
-            session.add(
+            employee_items.append(
                 PayPayrollRunItem(
-                    run_employee_id=run_employee.id,
                     item_code=variable.item_code,
                     item_name=item_name,
                     direction=variable.direction,
@@ -1626,9 +1649,8 @@ def calculate_payroll_run(session: Session, run_id: int) -> PayPayrollRunActionR
                 deduction_amount=deduction_amount,
             )
 
-            session.add(
+            employee_items.append(
                 PayPayrollRunItem(
-                    run_employee_id=run_employee.id,
                     item_code=item_code,
                     item_name=item_name,
                     direction=direction,
@@ -1660,9 +1682,8 @@ def calculate_payroll_run(session: Session, run_id: int) -> PayPayrollRunActionR
                 non_taxable_income=non_taxable_income,
                 deduction_amount=deduction_amount,
             )
-            session.add(
+            employee_items.append(
                 PayPayrollRunItem(
-                    run_employee_id=run_employee.id,
                     item_code=code,
                     item_name=name,
                     direction="deduction",
@@ -1686,13 +1707,32 @@ def calculate_payroll_run(session: Session, run_id: int) -> PayPayrollRunActionR
         run_employee.status = "warning" if warning_messages else "ok"
         run_employee.warning_message = "; ".join(warning_messages) if warning_messages else None
         run_employee.updated_at = _utc_now()
-        session.add(run_employee)
+        pending.append((run_employee, employee_items))
 
         total_employees += 1
         total_gross += run_employee.gross_pay
         total_deductions += run_employee.total_deductions
         total_net += run_employee.net_pay
 
+    if pending:
+        session.exec(
+            insert(PayPayrollRunEmployee).execution_options(render_nulls=True),
+            params=[run_employee.model_dump(exclude={"id"}) for run_employee, _items in pending],
+        )
+        run_employee_ids = dict(
+            session.exec(
+                select(PayPayrollRunEmployee.employee_id, PayPayrollRunEmployee.id).where(PayPayrollRunEmployee.run_id == run_id)
+            ).all()
+        )
+        session.exec(
+            insert(PayPayrollRunItem),
+            params=[
+                {**item.model_dump(exclude={"id", "run_employee_id"}), "run_employee_id": run_employee_ids[run_employee.employee_id]}
+                for run_employee, employee_items in pending
+                for item in employee_items
+            ],
+        )
+
     run.total_employees = total_employees
     run.total_gross = round(total_gross, 2)
     run.total_deductions = round(total_deductions, 2)
@@ -7,14 +7,22 @@ from fastapi import HTTPException, status
 from sqlmodel import Session, select
 
 from app.core.auth import get_user_role_codes
-from app.core.pagination import calc_total_pages, count_query
+from app.core.pagination import (
+    COUNT_MODE_EXACT,
+    KeysetColumn,
+    calc_total_pages,
+    fetch_keyset_page,
+    resolve_total_count,
+)
 from app.core.time_utils import APP_TZ, business_today, now_utc
-from app.models import AuthUser, HrAttendanceDaily, HrEmployee, OrgDepartment, TimAttendanceCorrection, TimEmployeeDailySchedule
+from app.models import AuthUser, HrAttendanceDaily, HrEmployee, TimAttendanceCorrection, TimEmployeeDailySchedule
 from app.schemas.tim_attendance_daily import (
     TimAttendanceCorrectionItem,
     TimAttendanceDailyItem,
     TimAttendanceDailyListResponse,
 )
+from app.services.employee_directory_service import EmployeeEntry, lookup_employees
+from app.services.org_hierarchy_service import subtree_department_ids
 
 ALLOWED_STATUS = {"present", "late", "absent", "leave", "remote"}
 
@@ -27,14 +35,14 @@ def _worked_minutes(check_in_at: datetime | None, check_out_at: datetime | None)
     return max(minutes, 0)
 
 
-def _to_item(row: HrAttendanceDaily, employee: HrEmployee, user: AuthUser, department: OrgDepartment) -> TimAttendanceDailyItem:
+def _to_item(row: HrAttendanceDaily, employee: EmployeeEntry) -> TimAttendanceDailyItem:
     return TimAttendanceDailyItem(
         id=row.id,
         employee_id=employee.id,
         employee_no=employee.employee_no,
-        employee_name=user.display_name,
-        department_id=department.id,
-        department_name=department.name,
+        employee_name=employee.display_name,
+        department_id=employee.department_id,
+        department_name=employee.department_name,
         work_date=row.work_date,
         check_in_at=row.check_in_at,
         check_out_at=row.check_out_at,
@@ -51,6 +59,12 @@ def _to_item(row: HrAttendanceDaily, employee: HrEmployee, user: AuthUser, depar
     )
 
 
+def _to_items(session: Session, rows: list[HrAttendanceDaily]) -> list[TimAttendanceDailyItem]:
+    """사번/이름/부서는 사원 디렉터리에서 채운다. 사원 정보가 없는 행은 기존 내부 조인처럼 뺀다."""
+    employees = lookup_employees(session, (row.employee_id for row in rows))
+    return [_to_item(row, employees[row.employee_id]) for row in rows if row.employee_id in employees]
+
+
 _ATTENDANCE_MANAGE_ROLES = {"admin", "hr_manager"}
 
 
@@ -88,26 +102,45 @@ def list_attendance_daily(
     status_filter: str | None,
     page: int,
     limit: int,
+    cursor: str | None = None,
+    count_mode: str = COUNT_MODE_EXACT,
+    department_id: int | None = None,
+    include_sub_departments: bool = False,
 ) -> TimAttendanceDailyListResponse:
-    base = (
-        select(HrAttendanceDaily, HrEmployee, AuthUser, OrgDepartment)
-        .join(HrEmployee, HrAttendanceDaily.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        .where(HrAttendanceDaily.work_date >= start_date, HrAttendanceDaily.work_date <= end_date)
+    """근태 목록. cursor 가 주어지면(빈 문자열 포함) OFFSET 대신 (work_date, id) keyset 으로 조회한다."""
+    base = select(HrAttendanceDaily).where(
+        HrAttendanceDaily.work_date >= start_date,
+        HrAttendanceDaily.work_date <= end_date,
     )
 
     if employee_id is not None:
         base = base.where(HrAttendanceDaily.employee_id == employee_id)
 
+    if department_id is not None:
+        department_ids = subtree_department_ids(department_id) if include_sub_departments else [department_id]
+        base = base.where(
+            HrAttendanceDaily.employee_id.in_(select(HrEmployee.id).where(HrEmployee.department_id.in_(department_ids)))
+        )
+
     if status_filter:
         base = base.where(HrAttendanceDaily.attendance_status == status_filter)
 
-    total_count = count_query(session, base)
-
-    offset = (page - 1) * limit
-    rows = session.exec(base.order_by(HrAttendanceDaily.work_date.desc(), HrAttendanceDaily.id.desc()).offset(offset).limit(limit)).all()
-    items = [_to_item(att, emp, usr, dept) for att, emp, usr, dept in rows]
+    total_count, total_is_estimate = resolve_total_count(session, base, count_mode)
+
+    next_cursor: str | None = None
+    if cursor is not None:
+        rows, next_cursor = fetch_keyset_page(
+            session,
+            base,
+            [KeysetColumn(HrAttendanceDaily.work_date, descending=True), KeysetColumn(HrAttendanceDaily.id, descending=True)],
+            cursor=cursor,
+            limit=limit,
+            key=lambda row: (row.work_date, row.id),
+        )
+    else:
+        offset = (page - 1) * limit
+        rows = session.exec(base.order_by(HrAttendanceDaily.work_date.desc(), HrAttendanceDaily.id.desc()).offset(offset).limit(limit)).all()
+    items = _to_items(session, list(rows))
 
     return TimAttendanceDailyListResponse(
         items=items,
@@ -115,40 +148,31 @@ def list_attendance_daily(
         page=page,
         limit=limit,
         total_pages=calc_total_pages(total_count, limit),
+        total_is_estimate=total_is_estimate,
+        next_cursor=next_cursor,
     )
 
 
 def get_attendance_by_id(session: Session, attendance_id: int) -> TimAttendanceDailyItem:
-    row = session.exec(
-        select(HrAttendanceDaily, HrEmployee, AuthUser, OrgDepartment)
-        .join(HrEmployee, HrAttendanceDaily.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        .where(HrAttendanceDaily.id == attendance_id)
-        .limit(1)
-    ).first()
-    if row is None:
+    row = session.get(HrAttendanceDaily, attendance_id)
+    items = _to_items(session, [row]) if row is not None else []
+    if not items:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="근태 기록을 찾을 수 없습니다.")
-
-    attendance, employee, user, department = row
-    return _to_item(attendance, employee, user, department)
+    return items[0]
 
 
 def get_today_attendance(session: Session, employee_id: int) -> TimAttendanceDailyItem | None:
     today = business_today()
     row = session.exec(
-        select(HrAttendanceDaily, HrEmployee, AuthUser, OrgDepartment)
-        .join(HrEmployee, HrAttendanceDaily.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
+        select(HrAttendanceDaily)
         .where(HrAttendanceDaily.employee_id == employee_id, HrAttendanceDaily.work_date == today)
         .limit(1)
     ).first()
     if row is None:
         return None
 
-    attendance, employee, user, department = row
-    return _to_item(attendance, employee, user, department)
+    items = _to_items(session, [row])
+    return items[0] if items else None
 
 
 def check_in(session: Session, employee_id: int) -> TimAttendanceDailyItem:
@@ -188,17 +212,10 @@ def check_in(session: Session, employee_id: int) -> TimAttendanceDailyItem:
     session.commit()
     session.refresh(row)
 
-    detail = session.exec(
-        select(HrAttendanceDaily, HrEmployee, AuthUser, OrgDepartment)
-        .join(HrEmployee, HrAttendanceDaily.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        .where(HrAttendanceDaily.id == row.id)
-    ).first()
-    if detail is None:
+    items = _to_items(session, [row])
+    if not items:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="출근 처리 후 조회 실패")
-    attendance, employee, user, department = detail
-    return _to_item(attendance, employee, user, department)
+    return items[0]
 
 
 def check_out(session: Session, employee_id: int) -> TimAttendanceDailyItem:
@@ -220,17 +237,10 @@ def check_out(session: Session, employee_id: int) -> TimAttendanceDailyItem:
     session.commit()
     session.refresh(row)
 
-    detail = session.exec(
-        select(HrAttendanceDaily, HrEmployee, AuthUser, OrgDepartment)
-        .join(HrEmployee, HrAttendanceDaily.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        .where(HrAttendanceDaily.id == row.id)
-    ).first()
-    if detail is None:
+    items = _to_items(session, [row])
+    if not items:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="퇴근 처리 후 조회 실패")
-    attendance, employee, user, department = detail
-    return _to_item(attendance, employee, user, department)
+    return items[0]
 
 
 def correct_attendance(
@@ -3,17 +3,27 @@ from __future__ import annotations
 from datetime import date, timedelta
 
 from fastapi import HTTPException, status
+from sqlalchemy import or_
 from sqlmodel import Session, select
 
+from app.core.pagination import ALL_ROWS, COUNT_MODE_EXACT, KeysetColumn, PageParams, fetch_keyset_page, fetch_page, resolve_total_count
+from app.core.search import contains, normalize_term
 from app.core.time_utils import now_utc
 from app.models import AuthUser, HrAnnualLeave, HrEmployee, HrLeaveRequest, OrgDepartment, TimHoliday
 from app.schemas.tim_leave import TimAnnualLeaveItem, TimLeaveRequestItem
+from app.services.employee_directory_service import EmployeeEntry, lookup_employees
 
 
-def _working_days(session: Session, start_date: date, end_date: date) -> float:
-    """근무일 수 계산 (주말 + 공휴일 제외). 연차 차감 기준으로 사용."""
-    holidays = session.exec(select(TimHoliday.holiday_date).where(TimHoliday.holiday_date >= start_date, TimHoliday.holiday_date <= end_date)).all()
-    holiday_set = set(holidays)
+def _load_holidays(session: Session, start_date: date, end_date: date) -> set[date]:
+    return set(session.exec(select(TimHoliday.holiday_date).where(TimHoliday.holiday_date >= start_date, TimHoliday.holiday_date <= end_date)).all())
+
+
+def _working_days(session: Session, start_date: date, end_date: date, holidays: set[date] | None = None) -> float:
+    """근무일 수 계산 (주말 + 공휴일 제외). 연차 차감 기준으로 사용.
+
+    holidays 를 넘기면 공휴일 조회를 생략한다 (목록 변환 시 페이지 단위로 1회 조회).
+    """
+    holiday_set = holidays if holidays is not None else _load_holidays(session, start_date, end_date)
     total = 0.0
     current = start_date
     while current <= end_date:
@@ -23,7 +33,12 @@ def _working_days(session: Session, start_date: date, end_date: date) -> float:
     return total
 
 
-def _to_leave_item(session: Session, row: HrLeaveRequest, employee: HrEmployee, user: AuthUser, department: OrgDepartment) -> TimLeaveRequestItem:
+def _to_leave_item(
+    session: Session,
+    row: HrLeaveRequest,
+    employee: EmployeeEntry,
+    holidays: set[date] | None = None,
+) -> TimLeaveRequestItem:
     """HrLeaveRequest → TimLeaveRequestItem 변환.
 
     - calendar_days: 캘린더 일수 (end - start + 1), 화면 표시용
@@ -31,13 +46,13 @@ def _to_leave_item(session: Session, row: HrLeaveRequest, employee: HrEmployee,
     - leave_days: deduction_days와 동일 (하위 호환 유지)
     """
     calendar_days = float((row.end_date - row.start_date).days + 1)
-    deduction_days = _working_days(session, row.start_date, row.end_date)
+    deduction_days = _working_days(session, row.start_date, row.end_date, holidays)
     return TimLeaveRequestItem(
         id=row.id,
         employee_id=employee.id,
         employee_no=employee.employee_no,
-        employee_name=user.display_name,
-        department_name=department.name,
+        employee_name=employee.display_name,
+        department_name=employee.department_name,
         leave_type=row.leave_type,
         start_date=row.start_date,
         end_date=row.end_date,
@@ -191,27 +206,14 @@ def create_leave_request(session: Session, *, employee_id: int, leave_type: str,
     session.commit()
     session.refresh(row)
 
-    detail = session.exec(
-        select(HrLeaveRequest, HrEmployee, AuthUser, OrgDepartment)
-        .join(HrEmployee, HrLeaveRequest.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        .where(HrLeaveRequest.id == row.id)
-    ).first()
-    if detail is None:
+    items = _to_leave_items(session, [row])
+    if not items:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Leave request not found.")
-
-    leave, employee, user, department = detail
-    return _to_leave_item(session, leave, employee, user, department)
+    return items[0]
 
 
-def list_leave_requests(session: Session, *, employee_id: int | None = None, status_filter: str | None = None, pending_only: bool = False) -> list[TimLeaveRequestItem]:
-    query = (
-        select(HrLeaveRequest, HrEmployee, AuthUser, OrgDepartment)
-        .join(HrEmployee, HrLeaveRequest.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-    )
+def _build_leave_request_query(*, employee_id: int | None, status_filter: str | None, pending_only: bool):
+    query = select(HrLeaveRequest)
 
     if employee_id is not None:
         query = query.where(HrLeaveRequest.employee_id == employee_id)
@@ -219,9 +221,62 @@ def list_leave_requests(session: Session, *, employee_id: int | None = None, sta
         query = query.where(HrLeaveRequest.request_status == status_filter)
     if pending_only:
         query = query.where(HrLeaveRequest.request_status == "pending")
+    return query
+
+
+def _to_leave_items(session: Session, rows: list[HrLeaveRequest]) -> list[TimLeaveRequestItem]:
+    """사번/이름/부서는 사원 디렉터리에서 채운다. 사원 정보가 없는 행은 기존 내부 조인처럼 뺀다."""
+    if not rows:
+        return []
+    employees = lookup_employees(session, (row.employee_id for row in rows))
+    holidays = _load_holidays(session, min(row.start_date for row in rows), max(row.end_date for row in rows))
+    return [
+        _to_leave_item(session, row, employees[row.employee_id], holidays)
+        for row in rows
+        if row.employee_id in employees
+    ]
+
+
+def list_leave_requests(
+    session: Session,
+    *,
+    employee_id: int | None = None,
+    status_filter: str | None = None,
+    pending_only: bool = False,
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[TimLeaveRequestItem], int]:
+    """휴가신청 OFFSET 조회. (items, total_count) 를 반환한다."""
+    query = _build_leave_request_query(employee_id=employee_id, status_filter=status_filter, pending_only=pending_only)
+    rows, total_count = fetch_page(
+        session,
+        query.order_by(HrLeaveRequest.created_at.desc(), HrLeaveRequest.id.desc()),
+        page_params,
+    )
+    return _to_leave_items(session, rows), total_count
+
 
-    rows = session.exec(query.order_by(HrLeaveRequest.created_at.desc())).all()
-    return [_to_leave_item(session, leave, employee, user, department) for leave, employee, user, department in rows]
+def list_leave_requests_keyset(
+    session: Session,
+    *,
+    cursor: str | None,
+    limit: int,
+    count_mode: str = COUNT_MODE_EXACT,
+    employee_id: int | None = None,
+    status_filter: str | None = None,
+    pending_only: bool = False,
+) -> tuple[list[TimLeaveRequestItem], int, bool, str | None]:
+    """휴가신청 keyset 조회. (items, total_count, total_is_estimate, next_cursor) 를 반환한다."""
+    query = _build_leave_request_query(employee_id=employee_id, status_filter=status_filter, pending_only=pending_only)
+    total_count, total_is_estimate = resolve_total_count(session, query, count_mode)
+    rows, next_cursor = fetch_keyset_page(
+        session,
+        query,
+        [KeysetColumn(HrLeaveRequest.created_at, descending=True), KeysetColumn(HrLeaveRequest.id, descending=True)],
+        cursor=cursor,
+        limit=limit,
+        key=lambda row: (row.created_at, row.id),
+    )
+    return _to_leave_items(session, rows), total_count, total_is_estimate, next_cursor
 
 
 def decide_leave_request(session: Session, *, request_id: int, approver_employee_id: int, decision: str, reason: str | None = None) -> TimLeaveRequestItem:
@@ -261,18 +316,10 @@ def decide_leave_request(session: Session, *, request_id: int, approver_employee
     session.add(row)
     session.commit()
 
-    detail = session.exec(
-        select(HrLeaveRequest, HrEmployee, AuthUser, OrgDepartment)
-        .join(HrEmployee, HrLeaveRequest.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        .where(HrLeaveRequest.id == row.id)
-    ).first()
-    if detail is None:
+    items = _to_leave_items(session, [row])
+    if not items:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Leave request not found.")
-
-    leave, employee, user, department = detail
-    return _to_leave_item(session, leave, employee, user, department)
+    return items[0]
 
 
 def list_annual_leaves(
@@ -281,11 +328,13 @@ def list_annual_leaves(
     year: int,
     department_id: int | None = None,
     keyword: str | None = None,
-) -> list[TimAnnualLeaveItem]:
+    page_params: PageParams = ALL_ROWS,
+) -> tuple[list[TimAnnualLeaveItem], int]:
+    """연차 현황 OFFSET 조회. (items, total_count) 를 반환한다."""
+    # 정렬(부서명, 사번)에 필요한 조인만 두고 표시용 이름은 사원 디렉터리에서 채운다.
     query = (
-        select(HrAnnualLeave, HrEmployee, AuthUser, OrgDepartment)
+        select(HrAnnualLeave)
         .join(HrEmployee, HrAnnualLeave.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
         .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
         .where(HrAnnualLeave.year == year)
     )
@@ -293,18 +342,27 @@ def list_annual_leaves(
     if department_id is not None:
         query = query.where(HrEmployee.department_id == department_id)
 
-    if keyword:
-        like = f"%{keyword}%"
-        query = query.where((HrEmployee.employee_no.like(like)) | (AuthUser.display_name.like(like)))
+    if keyword := normalize_term(keyword):
+        query = query.join(AuthUser, HrEmployee.user_id == AuthUser.id).where(
+            or_(
+                contains(HrEmployee.employee_no, keyword),
+                contains(AuthUser.display_name, keyword, chosung_column=AuthUser.display_name_chosung),
+            )
+        )
 
-    rows = session.exec(query.order_by(OrgDepartment.name.asc(), HrEmployee.employee_no.asc())).all()
-    return [
+    rows, total_count = fetch_page(
+        session,
+        query.order_by(OrgDepartment.name.asc(), HrEmployee.employee_no.asc(), HrAnnualLeave.id.asc()),
+        page_params,
+    )
+    employees = lookup_employees(session, (annual.employee_id for annual in rows))
+    items = [
         TimAnnualLeaveItem(
             id=annual.id,
-            employee_id=employee.id,
+            employee_id=annual.employee_id,
             employee_no=employee.employee_no,
-            employee_name=user.display_name,
-            department_name=department.name,
+            employee_name=employee.display_name,
+            department_name=employee.department_name,
             year=annual.year,
             granted_days=annual.granted_days,
             used_days=annual.used_days,
@@ -313,8 +371,10 @@ def list_annual_leaves(
             grant_type=annual.grant_type,
             note=annual.note,
         )
-        for annual, employee, user, department in rows
+        for annual in rows
+        if (employee := employees.get(annual.employee_id)) is not None
     ]
+    return items, total_count
 
 
 def cancel_leave_request(session: Session, *, request_id: int, actor_employee_id: int, reason: str | None = None) -> TimLeaveRequestItem:
@@ -345,15 +405,7 @@ def cancel_leave_request(session: Session, *, request_id: int, actor_employee_id
     session.add(row)
     session.commit()
 
-    detail = session.exec(
-        select(HrLeaveRequest, HrEmployee, AuthUser, OrgDepartment)
-        .join(HrEmployee, HrLeaveRequest.employee_id == HrEmployee.id)
-        .join(AuthUser, HrEmployee.user_id == AuthUser.id)
-        .join(OrgDepartment, HrEmployee.department_id == OrgDepartment.id)
-        .where(HrLeaveRequest.id == row.id)
-    ).first()
-    if detail is None:
+    items = _to_leave_items(session, [row])
+    if not items:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Leave request not found.")
-
-    leave, employee, user, department = detail
-    return _to_leave_item(session, leave, employee, user, department)
+    return items[0]
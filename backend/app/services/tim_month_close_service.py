@@ -5,8 +5,10 @@ from calendar import monthrange
 from datetime import date
 
 from fastapi import HTTPException, status
+from sqlalchemy import insert
 from sqlmodel import Session, col, func, select
 
+from app.core.bulk import bulk_update_by_pk
 from app.core.time_utils import utc_now
 from app.models import AuthUser, HrAttendanceDaily, HrEmployee, TimMonthClose
 from app.models.entities import PayEmployeeProfile, PayVariableInput
@@ -160,6 +162,7 @@ def _calc_aggregates(session: Session, year: int, month: int) -> dict[str, int]:
 
 
 _MONTHLY_STATUTORY_HOURS = 209  # 월 소정근로시간
+_VARIABLE_INPUT_CODES = ("OTX", "NGT", "HDW", "HDO", "HDN")
 
 
 def _generate_pay_variable_inputs(session: Session, year: int, month: int) -> int:
@@ -189,7 +192,36 @@ def _generate_pay_variable_inputs(session: Session, year: int, month: int) -> in
         .group_by(HrAttendanceDaily.employee_id)
     )
     per_employee = session.exec(stmt).all()
+    employee_ids = [row[0] for row in per_employee]
 
+    # 사원별 마지막 유효 프로필과 기존 입력분을 한 번에 읽고, 쓰기도 모아서 한 번에 한다.
+    profiles: dict[int, PayEmployeeProfile] = {}
+    existing_inputs: dict[tuple[int, str], PayVariableInput] = {}
+    if employee_ids:
+        for profile in session.exec(
+            select(PayEmployeeProfile)
+            .where(
+                PayEmployeeProfile.employee_id.in_(employee_ids),
+                PayEmployeeProfile.is_active == True,  # noqa: E712
+                PayEmployeeProfile.effective_from <= last_day,
+            )
+            .order_by(PayEmployeeProfile.effective_from.desc(), PayEmployeeProfile.id)
+        ).all():
+            profiles.setdefault(profile.employee_id, profile)
+        for variable_input in session.exec(
+            select(PayVariableInput)
+            .where(
+                PayVariableInput.year_month == year_month,
+                PayVariableInput.employee_id.in_(employee_ids),
+                PayVariableInput.item_code.in_(_VARIABLE_INPUT_CODES),
+            )
+            .order_by(PayVariableInput.id)
+        ).all():
+            existing_inputs.setdefault((variable_input.employee_id, variable_input.item_code), variable_input)
+
+    updates: list[dict] = []
+    inserts: list[dict] = []
+    now = utc_now()
     count = 0
     for row in per_employee:
         emp_id = row[0]
@@ -200,16 +232,7 @@ def _generate_pay_variable_inputs(session: Session, year: int, month: int) -> in
         holiday_night_min = int(row[5])
 
         # base_hourly 계산: base_salary / 209
-        profile = session.exec(
-            select(PayEmployeeProfile)
-            .where(
-                PayEmployeeProfile.employee_id == emp_id,
-                PayEmployeeProfile.is_active == True,  # noqa: E712
-                PayEmployeeProfile.effective_from <= last_day,
-            )
-            .order_by(PayEmployeeProfile.effective_from.desc())
-            .limit(1)
-        ).first()
+        profile = profiles.get(emp_id)
 
         if profile is None or profile.base_salary <= 0:
             continue
@@ -228,33 +251,31 @@ def _generate_pay_variable_inputs(session: Session, year: int, month: int) -> in
         for item_code, direction, minutes, multiplier in items:
             amount = round(base_hourly * multiplier * (minutes / 60), 0) if minutes > 0 else 0
 
-            existing = session.exec(
-                select(PayVariableInput).where(
-                    PayVariableInput.year_month == year_month,
-                    PayVariableInput.employee_id == emp_id,
-                    PayVariableInput.item_code == item_code,
-                )
-            ).first()
+            existing = existing_inputs.get((emp_id, item_code))
+            memo = f"월마감 자동생성 ({minutes}분)"
 
             if existing:
-                existing.amount = amount
-                existing.direction = direction
-                existing.memo = f"월마감 자동생성 ({minutes}분)"
+                updates.append({"id": existing.id, "amount": amount, "direction": direction, "memo": memo})
             else:
                 if amount <= 0:
                     continue
-                session.add(
-                    PayVariableInput(
-                        year_month=year_month,
-                        employee_id=emp_id,
-                        item_code=item_code,
-                        direction=direction,
-                        amount=amount,
-                        memo=f"월마감 자동생성 ({minutes}분)",
-                    )
+                inserts.append(
+                    {
+                        "year_month": year_month,
+                        "employee_id": emp_id,
+                        "item_code": item_code,
+                        "direction": direction,
+                        "amount": amount,
+                        "memo": memo,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
                 )
             count += 1
 
+    bulk_update_by_pk(session, PayVariableInput, updates)
+    if inserts:
+        session.exec(insert(PayVariableInput), params=inserts)
     return count
 
 
@@ -68,37 +68,69 @@ def _to_datetime(work_date: date, hhmm: str | None) -> datetime | None:
     return kst_dt.astimezone(ZoneInfo("UTC"))
 
 
-def _resolve_assignment(session: Session, employee: HrEmployee, work_date: date):
-    ex = session.exec(
-        select(TimEmployeeScheduleException)
-        .where(
-            TimEmployeeScheduleException.employee_id == employee.id,
-            TimEmployeeScheduleException.is_active == True,
-        )
-        .order_by(TimEmployeeScheduleException.priority.desc(), TimEmployeeScheduleException.id.desc())
-    ).all()
-    for row in ex:
-        if _in_range(work_date, row.effective_from, row.effective_to):
-            return row.pattern_id, "employee_exception"
-
-    deps = session.exec(
-        select(TimDepartmentScheduleAssignment)
-        .where(
-            TimDepartmentScheduleAssignment.department_id == employee.department_id,
-            TimDepartmentScheduleAssignment.is_active == True,
-        )
-        .order_by(TimDepartmentScheduleAssignment.priority.desc(), TimDepartmentScheduleAssignment.id.desc())
-    ).all()
-    for row in deps:
-        if _in_range(work_date, row.effective_from, row.effective_to):
-            return row.pattern_id, "department_default"
-
-    default_pattern = session.exec(
-        select(TimSchedulePattern)
-        .where(TimSchedulePattern.is_active == True)
-        .order_by(TimSchedulePattern.id.asc())
-    ).first()
-    return (default_pattern.id if default_pattern else None), "company_default"
+class _AssignmentRules:
+    """대상 사원들의 예외/부서 배정, 근무패턴과 요일별 설정을 한 번에 읽어 둔 것."""
+
+    def __init__(self, session: Session, employees: list[HrEmployee]) -> None:
+        employee_ids = [employee.id for employee in employees if employee.id is not None]
+        department_ids = {employee.department_id for employee in employees}
+
+        self.exceptions: dict[int, list[TimEmployeeScheduleException]] = {}
+        if employee_ids:
+            for row in session.exec(
+                select(TimEmployeeScheduleException)
+                .where(
+                    TimEmployeeScheduleException.employee_id.in_(employee_ids),
+                    TimEmployeeScheduleException.is_active == True,
+                )
+                .order_by(TimEmployeeScheduleException.priority.desc(), TimEmployeeScheduleException.id.desc())
+            ).all():
+                self.exceptions.setdefault(row.employee_id, []).append(row)
+
+        self.department_assignments: dict[int, list[TimDepartmentScheduleAssignment]] = {}
+        if department_ids:
+            for row in session.exec(
+                select(TimDepartmentScheduleAssignment)
+                .where(
+                    TimDepartmentScheduleAssignment.department_id.in_(department_ids),
+                    TimDepartmentScheduleAssignment.is_active == True,
+                )
+                .order_by(TimDepartmentScheduleAssignment.priority.desc(), TimDepartmentScheduleAssignment.id.desc())
+            ).all():
+                self.department_assignments.setdefault(row.department_id, []).append(row)
+
+        self.default_pattern_id = session.exec(
+            select(TimSchedulePattern.id)
+            .where(TimSchedulePattern.is_active == True)
+            .order_by(TimSchedulePattern.id.asc())
+        ).first()
+
+        pattern_ids = {row.pattern_id for rows in self.exceptions.values() for row in rows}
+        pattern_ids |= {row.pattern_id for rows in self.department_assignments.values() for row in rows}
+        if self.default_pattern_id is not None:
+            pattern_ids.add(self.default_pattern_id)
+        self.patterns: dict[int, TimSchedulePattern] = {}
+        self.pattern_days: dict[tuple[int, int], TimSchedulePatternDay] = {}
+        if pattern_ids:
+            self.patterns = {
+                pattern.id: pattern
+                for pattern in session.exec(select(TimSchedulePattern).where(TimSchedulePattern.id.in_(pattern_ids))).all()
+            }
+            for pattern_day in session.exec(
+                select(TimSchedulePatternDay)
+                .where(TimSchedulePatternDay.pattern_id.in_(pattern_ids))
+                .order_by(TimSchedulePatternDay.id)
+            ).all():
+                self.pattern_days.setdefault((pattern_day.pattern_id, pattern_day.weekday), pattern_day)
+
+    def resolve(self, employee: HrEmployee, work_date: date) -> tuple[int | None, str]:
+        for row in self.exceptions.get(employee.id, ()):
+            if _in_range(work_date, row.effective_from, row.effective_to):
+                return row.pattern_id, "employee_exception"
+        for row in self.department_assignments.get(employee.department_id, ()):
+            if _in_range(work_date, row.effective_from, row.effective_to):
+                return row.pattern_id, "department_default"
+        return self.default_pattern_id, "company_default"
 
 
 def generate_employee_daily_schedules(session: Session, payload: TimScheduleGenerateRequest) -> TimScheduleGenerateResponse:
@@ -134,17 +166,15 @@ def generate_employee_daily_schedules(session: Session, payload: TimScheduleGene
     skipped = 0
     version_tag = datetime.utcnow().strftime("gen-%Y%m%d-%H%M%S")
 
+    rules = _AssignmentRules(session, employees)
+
     day = payload.date_from
     while day <= payload.date_to:
         weekday = day.weekday()
         for employee in employees:
-            pattern_id, source = _resolve_assignment(session, employee, day)
-            pattern = session.get(TimSchedulePattern, pattern_id) if pattern_id else None
-            pattern_day = None
-            if pattern is not None:
-                pattern_day = session.exec(
-                    select(TimSchedulePatternDay).where(TimSchedulePatternDay.pattern_id == pattern.id, TimSchedulePatternDay.weekday == weekday)
-                ).first()
+            pattern_id, source = rules.resolve(employee, day)
+            pattern = rules.patterns.get(pattern_id) if pattern_id else None
+            pattern_day = rules.pattern_days.get((pattern.id, weekday)) if pattern is not None else None
 
             is_holiday = day in holidays
             holiday_name = holidays[day].name if is_holiday else None
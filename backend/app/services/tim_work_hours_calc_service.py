@@ -12,6 +12,7 @@ from zoneinfo import ZoneInfo
 
 from sqlmodel import Session, select
 
+from app.core.bulk import bulk_update_by_pk
 from app.core.time_utils import APP_TZ
 from app.models import HrAttendanceDaily, TimEmployeeDailySchedule
 
@@ -80,6 +81,18 @@ def calculate_work_hours(
         night_minutes, holiday_work_minutes, holiday_overtime_minutes,
         holiday_night_minutes, is_holiday_work
     """
+    schedule = None
+    if attendance.check_in_at and attendance.check_out_at and attendance.attendance_status not in ("absent", "leave"):
+        schedule = session.exec(
+            select(TimEmployeeDailySchedule).where(
+                TimEmployeeDailySchedule.employee_id == attendance.employee_id,
+                TimEmployeeDailySchedule.work_date == attendance.work_date,
+            )
+        ).first()
+    return _calculate_with_schedule(attendance, schedule)
+
+
+def _calculate_with_schedule(attendance: HrAttendanceDaily, schedule: TimEmployeeDailySchedule | None) -> dict:
     result = {
         "actual_minutes": 0,
         "regular_minutes": 0,
@@ -97,14 +110,6 @@ def calculate_work_hours(
     if attendance.attendance_status in ("absent", "leave"):
         return result
 
-    # 일별 스케줄 조회
-    schedule = session.exec(
-        select(TimEmployeeDailySchedule).where(
-            TimEmployeeDailySchedule.employee_id == attendance.employee_id,
-            TimEmployeeDailySchedule.work_date == attendance.work_date,
-        )
-    ).first()
-
     check_in_kst = _to_kst(attendance.check_in_at)
     check_out_kst = _to_kst(attendance.check_out_at)
 
@@ -140,20 +145,28 @@ def calculate_work_hours(
     return result
 
 
+def _work_hours_values(hours: dict) -> dict:
+    """계산 결과 중 HrAttendanceDaily 에 저장하는 컬럼 값."""
+    return {
+        "actual_minutes": hours["actual_minutes"],
+        "regular_minutes": hours["regular_minutes"],
+        "overtime_minutes": hours["overtime_minutes"],
+        "night_minutes": hours["night_minutes"],
+        "holiday_work_minutes": hours["holiday_work_minutes"],
+        "holiday_overtime_minutes": hours["holiday_overtime_minutes"],
+        "holiday_night_minutes": hours["holiday_night_minutes"],
+        "is_holiday_work": hours["is_holiday_work"],
+        "calculated_at": datetime.now(timezone.utc),
+    }
+
+
 def apply_work_hours(
     attendance: HrAttendanceDaily,
     hours: dict,
 ) -> None:
     """계산 결과를 HrAttendanceDaily 레코드에 반영."""
-    attendance.actual_minutes = hours["actual_minutes"]
-    attendance.regular_minutes = hours["regular_minutes"]
-    attendance.overtime_minutes = hours["overtime_minutes"]
-    attendance.night_minutes = hours["night_minutes"]
-    attendance.holiday_work_minutes = hours["holiday_work_minutes"]
-    attendance.holiday_overtime_minutes = hours["holiday_overtime_minutes"]
-    attendance.holiday_night_minutes = hours["holiday_night_minutes"]
-    attendance.is_holiday_work = hours["is_holiday_work"]
-    attendance.calculated_at = datetime.now(timezone.utc)
+    for name, value in _work_hours_values(hours).items():
+        setattr(attendance, name, value)
 
 
 def calculate_and_save(session: Session, attendance: HrAttendanceDaily) -> dict:
@@ -165,7 +178,10 @@ def calculate_and_save(session: Session, attendance: HrAttendanceDaily) -> dict:
 
 
 def recalculate_month(session: Session, year: int, month: int) -> int:
-    """한 달 전체 근태 레코드를 재계산. 반환값: 처리 건수."""
+    """한 달 전체 근태 레코드를 재계산. 반환값: 처리 건수.
+
+    일별 스케줄은 월 단위로 한 번에 읽고, 계산 결과는 bulk_update_by_pk 로 한 번에 쓴다.
+    """
     first_day = date(year, month, 1)
     last_day = date(year, month, monthrange(year, month)[1])
 
@@ -175,12 +191,20 @@ def recalculate_month(session: Session, year: int, month: int) -> int:
             HrAttendanceDaily.work_date <= last_day,
         )
     ).all()
+    schedules: dict[tuple[int, date], TimEmployeeDailySchedule] = {}
+    for schedule in session.exec(
+        select(TimEmployeeDailySchedule)
+        .where(
+            TimEmployeeDailySchedule.work_date >= first_day,
+            TimEmployeeDailySchedule.work_date <= last_day,
+        )
+        .order_by(TimEmployeeDailySchedule.id)
+    ).all():
+        schedules.setdefault((schedule.employee_id, schedule.work_date), schedule)
 
-    count = 0
+    updates: list[dict] = []
     for attendance in rows:
         if attendance.check_in_at and attendance.check_out_at:
-            calculate_and_save(session, attendance)
-            count += 1
-
-    session.flush()
-    return count
+            schedule = schedules.get((attendance.employee_id, attendance.work_date))
+            updates.append({"id": attendance.id, **_work_hours_values(_calculate_with_schedule(attendance, schedule))})
+    return bulk_update_by_pk(session, HrAttendanceDaily, updates)
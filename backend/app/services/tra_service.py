@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import func
+from sqlalchemy import String, case, cast, func, literal, true, union_all
+from sqlalchemy import insert as sa_insert
+from sqlalchemy import update as sa_update
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, SQLModel, select
 
+from app.core.bulk import dialect_insert
+from app.core.export import EXPORT_BATCH_SIZE, stream_rows
+from app.core.pagination import KeysetColumn, apply_keyset, count_query, fetch_keyset_page
+from app.core.sequence import allocate_sequence_block, max_suffix_seq, next_sequence
+from app.core.time_utils import business_today
 from app.models import AuthUser, HrEmployee, OrgDepartment
 from app.models.tra import (
     TraApplication,
@@ -26,6 +35,7 @@ from app.schemas.tra import (
     TraApplicationItem,
     TraApplicationListResponse,
     TraApplicationRejectRequest,
+    TraCyberApplyResponse,
     TraResourceBatchRequest,
 )
 
@@ -73,31 +83,20 @@ def _to_date(value: Any) -> date | None:
     raise ValueError(f"Unsupported date value: {value}")
 
 
-def _sqlmodel_to_dict(row: SQLModel) -> dict[str, Any]:
-    return row.model_dump()
-
+@dataclass(frozen=True)
+class ResourceLookup:
+    """외래키로 이어진 표시용 컬럼. 목록 조회 때 LEFT JOIN 으로 같은 쿼리에서 읽는다."""
 
-def _name_map_by_id(
-    session: Session,
-    model: type[SQLModel],
-    ids: set[int],
-    value_field: str,
-) -> dict[int, Any]:
-    if not ids:
-        return {}
-    id_column = getattr(model, "id")
-    value_column = getattr(model, value_field)
-    rows = session.exec(select(id_column, value_column).where(id_column.in_(ids))).all()
-    return {int(row[0]): row[1] for row in rows}
+    name: str
+    key_field: str
+    model: type[SQLModel]
+    value_field: str
 
 
-def _employee_no_map(session: Session, employee_ids: set[int]) -> dict[int, str]:
-    if not employee_ids:
-        return {}
-    rows = session.exec(
-        select(HrEmployee.id, HrEmployee.employee_no).where(HrEmployee.id.in_(employee_ids)),
-    ).all()
-    return {int(row[0]): row[1] for row in rows}
+_COURSE_NAME = ResourceLookup("course_name", "course_id", TraCourse, "course_name")
+_EVENT_NAME = ResourceLookup("event_name", "event_id", TraEvent, "event_name")
+_ORGANIZATION_NAME = ResourceLookup("organization_name", "organization_id", TraOrganization, "name")
+_EMPLOYEE_NO = ResourceLookup("employee_no", "employee_id", HrEmployee, "employee_no")
 
 
 @dataclass(frozen=True)
@@ -109,6 +108,11 @@ class ResourceConfig:
     bool_fields: frozenset[str]
     date_fields: frozenset[str]
     order_fields: tuple[str, ...]
+    # 목록 조회용: 조건으로 받을 컬럼, 정렬 가능한 컬럼, 기본 응답 컬럼(비면 전체 컬럼 + lookups)
+    filter_fields: tuple[str, ...] = ()
+    sort_fields: tuple[str, ...] = ()
+    default_fields: tuple[str, ...] = ()
+    lookups: tuple[ResourceLookup, ...] = ()
 
 
 RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
@@ -128,6 +132,8 @@ RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
         bool_fields=frozenset({"is_active"}),
         date_fields=frozenset(),
         order_fields=("code", "id"),
+        filter_fields=("code", "name", "business_no", "is_active"),
+        sort_fields=("code", "name", "id"),
     ),
     "courses": ResourceConfig(
         model=TraCourse,
@@ -154,6 +160,19 @@ RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
         bool_fields=frozenset({"mandatory_yn", "is_active"}),
         date_fields=frozenset(),
         order_fields=("course_code", "id"),
+        filter_fields=(
+            "course_code",
+            "course_name",
+            "in_out_type",
+            "status_code",
+            "organization_id",
+            "mandatory_yn",
+            "job_code",
+            "edu_level",
+            "is_active",
+        ),
+        sort_fields=("course_code", "course_name", "id"),
+        lookups=(_ORGANIZATION_NAME,),
     ),
     "events": ResourceConfig(
         model=TraEvent,
@@ -191,6 +210,9 @@ RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
         bool_fields=frozenset({"labor_apply_yn", "labor_return_yn", "result_app_skip_yn", "is_active"}),
         date_fields=frozenset({"start_date", "end_date", "appl_start_date", "appl_end_date", "labor_return_date"}),
         order_fields=("start_date", "id"),
+        filter_fields=("course_id", "event_code", "status_code", "organization_id", "start_date", "is_active"),
+        sort_fields=("start_date", "event_code", "course_id", "id"),
+        lookups=(_COURSE_NAME, _ORGANIZATION_NAME),
     ),
     "required-standards": ResourceConfig(
         model=TraRequiredRule,
@@ -217,6 +239,9 @@ RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
         bool_fields=frozenset({"is_active"}),
         date_fields=frozenset(),
         order_fields=("year", "rule_code", "order_seq", "id"),
+        filter_fields=("year", "rule_code", "course_id", "job_code", "edu_level", "is_active"),
+        sort_fields=("year", "rule_code", "order_seq", "id"),
+        lookups=(_COURSE_NAME,),
     ),
     "required-targets": ResourceConfig(
         model=TraRequiredTarget,
@@ -240,6 +265,24 @@ RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
         bool_fields=frozenset(),
         date_fields=frozenset(),
         order_fields=("year", "edu_month", "employee_id", "id"),
+        filter_fields=("year", "employee_id", "rule_code", "course_id", "edu_month", "event_id", "completion_status"),
+        sort_fields=("year", "edu_month", "employee_id", "id"),
+        default_fields=(
+            "id",
+            "year",
+            "employee_id",
+            "employee_no",
+            "rule_code",
+            "course_id",
+            "course_name",
+            "edu_month",
+            "event_id",
+            "event_name",
+            "completion_status",
+            "completed_count",
+            "note",
+        ),
+        lookups=(_COURSE_NAME, _EVENT_NAME, _EMPLOYEE_NO),
     ),
     "applications": ResourceConfig(
         model=TraApplication,
@@ -262,6 +305,9 @@ RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
         bool_fields=frozenset({"year_plan_yn", "survey_yn"}),
         date_fields=frozenset(),
         order_fields=("id",),
+        filter_fields=("application_no", "employee_id", "course_id", "event_id", "status"),
+        sort_fields=("id",),
+        lookups=(_COURSE_NAME, _EVENT_NAME, _EMPLOYEE_NO),
     ),
     "elearning-windows": ResourceConfig(
         model=TraElearningWindow,
@@ -271,6 +317,8 @@ RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
         bool_fields=frozenset(),
         date_fields=frozenset({"start_date", "end_date"}),
         order_fields=("year_month", "id"),
+        filter_fields=("year_month",),
+        sort_fields=("year_month", "id"),
     ),
     "histories": ResourceConfig(
         model=TraHistory,
@@ -291,6 +339,23 @@ RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
         bool_fields=frozenset(),
         date_fields=frozenset({"completed_at"}),
         order_fields=("completed_at", "id"),
+        filter_fields=("employee_id", "course_id", "event_id", "confirm_type", "completed_at"),
+        sort_fields=("completed_at", "employee_id", "id"),
+        default_fields=(
+            "id",
+            "employee_id",
+            "employee_no",
+            "course_id",
+            "course_name",
+            "event_id",
+            "event_name",
+            "confirm_type",
+            "completed_at",
+            "app_point",
+            "unconfirm_reason",
+            "note",
+        ),
+        lookups=(_COURSE_NAME, _EVENT_NAME, _EMPLOYEE_NO),
     ),
     "cyber-uploads": ResourceConfig(
         model=TraCyberUpload,
@@ -331,6 +396,22 @@ RESOURCE_CONFIGS: dict[str, ResourceConfig] = {
         bool_fields=frozenset({"labor_apply_yn", "mandatory_yn", "close_yn"}),
         date_fields=frozenset({"start_date", "end_date"}),
         order_fields=("upload_ym", "id"),
+        filter_fields=("upload_ym", "employee_no", "course_name", "close_yn"),
+        sort_fields=("upload_ym", "id"),
+        default_fields=(
+            "id",
+            "upload_ym",
+            "employee_no",
+            "course_name",
+            "start_date",
+            "end_date",
+            "edu_hour",
+            "reward_hour",
+            "organization_name",
+            "confirm_type",
+            "close_yn",
+            "note",
+        ),
     ),
 }
 
@@ -365,140 +446,212 @@ def _normalize_payload(config: ResourceConfig, raw: dict[str, Any]) -> dict[str,
     return normalized
 
 
-def _serialize_rows(session: Session, resource: str, rows: list[SQLModel]) -> list[dict[str, Any]]:
-    if not rows:
-        return []
-
-    if resource == "courses":
-        org_ids = {row.organization_id for row in rows if isinstance(row, TraCourse) and row.organization_id is not None}
-        org_map = _name_map_by_id(session, TraOrganization, {int(item) for item in org_ids}, "name")
-        items: list[dict[str, Any]] = []
-        for row in rows:
-            if not isinstance(row, TraCourse):
-                continue
-            data = _sqlmodel_to_dict(row)
-            data["organization_name"] = org_map.get(row.organization_id or 0)
-            items.append(data)
-        return items
-
-    if resource == "events":
-        course_ids = {row.course_id for row in rows if isinstance(row, TraEvent)}
-        org_ids = {row.organization_id for row in rows if isinstance(row, TraEvent) and row.organization_id is not None}
-        course_map = _name_map_by_id(session, TraCourse, {int(item) for item in course_ids}, "course_name")
-        org_map = _name_map_by_id(session, TraOrganization, {int(item) for item in org_ids}, "name")
-        items = []
-        for row in rows:
-            if not isinstance(row, TraEvent):
-                continue
-            data = _sqlmodel_to_dict(row)
-            data["course_name"] = course_map.get(row.course_id)
-            data["organization_name"] = org_map.get(row.organization_id or 0)
-            items.append(data)
-        return items
-
-    if resource == "required-standards":
-        course_ids = {row.course_id for row in rows if isinstance(row, TraRequiredRule)}
-        course_map = _name_map_by_id(session, TraCourse, {int(item) for item in course_ids}, "course_name")
-        items = []
-        for row in rows:
-            if not isinstance(row, TraRequiredRule):
-                continue
-            data = _sqlmodel_to_dict(row)
-            data["course_name"] = course_map.get(row.course_id)
-            items.append(data)
-        return items
-
-    if resource == "required-targets":
-        course_ids = {row.course_id for row in rows if isinstance(row, TraRequiredTarget)}
-        event_ids = {row.event_id for row in rows if isinstance(row, TraRequiredTarget) and row.event_id is not None}
-        employee_ids = {row.employee_id for row in rows if isinstance(row, TraRequiredTarget)}
-        course_map = _name_map_by_id(session, TraCourse, {int(item) for item in course_ids}, "course_name")
-        event_map = _name_map_by_id(session, TraEvent, {int(item) for item in event_ids}, "event_name")
-        employee_map = _employee_no_map(session, {int(item) for item in employee_ids})
-        items = []
-        for row in rows:
-            if not isinstance(row, TraRequiredTarget):
-                continue
-            data = _sqlmodel_to_dict(row)
-            data["course_name"] = course_map.get(row.course_id)
-            data["event_name"] = event_map.get((row.event_id or 0))
-            data["employee_no"] = employee_map.get(row.employee_id)
-            items.append(data)
-        return items
-
-    if resource == "applications":
-        course_ids = {row.course_id for row in rows if isinstance(row, TraApplication)}
-        event_ids = {row.event_id for row in rows if isinstance(row, TraApplication) and row.event_id is not None}
-        employee_ids = {row.employee_id for row in rows if isinstance(row, TraApplication)}
-        course_map = _name_map_by_id(session, TraCourse, {int(item) for item in course_ids}, "course_name")
-        event_map = _name_map_by_id(session, TraEvent, {int(item) for item in event_ids}, "event_name")
-        employee_map = _employee_no_map(session, {int(item) for item in employee_ids})
-        items = []
-        for row in rows:
-            if not isinstance(row, TraApplication):
-                continue
-            data = _sqlmodel_to_dict(row)
-            data["course_name"] = course_map.get(row.course_id)
-            data["event_name"] = event_map.get((row.event_id or 0))
-            data["employee_no"] = employee_map.get(row.employee_id)
-            items.append(data)
-        return items
-
-    if resource == "histories":
-        course_ids = {row.course_id for row in rows if isinstance(row, TraHistory)}
-        event_ids = {row.event_id for row in rows if isinstance(row, TraHistory) and row.event_id is not None}
-        employee_ids = {row.employee_id for row in rows if isinstance(row, TraHistory)}
-        course_map = _name_map_by_id(session, TraCourse, {int(item) for item in course_ids}, "course_name")
-        event_map = _name_map_by_id(session, TraEvent, {int(item) for item in event_ids}, "event_name")
-        employee_map = _employee_no_map(session, {int(item) for item in employee_ids})
-        items = []
-        for row in rows:
-            if not isinstance(row, TraHistory):
-                continue
-            data = _sqlmodel_to_dict(row)
-            data["course_name"] = course_map.get(row.course_id)
-            data["event_name"] = event_map.get((row.event_id or 0))
-            data["employee_no"] = employee_map.get(row.employee_id)
-            items.append(data)
-        return items
-
-    return [_sqlmodel_to_dict(row) for row in rows]
+RESOURCE_EXPORT_BATCH_SIZE = EXPORT_BATCH_SIZE
 
 
-def list_tra_resource(
-    session: Session,
+@dataclass(frozen=True)
+class ResourceQuery:
+    """검증을 마친 목록 조회. statement 는 조건까지 적용된 SELECT(정렬 전)이다."""
+
+    resource: str
+    statement: Any
+    fields: tuple[str, ...]
+    keyset: tuple[KeysetColumn, ...]
+
+    def row_key(self, row: Any) -> list[Any]:
+        return [row._mapping[f"_sort{index}"] for index in range(len(self.keyset))]
+
+    def to_item(self, row: Any) -> dict[str, Any]:
+        mapping = row._mapping
+        return {field: mapping[field] for field in self.fields}
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def _coerce_filter_value(config: ResourceConfig, field: str, value: str) -> Any:
+    try:
+        if field in config.bool_fields:
+            return _to_bool(value)
+        if field in config.int_fields or field == "id":
+            return int(value)
+        if field in config.float_fields:
+            return float(value)
+        if field in config.date_fields:
+            return _to_date(value)
+    except (TypeError, ValueError) as error:
+        raise _bad_request(f"Invalid filter value for {field}: {value}") from error
+    return value
+
+
+def _resource_filters(config: ResourceConfig, filters: dict[str, str]) -> list[Any]:
+    """field=value 는 일치 조건, 날짜 컬럼은 field_from / field_to 로 범위 조건을 받는다."""
+    model = config.model
+    clauses: list[Any] = []
+    for key, value in filters.items():
+        field, operator = key, "eq"
+        for suffix in ("_from", "_to"):
+            base = key.removesuffix(suffix)
+            if key.endswith(suffix) and base in config.date_fields and base in config.filter_fields:
+                field, operator = base, suffix
+        if field not in config.filter_fields:
+            raise _bad_request(f"Unknown filter field: {key}")
+        column = getattr(model, field)
+        coerced = _coerce_filter_value(config, field, value)
+        if operator == "_from":
+            clauses.append(column >= coerced)
+        elif operator == "_to":
+            clauses.append(column <= coerced)
+        else:
+            clauses.append(column == coerced)
+    return clauses
+
+
+def _resource_keyset(config: ResourceConfig, sort: str | None) -> list[KeysetColumn]:
+    """sort 는 'field' 또는 '-field' 의 쉼표 목록. 마지막에 id 를 붙여 정렬을 유일하게 만든다.
+
+    NULL 이 될 수 있는 컬럼은 (NULL 여부, 값) 두 키로 나눠 cursor 비교가 NULL 에서 끊기지 않게 한다.
+    """
+    model = config.model
+    if sort:
+        requested = [item.strip() for item in sort.split(",") if item.strip()]
+        unknown = [item for item in requested if item.lstrip("-") not in config.sort_fields]
+        if unknown:
+            raise _bad_request(f"Unknown sort field: {', '.join(unknown)}")
+        order = [(item.lstrip("-"), item.startswith("-")) for item in requested]
+    else:
+        order = [(field, False) for field in config.order_fields]
+    if not any(field == "id" for field, _ in order):
+        order.append(("id", False))
+
+    keyset: list[KeysetColumn] = []
+    for field, descending in order:
+        column = getattr(model, field)
+        if model.__table__.c[field].nullable:
+            keyset.append(KeysetColumn(case((column.is_(None), 1), else_=0), descending))
+        keyset.append(KeysetColumn(column, descending))
+        if field == "id":
+            break
+    return keyset
+
+
+def build_tra_resource_query(
     resource: str,
     *,
     year: int | None = None,
-) -> list[dict[str, Any]]:
+    filters: dict[str, str] | None = None,
+    fields: list[str] | None = None,
+    sort: str | None = None,
+) -> ResourceQuery:
+    """ResourceConfig 선언대로 조건, 정렬, 컬럼 선택을 SQL 로 구성한다. 잘못된 이름은 400."""
     config = _resource_config_or_404(resource)
     model = config.model
-    statement = select(model)
-
-    if year is not None and hasattr(model, "year"):
+    model_columns = tuple(model.__table__.c.keys())
+    lookups = {lookup.name: lookup for lookup in config.lookups}
+
+    selected = tuple(fields or config.default_fields or (*model_columns, *lookups))
+    unknown = [field for field in selected if field not in model_columns and field not in lookups]
+    if unknown:
+        raise _bad_request(f"Unknown fields for {resource}: {', '.join(unknown)}")
+
+    keyset = _resource_keyset(config, sort)
+    columns: list[Any] = []
+    joins: list[tuple[Any, Any]] = []
+    for field in selected:
+        lookup = lookups.get(field) if field not in model_columns else None
+        if lookup is None:
+            columns.append(getattr(model, field).label(field))
+            continue
+        target = aliased(lookup.model, name=f"lookup_{lookup.name}")
+        joins.append((target, target.id == getattr(model, lookup.key_field)))
+        columns.append(getattr(target, lookup.value_field).label(field))
+    columns.extend(item.column.label(f"_sort{index}") for index, item in enumerate(keyset))
+
+    statement = select(*columns).select_from(model)
+    for target, onclause in joins:
+        statement = statement.outerjoin(target, onclause)
+    if year is not None and "year" in model_columns:
         statement = statement.where(getattr(model, "year") == year)
+    statement = statement.where(*_resource_filters(config, filters or {}))
+    return ResourceQuery(resource=resource, statement=statement, fields=selected, keyset=tuple(keyset))
+
+
+def list_tra_resource(
+    session: Session,
+    resource: str,
+    *,
+    year: int | None = None,
+    filters: dict[str, str] | None = None,
+    fields: list[str] | None = None,
+    sort: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> tuple[list[dict[str, Any]], int, str | None]:
+    """(items, total_count, next_cursor). limit 이 없으면 조건에 맞는 전체를 돌려준다."""
+    query = build_tra_resource_query(resource, year=year, filters=filters, fields=fields, sort=sort)
+    if limit is None:
+        rows = session.exec(apply_keyset(query.statement, query.keyset, None)).all()
+        return [query.to_item(row) for row in rows], len(rows), None
+
+    rows, next_cursor = fetch_keyset_page(
+        session, query.statement, query.keyset, cursor=cursor, limit=limit, key=query.row_key
+    )
+    if not cursor and next_cursor is None:
+        total_count = len(rows)
+    else:
+        total_count = count_query(session, query.statement)
+    return [query.to_item(row) for row in rows], total_count, next_cursor
+
+
+def iter_tra_resource_export(session: Session, query: ResourceQuery, export_format: str) -> Iterator[str]:
+    """정렬된 결과를 yield_per 묶음으로 읽어 NDJSON 줄 또는 CSV 행을 묶음마다 내보낸다.
+
+    전체 결과를 메모리에 올리지 않으므로 Postgres 에서는 서버 측 커서로 읽는다.
+    """
+    statement = apply_keyset(query.statement, query.keyset, None).execution_options(
+        yield_per=RESOURCE_EXPORT_BATCH_SIZE
+    )
+
+    def batches() -> Iterator[list[dict[str, Any]]]:
+        for partition in session.exec(statement).partitions():
+            yield [query.to_item(row) for row in partition]
 
-    order_columns = [getattr(model, field) for field in config.order_fields if hasattr(model, field)]
-    if order_columns:
-        statement = statement.order_by(*order_columns)
+    return stream_rows(batches(), query.fields, export_format)
 
-    rows = session.exec(statement).all()
-    return _serialize_rows(session, resource, rows)
+
+def _code_sequence_block(
+    session: Session,
+    counter_key: str,
+    model: type[SQLModel],
+    column: Any,
+    prefix: str,
+    count: int,
+) -> range:
+    # 기존 코드는 MAX(id)+1 로 만들어졌으므로 최초 시작값은 id 와 코드 접미사 중 큰 값으로 잡는다.
+    def initial() -> int:
+        max_id = session.exec(select(func.max(model.id))).one() or 0
+        return max(int(max_id), max_suffix_seq(session, column, prefix))
+
+    return allocate_sequence_block(session, counter_key, count, initial=initial)
+
+
+def _next_code_by_sequence(session: Session, counter_key: str, model: type[SQLModel], column: Any, prefix: str) -> int:
+    return _code_sequence_block(session, counter_key, model, column, prefix, 1)[0]
 
 
 def _next_application_no(session: Session) -> str:
-    max_id = session.exec(select(func.max(TraApplication.id))).one() or 0
-    return f"TRA-{date.today().year}-{int(max_id) + 1:06d}"
+    prefix = f"TRA-{business_today().year}-"
+    seq = _next_code_by_sequence(session, "TRA-APP", TraApplication, TraApplication.application_no, prefix)
+    return f"{prefix}{seq:06d}"
 
 
 def _next_org_code(session: Session) -> str:
-    max_id = session.exec(select(func.max(TraOrganization.id))).one() or 0
-    return f"TRORG{int(max_id) + 1:05d}"
+    return f"TRORG{_next_code_by_sequence(session, 'TRORG', TraOrganization, TraOrganization.code, 'TRORG'):05d}"
 
 
 def _next_course_code(session: Session) -> str:
-    max_id = session.exec(select(func.max(TraCourse.id))).one() or 0
-    return f"TRAC{int(max_id) + 1:05d}"
+    return f"TRAC{_next_code_by_sequence(session, 'TRAC', TraCourse, TraCourse.course_code, 'TRAC'):05d}"
 
 
 def batch_save_tra_resource(
@@ -559,108 +712,201 @@ def batch_save_tra_resource(
     return {"created": created, "updated": updated, "deleted": deleted}
 
 
-def generate_required_events(session: Session, year: int) -> int:
-    rules = session.exec(
-        select(TraRequiredRule).where(TraRequiredRule.year == year, TraRequiredRule.is_active.is_(True)),
-    ).all()
-    if not rules:
-        return 0
-
-    course_ids = {rule.course_id for rule in rules}
-    course_name_map = _name_map_by_id(session, TraCourse, {int(item) for item in course_ids}, "course_name")
-    created = 0
-
-    for rule in rules:
-        start_month = min(max(rule.start_month or 1, 1), 12)
-        end_month = min(max(rule.end_month or start_month, start_month), 12)
-        for month in range(start_month, end_month + 1):
-            event_code = f"{year}{month:02d}"
-            exists = session.exec(
-                select(TraEvent.id).where(TraEvent.course_id == rule.course_id, TraEvent.event_code == event_code),
-            ).first()
-            if exists is not None:
-                continue
-
-            month_start = date(year, month, 1)
-            if month == 12:
-                month_end = date(year + 1, 1, 1) - timedelta(days=1)
-            else:
-                month_end = date(year, month + 1, 1) - timedelta(days=1)
-
-            course_name = course_name_map.get(rule.course_id) or f"Course-{rule.course_id}"
-            row = TraEvent(
-                course_id=rule.course_id,
-                event_code=event_code,
-                event_name=f"{course_name}({year}-{month:02d})",
-                status_code="open",
-                start_date=month_start,
-                end_date=month_end,
-                appl_start_date=date(year, 1, 1),
-                appl_end_date=month_start - timedelta(days=1),
-                result_app_skip_yn=True,
-                max_person=999,
-                created_at=_utc_now(),
-                updated_at=_utc_now(),
+def _required_rule_filters(
+    year: int,
+    rule_code: str | None = None,
+    job_code: str | None = None,
+    edu_level: str | None = None,
+) -> list[Any]:
+    filters: list[Any] = [TraRequiredRule.year == year, TraRequiredRule.is_active.is_(True)]
+    if rule_code:
+        filters.append(TraRequiredRule.rule_code == rule_code)
+    if job_code:
+        filters.append(TraRequiredRule.job_code == job_code)
+    if edu_level:
+        filters.append(TraRequiredRule.edu_level == edu_level)
+    return filters
+
+
+def _clamp_month(month: Any, lower: Any) -> Any:
+    """SQL 식 버전의 min(max(month, lower), 12)."""
+    return case((month < lower, lower), (month > 12, 12), else_=month)
+
+
+def _year_month_code(year: int, month: Any) -> Any:
+    # lpad 는 SQLite 에 없으므로 100+월 을 문자열로 바꿔 뒤 두 자리를 쓴다.
+    return literal(str(year)) + func.substr(cast(100 + month, String), 2)
+
+
+def _insert_from_select_ignore(
+    session: Session,
+    model: type[SQLModel],
+    columns: list[str],
+    select_stmt: Any,
+    *,
+    conflict_columns: list[str],
+    not_exists: Any,
+) -> int:
+    """INSERT ... SELECT 로 한 번에 넣고 conflict_columns 가 겹치는 행은 건너뛴다. 넣은 행 수를 반환한다."""
+    insert_stmt = dialect_insert(session, model)
+    if insert_stmt is not None:
+        statement = insert_stmt.from_select(columns, select_stmt).on_conflict_do_nothing(index_elements=conflict_columns)
+    else:
+        # ON CONFLICT 를 지원하지 않는 방언용 대체 경로.
+        statement = sa_insert(model).from_select(columns, select_stmt.where(~not_exists))
+    return int(session.exec(statement).rowcount or 0)
+
+
+def generate_required_events(
+    session: Session,
+    year: int,
+    *,
+    job_code: str | None = None,
+    edu_level: str | None = None,
+) -> int:
+    """활성 필수교육 규칙의 시작~종료 월마다 과정 차수를 만든다. 이미 있는 (과정, 차수코드)는 건너뛴다."""
+    months = union_all(
+        *(
+            select(
+                literal(month).label("month"),
+                literal(f"{year}{month:02d}").label("event_code"),
+                literal(f"({year}-{month:02d})").label("name_suffix"),
+                literal(date(year, month, 1)).label("start_date"),
+                literal(date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)).label("end_date"),
+                literal(date(year, month, 1) - timedelta(days=1)).label("appl_end_date"),
             )
-            session.add(row)
-            created += 1
+            for month in range(1, 13)
+        )
+    ).subquery("months")
 
+    start_month = _clamp_month(func.coalesce(func.nullif(TraRequiredRule.start_month, 0), 1), 1)
+    end_month = _clamp_month(func.coalesce(func.nullif(TraRequiredRule.end_month, 0), start_month), start_month)
+    course_name = func.coalesce(
+        func.nullif(TraCourse.course_name, ""),
+        literal("Course-") + cast(TraRequiredRule.course_id, String),
+    )
+    now = _utc_now()
+
+    rows = (
+        select(
+            TraRequiredRule.course_id,
+            months.c.event_code,
+            course_name + months.c.name_suffix,
+            literal("open"),
+            months.c.start_date,
+            months.c.end_date,
+            literal(date(year, 1, 1)),
+            months.c.appl_end_date,
+            literal(True),
+            literal(999),
+            literal(now),
+            literal(now),
+        )
+        .select_from(TraRequiredRule)
+        .join(months, months.c.month.between(start_month, end_month))
+        .outerjoin(TraCourse, TraCourse.id == TraRequiredRule.course_id)
+        .where(*_required_rule_filters(year, job_code=job_code, edu_level=edu_level))
+    )
+    existing = (
+        select(TraEvent.id)
+        .where(TraEvent.course_id == TraRequiredRule.course_id, TraEvent.event_code == months.c.event_code)
+        .exists()
+    )
+    created = _insert_from_select_ignore(
+        session,
+        TraEvent,
+        [
+            "course_id",
+            "event_code",
+            "event_name",
+            "status_code",
+            "start_date",
+            "end_date",
+            "appl_start_date",
+            "appl_end_date",
+            "result_app_skip_yn",
+            "max_person",
+            "created_at",
+            "updated_at",
+        ],
+        rows,
+        conflict_columns=["course_id", "event_code"],
+        not_exists=existing,
+    )
     session.commit()
     return created
 
 
-def generate_required_targets(session: Session, year: int, rule_code: str | None = None) -> int:
-    statement = select(TraRequiredRule).where(TraRequiredRule.year == year, TraRequiredRule.is_active.is_(True))
-    if rule_code:
-        statement = statement.where(TraRequiredRule.rule_code == rule_code)
-    rules = session.exec(statement).all()
-    if not rules:
-        return 0
+def generate_required_targets(
+    session: Session,
+    year: int,
+    rule_code: str | None = None,
+    *,
+    job_code: str | None = None,
+    edu_level: str | None = None,
+) -> int:
+    """활성 필수교육 규칙 × 재직/휴직 직원 대상자를 DB 안에서 INSERT ... SELECT 로 만든다.
+
+    대상 월은 규칙의 입사월 → 시작월 → 1월 순으로 정한다. 이미 있는
+    (연도, 직원, 규칙, 과정, 대상월)은 건너뛰고 새로 만든 건수를 반환한다.
+    """
+    month = _clamp_month(
+        func.coalesce(func.nullif(TraRequiredRule.entry_month, 0), func.nullif(TraRequiredRule.start_month, 0), 1),
+        1,
+    )
+    edu_month = _year_month_code(year, month)
+    now = _utc_now()
 
-    employees = session.exec(
-        select(HrEmployee).where(HrEmployee.employment_status.in_(["active", "leave"])),
-    ).all()
-    if not employees:
-        return 0
-
-    existing_keys = {
-        (
-            row.employee_id,
-            row.rule_code,
-            row.course_id,
-            row.edu_month,
+    rows = (
+        select(
+            literal(year),
+            HrEmployee.id,
+            TraRequiredRule.rule_code,
+            TraRequiredRule.course_id,
+            edu_month,
+            TraRequiredRule.id,
+            TraRequiredRule.edu_level,
+            literal("pending"),
+            literal(now),
+            literal(now),
         )
-        for row in session.exec(select(TraRequiredTarget).where(TraRequiredTarget.year == year)).all()
-    }
-
-    created = 0
-    for rule in rules:
-        month = rule.entry_month or rule.start_month or 1
-        month = min(max(month, 1), 12)
-        edu_month = f"{year}{month:02d}"
-        for employee in employees:
-            if employee.id is None:
-                continue
-            key = (employee.id, rule.rule_code, rule.course_id, edu_month)
-            if key in existing_keys:
-                continue
-            session.add(
-                TraRequiredTarget(
-                    year=year,
-                    employee_id=employee.id,
-                    rule_code=rule.rule_code,
-                    course_id=rule.course_id,
-                    edu_month=edu_month,
-                    standard_rule_id=rule.id,
-                    edu_level=rule.edu_level,
-                    completion_status="pending",
-                    created_at=_utc_now(),
-                    updated_at=_utc_now(),
-                ),
-            )
-            existing_keys.add(key)
-            created += 1
-
+        .select_from(TraRequiredRule)
+        .join(HrEmployee, true())
+        .where(
+            *_required_rule_filters(year, rule_code, job_code, edu_level),
+            HrEmployee.employment_status.in_(["active", "leave"]),
+        )
+    )
+    existing = (
+        select(TraRequiredTarget.id)
+        .where(
+            TraRequiredTarget.year == year,
+            TraRequiredTarget.employee_id == HrEmployee.id,
+            TraRequiredTarget.rule_code == TraRequiredRule.rule_code,
+            TraRequiredTarget.course_id == TraRequiredRule.course_id,
+            TraRequiredTarget.edu_month == edu_month,
+        )
+        .exists()
+    )
+    created = _insert_from_select_ignore(
+        session,
+        TraRequiredTarget,
+        [
+            "year",
+            "employee_id",
+            "rule_code",
+            "course_id",
+            "edu_month",
+            "standard_rule_id",
+            "edu_level",
+            "completion_status",
+            "created_at",
+            "updated_at",
+        ],
+        rows,
+        conflict_columns=["year", "employee_id", "rule_code", "course_id", "edu_month"],
+        not_exists=existing,
+    )
     session.commit()
     return created
 
@@ -706,137 +952,273 @@ def generate_elearning_windows(session: Session, year: int, app_count: int = 2)
     return processed
 
 
-def apply_cyber_results(session: Session, upload_ym: str | None = None) -> int:
-    statement = select(TraCyberUpload).where(TraCyberUpload.close_yn.is_(False))
-    if upload_ym:
-        statement = statement.where(TraCyberUpload.upload_ym == upload_ym)
-    uploads = session.exec(statement.order_by(TraCyberUpload.id)).all()
-    if not uploads:
-        return 0
+CYBER_IMPORT_CHUNK_SIZE = 1000
 
-    employee_nos = {row.employee_no for row in uploads if row.employee_no}
-    employee_map: dict[str, HrEmployee] = {}
-    if employee_nos:
-        employees = session.exec(select(HrEmployee).where(HrEmployee.employee_no.in_(employee_nos))).all()
-        employee_map = {emp.employee_no: emp for emp in employees}
+def _cyber_event_code(upload: TraCyberUpload) -> str:
+    return upload.start_date.strftime("%Y%m%d") if upload.start_date is not None else f"{upload.upload_ym}01"
 
-    processed = 0
+
+def _first_id_by(session: Session, model: type[SQLModel], column: Any, keys: set[Any]) -> dict[Any, int]:
+    """column 값별 가장 작은 id. 이름처럼 유일하지 않은 키를 기존 first() 조회와 같게 해석한다."""
+    if not keys:
+        return {}
+    rows = session.exec(select(column, model.id).where(column.in_(keys)).order_by(model.id)).all()
+    result: dict[Any, int] = {}
+    for key, row_id in rows:
+        result.setdefault(key, row_id)
+    return result
+
+
+def _insert_rows(session: Session, model: type[SQLModel], rows: list[dict[str, Any]]) -> None:
+    # RETURNING 순서 보장은 SQLite 에서 행 단위 실행으로 떨어지므로 executemany 로 넣고
+    # 새 id 는 호출자가 자연키로 다시 읽는다. NULL 도 그대로 넣어야 한 문장으로 묶인다.
+    if rows:
+        session.exec(sa_insert(model).execution_options(render_nulls=True), params=rows)
+
+
+def _cyber_event_ids(session: Session, keys: set[tuple[int, str]]) -> dict[tuple[int, str], int]:
+    """(과정, 차수코드) 쌍별 차수 id. 두 IN 조건으로 넓게 읽고 필요한 쌍만 남긴다."""
+    if not keys:
+        return {}
+    rows = session.exec(
+        select(TraEvent.course_id, TraEvent.event_code, TraEvent.id).where(
+            TraEvent.course_id.in_({course_id for course_id, _ in keys}),
+            TraEvent.event_code.in_({event_code for _, event_code in keys}),
+        )
+    ).all()
+    return {(course_id, event_code): event_id for course_id, event_code, event_id in rows if (course_id, event_code) in keys}
+
+
+def _cyber_history_ids(session: Session, keys: set[tuple[int, int, int]]) -> dict[tuple[int, int, int], int]:
+    """(직원, 과정, 차수) 별 가장 작은 이력 id."""
+    if not keys:
+        return {}
+    rows = session.exec(
+        select(TraHistory.employee_id, TraHistory.course_id, TraHistory.event_id, TraHistory.id)
+        .where(
+            TraHistory.employee_id.in_({key[0] for key in keys}),
+            TraHistory.event_id.in_({key[2] for key in keys}),
+        )
+        .order_by(TraHistory.id)
+    ).all()
+    result: dict[tuple[int, int, int], int] = {}
+    for employee_id, course_id, event_id, history_id in rows:
+        if (employee_id, course_id, event_id) in keys:
+            result.setdefault((employee_id, course_id, event_id), history_id)
+    return result
+
+
+def _apply_cyber_chunk(session: Session, uploads: list[TraCyberUpload]) -> None:
+    """업로드 한 묶음을 반영한다. 묶음 크기와 무관하게 조회/쓰기 문장 수가 일정하다."""
+    now = _utc_now()
+
+    # 1) 교육기관: 이름별 기존 id, 없는 이름은 코드 블록을 받아 한 번에 생성
+    first_by_org: dict[str, TraCyberUpload] = {}
     for upload in uploads:
-        organization_id: int | None = None
         if upload.organization_name:
-            org = session.exec(
-                select(TraOrganization).where(TraOrganization.name == upload.organization_name),
-            ).first()
-            if org is None:
-                org = TraOrganization(
-                    code=_next_org_code(session),
-                    name=upload.organization_name,
-                    business_no=upload.business_no,
-                    is_active=True,
-                    created_at=_utc_now(),
-                    updated_at=_utc_now(),
-                )
-                session.add(org)
-                session.flush()
-            organization_id = org.id
-
-        course = session.exec(select(TraCourse).where(TraCourse.course_name == upload.course_name)).first()
-        if course is None:
-            course = TraCourse(
-                course_code=_next_course_code(session),
-                course_name=upload.course_name,
-                in_out_type=upload.in_out_type or "EXTERNAL",
-                branch_code=upload.edu_branch_code,
-                sub_branch_code=upload.edu_sub_branch_code,
-                method_code=upload.method_code,
-                status_code="open",
-                organization_id=organization_id,
-                mandatory_yn=upload.mandatory_yn,
-                job_code=upload.job_code,
-                edu_level=upload.edu_level,
-                is_active=True,
-                created_at=_utc_now(),
-                updated_at=_utc_now(),
-            )
-            session.add(course)
-            session.flush()
+            first_by_org.setdefault(upload.organization_name, upload)
+    org_ids = _first_id_by(session, TraOrganization, TraOrganization.name, set(first_by_org))
+    missing_orgs = [name for name in first_by_org if name not in org_ids]
+    codes = _code_sequence_block(
+        session, "TRORG", TraOrganization, TraOrganization.code, "TRORG", len(missing_orgs)
+    )
+    _insert_rows(
+        session,
+        TraOrganization,
+        [
+            {
+                "code": f"TRORG{seq:05d}",
+                "name": name,
+                "business_no": first_by_org[name].business_no,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for name, seq in zip(missing_orgs, codes)
+        ],
+    )
+    if missing_orgs:
+        org_ids.update(_first_id_by(session, TraOrganization, TraOrganization.name, set(missing_orgs)))
 
-        event_code = (
-            upload.start_date.strftime("%Y%m%d")
-            if upload.start_date is not None
-            else f"{upload.upload_ym}01"
+    def organization_id_of(upload: TraCyberUpload) -> int | None:
+        return org_ids.get(upload.organization_name) if upload.organization_name else None
+
+    # 2) 과정: 과정명별 기존 id, 없는 과정은 처음 나온 업로드 값으로 생성
+    first_by_course: dict[str, TraCyberUpload] = {}
+    for upload in uploads:
+        first_by_course.setdefault(upload.course_name, upload)
+    course_ids = _first_id_by(session, TraCourse, TraCourse.course_name, set(first_by_course))
+    missing_courses = [name for name in first_by_course if name not in course_ids]
+    codes = _code_sequence_block(
+        session, "TRAC", TraCourse, TraCourse.course_code, "TRAC", len(missing_courses)
+    )
+    course_rows = []
+    for name, seq in zip(missing_courses, codes):
+        upload = first_by_course[name]
+        course_rows.append(
+            {
+                "course_code": f"TRAC{seq:05d}",
+                "course_name": name,
+                "in_out_type": upload.in_out_type or "EXTERNAL",
+                "branch_code": upload.edu_branch_code,
+                "sub_branch_code": upload.edu_sub_branch_code,
+                "method_code": upload.method_code,
+                "status_code": "open",
+                "organization_id": organization_id_of(upload),
+                "mandatory_yn": upload.mandatory_yn,
+                "job_code": upload.job_code,
+                "edu_level": upload.edu_level,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
         )
-        event = session.exec(
-            select(TraEvent).where(TraEvent.course_id == course.id, TraEvent.event_code == event_code),
-        ).first()
-        if event is None:
-            event = TraEvent(
-                course_id=course.id or 0,
-                event_code=event_code,
-                event_name=upload.event_name or f"{course.course_name}({event_code})",
-                status_code="closed" if upload.close_yn else "open",
-                organization_id=organization_id,
-                place=upload.place,
-                start_date=upload.start_date,
-                end_date=upload.end_date,
-                edu_hour=upload.edu_hour,
-                per_expense_amount=upload.per_expense_amount,
-                real_expense_amount=upload.real_expense_amount,
-                labor_apply_yn=upload.labor_apply_yn,
-                labor_amount=upload.labor_amount,
-                created_at=_utc_now(),
-                updated_at=_utc_now(),
-            )
-            session.add(event)
-            session.flush()
-
-        employee = employee_map.get(upload.employee_no or "")
-        history_id: int | None = None
-        if employee is not None and employee.id is not None and course.id is not None and event.id is not None:
-            history = session.exec(
-                select(TraHistory).where(
-                    TraHistory.employee_id == employee.id,
-                    TraHistory.course_id == course.id,
-                    TraHistory.event_id == event.id,
-                ),
-            ).first()
-            if history is None:
-                history = TraHistory(
-                    employee_id=employee.id,
-                    course_id=course.id,
-                    event_id=event.id,
-                    confirm_type=upload.confirm_type,
-                    unconfirm_reason=upload.unconfirm_reason,
-                    app_point=upload.reward_hour,
-                    job_code=upload.job_code,
-                    note=upload.note,
-                    completed_at=upload.end_date,
-                    created_at=_utc_now(),
-                    updated_at=_utc_now(),
-                )
-            else:
-                history.confirm_type = upload.confirm_type
-                history.unconfirm_reason = upload.unconfirm_reason
-                history.app_point = upload.reward_hour
-                history.job_code = upload.job_code
-                history.note = upload.note
-                history.completed_at = upload.end_date
-                history.updated_at = _utc_now()
-            session.add(history)
-            session.flush()
-            history_id = history.id
-            upload.employee_id = employee.id
-
-        upload.close_yn = True
-        upload.applied_course_id = course.id
-        upload.applied_event_id = event.id
-        upload.applied_history_id = history_id
-        upload.updated_at = _utc_now()
-        session.add(upload)
-        processed += 1
+    _insert_rows(session, TraCourse, course_rows)
+    if missing_courses:
+        course_ids.update(_first_id_by(session, TraCourse, TraCourse.course_name, set(missing_courses)))
 
-    session.commit()
-    return processed
+    # 3) 차수: (과정, 차수코드) 쌍별 기존 id, 없는 차수는 처음 나온 업로드 값으로 생성
+    first_by_event: dict[tuple[int, str], TraCyberUpload] = {}
+    for upload in uploads:
+        first_by_event.setdefault((course_ids[upload.course_name], _cyber_event_code(upload)), upload)
+    event_ids = _cyber_event_ids(session, set(first_by_event))
+    missing_events = [key for key in first_by_event if key not in event_ids]
+    event_rows = []
+    for course_id, event_code in missing_events:
+        upload = first_by_event[(course_id, event_code)]
+        event_rows.append(
+            {
+                "course_id": course_id,
+                "event_code": event_code,
+                "event_name": upload.event_name or f"{upload.course_name}({event_code})",
+                "status_code": "closed" if upload.close_yn else "open",
+                "organization_id": organization_id_of(upload),
+                "place": upload.place,
+                "start_date": upload.start_date,
+                "end_date": upload.end_date,
+                "edu_hour": upload.edu_hour,
+                "per_expense_amount": upload.per_expense_amount,
+                "real_expense_amount": upload.real_expense_amount,
+                "labor_apply_yn": upload.labor_apply_yn,
+                "labor_amount": upload.labor_amount,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+    _insert_rows(session, TraEvent, event_rows)
+    if missing_events:
+        event_ids.update(_cyber_event_ids(session, set(missing_events)))
+
+    # 4) 이력: (직원, 과정, 차수) 별 기존 이력은 일괄 UPDATE, 없는 것은 일괄 INSERT.
+    #    같은 묶음에 같은 키가 여러 번 나오면 기존 순차 처리처럼 마지막 업로드 값이 남는다.
+    employee_nos = {upload.employee_no for upload in uploads if upload.employee_no}
+    employee_ids = _first_id_by(session, HrEmployee, HrEmployee.employee_no, employee_nos)
+
+    keys_by_upload: dict[int, tuple[int, int, int] | None] = {}
+    for upload in uploads:
+        employee_id = employee_ids.get(upload.employee_no or "")
+        course_id = course_ids[upload.course_name]
+        event_id = event_ids[(course_id, _cyber_event_code(upload))]
+        keys_by_upload[upload.id] = (employee_id, course_id, event_id) if employee_id is not None else None
+
+    wanted_keys = {key for key in keys_by_upload.values() if key is not None}
+    history_ids = _cyber_history_ids(session, wanted_keys)
+
+    history_updates: dict[int, dict[str, Any]] = {}
+    history_inserts: dict[tuple[int, int, int], dict[str, Any]] = {}
+    for upload in uploads:
+        key = keys_by_upload[upload.id]
+        if key is None:
+            continue
+        values = {
+            "confirm_type": upload.confirm_type,
+            "unconfirm_reason": upload.unconfirm_reason,
+            "app_point": upload.reward_hour,
+            "job_code": upload.job_code,
+            "note": upload.note,
+            "completed_at": upload.end_date,
+            "updated_at": now,
+        }
+        if key in history_ids:
+            history_updates[history_ids[key]] = {"id": history_ids[key], **values}
+        else:
+            employee_id, course_id, event_id = key
+            history_inserts[key] = {
+                "employee_id": employee_id,
+                "course_id": course_id,
+                "event_id": event_id,
+                "created_at": now,
+                **values,
+            }
+    if history_updates:
+        session.exec(sa_update(TraHistory), params=list(history_updates.values()))
+    _insert_rows(session, TraHistory, list(history_inserts.values()))
+    if history_inserts:
+        history_ids.update(_cyber_history_ids(session, set(history_inserts)))
+
+    # 5) 업로드 마감 표시: 반영 결과 id 를 남기고 close_yn 으로 재실행 시 건너뛴다.
+    upload_rows = []
+    for upload in uploads:
+        key = keys_by_upload[upload.id]
+        course_id = course_ids[upload.course_name]
+        upload_rows.append(
+            {
+                "id": upload.id,
+                "employee_id": key[0] if key is not None else upload.employee_id,
+                "close_yn": True,
+                "applied_course_id": course_id,
+                "applied_event_id": event_ids[(course_id, _cyber_event_code(upload))],
+                "applied_history_id": history_ids[key] if key is not None else None,
+                "updated_at": now,
+            }
+        )
+    session.exec(sa_update(TraCyberUpload), params=upload_rows)
+
+
+def apply_cyber_results(
+    session: Session,
+    upload_ym: str | None = None,
+    *,
+    chunk_size: int = CYBER_IMPORT_CHUNK_SIZE,
+    max_chunks: int | None = None,
+) -> TraCyberApplyResponse:
+    """미마감 사이버 교육 업로드를 id 순 묶음 단위로 반영하고 묶음마다 커밋한다.
+
+    반영된 업로드는 close_yn 으로 마감되므로 중단되더라도 다시 호출하면 커밋된 묶음
+    다음부터 이어서 처리한다. max_chunks 를 주면 그만큼만 처리하고 has_more 로 남은
+    건이 있는지 알려준다.
+    """
+    statement = select(TraCyberUpload).where(TraCyberUpload.close_yn.is_(False))
+    if upload_ym:
+        statement = statement.where(TraCyberUpload.upload_ym == upload_ym)
+
+    processed = 0
+    chunk_count = 0
+    last_upload_id: int | None = None
+    has_more = False
+    while True:
+        page = statement if last_upload_id is None else statement.where(TraCyberUpload.id > last_upload_id)
+        if max_chunks is not None and chunk_count >= max_chunks:
+            has_more = session.exec(page.limit(1)).first() is not None
+            break
+        uploads = list(session.exec(page.order_by(TraCyberUpload.id).limit(max(1, chunk_size))).all())
+        if not uploads:
+            break
+        _apply_cyber_chunk(session, uploads)
+        session.commit()
+        processed += len(uploads)
+        chunk_count += 1
+        last_upload_id = uploads[-1].id
+        if len(uploads) < chunk_size:
+            break
+
+    return TraCyberApplyResponse(
+        processed=processed,
+        message="Cyber upload results applied.",
+        chunk_count=chunk_count,
+        last_upload_id=last_upload_id,
+        has_more=has_more,
+    )
 
 
 # ─── Write-flow service ───────────────────────────────────────────────────────
@@ -902,8 +1284,13 @@ def create_tra_application(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found.")
 
     now = _utc_now()
-    count = session.exec(select(func.count()).select_from(TraApplication)).one()
-    app_no = f"APP{now.strftime('%Y%m%d')}{count + 1:04d}"
+    prefix = f"APP{business_today():%Y%m%d}"
+    seq = next_sequence(
+        session,
+        prefix,
+        initial=lambda: max_suffix_seq(session, TraApplication.application_no, prefix),
+    )
+    app_no = f"{prefix}{seq:04d}"
 
     req = TraApplication(
         application_no=app_no,
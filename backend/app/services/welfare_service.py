@@ -5,6 +5,9 @@ from datetime import datetime, timezone
 from fastapi import HTTPException, status
 from sqlmodel import Session, select
 
+from app.core.pagination import ALL_ROWS, PageParams, fetch_page
+from app.core.sequence import max_suffix_seq, next_sequence
+from app.core.time_utils import business_today
 from app.models import AuthUser, HrEmployee, OrgDepartment, WelBenefitRequest, WelBenefitType
 from app.schemas.welfare import (
     WelBenefitRequestActionResponse,
@@ -21,18 +24,22 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def list_wel_benefit_types(session: Session) -> list[WelBenefitTypeItem]:
-    rows = session.exec(
-        select(WelBenefitType).order_by(WelBenefitType.sort_order, WelBenefitType.id)
-    ).all()
-    return [WelBenefitTypeItem.model_validate(row, from_attributes=True) for row in rows]
+def list_wel_benefit_types(session: Session, page_params: PageParams = ALL_ROWS) -> tuple[list[WelBenefitTypeItem], int]:
+    rows, total_count = fetch_page(
+        session,
+        select(WelBenefitType).order_by(WelBenefitType.sort_order, WelBenefitType.id),
+        page_params,
+    )
+    return [WelBenefitTypeItem.model_validate(row, from_attributes=True) for row in rows], total_count
 
 
-def list_wel_benefit_requests(session: Session) -> list[WelBenefitRequestItem]:
-    rows = session.exec(
-        select(WelBenefitRequest).order_by(WelBenefitRequest.requested_at.desc(), WelBenefitRequest.id.desc())
-    ).all()
-    return [WelBenefitRequestItem.model_validate(row, from_attributes=True) for row in rows]
+def list_wel_benefit_requests(session: Session, page_params: PageParams = ALL_ROWS) -> tuple[list[WelBenefitRequestItem], int]:
+    rows, total_count = fetch_page(
+        session,
+        select(WelBenefitRequest).order_by(WelBenefitRequest.requested_at.desc(), WelBenefitRequest.id.desc()),
+        page_params,
+    )
+    return [WelBenefitRequestItem.model_validate(row, from_attributes=True) for row in rows], total_count
 
 
 def batch_save_wel_benefit_types(session: Session, payload: WelBenefitTypeBatchRequest) -> dict[str, int]:
@@ -88,21 +95,12 @@ def batch_save_wel_benefit_types(session: Session, payload: WelBenefitTypeBatchR
 
 def _generate_request_no(session: Session) -> str:
     """WEL-YYYYMM-NNNNN 형식 신청번호 자동생성."""
-    from datetime import date
-    ym = date.today().strftime("%Y%m")
-    prefix = f"WEL-{ym}-"
-    latest = session.exec(
-        select(WelBenefitRequest)
-        .where(WelBenefitRequest.request_no.startswith(prefix))
-        .order_by(WelBenefitRequest.id.desc())
-    ).first()
-    if latest is None:
-        seq = 1
-    else:
-        try:
-            seq = int(latest.request_no.rsplit("-", 1)[-1]) + 1
-        except (ValueError, IndexError):
-            seq = 1
+    prefix = f"WEL-{business_today():%Y%m}-"
+    seq = next_sequence(
+        session,
+        prefix.rstrip("-"),
+        initial=lambda: max_suffix_seq(session, WelBenefitRequest.request_no, prefix),
+    )
     return f"{prefix}{seq:05d}"
 
 
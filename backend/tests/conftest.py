@@ -1,6 +1,133 @@
+import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@dataclass(frozen=True)
+class BenchScale:
+    """쿼리 예산 벤치 시드 규모. 환경변수로 조정한다.
+
+    - VIBE_HR_BENCH_DATABASE_URL: 미지정 시 임시 SQLite 파일 사용
+    - VIBE_HR_BENCH_BASELINE_DATABASE_URL: 1/4 규모 비교용 DB. DATABASE_URL 을 지정했다면 같은 방언으로 함께 지정
+    - VIBE_HR_BENCH_EMPLOYEES: 벌크 사원 수
+    - VIBE_HR_BENCH_ATTENDANCE_DAYS: 근태 샘플 영업일 수
+    - VIBE_HR_BENCH_PAYROLL_RUNS: 시드 외 추가 급여 회차(이전 월) 수
+    - VIBE_HR_BENCH_TIME_FACTOR: 시간 예산 배수 (느린 CI 러너용)
+    """
+
+    database_url: str | None
+    baseline_database_url: str | None
+    employees: int
+    attendance_days: int
+    payroll_runs: int
+    time_factor: float
+
+    @classmethod
+    def from_env(cls) -> "BenchScale":
+        return cls(
+            database_url=os.getenv("VIBE_HR_BENCH_DATABASE_URL") or None,
+            baseline_database_url=os.getenv("VIBE_HR_BENCH_BASELINE_DATABASE_URL") or None,
+            employees=int(os.getenv("VIBE_HR_BENCH_EMPLOYEES", "40")),
+            attendance_days=int(os.getenv("VIBE_HR_BENCH_ATTENDANCE_DAYS", "5")),
+            payroll_runs=int(os.getenv("VIBE_HR_BENCH_PAYROLL_RUNS", "0")),
+            time_factor=float(os.getenv("VIBE_HR_BENCH_TIME_FACTOR", "1.0")),
+        )
+
+    @property
+    def baseline_employees(self) -> int:
+        return max(self.employees // 4, 5)
+
+
+@pytest.fixture(scope="session")
+def bench_scale() -> BenchScale:
+    return BenchScale.from_env()
+
+
+@pytest.fixture(scope="session")
+def seeded_engine(bench_scale: BenchScale, tmp_path_factory: pytest.TempPathFactory):
+    """bootstrap.seed_initial_data 로 시드한 엔진 (세션 단위 1회)."""
+    engine = _seed_engine(bench_scale, bench_scale.database_url, bench_scale.employees, tmp_path_factory)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def baseline_seeded_engine(bench_scale: BenchScale, tmp_path_factory: pytest.TempPathFactory):
+    """seeded_engine 의 1/4 규모로 시드한 엔진. 쿼리 수가 사원 수에 따라 늘지 않는지 비교하는 기준이다."""
+    if bench_scale.baseline_database_url is None and bench_scale.database_url is not None:
+        pytest.skip("VIBE_HR_BENCH_BASELINE_DATABASE_URL is required with VIBE_HR_BENCH_DATABASE_URL")
+    engine = _seed_engine(
+        bench_scale, bench_scale.baseline_database_url, bench_scale.baseline_employees, tmp_path_factory
+    )
+    yield engine
+    engine.dispose()
+
+
+def _seed_engine(bench_scale: BenchScale, database_url: str | None, employees: int, tmp_path_factory: pytest.TempPathFactory):
+    from sqlmodel import Session, SQLModel, create_engine
+
+    import app.bootstrap as bootstrap
+    from app.core.query_metrics import install_query_hooks
+
+    if database_url is None:
+        database_url = f"sqlite:///{tmp_path_factory.mktemp('bench') / 'vibe_hr_bench.db'}"
+    engine = create_engine(database_url)
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+
+    overrides = {
+        "DEV_EMPLOYEE_TOTAL": employees,
+        "HR_BASIC_SEED_TARGET_PER_CATEGORY": employees,
+        "TIM_LEAVE_REQUEST_SEED_TARGET": employees,
+        "PAY_PROFILE_SEED_TARGET": employees,
+        "HRI_BULK_REQUEST_TARGET": max(employees // 2, 1),
+        "WEL_BULK_REQUEST_TARGET": max(employees // 2, 1),
+        "TRA_APPLICATION_TARGET": max(employees // 2, 1),
+        "TRA_REQUIRED_TARGET": max(employees // 3, 1),
+        "TRA_HISTORY_TARGET": max(employees // 4, 1),
+        "TRA_UPLOAD_TARGET": max(employees // 4, 1),
+        "TIM_ATTENDANCE_SEED_DAYS": bench_scale.attendance_days,
+    }
+    with pytest.MonkeyPatch.context() as patch:
+        for name, value in overrides.items():
+            patch.setattr(bootstrap, name, value)
+        with Session(engine) as session:
+            bootstrap.seed_initial_data(session)
+            _seed_extra_payroll_runs(session, bench_scale.payroll_runs)
+    return engine
+
+
+def _seed_extra_payroll_runs(session, count: int) -> None:
+    from datetime import date, timedelta
+
+    from sqlmodel import select
+
+    from app.models import PayPayrollCode
+    from app.schemas.payroll_phase2 import PayPayrollRunCreateRequest
+    from app.services.payroll_phase2_service import calculate_payroll_run, create_payroll_run
+
+    payroll_code = session.exec(select(PayPayrollCode).where(PayPayrollCode.code == "P100")).first()
+    if payroll_code is None:
+        return
+
+    for offset in range(count):
+        month_start = date.today().replace(day=1)
+        # 시드가 만드는 당월/전월 회차와 겹치지 않도록 전전월부터 거슬러 올라간다.
+        for _ in range(offset + 2):
+            month_start = (month_start - timedelta(days=1)).replace(day=1)
+        created = create_payroll_run(
+            session,
+            PayPayrollRunCreateRequest(
+                year_month=month_start.strftime("%Y-%m"),
+                payroll_code_id=payroll_code.id,
+                run_name=f"벤치 급여 {offset + 1}",
+            ),
+        )
+        calculate_payroll_run(session, int(created.run.id))
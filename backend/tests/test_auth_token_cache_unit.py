@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.auth import build_access_token, parse_access_token_payload, token_payload_cache
+from app.core.token_cache import BloomFilter, TokenPayloadCache, TokenRevocationList
+from app.models import AuthRevokedToken, AuthUser
+
+
+def test_token_payload_cache_evicts_least_recently_used_and_expired() -> None:
+    cache = TokenPayloadCache(max_size=2)
+    cache.put("a", {"sub": "1", "exp": 2_000})
+    cache.put("b", {"sub": "2", "exp": 2_000})
+    assert cache.get("a", now=1_000) == {"sub": "1", "exp": 2_000}
+
+    cache.put("c", {"sub": "3", "exp": 2_000})
+
+    assert cache.get("b", now=1_000) is None
+    assert cache.get("a", now=1_000) is not None
+    assert cache.get("c", now=2_000) is None
+
+
+def test_parse_access_token_payload_caches_validated_tokens() -> None:
+    token_payload_cache.clear()
+    token = build_access_token(7)
+
+    payload = parse_access_token_payload(token)
+
+    assert payload is not None
+    assert payload["sub"] == "7"
+    assert isinstance(payload["jti"], str)
+    assert token_payload_cache.get(token) == payload
+    assert parse_access_token_payload(token + "x") is None
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+    values = [f"jti-{index}" for index in range(500)]
+    for value in values:
+        bloom.add(value)
+
+    assert all(value in bloom for value in values)
+    false_positives = sum(1 for index in range(1_000) if f"other-{index}" in bloom)
+    assert false_positives < 50
+
+
+def test_token_revocation_list_confirms_filter_hits_against_table() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[AuthUser.__table__, AuthRevokedToken.__table__])
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    with Session(engine) as session:
+        session.add(AuthUser(id=1, login_id="user", email="user@example.com", password_hash="x", display_name="User"))
+        session.add(AuthRevokedToken(jti="remote-jti", user_id=1, expires_at=expires_at))
+        session.commit()
+
+        revocations = TokenRevocationList(refresh_sec=60, capacity=100)
+        assert revocations.is_revoked(session, "remote-jti") is True
+        assert revocations.is_revoked(session, "local-jti") is False
+
+        revocations.revoke(session, jti="local-jti", user_id=1, expires_at=expires_at)
+
+        assert revocations.is_revoked(session, "local-jti") is True
+        assert session.get(AuthRevokedToken, "local-jti") is not None
+
+
+def test_token_revocation_list_keeps_the_resized_filter() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[AuthUser.__table__, AuthRevokedToken.__table__])
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    with Session(engine) as session:
+        session.add(AuthUser(id=1, login_id="user", email="user@example.com", password_hash="x", display_name="User"))
+        for index in range(3):
+            session.add(AuthRevokedToken(jti=f"jti-{index}", user_id=1, expires_at=expires_at))
+        session.commit()
+
+        revocations = TokenRevocationList(refresh_sec=60, capacity=2)
+        revocations.refresh(session, force=True)
+        resized = revocations._bloom
+        assert resized.capacity == 6
+
+        revocations.refresh(session, force=True)
+        assert revocations._bloom is resized
+        assert all(revocations.is_revoked(session, f"jti-{index}") for index in range(3))
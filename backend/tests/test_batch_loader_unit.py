@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.batch_loader import get_batch_loader
+from app.models import AuthUser, HriFormType, HriRequestMaster, HriRequestStepSnapshot
+from app.services.hri_request_service import list_my_requests
+
+
+def _make_engine():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(
+        engine,
+        tables=[
+            AuthUser.__table__,
+            HriFormType.__table__,
+            HriRequestMaster.__table__,
+            HriRequestStepSnapshot.__table__,
+        ],
+    )
+    return engine
+
+
+def _count_selects(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(_conn, _cursor, statement, _params, _context, _executemany):  # noqa: ANN001
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_batch_loader_resolves_primed_keys_with_single_query() -> None:
+    engine = _make_engine()
+    with Session(engine) as session:
+        for user_id in range(1, 6):
+            session.add(
+                AuthUser(
+                    id=user_id,
+                    login_id=f"user{user_id}",
+                    email=f"user{user_id}@example.com",
+                    password_hash="x",
+                    display_name=f"User {user_id}",
+                )
+            )
+        session.commit()
+
+        statements = _count_selects(engine)
+        loader = get_batch_loader(session)
+        loader.prime(AuthUser, [1, 2, 3, 99])
+
+        assert loader.get(AuthUser, 1).display_name == "User 1"
+        assert loader.get(AuthUser, 3).display_name == "User 3"
+        assert loader.get(AuthUser, 99) is None
+        assert len(statements) == 1
+
+        assert set(loader.load_many(AuthUser, [4, 5])) == {4, 5}
+        assert len(statements) == 2
+
+
+def test_list_my_requests_uses_constant_query_count() -> None:
+    engine = _make_engine()
+    with Session(engine) as session:
+        session.add(AuthUser(id=1, login_id="req", email="req@example.com", password_hash="x", display_name="Req"))
+        session.add(AuthUser(id=2, login_id="apv", email="apv@example.com", password_hash="x", display_name="Approver"))
+        session.add(HriFormType(id=1, form_code="CERT", form_name_ko="재직증명서", form_name_en="Cert", module_code="HR"))
+        session.add(HriFormType(id=2, form_code="LEAVE", form_name_ko="휴가", form_name_en="Leave", module_code="TIM"))
+        for request_id in range(1, 11):
+            session.add(
+                HriRequestMaster(
+                    id=request_id,
+                    request_no=f"REQ-{request_id}",
+                    form_type_id=1 + request_id % 2,
+                    requester_id=1,
+                    title=f"Request {request_id}",
+                    status_code="APPROVAL_IN_PROGRESS",
+                    current_step_order=1,
+                    created_at=datetime(2026, 1, request_id),
+                )
+            )
+            session.add(
+                HriRequestStepSnapshot(
+                    request_id=request_id,
+                    step_order=1,
+                    actor_user_id=2,
+                    actor_name="Approver",
+                )
+            )
+        session.commit()
+
+        statements = _count_selects(engine)
+        items, total_count = list_my_requests(session, 1)
+
+        assert len(items) == 10
+        assert total_count == 10
+        assert {item.form_name for item in items} == {"재직증명서", "휴가"}
+        assert all(item.current_actor_name == "Approver" for item in items)
+        assert len(statements) == 3
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import update
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.event_hub import HubEvent, event_hub
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import AuthUser, HrEmployee, OrgDepartment
+from app.services.employee_directory_service import (
+    CHANGE_EVENT,
+    EmployeeDirectory,
+    get_employee_directory,
+    lookup_employees,
+)
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="본사"))
+    session.add(OrgDepartment(id=2, code="DEV", name="개발팀"))
+    for index in (1, 2, 3):
+        session.add(
+            AuthUser(id=index, login_id=f"user{index}", email=f"user{index}@example.com", password_hash="x", display_name=f"User {index}")
+        )
+        session.add(
+            HrEmployee(
+                id=index,
+                user_id=index,
+                employee_no=f"E{index:04d}",
+                department_id=1 if index < 3 else 2,
+                position_title="Staff",
+                hire_date=date(2024, 1, 1),
+            )
+        )
+    session.commit()
+    return session
+
+
+def test_loads_once_and_serves_lookups_from_memory() -> None:
+    with _make_session() as session:
+        with capture_queries() as stats:
+            entries = lookup_employees(session, [1, 3, None])
+        assert stats.statement_count == 1
+        assert (entries[1].employee_no, entries[1].display_name, entries[1].department_name) == ("E0001", "User 1", "본사")
+        assert entries[3].department_name == "개발팀"
+
+        directory = get_employee_directory(session)
+        with capture_queries() as stats:
+            assert lookup_employees(session, [2])[2].display_name == "User 2"
+            assert directory.by_user_id(session, 3).id == 3
+            assert directory.by_employee_no(session, "E0002").id == 2
+        assert stats.statement_count == 0
+
+
+def test_committed_changes_reload_only_affected_entries() -> None:
+    with _make_session() as session:
+        lookup_employees(session, [1, 2, 3])
+
+        session.get(AuthUser, 1).display_name = "Renamed"
+        session.get(OrgDepartment, 2).name = "플랫폼팀"
+        # 커밋 전에는 디렉터리를 건너뛰고 세션에서 바로 읽는다.
+        session.flush()
+        assert lookup_employees(session, [1])[1].display_name == "Renamed"
+        session.commit()
+
+        entries = lookup_employees(session, [1, 2, 3])
+        assert entries[1].display_name == "Renamed" and entries[2].display_name == "User 2"
+        assert entries[3].department_name == "플랫폼팀"
+
+        employee = session.get(HrEmployee, 2)
+        employee.employee_no = "E9999"
+        session.commit()
+        directory = get_employee_directory(session)
+        assert directory.by_employee_no(session, "E9999").id == 2
+        assert directory.by_employee_no(session, "E0002") is None
+
+        session.delete(session.get(HrEmployee, 3))
+        session.commit()
+        assert 3 not in lookup_employees(session, [3])
+
+
+def test_rolled_back_changes_are_not_applied() -> None:
+    with _make_session() as session:
+        lookup_employees(session, [1])
+        session.get(AuthUser, 1).display_name = "Rolled back"
+        session.flush()
+        session.rollback()
+        assert lookup_employees(session, [1])[1].display_name == "User 1"
+
+
+def test_hub_event_from_another_worker_marks_directory_changed() -> None:
+    with _make_session() as session:
+        lookup_employees(session, [1])
+        # 다른 워커의 쓰기: ORM 세션을 거치지 않고 직접 바꾼다.
+        with session.get_bind().begin() as connection:
+            connection.execute(update(AuthUser).where(AuthUser.id == 1).values(display_name="Remote"))
+        assert lookup_employees(session, [1])[1].display_name == "User 1"
+
+        event_hub.dispatch(HubEvent(CHANGE_EVENT, {"user_ids": [1]}))
+        assert lookup_employees(session, [1])[1].display_name == "Remote"
+
+
+def test_watermark_refresh_and_missing_ids_fall_back_to_database() -> None:
+    with _make_session() as session:
+        directory = EmployeeDirectory(refresh_sec=1)
+        directory.lookup(session, [1])
+
+        with session.get_bind().begin() as connection:
+            connection.execute(
+                update(HrEmployee)
+                .where(HrEmployee.id == 2)
+                .values(position_title="Lead", updated_at=datetime.utcnow() + timedelta(minutes=1))
+            )
+        assert directory.lookup(session, [2])[2].position_title == "Staff"
+
+        directory._checked_at -= 1
+        assert directory.lookup(session, [2])[2].position_title == "Lead"
+
+        session.add(AuthUser(id=4, login_id="user4", email="user4@example.com", password_hash="x", display_name="New"))
+        session.add(HrEmployee(id=4, user_id=4, employee_no="E0004", department_id=1, position_title="Staff", hire_date=date(2024, 1, 1)))
+        session.commit()
+        assert directory.lookup(session, [4, 99]).keys() == {4}
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import date, datetime
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.event_hub import RESYNC_EVENT, EventHub, HubEvent, event_hub, format_sse, publish_after_commit
+from app.models import (
+    AuthUser,
+    HrEmployee,
+    HriApprovalLineStep,
+    HriApprovalLineTemplate,
+    HriFormType,
+    HriFormTypeApprovalMap,
+    HriRequestMaster,
+    OrgDepartment,
+)
+from app.services.hri_request_service import REQUEST_EVENT, approve_request, submit_request
+
+
+def test_dispatch_reaches_only_recipient_subscribers_across_threads() -> None:
+    async def scenario() -> None:
+        hub = EventHub()
+        first = hub.subscribe(1)
+        second = hub.subscribe(2)
+
+        worker = threading.Thread(target=hub.dispatch, args=(HubEvent("hri.request", {"request_id": 7}, frozenset({1})),))
+        worker.start()
+        worker.join()
+
+        received = await first.get(timeout=1)
+        assert received is not None and received.data == {"request_id": 7}
+        assert await second.get(timeout=0.05) is None
+
+        first.close()
+        second.close()
+        assert hub.subscriber_count() == 0
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_turns_into_single_resync_event() -> None:
+    async def scenario() -> None:
+        hub = EventHub(queue_size=2)
+        subscription = hub.subscribe(1)
+        for index in range(5):
+            hub.dispatch(HubEvent("hri.request", {"index": index}, frozenset({1})))
+        await asyncio.sleep(0)
+
+        received = await subscription.get(timeout=1)
+        assert received is not None and received.event == RESYNC_EVENT
+        assert await subscription.get(timeout=0.05) is None
+
+    asyncio.run(scenario())
+
+
+def test_payload_round_trip_and_sse_format_hide_recipients() -> None:
+    hub_event = HubEvent("hri.request", {"request_id": 1, "title": "재직증명서"}, frozenset({3, 1}))
+
+    assert HubEvent.from_payload(hub_event.to_payload()) == hub_event
+    assert format_sse(hub_event) == 'event: hri.request\ndata: {"request_id":1,"title":"재직증명서"}\n\n'
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=10, code="HQ", name="HQ"))
+    for user_id in (1, 2, 3, 4):
+        session.add(
+            AuthUser(
+                id=user_id,
+                login_id=f"user{user_id}",
+                email=f"user{user_id}@example.com",
+                password_hash="x",
+                display_name=f"User {user_id}",
+            )
+        )
+        session.add(
+            HrEmployee(
+                id=100 + user_id,
+                user_id=user_id,
+                employee_no=f"HR-{user_id:04d}",
+                department_id=10,
+                position_title="Staff",
+                hire_date=date(2024, 1, 1),
+                employment_status="active",
+            )
+        )
+    session.add(HriFormType(id=1, form_code="CERT_EMPLOYMENT", form_name_ko="재직증명서", module_code="HRI", is_active=True))
+    session.add(HriApprovalLineTemplate(id=1, template_code="T1", template_name="line", is_active=True))
+    session.add(HriFormTypeApprovalMap(form_type_id=1, template_id=1, effective_from=date(2000, 1, 1), is_active=True))
+    for order, actor_user_id in ((1, 2), (2, 3)):
+        session.add(
+            HriApprovalLineStep(
+                template_id=1,
+                step_order=order,
+                step_type="APPROVAL",
+                actor_resolve_type="USER_FIXED",
+                actor_user_id=actor_user_id,
+            )
+        )
+    session.add(
+        HriRequestMaster(
+            id=1,
+            request_no="HRI-TEST-0001",
+            form_type_id=1,
+            requester_id=1,
+            title="재직증명서",
+            content_json="{}",
+            status_code="DRAFT",
+            created_at=datetime(2026, 3, 1, 9, 0),
+            updated_at=datetime(2026, 3, 1, 9, 0),
+        )
+    )
+    session.commit()
+    return session
+
+
+def test_request_actions_publish_to_requester_and_actors_after_commit() -> None:
+    async def scenario() -> None:
+        subscriptions = {user_id: event_hub.subscribe(user_id) for user_id in (1, 2, 3, 4)}
+        try:
+            with _make_session() as session:
+                submit_request(session, 1, 1)
+                approve_request(session, 2, 1, "ok")
+
+            received: dict[int, list[dict]] = {}
+            for user_id, subscription in subscriptions.items():
+                events = []
+                while (hub_event := await subscription.get(timeout=0.05)) is not None:
+                    assert hub_event.event == REQUEST_EVENT
+                    events.append(hub_event.data)
+                received[user_id] = events
+        finally:
+            for subscription in subscriptions.values():
+                subscription.close()
+
+        assert [item["action"] for item in received[1]] == ["SUBMIT", "APPROVE"]
+        assert received[2] == received[1] == received[3]
+        assert received[4] == []
+        assert received[1][1]["current_step_order"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_rolled_back_transaction_publishes_nothing() -> None:
+    async def scenario() -> None:
+        subscription = event_hub.subscribe(9)
+        try:
+            with _make_session() as session:
+                session.get(HriRequestMaster, 1)
+                publish_after_commit(session, HubEvent(REQUEST_EVENT, {"request_id": 1}, frozenset({9})))
+                session.rollback()
+                session.commit()
+            assert await subscription.get(timeout=0.05) is None
+        finally:
+            subscription.close()
+
+    asyncio.run(scenario())
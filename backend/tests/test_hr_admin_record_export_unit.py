@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import tracemalloc
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.api.hr_basic import hr_admin_records_export
+from app.models import AuthUser, HrEmployee, HrEmployeeInfoRecord, HrLicense, OrgDepartment
+from app.services import hr_basic_service
+from app.services.hr_basic_service import iter_hr_admin_record_export, list_hr_admin_records
+
+
+def _make_session(employee_count: int = 3, licenses_per_employee: int = 2) -> Session:
+    # 응답 본문은 스레드풀에서 읽으므로 스레드 간에 같은 메모리 DB 를 쓴다.
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="본사"))
+    session.exec(
+        insert(AuthUser),
+        params=[
+            {"id": index, "login_id": f"user{index}", "email": f"user{index}@example.com", "password_hash": "x", "display_name": f"User {index}"}
+            for index in range(1, employee_count + 1)
+        ],
+    )
+    session.exec(
+        insert(HrEmployee),
+        params=[
+            {"id": index, "user_id": index, "employee_no": f"E{index:05d}", "department_id": 1, "position_title": "Staff", "hire_date": date(2024, 1, 1)}
+            for index in range(1, employee_count + 1)
+        ],
+    )
+    session.exec(
+        insert(HrLicense),
+        params=[
+            {
+                "employee_id": employee_id,
+                "license_name": f"자격증 {seq}",
+                "license_no": f"L-{employee_id}-{seq}",
+                "record_date": date(2020 + seq % 5, 1, 1) if seq % 3 else None,
+            }
+            for employee_id in range(1, employee_count + 1)
+            for seq in range(licenses_per_employee)
+        ],
+    )
+    session.commit()
+    return session
+
+
+def test_list_orders_by_employee_then_latest_record_and_pages_with_cursor() -> None:
+    with _make_session(employee_count=3, licenses_per_employee=4) as session:
+        session.add(HrEmployeeInfoRecord(employee_id=2, category="education", title="학사"))
+        session.commit()
+
+        full = list_hr_admin_records(session, category="certificate")
+        assert full.total_count == 12 and full.next_cursor is None
+        # 사번 순, 같은 사원 안에서는 날짜 없는 기록 → 최신 날짜 → id 최신 순
+        assert [(item.employee_no, item.id, item.record_date) for item in full.items[:4]] == [
+            ("E00001", 4, None),
+            ("E00001", 1, None),
+            ("E00001", 3, date(2022, 1, 1)),
+            ("E00001", 2, date(2021, 1, 1)),
+        ]
+
+        seen: list[int] = []
+        cursor = None
+        while True:
+            page = list_hr_admin_records(session, category="licenses", limit=5, cursor=cursor)
+            assert page.total_count == 12 and page.limit == 5
+            seen.extend(item.id for item in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == [item.id for item in full.items]
+
+        educations = list_hr_admin_records(session, category="education", name="User 2", limit=10)
+        assert [(item.display_name, item.title) for item in educations.items] == [("User 2", "학사")]
+        assert educations.total_count == 1
+
+
+def test_export_streams_ndjson_and_csv() -> None:
+    with _make_session() as session:
+        lines = "".join(iter_hr_admin_record_export(session, "ndjson", category="licenses")).splitlines()
+        assert len(lines) == 6
+        first = json.loads(lines[0])
+        assert (first["employee_no"], first["department_name"], first["category"]) == ("E00001", "본사", "licenses")
+
+        text = "".join(iter_hr_admin_record_export(session, "csv", category="licenses", employee_no="E00002"))
+        assert text.startswith("\ufeff")
+        rows = list(csv.reader(io.StringIO(text.lstrip("\ufeff"))))
+        assert rows[0][:3] == ["id", "category", "record_date"]
+        assert len(rows) == 3 and all(row[rows[0].index("employee_no")] == "E00002" for row in rows[1:])
+
+    with pytest.raises(HTTPException) as error:
+        next(iter_hr_admin_record_export(session, "xlsx", category="licenses"))
+    assert error.value.status_code == 400
+
+
+def test_export_endpoint_streams_from_the_request_session_bind() -> None:
+    with _make_session() as session:
+        response = hr_admin_records_export(
+            category="licenses",
+            export_format="csv",
+            employee_no=None,
+            name=None,
+            department=None,
+            employment_status=None,
+            session=session,
+        )
+
+        async def collect() -> str:
+            return "".join([chunk async for chunk in response.body_iterator])
+
+        assert response.headers["content-disposition"] == 'attachment; filename="hr-admin-records.csv"'
+        assert len(asyncio.run(collect()).splitlines()) == 7
+
+
+def test_export_peak_memory_stays_below_full_list(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 전체 목록 응답 대비 스트리밍 내보내기의 최대 할당량 비교(tracemalloc 기준).
+    monkeypatch.setattr(hr_basic_service, "ADMIN_RECORD_EXPORT_BATCH_SIZE", 200)
+    with _make_session(employee_count=400, licenses_per_employee=10) as session:
+        tracemalloc.start()
+        try:
+            response = list_hr_admin_records(session, category="licenses")
+            assert len(response.model_dump_json()) > 0
+            del response
+            _, list_peak = tracemalloc.get_traced_memory()
+
+            tracemalloc.reset_peak()
+            exported = 0
+            for chunk in iter_hr_admin_record_export(session, "ndjson", category="licenses"):
+                exported += chunk.count("\n")
+            _, export_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    assert exported == 4000
+    assert export_peak * 3 < list_peak
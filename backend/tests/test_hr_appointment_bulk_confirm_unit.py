@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import (
+    AuthUser,
+    HrAppointmentOrder,
+    HrAppointmentOrderItem,
+    HrEmployee,
+    HrEmployeeInfoRecord,
+    HrPersonnelHistory,
+    HrRecruitFinalist,
+    OrgDepartment,
+)
+from app.services import hr_appointment_record_service
+from app.services.hr_appointment_record_service import confirm_appointment_order
+
+_NOW = datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _make_session(employee_count: int) -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="본사"))
+    session.add(OrgDepartment(id=2, code="DEV", name="개발팀"))
+    ids = range(1, employee_count + 1)
+    session.exec(
+        insert(AuthUser),
+        params=[
+            {"id": index, "login_id": f"user{index}", "email": f"user{index}@example.com", "password_hash": "x", "display_name": f"User {index}"}
+            for index in ids
+        ],
+    )
+    session.exec(
+        insert(HrEmployee),
+        params=[
+            {
+                "id": index,
+                "user_id": index,
+                "employee_no": f"E{index:04d}",
+                "department_id": 1,
+                "position_title": "Staff",
+                "hire_date": date(2026, 3, 1),
+                "employment_status": "leave" if index % 5 == 0 else "active",
+                "updated_at": datetime(2026, 1, 1),
+            }
+            for index in ids
+        ],
+    )
+    # 사번으로 이어진 합격자, 로그인 id 로 이어진 합격자, 이미 발령된 합격자
+    session.add(HrRecruitFinalist(candidate_no="C1", full_name="A", employee_no="E0005", status_code="ready"))
+    session.add(HrRecruitFinalist(candidate_no="C2", full_name="B", login_id="user10", status_code="draft"))
+    session.add(HrRecruitFinalist(candidate_no="C3", full_name="C", employee_no="E0001", status_code="appointed"))
+    session.add(HrAppointmentOrder(id=1, appointment_no="APP-0001", title="정기 인사", effective_date=date(2026, 3, 1)))
+    for index in ids:
+        session.add(
+            HrAppointmentOrderItem(
+                order_id=1,
+                employee_id=index,
+                action_type="입사" if index % 5 == 0 else "전보",
+                start_date=date(2026, 3, 1),
+                to_department_id=2 if index % 2 else None,
+                to_position_title="Lead" if index % 3 == 0 else None,
+                to_employment_status="active" if index % 5 == 0 else None,
+                apply_status="cancelled" if index == 7 else "pending",
+                note=f"note {index}",
+            )
+        )
+    session.commit()
+    return session
+
+
+def _snapshot(session: Session) -> dict[str, list[tuple]]:
+    def rows(model, *columns):
+        return [tuple(row) for row in session.exec(select(*columns).order_by(model.id)).all()]
+
+    return {
+        "employees": rows(HrEmployee, HrEmployee.id, HrEmployee.department_id, HrEmployee.position_title, HrEmployee.employment_status, HrEmployee.updated_at),
+        "histories": rows(
+            HrPersonnelHistory,
+            HrPersonnelHistory.employee_id,
+            HrPersonnelHistory.history_type,
+            HrPersonnelHistory.source_id,
+            HrPersonnelHistory.field_name,
+            HrPersonnelHistory.before_value,
+            HrPersonnelHistory.after_value,
+            HrPersonnelHistory.description,
+            HrPersonnelHistory.created_at,
+        ),
+        "records": rows(
+            HrEmployeeInfoRecord,
+            HrEmployeeInfoRecord.employee_id,
+            HrEmployeeInfoRecord.title,
+            HrEmployeeInfoRecord.type,
+            HrEmployeeInfoRecord.organization,
+            HrEmployeeInfoRecord.value,
+            HrEmployeeInfoRecord.note,
+        ),
+        "finalists": rows(HrRecruitFinalist, HrRecruitFinalist.candidate_no, HrRecruitFinalist.status_code),
+        "items": rows(HrAppointmentOrderItem, HrAppointmentOrderItem.id, HrAppointmentOrderItem.apply_status, HrAppointmentOrderItem.applied_at),
+    }
+
+
+def test_bulk_confirmation_matches_per_item_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hr_appointment_record_service, "_utc_now", lambda: _NOW)
+    results = []
+    for threshold in (10_000, 1):
+        monkeypatch.setattr(hr_appointment_record_service, "BULK_CONFIRM_MIN_ITEMS", threshold)
+        with _make_session(employee_count=30) as session:
+            response = confirm_appointment_order(session, 1, user_id=1)
+            results.append((response.applied_count, response.status, _snapshot(session)))
+
+    sequential, bulk = results
+    assert bulk == sequential
+    applied_count, _, snapshot = bulk
+    assert applied_count == 29
+    assert dict(snapshot["finalists"]) == {"C1": "appointed", "C2": "appointed", "C3": "appointed"}
+    assert ("department_id", "1", "2") in {row[3:6] for row in snapshot["histories"]}
+
+
+def test_bulk_confirmation_statement_count_does_not_grow_with_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hr_appointment_record_service, "BULK_CONFIRM_MIN_ITEMS", 1)
+    counts = []
+    for employee_count in (20, 200):
+        with _make_session(employee_count=employee_count) as session:
+            with capture_queries() as stats:
+                confirm_appointment_order(session, 1, user_id=1)
+            counts.append(stats.statement_count)
+    assert counts[0] == counts[1]
@@ -1,7 +1,12 @@
 from datetime import date, datetime, timezone
+from types import SimpleNamespace
 
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
 from sqlmodel import Session, SQLModel, create_engine, select
 
+from app.core.query_metrics import capture_queries, install_query_hooks
 from app.models import (
     AuthUser,
     HrAppointmentOrderItem,
@@ -9,10 +14,14 @@ from app.models import (
     HrEmployeeInfoRecord,
     OrgDepartment,
 )
-from app.schemas.hr_appointment_record import HrAppointmentRecordCreateRequest
+from app.schemas.hr_appointment_record import HrAppointmentRecordCreateRequest, HrAppointmentRecordUpdateRequest
 from app.services.hr_appointment_record_service import (
+    _AppointmentPeriod,
+    _ensure_no_overlapping_appointments,
+    _period_overlap_condition,
     confirm_appointment_order,
     create_appointment_record,
+    update_appointment_record,
 )
 from app.services.hr_basic_service import get_hr_basic_detail
 
@@ -108,3 +117,56 @@ def test_confirm_appointment_order_creates_legacy_hr_basic_appointment_record()
         assert detail.appointments
         assert detail.appointments[0].title == "입사발령"
         assert detail.appointments[0].type == "입사"
+
+
+def _create_temporary(session: Session, employee: HrEmployee, start: date, end: date | None):
+    return create_appointment_record(
+        session,
+        HrAppointmentRecordCreateRequest(
+            employee_id=employee.id or 0,
+            order_title="파견",
+            effective_date=start,
+            appointment_kind="temporary" if end is not None else "permanent",
+            action_type="파견",
+            start_date=start,
+            end_date=end,
+        ),
+        user_id=employee.user_id,
+    )
+
+
+def test_overlap_check_is_one_query_and_excludes_the_edited_item() -> None:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        employee = _seed_employee(session)
+        first = _create_temporary(session, employee, date(2026, 4, 1), date(2026, 4, 30))
+        _create_temporary(session, employee, date(2026, 5, 1), date(2026, 5, 31))
+
+        with capture_queries() as stats:
+            _ensure_no_overlapping_appointments(session, _AppointmentPeriod(employee.id, date(2026, 6, 1), date(2026, 6, 30)))
+        assert stats.statement_count == 1
+
+        with pytest.raises(HTTPException) as error:
+            _create_temporary(session, employee, date(2026, 4, 30), date(2026, 5, 2))
+        assert error.value.status_code == 409 and "2026-04-01~2026-04-30" in error.value.detail
+
+        # 자기 자신과는 겹치지 않는다.
+        updated = update_appointment_record(session, first.id, HrAppointmentRecordUpdateRequest(end_date=date(2026, 4, 20)))
+        assert updated.end_date == date(2026, 4, 20)
+
+        _create_temporary(session, employee, date(2026, 7, 1), None)
+        with pytest.raises(HTTPException) as error:
+            _create_temporary(session, employee, date(2026, 3, 1), date(2026, 3, 10))
+        assert error.value.status_code == 409
+
+
+def test_postgres_overlap_condition_uses_daterange_operator() -> None:
+    # 공유 엔진의 dialect 를 바꾸지 않도록 bind 만 흉내 낸다.
+    session = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=postgresql.dialect()))
+    condition = _period_overlap_condition(session, _AppointmentPeriod(1, date(2026, 1, 1), None))
+    sql = str(condition.compile(dialect=postgresql.dialect()))
+    assert "daterange(hr_appointment_order_items.start_date, hr_appointment_order_items.end_date" in sql
+    assert "&&" in sql
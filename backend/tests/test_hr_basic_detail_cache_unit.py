@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import (
+    AuthUser,
+    HrCareer,
+    HrContactPoint,
+    HrEmployee,
+    HrEmployeeInfoRecord,
+    HrRewardPunish,
+    OrgDepartment,
+)
+from app.schemas.hr_basic import HrBasicProfileUpdateRequest, HrBasicRecordCreateRequest
+from app.services.hr_basic_detail_cache_service import HrBasicDetailCache, LoadedDetail, get_hr_basic_detail_cache
+from app.services.hr_basic_service import (
+    create_hr_basic_record,
+    delete_hr_basic_record,
+    get_hr_basic_detail,
+    update_hr_basic_profile,
+)
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="HQ"))
+    for index in (1, 2):
+        session.add(
+            AuthUser(id=index, login_id=f"user{index}", email=f"user{index}@example.com", password_hash="x", display_name=f"User {index}")
+        )
+        session.add(
+            HrEmployee(
+                id=index,
+                user_id=index,
+                employee_no=f"E{index:04d}",
+                department_id=1,
+                position_title="Staff",
+                hire_date=date(2024, 1, 1),
+            )
+        )
+    session.add(HrEmployeeInfoRecord(id=1, employee_id=1, category="appointment", record_date=date(2024, 1, 1), title="입사"))
+    session.add(HrEmployeeInfoRecord(id=2, employee_id=1, category="appointment", record_date=date(2025, 3, 1), title="승진"))
+    session.add(HrEmployeeInfoRecord(id=3, employee_id=1, category="education", title="학사"))
+    session.add(HrEmployeeInfoRecord(id=4, employee_id=1, category="career", title="레거시 경력"))
+    session.add(HrContactPoint(id=1, employee_id=1, phone_mobile="", phone_home="02-000", valid_from=date(2024, 2, 1)))
+    session.add(HrCareer(id=1, employee_id=1, company_name="A사", start_date=date(2020, 1, 1), position_title="", job_title="개발"))
+    session.add(HrRewardPunish(id=1, employee_id=1, reward_punish_type="REWARD", action_date=date(2025, 1, 1), title="표창"))
+    session.commit()
+    return session
+
+
+def test_detail_loads_all_sections_in_one_statement_and_hits_cache() -> None:
+    with _make_session() as session:
+        with capture_queries() as stats:
+            detail = get_hr_basic_detail(session, 1)
+        assert stats.statement_count == 1
+
+        assert detail.profile.full_name == "User 1"
+        assert detail.profile.job_role == "Staff"
+        assert [item.title for item in detail.appointments] == ["승진", "입사"]
+        assert [item.title for item in detail.educations] == ["학사"]
+        assert detail.contacts[0].type == "02-000"
+        assert detail.contacts[0].record_date == date(2024, 2, 1)
+        assert [(item.title, item.value) for item in detail.careers] == [("A사", "개발")]
+        assert detail.rewards_penalties[0].category == "reward_punish"
+        assert detail.certificates == [] and detail.military == [] and detail.evaluations == []
+
+        empty = get_hr_basic_detail(session, 2)
+        assert empty.appointments == [] and empty.careers == []
+
+        with capture_queries() as stats:
+            assert get_hr_basic_detail(session, 1) == detail
+        assert stats.statement_count == 0
+
+
+def test_writes_invalidate_only_the_affected_card() -> None:
+    with _make_session() as session:
+        get_hr_basic_detail(session, 1)
+        get_hr_basic_detail(session, 2)
+        cache = get_hr_basic_detail_cache(session)
+        assert len(cache) == 2
+
+        update_hr_basic_profile(session, 1, HrBasicProfileUpdateRequest(job_role="리더"))
+        assert cache.get(1) is None and cache.get(2) is not None
+        assert get_hr_basic_detail(session, 1).profile.job_role == "리더"
+
+        record = create_hr_basic_record(session, 1, HrBasicRecordCreateRequest(category="evaluation", title="S"))
+        assert [item.title for item in get_hr_basic_detail(session, 1).evaluations] == ["S"]
+
+        delete_hr_basic_record(session, 1, record.id, category="evaluation")
+        assert get_hr_basic_detail(session, 1).evaluations == []
+
+        update_hr_basic_profile(session, 2, HrBasicProfileUpdateRequest(full_name="Renamed"))
+        assert get_hr_basic_detail(session, 2).profile.full_name == "Renamed"
+
+
+def test_load_racing_with_invalidation_is_not_cached() -> None:
+    with _make_session() as session:
+        cache = HrBasicDetailCache(max_size=10, ttl_sec=0)
+        real = get_hr_basic_detail(session, 1)
+
+        def stale_loader() -> LoadedDetail:
+            cache.invalidate([1])
+            return LoadedDetail(detail=real, user_id=1, department_id=1)
+
+        cache.get_or_load(session, 1, stale_loader)
+        assert cache.get(1) is None
+
+        cache.get_or_load(session, 1, lambda: LoadedDetail(detail=real, user_id=1, department_id=1))
+        assert cache.get(1) == real
+        cache.invalidate(department_ids=[1])
+        assert len(cache) == 0
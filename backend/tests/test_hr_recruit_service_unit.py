@@ -1,9 +1,12 @@
 from datetime import date, datetime, timezone
 
+from fastapi import HTTPException
 from sqlmodel import Session, SQLModel, create_engine, select
 
+from app.core.query_metrics import capture_queries, install_query_hooks
 from app.models import AuthRole, AuthUser, HrEmployee, HrRecruitFinalist, OrgDepartment
-from app.services.hr_recruit_service import create_employees_from_finalists
+from app.schemas.hr_recruit import HrRecruitIfInboundRow
+from app.services.hr_recruit_service import create_employees_from_finalists, parse_if_ndjson_line, sync_if_rows
 
 
 def _utc_now() -> datetime:
@@ -165,3 +168,49 @@ def test_create_employees_from_finalists_skips_when_employee_already_exists() ->
         assert response.error_count == 0
         assert len(all_employees) == 1
         assert response.results[0].outcome == "skipped"
+
+
+def _inbound(external_key: str, full_name: str, **extra) -> HrRecruitIfInboundRow:
+    return HrRecruitIfInboundRow(external_key=external_key, full_name=full_name, **extra)
+
+
+def test_sync_if_rows_upserts_in_chunks_with_block_candidate_numbers() -> None:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        first = sync_if_rows(session, [_inbound("EXT-1", "김하나"), _inbound("EXT-2", "이둘")])
+        assert (first.inserted_count, first.updated_count, first.chunk_count) == (2, 0, 1)
+
+        feed = [_inbound(f"EXT-{index}", f"지원자{index}", note=" 메모 ") for index in range(1, 8)]
+        feed.append(_inbound("EXT-3", "마지막값"))
+        with capture_queries() as stats:
+            second = sync_if_rows(session, feed, chunk_size=3)
+
+        rows = session.exec(select(HrRecruitFinalist).order_by(HrRecruitFinalist.external_key)).all()
+        by_key = {row.external_key: row for row in rows}
+        candidate_nos = [by_key[f"EXT-{index}"].candidate_no for index in range(1, 8)]
+
+        assert (second.inserted_count, second.updated_count, second.chunk_count) == (5, 3, 3)
+        assert len(rows) == 7
+        assert by_key["EXT-1"].full_name == "지원자1"
+        assert by_key["EXT-1"].note == "메모"
+        assert by_key["EXT-3"].full_name == "마지막값"
+        assert [int(value.rsplit("-", 1)[1]) for value in candidate_nos] == list(range(1, 8))
+        assert all(row.source_type == "if" and row.status_code == "draft" for row in rows)
+        # 묶음마다 기존 키 조회 + 번호 예약 + upsert 로 고정 (행 수에 비례하지 않음)
+        assert stats.statement_count <= second.chunk_count * 3 + 1
+
+
+def test_parse_if_ndjson_line_reports_line_number() -> None:
+    assert parse_if_ndjson_line(b"  ", 1) is None
+    assert parse_if_ndjson_line(b'{"external_key": "EXT-1", "full_name": "A"}', 1).external_key == "EXT-1"
+
+    try:
+        parse_if_ndjson_line(b'{"external_key": "EXT-1"}', 7)
+    except HTTPException as error:
+        assert error.status_code == 422
+        assert "7번째 줄" in str(error.detail)
+    else:
+        raise AssertionError("invalid line must raise")
@@ -4,6 +4,7 @@ from datetime import datetime
 
 from sqlmodel import Session, SQLModel, create_engine
 
+from app.core.query_metrics import capture_queries, install_query_hooks
 from app.models import (
     AuthRole,
     AuthUser,
@@ -17,6 +18,7 @@ from app.services.hri_request_service import _resolve_admin_fallback_user_id, _r
 
 def _make_session() -> Session:
     engine = create_engine("sqlite://")
+    install_query_hooks(engine)
     SQLModel.metadata.create_all(
         engine,
         tables=[
@@ -134,3 +136,86 @@ def test_resolve_role_actor_user_id_falls_back_to_admin_when_chain_has_no_match(
         actor_user_id = _resolve_role_actor_user_id(session, 1, "TEAM_LEADER")
 
         assert actor_user_id == 3
+
+
+def _seed_chain_with_rules(session: Session) -> None:
+    session.add(AuthUser(id=1, login_id="req", email="req@example.com", password_hash="x", display_name="Requester"))
+    session.add(AuthUser(id=2, login_id="lead", email="lead@example.com", password_hash="x", display_name="Lead"))
+    session.add(AuthUser(id=3, login_id="admin", email="admin@example.com", password_hash="x", display_name="Admin"))
+    session.add(AuthUser(id=4, login_id="head", email="head@example.com", password_hash="x", display_name="Head"))
+    _seed_admin_role(session, 3)
+
+    session.add(OrgDepartment(id=10, code="HQ", name="HQ"))
+    session.add(OrgDepartment(id=11, code="HQ-HR", name="HR", parent_id=10))
+    session.add(OrgDepartment(id=12, code="HQ-HR-OPS", name="HR Ops", parent_id=11))
+    for employee_id, user_id, department_id, position_title in (
+        (100, 1, 12, "Staff"),
+        (101, 2, 11, "Team LEAD"),
+        (102, 4, 10, "Division Head"),
+    ):
+        session.add(
+            HrEmployee(
+                id=employee_id,
+                user_id=user_id,
+                employee_no=f"HR-{employee_id}",
+                department_id=department_id,
+                position_title=position_title,
+                hire_date=datetime(2024, 1, 1).date(),
+                employment_status="active",
+            )
+        )
+    session.add(
+        HriApprovalActorRule(
+            role_code="TEAM_LEADER",
+            resolve_method="ORG_CHAIN",
+            fallback_rule="ESCALATE",
+            position_keywords_json='["lead"]',
+            is_active=True,
+        )
+    )
+    session.add(
+        HriApprovalActorRule(
+            role_code="DIVISION_HEAD",
+            resolve_method="JOB_POSITION",
+            fallback_rule="ESCALATE",
+            position_keywords_json='["head", "director"]',
+            is_active=True,
+        )
+    )
+    session.commit()
+
+
+def test_resolve_role_actor_user_id_uses_index_without_keyword_scans() -> None:
+    with _make_session() as session:
+        _seed_chain_with_rules(session)
+
+        assert _resolve_role_actor_user_id(session, 1, "TEAM_LEADER") == 2
+        with capture_queries(record_statements=True) as stats:
+            assert _resolve_role_actor_user_id(session, 1, "TEAM_LEADER") == 2
+            assert _resolve_role_actor_user_id(session, 1, "DIVISION_HEAD") == 4
+
+        # 규칙 조회만 남고 부서 체인/직위 키워드 조회는 인덱스에서 처리된다.
+        assert stats.statement_count == 2
+        assert not any("LIKE" in statement.upper() for statement in stats.statements)
+
+
+def test_committed_employee_change_rebuilds_approver_index() -> None:
+    with _make_session() as session:
+        _seed_chain_with_rules(session)
+        assert _resolve_role_actor_user_id(session, 1, "TEAM_LEADER") == 2
+
+        session.add(AuthUser(id=5, login_id="ops-lead", email="ops@example.com", password_hash="x", display_name="Ops Lead"))
+        session.add(
+            HrEmployee(
+                id=103,
+                user_id=5,
+                employee_no="HR-103",
+                department_id=12,
+                position_title="Ops Lead",
+                hire_date=datetime(2024, 1, 1).date(),
+                employment_status="active",
+            )
+        )
+        session.commit()
+
+        assert _resolve_role_actor_user_id(session, 1, "TEAM_LEADER") == 5
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.pagination import PageParams
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import (
+    AuthUser,
+    HrEmployee,
+    HriApprovalActorRule,
+    HriApprovalInbox,
+    HriApprovalLineStep,
+    HriApprovalLineTemplate,
+    HriFormType,
+    HriFormTypeApprovalMap,
+    HriRequestMaster,
+    OrgDepartment,
+)
+from app.services.hri_request_service import (
+    approve_request,
+    count_unread_tasks,
+    ensure_approval_inbox,
+    list_my_approval_tasks,
+    list_my_approval_tasks_keyset,
+    list_my_receive_tasks,
+    mark_task_read,
+    rebuild_approval_inbox,
+    receive_complete_request,
+    submit_request,
+    withdraw_request,
+)
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+
+    session.add(OrgDepartment(id=10, code="HQ", name="HQ"))
+    session.add(OrgDepartment(id=11, code="HQ-HR", name="HR", parent_id=10))
+    for user_id, department_id, position_title in ((1, 11, "Staff"), (2, 11, "Team Lead"), (3, 10, "Director")):
+        session.add(
+            AuthUser(
+                id=user_id,
+                login_id=f"user{user_id}",
+                email=f"user{user_id}@example.com",
+                password_hash="x",
+                display_name=f"User {user_id}",
+            )
+        )
+        session.add(
+            HrEmployee(
+                id=100 + user_id,
+                user_id=user_id,
+                employee_no=f"HR-{user_id:04d}",
+                department_id=department_id,
+                position_title=position_title,
+                hire_date=date(2024, 1, 1),
+                employment_status="active",
+            )
+        )
+    session.add(
+        HriApprovalActorRule(
+            role_code="TEAM_LEADER",
+            resolve_method="ORG_CHAIN",
+            fallback_rule="ESCALATE",
+            position_keywords_json='["Lead"]',
+        )
+    )
+    session.add(HriFormType(id=1, form_code="CERT_EMPLOYMENT", form_name_ko="재직증명서", module_code="HRI", is_active=True))
+    session.add(HriApprovalLineTemplate(id=1, template_code="T1", template_name="line", is_active=True))
+    session.add(HriFormTypeApprovalMap(form_type_id=1, template_id=1, effective_from=date(2000, 1, 1), is_active=True))
+    # 팀장(2) 결재 → 이사(3) 결재 → 이사(3) 수신
+    for order, (step_type, resolve_type, actor_user_id) in enumerate(
+        (("APPROVAL", "ROLE_BASED", None), ("APPROVAL", "USER_FIXED", 3), ("RECEIVE", "USER_FIXED", 3)),
+        start=1,
+    ):
+        session.add(
+            HriApprovalLineStep(
+                template_id=1,
+                step_order=order,
+                step_type=step_type,
+                actor_resolve_type=resolve_type,
+                actor_role_code="TEAM_LEADER" if resolve_type == "ROLE_BASED" else None,
+                actor_user_id=actor_user_id,
+            )
+        )
+    session.commit()
+    return session
+
+
+def _submit(session: Session, request_id: int, created_day: int = 1) -> None:
+    session.add(
+        HriRequestMaster(
+            id=request_id,
+            request_no=f"HRI-TEST-{request_id:04d}",
+            form_type_id=1,
+            requester_id=1,
+            title=f"재직증명서 {request_id}",
+            content_json="{}",
+            status_code="DRAFT",
+            created_at=datetime(2026, 3, created_day, 9, 0),
+            updated_at=datetime(2026, 3, created_day, 9, 0),
+        )
+    )
+    session.commit()
+    submit_request(session, 1, request_id)
+
+
+def _inbox_keys(session: Session) -> list[tuple[int, int, int, str]]:
+    rows = session.exec(select(HriApprovalInbox).order_by(HriApprovalInbox.request_id, HriApprovalInbox.step_order)).all()
+    return [(row.actor_user_id, row.request_id, row.step_order, row.step_type) for row in rows]
+
+
+def test_inbox_follows_request_through_approval_and_receive() -> None:
+    with _make_session() as session:
+        _submit(session, 1)
+        assert _inbox_keys(session) == [(2, 1, 1, "APPROVAL"), (3, 1, 2, "APPROVAL")]
+        items, total_count = list_my_approval_tasks(session, 2)
+        assert total_count == 1
+        assert (items[0].request_no, items[0].form_name, items[0].is_read) == ("HRI-TEST-0001", "재직증명서", False)
+
+        approve_request(session, 2, 1)
+        assert _inbox_keys(session) == [(3, 1, 2, "APPROVAL")]
+
+        approve_request(session, 3, 1)
+        assert _inbox_keys(session) == [(3, 1, 3, "RECEIVE")]
+        assert list_my_approval_tasks(session, 3) == ([], 0)
+        assert [item.status_code for item in list_my_receive_tasks(session, 3)[0]] == ["RECEIVE_IN_PROGRESS"]
+
+        receive_complete_request(session, 3, 1)
+        assert _inbox_keys(session) == []
+
+
+def test_withdraw_clears_inbox_rows() -> None:
+    with _make_session() as session:
+        _submit(session, 1)
+
+        withdraw_request(session, 1, 1)
+
+        assert _inbox_keys(session) == []
+
+
+def test_read_flag_survives_other_steps_and_drives_unread_count() -> None:
+    with _make_session() as session:
+        _submit(session, 1, created_day=1)
+        _submit(session, 2, created_day=2)
+        assert count_unread_tasks(session, 3).approval_count == 2
+
+        mark_task_read(session, 3, 1)
+        approve_request(session, 2, 1)
+
+        unread = count_unread_tasks(session, 3)
+        assert (unread.approval_count, unread.receive_count, unread.total_count) == (1, 0, 1)
+        items, _total = list_my_approval_tasks(session, 3)
+        assert [(item.request_id, item.is_read) for item in items] == [(2, False), (1, True)]
+
+        with pytest.raises(HTTPException) as error:
+            mark_task_read(session, 1, 1)
+        assert error.value.status_code == 404
+
+
+def test_keyset_pages_match_offset_order_with_single_query_per_page() -> None:
+    with _make_session() as session:
+        for request_id in range(1, 6):
+            _submit(session, request_id, created_day=1 + request_id % 3)
+        expected = [item.request_id for item in list_my_approval_tasks(session, 3)[0]]
+
+        collected: list[int] = []
+        cursor: str | None = ""
+        while cursor is not None:
+            with capture_queries() as stats:
+                items, total_count, cursor = list_my_approval_tasks_keyset(session, 3, cursor=cursor, limit=2)
+            collected.extend(item.request_id for item in items)
+            assert total_count == 5
+            assert stats.statement_count == 2
+
+        assert collected == expected
+        page_items, _total = list_my_approval_tasks(session, 3, PageParams(page=2, limit=2))
+        assert [item.request_id for item in page_items] == expected[2:4]
+
+
+def test_rebuild_matches_transactionally_maintained_inbox() -> None:
+    with _make_session() as session:
+        _submit(session, 1)
+        _submit(session, 2)
+        approve_request(session, 2, 1)
+        approve_request(session, 3, 1)
+        maintained = _inbox_keys(session)
+
+        assert rebuild_approval_inbox(session) == len(maintained)
+        assert _inbox_keys(session) == maintained
+
+
+def test_ensure_fills_an_empty_inbox_only_once() -> None:
+    with _make_session() as session:
+        assert ensure_approval_inbox(session) is False
+        _submit(session, 1)
+        maintained = _inbox_keys(session)
+        assert ensure_approval_inbox(session) is False
+
+        # 결재함 도입 전 DB: 진행 중 신청서는 있는데 결재함이 비어 있다.
+        session.exec(delete(HriApprovalInbox))
+        session.commit()
+        assert ensure_approval_inbox(session) is True
+        assert _inbox_keys(session) == maintained
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import (
+    AuthUser,
+    HrEmployee,
+    HriApprovalActorRule,
+    HriApprovalLineStep,
+    HriApprovalLineTemplate,
+    HriFormType,
+    HriFormTypeApprovalMap,
+    HriRequestMaster,
+    HriRequestStepSnapshot,
+    OrgDepartment,
+)
+from app.services.hri_request_service import reject_request, submit_request
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+
+    session.add(OrgDepartment(id=10, code="HQ", name="HQ"))
+    session.add(OrgDepartment(id=11, code="HQ-HR", name="HR", parent_id=10))
+    for user_id, department_id, position_title in ((1, 11, "Staff"), (2, 11, "Team Lead"), (3, 10, "Director")):
+        session.add(
+            AuthUser(
+                id=user_id,
+                login_id=f"user{user_id}",
+                email=f"user{user_id}@example.com",
+                password_hash="x",
+                display_name=f"User {user_id}",
+            )
+        )
+        session.add(
+            HrEmployee(
+                id=100 + user_id,
+                user_id=user_id,
+                employee_no=f"HR-{user_id:04d}",
+                department_id=department_id,
+                position_title=position_title,
+                hire_date=date(2024, 1, 1),
+                employment_status="active",
+            )
+        )
+    session.add(
+        HriApprovalActorRule(
+            role_code="TEAM_LEADER",
+            resolve_method="ORG_CHAIN",
+            fallback_rule="ESCALATE",
+            position_keywords_json='["Lead"]',
+        )
+    )
+    session.commit()
+    return session
+
+
+def _add_request(session: Session, request_id: int, step_count: int) -> None:
+    """REFERENCE 1단계 + ROLE_BASED/USER_FIXED 결재 단계 + 수신 1단계 템플릿을 가진 신청서."""
+    form_type_id = 100 + request_id
+    session.add(
+        HriFormType(
+            id=form_type_id,
+            form_code=f"CERT_EMPLOYMENT_{request_id}",
+            form_name_ko="재직증명서",
+            module_code="HRI",
+            is_active=True,
+        )
+    )
+    session.add(HriApprovalLineTemplate(id=request_id, template_code=f"T{request_id}", template_name="line", is_active=True))
+    session.add(
+        HriFormTypeApprovalMap(
+            form_type_id=form_type_id,
+            template_id=request_id,
+            effective_from=date(2000, 1, 1),
+            is_active=True,
+        )
+    )
+    steps = [("REFERENCE", "USER_FIXED", 3)]
+    steps += [("APPROVAL", "ROLE_BASED", None) if index % 2 == 0 else ("APPROVAL", "USER_FIXED", 3) for index in range(step_count - 2)]
+    steps += [("RECEIVE", "USER_FIXED", 3)]
+    for order, (step_type, resolve_type, actor_user_id) in enumerate(steps, start=1):
+        session.add(
+            HriApprovalLineStep(
+                template_id=request_id,
+                step_order=order,
+                step_type=step_type,
+                actor_resolve_type=resolve_type,
+                actor_role_code="TEAM_LEADER" if resolve_type == "ROLE_BASED" else None,
+                actor_user_id=actor_user_id,
+            )
+        )
+    session.add(
+        HriRequestMaster(
+            id=request_id,
+            request_no=f"HRI-TEST-{request_id:04d}",
+            form_type_id=form_type_id,
+            requester_id=1,
+            title="재직증명서",
+            content_json="{}",
+            status_code="DRAFT",
+            created_at=datetime(2026, 3, 1, 9, 0),
+            updated_at=datetime(2026, 3, 1, 9, 0),
+        )
+    )
+    session.commit()
+
+
+def _submit_and_count(session: Session, request_id: int) -> int:
+    with capture_queries() as stats:
+        submit_request(session, 1, request_id)
+    return stats.statement_count
+
+
+def test_submit_builds_snapshots_and_picks_first_waiting_step() -> None:
+    with _make_session() as session:
+        _add_request(session, 1, step_count=4)
+
+        response = submit_request(session, 1, 1)
+
+        snapshots = session.exec(
+            select(HriRequestStepSnapshot).where(HriRequestStepSnapshot.request_id == 1).order_by(HriRequestStepSnapshot.step_order)
+        ).all()
+        assert response.status_code == "APPROVAL_IN_PROGRESS"
+        assert response.current_step_order == 2
+        assert [(row.step_type, row.action_status, row.actor_user_id) for row in snapshots] == [
+            ("REFERENCE", "RECEIVED", 3),
+            ("APPROVAL", "WAITING", 2),
+            ("APPROVAL", "WAITING", 3),
+            ("RECEIVE", "WAITING", 3),
+        ]
+        assert snapshots[1].actor_name == "User 2"
+        assert snapshots[1].actor_org_id == 11
+        assert snapshots[0].comment == "AUTO_REFERENCE"
+
+
+def test_resubmit_replaces_previous_snapshots() -> None:
+    with _make_session() as session:
+        _add_request(session, 1, step_count=4)
+        submit_request(session, 1, 1)
+
+        reject_request(session, 2, 1)
+        submit_request(session, 1, 1)
+
+        snapshots = session.exec(select(HriRequestStepSnapshot).where(HriRequestStepSnapshot.request_id == 1)).all()
+        assert len(snapshots) == 4
+        assert {row.action_status for row in snapshots} == {"RECEIVED", "WAITING"}
+
+
+def test_submit_query_count_does_not_grow_with_approval_line_length() -> None:
+    with _make_session() as session:
+        _add_request(session, 1, step_count=3)
+        _add_request(session, 2, step_count=12)
+        # 결재자 인덱스 적재 비용을 측정에서 제외한다.
+        submit_request(session, 1, 1)
+        reject_request(session, 2, 1)
+
+        short_line = _submit_and_count(session, 1)
+        long_line = _submit_and_count(session, 2)
+
+        assert len(session.exec(select(HriRequestStepSnapshot).where(HriRequestStepSnapshot.request_id == 2)).all()) == 12
+        assert long_line == short_line
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 from sqlmodel import Session, SQLModel, create_engine
 
 from app.api.common_code import code_group_create, code_groups
@@ -204,6 +204,7 @@ def test_organization_departments_denies_when_query_permission_is_missing() -> N
 
         with pytest.raises(HTTPException) as exc_info:
             organization_departments(
+                response=Response(),
                 page=1,
                 limit=100,
                 all=False,
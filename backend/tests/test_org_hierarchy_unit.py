@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models import AuthUser, HrAttendanceDaily, HrEmployee, OrgDepartment, OrgDepartmentClosure
+from app.schemas.organization import (
+    OrganizationDepartmentCreateRequest,
+    OrganizationDepartmentUpdateRequest,
+    OrgRestructurePlanCreateRequest,
+    OrgRestructurePlanItemCreateRequest,
+)
+from app.services.employee_query_service import list_employees
+from app.services.org_hierarchy_service import (
+    ancestor_ids,
+    ensure_department_closure,
+    rebuild_department_closure,
+)
+from app.services.org_restructure_service import add_plan_item, apply_restructure_plan, create_restructure_plan
+from app.services.organization_service import create_department, delete_department, list_departments, update_department
+from app.services.tim_attendance_daily_service import list_attendance_daily
+
+
+def _closure(session: Session) -> set[tuple[int, int, int]]:
+    rows = session.exec(select(OrgDepartmentClosure)).all()
+    return {(row.ancestor_id, row.descendant_id, row.depth) for row in rows}
+
+
+def _make_session() -> Session:
+    """HQ(1) ─ DEV(2) ─ APP(3), SALES(4). 사원은 DEV·APP·SALES 에 한 명씩."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    create_department(session, OrganizationDepartmentCreateRequest(code="HQ", name="본사"))
+    create_department(session, OrganizationDepartmentCreateRequest(code="DEV", name="개발본부", parent_id=1))
+    create_department(session, OrganizationDepartmentCreateRequest(code="APP", name="앱개발팀", parent_id=2))
+    create_department(session, OrganizationDepartmentCreateRequest(code="SALES", name="영업팀"))
+    for index, department_id in ((1, 2), (2, 3), (3, 4)):
+        session.add(
+            AuthUser(id=index, login_id=f"user{index}", email=f"user{index}@example.com", password_hash="x", display_name=f"User {index}")
+        )
+        session.add(
+            HrEmployee(
+                id=index,
+                user_id=index,
+                employee_no=f"E{index:04d}",
+                department_id=department_id,
+                position_title="Staff",
+                hire_date=date(2025, 1, 1),
+            )
+        )
+        session.add(HrAttendanceDaily(employee_id=index, work_date=date(2026, 3, 2), attendance_status="present"))
+    session.commit()
+    return session
+
+
+def test_department_writes_keep_closure_in_sync_with_parent_ids() -> None:
+    with _make_session() as session:
+        assert ancestor_ids(session, 3) == [3, 2, 1]
+
+        moved = update_department(session, 2, OrganizationDepartmentUpdateRequest(parent_id=4))
+        assert (moved.employee_count, moved.subtree_employee_count) == (1, 2)
+        assert ancestor_ids(session, 3) == [3, 2, 4]
+        with pytest.raises(HTTPException):
+            update_department(session, 4, OrganizationDepartmentUpdateRequest(parent_id=3))
+
+        update_department(session, 2, OrganizationDepartmentUpdateRequest(parent_id=None))
+        assert ancestor_ids(session, 3) == [3, 2]
+
+        delete_department(session, 1)
+        maintained = _closure(session)
+        rebuild_department_closure(session)
+        assert _closure(session) == maintained
+        assert ensure_department_closure(session) is False
+
+
+def test_ensure_closure_detects_parent_changes_made_outside_the_service() -> None:
+    with _make_session() as session:
+        assert ensure_department_closure(session) is False
+
+        # 부서 수와 상위 관계 수는 그대로인 상위 부서 변경(SALES: 최상위 → HQ, DEV: HQ → 최상위)
+        session.exec(update(OrgDepartment).where(OrgDepartment.id == 4).values(parent_id=1))
+        session.exec(update(OrgDepartment).where(OrgDepartment.id == 2).values(parent_id=None))
+        session.commit()
+
+        assert ensure_department_closure(session) is True
+        assert ancestor_ids(session, 3) == [3, 2]
+        assert ancestor_ids(session, 4) == [4, 1]
+        assert ensure_department_closure(session) is False
+
+
+def test_restructure_plan_moves_and_creates_through_closure() -> None:
+    with _make_session() as session:
+        plan = create_restructure_plan(session, OrgRestructurePlanCreateRequest(title="개편"), user_id=1)
+        add_plan_item(session, plan.id, OrgRestructurePlanItemCreateRequest(action_type="move", target_dept_id=2, new_parent_id=4))
+        add_plan_item(
+            session,
+            plan.id,
+            OrgRestructurePlanItemCreateRequest(action_type="create", new_code="WEB", new_name="웹개발팀", new_parent_id=2, sort_order=1),
+        )
+        add_plan_item(session, plan.id, OrgRestructurePlanItemCreateRequest(action_type="move", target_dept_id=4, new_parent_id=3, sort_order=2))
+
+        result = apply_restructure_plan(session, plan.id, user_id=1)
+        assert (result.applied_count, result.skipped_count) == (2, 1)
+
+        web_id = session.exec(select(OrgDepartment.id).where(OrgDepartment.code == "WEB")).one()
+        assert ancestor_ids(session, web_id) == [web_id, 2, 4]
+        maintained = _closure(session)
+        rebuild_department_closure(session)
+        assert _closure(session) == maintained
+
+
+def test_lists_filter_by_subtree_and_report_subtree_headcount() -> None:
+    with _make_session() as session:
+        employees, total = list_employees(session, department_id=2, include_sub_departments=True)
+        assert total == 2 and {item.id for item in employees} == {1, 2}
+        _, total = list_employees(session, department_id=2)
+        assert total == 1
+
+        attendance = list_attendance_daily(
+            session,
+            start_date=date(2026, 3, 1),
+            end_date=date(2026, 3, 31),
+            employee_id=None,
+            status_filter=None,
+            page=1,
+            limit=10,
+            department_id=1,
+            include_sub_departments=True,
+        )
+        assert {item.employee_id for item in attendance.items} == {1, 2}
+
+        departments, _ = list_departments(session)
+        assert {item.code: (item.employee_count, item.subtree_employee_count) for item in departments} == {
+            "HQ": (0, 2),
+            "DEV": (1, 2),
+            "APP": (1, 1),
+            "SALES": (1, 1),
+        }
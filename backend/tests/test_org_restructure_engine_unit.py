@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import OrgDepartment, OrgDepartmentClosure, OrgDeptChangeHistory, OrgRestructurePlan, OrgRestructurePlanItem
+from app.services.org_hierarchy_service import ensure_department_closure, rebuild_department_closure
+from app.services.org_restructure_service import apply_restructure_plan, simulate_restructure_plan
+
+
+def _make_session(team_count: int = 3) -> Session:
+    """HQ(1) ─ DEV(2) ─ T01..Tn, SALES(3)."""
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="본사"))
+    session.add(OrgDepartment(id=2, code="DEV", name="개발본부", parent_id=1))
+    session.add(OrgDepartment(id=3, code="SALES", name="영업본부", parent_id=1))
+    session.exec(
+        insert(OrgDepartment),
+        params=[{"id": 10 + index, "code": f"T{index:02d}", "name": f"팀{index}", "parent_id": 2} for index in range(1, team_count + 1)],
+    )
+    session.add(OrgRestructurePlan(id=1, title="개편", created_by=1))
+    session.flush()
+    ensure_department_closure(session)
+    session.commit()
+    return session
+
+
+def _add_items(session: Session, items: list[dict]) -> None:
+    for sort_order, values in enumerate(items):
+        session.add(OrgRestructurePlanItem(plan_id=1, sort_order=sort_order, **values))
+    session.commit()
+
+
+def _closure(session: Session) -> set[tuple[int, int, int]]:
+    return {(row.ancestor_id, row.descendant_id, row.depth) for row in session.exec(select(OrgDepartmentClosure)).all()}
+
+
+_ITEMS = [
+    {"action_type": "move", "target_dept_id": 11, "new_parent_id": 3},
+    {"action_type": "rename", "target_dept_id": 12, "new_name": "플랫폼팀", "new_code": "plat"},
+    {"action_type": "create", "new_code": "web", "new_name": "웹팀", "new_parent_id": 11},
+    {"action_type": "move", "target_dept_id": 3, "new_parent_id": 11},
+    {"action_type": "rename", "target_dept_id": 13, "new_name": "중복", "new_code": "WEB"},
+    {"action_type": "deactivate", "target_dept_id": 13},
+]
+
+
+def test_dry_run_projects_tree_and_conflicts_without_writing() -> None:
+    with _make_session() as session:
+        _add_items(session, _ITEMS)
+        result = simulate_restructure_plan(session, 1)
+
+        assert (result.applied_count, result.skipped_count) == (4, 2)
+        assert [(conflict.action_type, conflict.detail) for conflict in result.conflicts] == [
+            ("move", "순환 부서 구조를 만들 수 없습니다."),
+            ("rename", "코드 'WEB'가 이미 존재합니다."),
+        ]
+        assert [(item.code, item.depth, item.parent_code, item.is_active) for item in result.departments] == [
+            ("HQ", 0, None, True),
+            ("DEV", 1, "HQ", True),
+            ("PLAT", 2, "DEV", True),
+            ("T03", 2, "DEV", False),
+            ("SALES", 1, "HQ", True),
+            ("T01", 2, "SALES", True),
+            ("WEB", 3, "T01", True),
+        ]
+        assert next(item for item in result.departments if item.code == "WEB").id is None
+        assert next(item for item in result.departments if item.code == "PLAT").changed_fields == ["code", "name"]
+
+        assert session.get(OrgDepartment, 11).parent_id == 2
+        assert session.exec(select(OrgDeptChangeHistory)).all() == []
+        assert {item.item_status for item in session.exec(select(OrgRestructurePlanItem)).all()} == {"pending"}
+
+
+def test_apply_writes_the_simulated_result() -> None:
+    with _make_session() as session:
+        _add_items(session, _ITEMS)
+        preview = simulate_restructure_plan(session, 1)
+        result = apply_restructure_plan(session, 1, user_id=7)
+
+        assert result.messages == preview.messages
+        assert result.messages[0] == "[MOVE] 팀1 → 상위부서 변경"
+        assert result.messages[3].startswith("[SKIP] move id=")
+
+        web = session.exec(select(OrgDepartment).where(OrgDepartment.code == "WEB")).one()
+        assert (web.name, web.parent_id) == ("웹팀", 11)
+        assert (session.get(OrgDepartment, 12).code, session.get(OrgDepartment, 12).name) == ("PLAT", "플랫폼팀")
+        assert session.get(OrgDepartment, 13).is_active is False
+
+        histories = session.exec(select(OrgDeptChangeHistory).order_by(OrgDeptChangeHistory.id)).all()
+        assert [(row.department_id, row.field_name, row.before_value, row.after_value) for row in histories] == [
+            (11, "parent_id", "2", "3"),
+            (12, "code", "T02", "PLAT"),
+            (12, "name", "팀2", "플랫폼팀"),
+            (web.id, "created", None, "WEB"),
+            (13, "is_active", "True", "False"),
+        ]
+        assert {row.changed_by for row in histories} == {7}
+
+        statuses = [item.item_status for item in session.exec(select(OrgRestructurePlanItem).order_by(OrgRestructurePlanItem.sort_order)).all()]
+        assert statuses == ["applied", "applied", "applied", "skipped", "skipped", "applied"]
+        assert session.get(OrgRestructurePlan, 1).status == "applied"
+
+        maintained = _closure(session)
+        rebuild_department_closure(session)
+        assert _closure(session) == maintained
+        assert (1, web.id, 3) in maintained
+
+
+@pytest.mark.parametrize(
+    ("items", "expected_codes"),
+    [
+        (
+            [
+                {"action_type": "rename", "target_dept_id": 12, "new_name": "플랫폼팀", "new_code": "PLAT"},
+                {"action_type": "create", "new_code": "T02", "new_name": "신설팀", "new_parent_id": 2},
+            ],
+            ["PLAT", "T01", "T02", "T03"],
+        ),
+        (
+            [
+                {"action_type": "rename", "target_dept_id": 12, "new_name": "기타팀", "new_code": "ZZ"},
+                {"action_type": "rename", "target_dept_id": 11, "new_name": "이전팀", "new_code": "T02"},
+            ],
+            ["T02", "T03", "ZZ"],
+        ),
+    ],
+)
+def test_apply_reuses_codes_freed_by_earlier_items(items: list[dict], expected_codes: list[str]) -> None:
+    with _make_session() as session:
+        _add_items(session, items)
+        assert simulate_restructure_plan(session, 1).skipped_count == 0
+
+        result = apply_restructure_plan(session, 1, user_id=1)
+
+        assert result.applied_count == len(items)
+        codes = session.exec(select(OrgDepartment.code).where(OrgDepartment.parent_id == 2).order_by(OrgDepartment.code)).all()
+        assert codes == expected_codes
+
+
+def _apply_statement_count(team_count: int) -> int:
+    with _make_session(team_count) as session:
+        items: list[dict] = []
+        for index in range(1, team_count + 1):
+            items.append({"action_type": "move", "target_dept_id": 10 + index, "new_parent_id": 3})
+            items.append({"action_type": "rename", "target_dept_id": 10 + index, "new_name": f"영업{index}팀"})
+            items.append({"action_type": "create", "new_code": f"N{index:03d}", "new_name": f"신설{index}", "new_parent_id": 10 + index})
+        _add_items(session, items)
+        with capture_queries() as stats:
+            result = apply_restructure_plan(session, 1, user_id=1)
+        assert result.applied_count == len(items)
+        return stats.statement_count
+
+
+def test_apply_statement_count_does_not_grow_with_items() -> None:
+    # 100개 팀(항목 300개)까지는 closure 재작성도 한 배치에 들어간다.
+    assert _apply_statement_count(5) == _apply_statement_count(100)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.bootstrap import ensure_read_models
+from app.core.time_utils import business_today
+from app.models import AuthUser, HrEmployee, HrEmployeeStateHistory, OrgDepartment, OrgDepartmentClosure, OrgDepartmentStateHistory
+from app.schemas.employee import EmployeeUpdateRequest
+from app.schemas.hr_appointment_record import HrAppointmentRecordCreateRequest
+from app.schemas.organization import OrganizationDepartmentUpdateRequest
+from app.services.employee_command_service import update_employee
+from app.services.hr_appointment_record_service import confirm_appointment_order, create_appointment_record
+from app.services.org_state_history_service import (
+    _replay_intervals,
+    backfill_state_histories,
+    department_states_as_of,
+    employee_states_as_of,
+    headcount_by_department,
+)
+from app.services.organization_service import update_department
+
+_CREATED = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="본사", created_at=_CREATED, updated_at=_CREATED))
+    session.add(OrgDepartment(id=2, code="DEV", name="개발팀", created_at=_CREATED, updated_at=_CREATED))
+    for index in (1, 2, 3):
+        session.add(
+            AuthUser(id=index, login_id=f"user{index}", email=f"user{index}@example.com", password_hash="x", display_name=f"User {index}")
+        )
+        session.add(
+            HrEmployee(
+                id=index,
+                user_id=index,
+                employee_no=f"E{index:04d}",
+                department_id=1,
+                position_title="Staff",
+                hire_date=date(2025, 1, 1),
+                employment_status="resigned" if index == 3 else "active",
+                created_at=_CREATED,
+                updated_at=_CREATED,
+            )
+        )
+    session.commit()
+    assert backfill_state_histories(session)
+    session.commit()
+    return session
+
+
+def test_replay_splits_history_into_half_open_intervals() -> None:
+    intervals = _replay_intervals(
+        start=date(2025, 1, 1),
+        current={"department_id": 3, "position_title": "Lead"},
+        current_since=date(2026, 5, 1),
+        changes=[
+            (date(2025, 6, 1), "department_id", 1, 2),
+            (date(2025, 6, 1), "position_title", "Staff", "Lead"),
+            (date(2026, 1, 1), "department_id", 2, 2),
+        ],
+    )
+    assert intervals == [
+        (date(2025, 1, 1), date(2025, 6, 1), {"department_id": 1, "position_title": "Staff"}),
+        (date(2025, 6, 1), date(2026, 5, 1), {"department_id": 2, "position_title": "Lead"}),
+        (date(2026, 5, 1), None, {"department_id": 3, "position_title": "Lead"}),
+    ]
+
+
+def test_confirmed_appointment_is_visible_as_of_its_effective_date() -> None:
+    with _make_session() as session:
+        created = create_appointment_record(
+            session,
+            HrAppointmentRecordCreateRequest(
+                employee_id=1,
+                order_title="전보",
+                effective_date=date(2026, 3, 1),
+                appointment_kind="permanent",
+                action_type="전보",
+                start_date=date(2026, 3, 1),
+                to_department_id=2,
+            ),
+            user_id=1,
+        )
+        confirm_appointment_order(session, created.order_id, user_id=1)
+
+        assert employee_states_as_of(session, date(2026, 2, 28), employee_ids=[1])[1].department_id == 1
+        assert employee_states_as_of(session, date(2026, 3, 1), employee_ids=[1])[1].department_id == 2
+        assert employee_states_as_of(session, date(2024, 12, 31), employee_ids=[1]) == {}
+
+        before = headcount_by_department(session, date(2026, 2, 1))
+        after = headcount_by_department(session, date(2026, 3, 2))
+        assert [(item.code, item.headcount) for item in before] == [("HQ", 2)]
+        assert [(item.code, item.headcount) for item in after] == [("DEV", 1), ("HQ", 1)]
+
+
+def test_direct_edits_start_from_their_update_date() -> None:
+    with _make_session() as session:
+        update_employee(session, 2, EmployeeUpdateRequest(position_title="Lead"))
+        today = business_today()
+
+        rows = session.exec(
+            select(HrEmployeeStateHistory).where(HrEmployeeStateHistory.employee_id == 2).order_by(HrEmployeeStateHistory.valid_from)
+        ).all()
+        assert [(row.valid_from, row.valid_to, row.position_title) for row in rows] == [
+            (date(2025, 1, 1), today, "Staff"),
+            (today, None, "Lead"),
+        ]
+
+
+def test_department_changes_are_tracked_by_change_date() -> None:
+    with _make_session() as session:
+        update_department(session, 2, OrganizationDepartmentUpdateRequest(name="플랫폼팀"), changed_by=1)
+        today = datetime.now(timezone.utc).date()
+
+        assert department_states_as_of(session, today - timedelta(days=1), department_ids=[2])[2].name == "개발팀"
+        assert department_states_as_of(session, today, department_ids=[2])[2].name == "플랫폼팀"
+        assert set(department_states_as_of(session, today)) == {1, 2}
+
+
+def test_startup_read_models_fill_closure_and_state_histories() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(OrgDepartment(id=1, code="HQ", name="본사", created_at=_CREATED, updated_at=_CREATED))
+        session.add(OrgDepartment(id=2, code="DEV", name="개발팀", parent_id=1, created_at=_CREATED, updated_at=_CREATED))
+        session.commit()
+
+        ensure_read_models(session)
+
+    with Session(engine) as session:
+        closure = {(row.ancestor_id, row.descendant_id) for row in session.exec(select(OrgDepartmentClosure)).all()}
+        assert closure == {(1, 1), (2, 2), (1, 2)}
+        states = session.exec(select(OrgDepartmentStateHistory.department_id)).all()
+        assert sorted(states) == [1, 2]
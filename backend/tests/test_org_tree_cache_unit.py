@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import update
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.api.organization import _etag_matches
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import AuthUser, HrEmployee, OrgDepartment
+from app.services.org_tree_cache_service import DepartmentTreeCache, build_department_tree, get_department_tree
+from app.services.organization_service import list_departments
+
+_CREATED = datetime(2025, 1, 1)
+
+
+def _make_session() -> Session:
+    """HQ(1) ─ DEV(2) ─ APP(3), SALES(4). 사원은 DEV 1명, APP 2명, SALES 1명."""
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    for department_id, code, name, parent_id in ((1, "HQ", "본사", None), (2, "DEV", "개발본부", 1), (3, "APP", "앱개발팀", 2), (4, "SALES", "영업팀", 1)):
+        session.add(OrgDepartment(id=department_id, code=code, name=name, parent_id=parent_id, created_at=_CREATED, updated_at=_CREATED))
+    for index, department_id in ((1, 2), (2, 3), (3, 3), (4, 4)):
+        session.add(
+            AuthUser(id=index, login_id=f"user{index}", email=f"user{index}@example.com", password_hash="x", display_name=f"User {index}")
+        )
+        session.add(
+            HrEmployee(id=index, user_id=index, employee_no=f"E{index:04d}", department_id=department_id, position_title="Staff", hire_date=date(2025, 1, 1))
+        )
+    session.commit()
+    return session
+
+
+def test_snapshot_has_depth_path_and_subtree_headcount_and_is_served_from_memory() -> None:
+    with _make_session() as session:
+        snapshot = get_department_tree(session)
+        assert [(node.code, node.depth, node.path_name, node.employee_count, node.subtree_employee_count) for node in snapshot.nodes] == [
+            ("HQ", 0, "본사", 0, 4),
+            ("DEV", 1, "본사 > 개발본부", 1, 3),
+            ("APP", 2, "본사 > 개발본부 > 앱개발팀", 2, 2),
+            ("SALES", 1, "본사 > 영업팀", 1, 1),
+        ]
+        assert snapshot.by_id[3].path_ids == (1, 2, 3)
+
+        with capture_queries() as stats:
+            assert get_department_tree(session) is snapshot
+            departments, total = list_departments(session, name="개발", page=1, limit=1)
+        assert stats.statement_count == 0
+        assert total == 2 and [item.code for item in departments] == ["APP"]
+        assert departments[0].parent_name == "개발본부" and departments[0].subtree_employee_count == 2
+
+        # 같은 트리는 새로 만들어도 같은 버전(ETag)이다.
+        assert build_department_tree(session).etag == snapshot.etag
+        assert _etag_matches(f"W/{snapshot.etag}, \"other\"", snapshot.etag)
+        assert not _etag_matches('"other"', snapshot.etag)
+
+
+def test_commits_refresh_only_the_affected_part() -> None:
+    with _make_session() as session:
+        before = get_department_tree(session)
+
+        session.get(OrgDepartment, 2).name = "플랫폼본부"
+        session.commit()
+        with capture_queries() as stats:
+            renamed = get_department_tree(session)
+        assert stats.statement_count == 1
+        assert renamed.version != before.version
+        assert renamed.by_id[3].path_name == "본사 > 플랫폼본부 > 앱개발팀"
+
+        session.get(HrEmployee, 2).department_id = 4
+        session.commit()
+        with capture_queries() as stats:
+            moved = get_department_tree(session)
+        assert stats.statement_count == 1
+        assert (moved.by_id[2].subtree_employee_count, moved.by_id[4].subtree_employee_count) == (2, 2)
+
+        session.add(OrgDepartment(id=5, code="WEB", name="웹팀", parent_id=3))
+        session.delete(session.get(HrEmployee, 1))
+        session.commit()
+        snapshot = get_department_tree(session)
+        assert (snapshot.by_id[5].depth, snapshot.by_id[1].subtree_employee_count) == (3, 3)
+
+
+def test_uncommitted_and_rolled_back_changes_are_not_cached() -> None:
+    with _make_session() as session:
+        cached = get_department_tree(session)
+
+        session.get(OrgDepartment, 4).parent_id = 3
+        session.flush()
+        assert get_department_tree(session).by_id[4].depth == 3
+        session.rollback()
+        assert get_department_tree(session) is cached
+
+        session.exec(update(OrgDepartment).where(OrgDepartment.id == 4).values(name="국내영업팀"))
+        session.commit()
+        assert get_department_tree(session).by_id[4].path_name == "본사 > 국내영업팀"
+
+
+def test_ttl_expiry_picks_up_writes_from_other_processes() -> None:
+    with _make_session() as session:
+        cache = DepartmentTreeCache(ttl_sec=1)
+        cache.get(session)
+        with session.get_bind().begin() as connection:
+            connection.execute(update(OrgDepartment).where(OrgDepartment.id == 3).values(name="모바일팀"))
+        assert cache.get(session).by_id[3].name == "앱개발팀"
+
+        cache._loaded_at -= 1
+        assert cache.get(session).by_id[3].name == "모바일팀"
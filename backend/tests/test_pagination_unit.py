@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.api.mng_company import mng_manager_status_create
+from app.api.mng_outsource import mng_outsource_attendance_create
+from app.core.pagination import PageParams, decode_cursor, encode_cursor, fetch_page
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import (
+    AuthUser,
+    HrAttendanceDaily,
+    HrEmployee,
+    MngCompany,
+    MngDevRequest,
+    MngManagerCompany,
+    MngOutsourceAttendance,
+    MngOutsourceContract,
+    OrgDepartment,
+)
+from app.schemas.mng import MngManagerCompanyCreateRequest, MngOutsourceAttendanceCreateRequest
+from app.services.employee_query_service import list_employees_keyset
+from app.services.mng_dev_service import list_dev_request_monthly_summary
+from app.services.tim_attendance_daily_service import list_attendance_daily
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(
+        engine,
+        tables=[
+            AuthUser.__table__,
+            OrgDepartment.__table__,
+            HrEmployee.__table__,
+            HrAttendanceDaily.__table__,
+            MngDevRequest.__table__,
+            MngCompany.__table__,
+            MngManagerCompany.__table__,
+            MngOutsourceContract.__table__,
+            MngOutsourceAttendance.__table__,
+        ],
+    )
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="HQ"))
+    for index in range(1, 6):
+        session.add(
+            AuthUser(
+                id=index,
+                login_id=f"user{index}",
+                email=f"user{index}@example.com",
+                password_hash="x",
+                display_name=f"User {index}",
+            )
+        )
+        session.add(
+            HrEmployee(
+                id=index,
+                user_id=index,
+                employee_no=f"EMP-{index:04d}",
+                department_id=1,
+                position_title="Staff",
+                hire_date=date(2024, 1, 1),
+                employment_status="active",
+            )
+        )
+    session.commit()
+    return session
+
+
+def test_cursor_round_trips_dates_and_ids() -> None:
+    values = [date(2026, 3, 1), datetime(2026, 3, 1, 9, 30), 42, "KR-0001"]
+
+    assert decode_cursor(encode_cursor(values)) == values
+
+
+def test_decode_cursor_rejects_garbage() -> None:
+    with pytest.raises(HTTPException) as error:
+        decode_cursor("not-a-cursor")
+
+    assert error.value.status_code == 400
+
+
+def test_list_employees_keyset_walks_all_pages_without_overlap() -> None:
+    with _make_session() as session:
+        seen: list[int] = []
+        cursor = ""
+        while cursor is not None:
+            items, total_count, total_is_estimate, cursor = list_employees_keyset(session, cursor=cursor, limit=2)
+            seen.extend(item.id for item in items)
+
+        assert seen == [1, 2, 3, 4, 5]
+        assert total_count == 5
+        assert total_is_estimate is False
+
+
+def test_list_attendance_daily_keyset_orders_by_work_date_then_id_desc() -> None:
+    with _make_session() as session:
+        for employee_id in (1, 2):
+            for day in (1, 2, 3):
+                session.add(
+                    HrAttendanceDaily(
+                        employee_id=employee_id,
+                        work_date=date(2026, 3, day),
+                        attendance_status="present",
+                    )
+                )
+        session.commit()
+
+        first = list_attendance_daily(
+            session,
+            start_date=date(2026, 3, 1),
+            end_date=date(2026, 3, 31),
+            employee_id=None,
+            status_filter=None,
+            page=1,
+            limit=4,
+            cursor="",
+        )
+        second = list_attendance_daily(
+            session,
+            start_date=date(2026, 3, 1),
+            end_date=date(2026, 3, 31),
+            employee_id=None,
+            status_filter=None,
+            page=1,
+            limit=4,
+            cursor=first.next_cursor,
+        )
+
+        work_dates = [item.work_date.day for item in first.items + second.items]
+        assert work_dates == [3, 3, 2, 2, 1, 1]
+        assert second.next_cursor is None
+        assert first.total_count == 6
+
+
+def test_fetch_page_counts_only_when_page_is_full() -> None:
+    with _make_session() as session:
+        stmt = select(HrEmployee).order_by(HrEmployee.id)
+
+        with capture_queries() as full_page:
+            rows, total_count = fetch_page(session, stmt, PageParams(page=1, limit=2))
+        assert [row.id for row in rows] == [1, 2]
+        assert total_count == 5
+        assert full_page.statement_count == 2
+
+        with capture_queries() as last_page:
+            rows, total_count = fetch_page(session, stmt, PageParams(page=3, limit=2))
+        assert [row.id for row in rows] == [5]
+        assert total_count == 5
+        assert last_page.statement_count == 1
+
+        rows, total_count = fetch_page(session, stmt, PageParams(page=9, limit=2))
+        assert rows == []
+        assert total_count == 5
+
+
+def test_list_dev_request_monthly_summary_groups_and_pages_in_sql() -> None:
+    with _make_session() as session:
+        for month, is_paid in ((1, True), (1, False), (2, True), (3, False)):
+            session.add(
+                MngDevRequest(
+                    company_id=1,
+                    request_ym=date(2026, month, 15),
+                    request_seq=month,
+                    is_paid=is_paid,
+                    paid_man_months=1.5 if is_paid else None,
+                )
+            )
+        session.commit()
+
+        items, total_count = list_dev_request_monthly_summary(session, page_params=PageParams(page=2, limit=2))
+
+        assert total_count == 3
+        assert [item.request_ym for item in items] == [date(2026, 1, 1)]
+        assert items[0].total_count == 2
+        assert items[0].paid_count == 1
+        assert items[0].paid_man_months_total == 1.5
+
+
+def test_mng_create_endpoints_return_the_full_list() -> None:
+    with _make_session() as session:
+        session.add(MngCompany(id=1, company_code="C001", company_name="고객사"))
+        session.add(MngOutsourceContract(id=1, employee_id=1, start_date=date(2026, 1, 1), end_date=date(2026, 12, 31)))
+        session.commit()
+
+        for employee_id in (1, 2):
+            managers = mng_manager_status_create(
+                MngManagerCompanyCreateRequest(employee_id=employee_id, company_id=1, start_date=date(2026, 1, 1)),
+                session=session,
+            )
+        assert (managers.total_count, managers.page, managers.limit) == (2, 1, 2)
+        assert [item.employee_id for item in managers.items] == [1, 2]
+
+        attendances = mng_outsource_attendance_create(
+            MngOutsourceAttendanceCreateRequest(
+                contract_id=1,
+                employee_id=1,
+                attendance_code="ANNUAL",
+                start_date=date(2026, 3, 2),
+                end_date=date(2026, 3, 2),
+            ),
+            session=session,
+        )
+        assert (attendances.total_count, attendances.limit) == (1, 1)
+        assert attendances.items[0].attendance_code == "ANNUAL"
@@ -0,0 +1,181 @@
+"""핫패스 쿼리 예산 벤치.
+
+seed_initial_data 로 시드한 DB 두 개(기본 규모, 1/4 규모)에서 주요 서비스 함수를 실행한다.
+SQL 수는 두 규모에서 같아야 하고(사원 수에 비례하는 N+1 이 생기면 실패) 상한도 넘지 않아야 한다.
+소요 시간은 기본 규모에서만 본다. 규모는 conftest.BenchScale 참고.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.core.pagination import PageParams
+from app.core.query_metrics import QueryStats, capture_queries
+from app.core.time_utils import business_today
+from app.models import AuthUser, HrEmployee, HriRequestStepSnapshot, PayPayrollRun, TimMonthClose
+from app.schemas.tim_schedule import TimScheduleGenerateRequest
+from app.services.employee_directory_service import get_employee_directory
+from app.services.employee_query_service import list_employees, search_employees
+from app.services.hri_request_service import list_my_approval_tasks
+from app.services.menu_service import get_menu_tree_for_user
+from app.services.payroll_phase2_service import calculate_payroll_run
+from app.services.tim_month_close_service import close_month
+from app.services.tim_schedule_service import generate_employee_daily_schedules
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    max_queries: int
+    base_seconds: float
+    seconds_per_employee: float = 0
+
+    def max_seconds(self, employees: int, time_factor: float) -> float:
+        return (self.base_seconds + self.seconds_per_employee * employees) * time_factor
+
+
+BUDGETS = {
+    "calculate_payroll_run": QueryBudget(max_queries=25, base_seconds=2.0, seconds_per_employee=0.02),
+    "generate_employee_daily_schedules": QueryBudget(max_queries=12, base_seconds=2.0, seconds_per_employee=0.03),
+    "close_month": QueryBudget(max_queries=20, base_seconds=2.0, seconds_per_employee=0.03),
+    "list_employees": QueryBudget(max_queries=2, base_seconds=0.5),
+    "get_menu_tree_for_user": QueryBudget(max_queries=3, base_seconds=0.5),
+    "list_my_approval_tasks": QueryBudget(max_queries=3, base_seconds=0.5),
+}
+# 자동완성은 키 입력마다 호출되므로 합계 대신 p99 지연으로 본다.
+TYPEAHEAD_P99_SECONDS = 0.02
+
+
+def _measure(engine, call: Callable[[Session], object]) -> tuple[QueryStats, float, int]:
+    with Session(engine) as session:
+        employees = session.exec(select(func.count()).select_from(HrEmployee)).one()
+        prepared = call(session)
+        # 사원 디렉터리의 주기적 워터마크 갱신은 경과 시간에 따라 끼어들므로 측정 전에 맞춰 둔다.
+        get_employee_directory(session).sync(session)
+        with capture_queries() as stats:
+            started = time.perf_counter()
+            prepared()
+            elapsed = time.perf_counter() - started
+    return stats, elapsed, employees
+
+
+def _run_within_budget(name: str, engines, bench_scale, call: Callable[[Session], Callable[[], object]]) -> QueryStats:
+    """call(session) 은 대상 함수를 실행할 인자 없는 함수를 돌려준다(인자 준비 쿼리는 세지 않는다)."""
+    seeded_engine, baseline_engine = engines
+    budget = BUDGETS[name]
+    baseline, _elapsed, baseline_employees = _measure(baseline_engine, call)
+    stats, elapsed, employees = _measure(seeded_engine, call)
+
+    assert stats.statement_count == baseline.statement_count, (
+        f"{name}: {baseline.statement_count} queries at {baseline_employees} employees "
+        f"-> {stats.statement_count} at {employees} employees"
+    )
+    assert stats.statement_count <= budget.max_queries, f"{name}: {stats.statement_count} queries > budget {budget.max_queries}"
+    assert elapsed <= budget.max_seconds(employees, bench_scale.time_factor), (
+        f"{name}: {elapsed:.2f}s > budget {budget.max_seconds(employees, bench_scale.time_factor):.2f}s"
+    )
+    return stats
+
+
+@pytest.fixture
+def engines(seeded_engine, baseline_seeded_engine):
+    return seeded_engine, baseline_seeded_engine
+
+
+def _admin_user_id(session: Session) -> int:
+    return int(session.exec(select(AuthUser.id).where(AuthUser.login_id == "admin-local")).one())
+
+
+def test_calculate_payroll_run_budget(engines, bench_scale) -> None:
+    def call(session: Session):
+        run = session.exec(
+            select(PayPayrollRun).where(PayPayrollRun.status == "calculated").order_by(PayPayrollRun.id)
+        ).first()
+        if run is None:
+            pytest.skip("no calculated payroll run in seed")
+        return lambda: calculate_payroll_run(session, int(run.id))
+
+    _run_within_budget("calculate_payroll_run", engines, bench_scale, call)
+
+
+def test_generate_employee_daily_schedules_budget(engines, bench_scale) -> None:
+    today = business_today()
+    payload = TimScheduleGenerateRequest(date_from=today, date_to=today + timedelta(days=6))
+    _run_within_budget(
+        "generate_employee_daily_schedules",
+        engines,
+        bench_scale,
+        lambda session: lambda: generate_employee_daily_schedules(session, payload),
+    )
+
+
+def test_close_month_budget(engines, bench_scale) -> None:
+    def call(session: Session):
+        closed = {
+            (row.year, row.month)
+            for row in session.exec(select(TimMonthClose).where(TimMonthClose.close_status == "closed")).all()
+        }
+        today = business_today()
+        year, month = today.year, today.month
+        while (year, month) in closed:
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        admin_user_id = _admin_user_id(session)
+        return lambda: close_month(session, year, month, admin_user_id, None)
+
+    _run_within_budget("close_month", engines, bench_scale, call)
+
+
+def test_list_employees_budget(engines, bench_scale) -> None:
+    _run_within_budget("list_employees", engines, bench_scale, lambda session: lambda: list_employees(session, page=2, limit=20))
+
+
+def test_get_menu_tree_for_user_budget(engines, bench_scale) -> None:
+    def call(session: Session):
+        admin_user_id = _admin_user_id(session)
+        return lambda: get_menu_tree_for_user(session, admin_user_id)
+
+    _run_within_budget("get_menu_tree_for_user", engines, bench_scale, call)
+
+
+def test_list_my_approval_tasks_budget(engines, bench_scale) -> None:
+    def call(session: Session):
+        actor = session.exec(
+            select(HriRequestStepSnapshot.actor_user_id)
+            .where(HriRequestStepSnapshot.action_status == "WAITING")
+            .group_by(HriRequestStepSnapshot.actor_user_id)
+            .order_by(func.count().desc())
+        ).first()
+        actor_user_id = int(actor) if actor is not None else _admin_user_id(session)
+        return lambda: list_my_approval_tasks(session, actor_user_id, PageParams(page=1, limit=20))
+
+    _run_within_budget("list_my_approval_tasks", engines, bench_scale, call)
+
+
+def test_search_employees_typeahead_p99(seeded_engine, bench_scale) -> None:
+    with Session(seeded_engine) as session:
+        rows = session.exec(
+            select(HrEmployee.employee_no, AuthUser.display_name)
+            .join(AuthUser, HrEmployee.user_id == AuthUser.id)
+            .order_by(HrEmployee.id)
+            .limit(20)
+        ).all()
+        terms = [term for employee_no, display_name in rows for term in (employee_no[-3:], display_name[:1], display_name[1:])]
+        search_employees(session, terms[0])
+
+        elapsed: list[float] = []
+        for term in terms * 5:
+            with capture_queries() as stats:
+                started = time.perf_counter()
+                search_employees(session, term)
+                elapsed.append(time.perf_counter() - started)
+            assert stats.statement_count == 1
+
+    elapsed.sort()
+    p99 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.99))]
+    assert p99 <= TYPEAHEAD_P99_SECONDS * bench_scale.time_factor, f"search_employees p99 {p99 * 1000:.1f}ms"
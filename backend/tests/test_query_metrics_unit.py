@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from app.core.query_metrics import (
+    QueryMetricsMiddleware,
+    capture_queries,
+    install_query_hooks,
+    render_prometheus_metrics,
+    reset_request_metrics,
+)
+
+
+def _make_engine():
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    install_query_hooks(engine)
+    return engine
+
+
+def _call_asgi(app: FastAPI, path: str) -> tuple[int, dict[str, str]]:
+    messages: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+    start = next(message for message in messages if message["type"] == "http.response.start")
+    headers = {key.decode(): value.decode() for key, value in start["headers"]}
+    return start["status"], headers
+
+
+def test_capture_queries_counts_statements_once_per_engine() -> None:
+    engine = _make_engine()
+    with Session(engine) as session:
+        with capture_queries(record_statements=True) as stats:
+            session.exec(text("SELECT 1"))
+            session.exec(text("SELECT 2"))
+
+        session.exec(text("SELECT 3"))
+
+    assert stats.statement_count == 2
+    assert stats.statements == ["SELECT 1", "SELECT 2"]
+    assert stats.db_seconds >= 0
+
+
+def test_middleware_sets_server_timing_and_records_route_template() -> None:
+    reset_request_metrics()
+    engine = _make_engine()
+    app = FastAPI()
+    app.add_middleware(QueryMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int) -> dict[str, int]:
+        with Session(engine) as session:
+            session.exec(text("SELECT 1"))
+            session.exec(text("SELECT 2"))
+        return {"id": item_id}
+
+    status_code, headers = _call_asgi(app, "/items/7")
+
+    assert status_code == 200
+    assert headers["x-query-count"] == "2"
+    assert 'desc="2 queries"' in headers["server-timing"]
+
+    metrics = render_prometheus_metrics()
+    assert 'vibe_hr_http_requests_total{method="GET",route="/items/{item_id}"} 1' in metrics
+    assert 'vibe_hr_db_statements_total{method="GET",route="/items/{item_id}"} 2' in metrics
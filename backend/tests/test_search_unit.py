@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.search import backfill_display_name_chosung, ensure_search_indexes, is_chosung_query, to_chosung
+from app.models import AuthUser, HrEmployee, OrgDepartment
+from app.services.employee_query_service import list_employees, search_employees
+from app.services.organization_service import list_departments
+
+_NAMES = ["홍길동", "홍길순", "김철수", "길동 Kim", "100%달성"]
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="경영지원본부"))
+    session.add(OrgDepartment(id=2, code="DEV_1", name="개발1팀"))
+    for index, name in enumerate(_NAMES, start=1):
+        session.add(AuthUser(id=index, login_id=f"user{index}", email=f"user{index}@example.com", password_hash="x", display_name=name))
+        session.add(
+            HrEmployee(
+                id=index,
+                user_id=index,
+                employee_no=f"E{index:04d}",
+                department_id=1 if index % 2 else 2,
+                position_title="Staff",
+                hire_date=date(2024, 1, 1),
+                employment_status="resigned" if index == 2 else "active",
+            )
+        )
+    session.commit()
+    return session
+
+
+def test_to_chosung_normalizes_hangul_and_keeps_other_characters() -> None:
+    assert to_chosung("홍 길동") == "ㅎㄱㄷ"
+    assert to_chosung("길동 Kim") == "ㄱㄷkim"
+    assert to_chosung(None) is None
+    assert is_chosung_query("ㅎㄱ") and is_chosung_query("홍ㄱ") and not is_chosung_query("홍길")
+
+
+def test_chosung_column_follows_orm_and_core_writes() -> None:
+    with _make_session() as session:
+        user = session.get(AuthUser, 1)
+        assert user.display_name_chosung == "ㅎㄱㄷ"
+        user.display_name = "이몽룡"
+        session.commit()
+        assert session.get(AuthUser, 1).display_name_chosung == "ㅇㅁㄹ"
+
+        session.exec(
+            insert(AuthUser),
+            params=[{"id": 9, "login_id": "bulk", "email": "bulk@example.com", "password_hash": "x", "display_name": "성춘향"}],
+        )
+        session.commit()
+        assert session.exec(select(AuthUser.display_name_chosung).where(AuthUser.id == 9)).one() == "ㅅㅊㅎ"
+
+        connection = session.connection()
+        ensure_search_indexes(connection)
+        connection.exec_driver_sql("UPDATE auth_users SET display_name_chosung = NULL")
+        assert backfill_display_name_chosung(connection, batch_size=2) == 6
+        session.commit()
+        assert session.get(AuthUser, 9).display_name_chosung == "ㅅㅊㅎ"
+
+
+def test_list_filters_accept_chosung_and_literal_wildcards() -> None:
+    with _make_session() as session:
+        employees, total = list_employees(session, name="ㅎㄱ")
+        assert total == 2 and {item.display_name for item in employees} == {"홍길동", "홍길순"}
+
+        employees, total = list_employees(session, name="100%")
+        assert [item.display_name for item in employees] == ["100%달성"]
+
+        departments, _ = list_departments(session, code="V_")
+        assert [item.code for item in departments] == ["DEV_1"]
+
+
+def test_typeahead_ranks_closest_match_first_and_skips_resigned() -> None:
+    with _make_session() as session:
+        assert [item.display_name for item in search_employees(session, "길동")] == ["길동 Kim", "홍길동"]
+        assert [item.display_name for item in search_employees(session, "ㅎㄱ")] == ["홍길동"]
+        assert [item.display_name for item in search_employees(session, "ㅎㄱ", include_resigned=True)] == ["홍길동", "홍길순"]
+
+        matches = search_employees(session, "E000", limit=3)
+        assert len(matches) == 3 and matches[0].department_name == "경영지원본부"
+        assert search_employees(session, "   ") == []
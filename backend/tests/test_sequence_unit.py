@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.core.sequence import allocate_sequence_block, max_suffix_seq, next_sequence
+from app.models import AppSequenceCounter, HrAppointmentOrder, HrEmployee, HrRecruitFinalist, OrgDepartment
+from app.services.employee_service_shared import generate_employee_no
+from app.services.hr_appointment_record_service import _next_appointment_no
+from app.services.hr_recruit_service import generate_employee_numbers
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    return Session(engine)
+
+
+def test_blocks_are_contiguous_and_initial_runs_only_for_new_key() -> None:
+    calls: list[str] = []
+
+    def initial() -> int:
+        calls.append("initial")
+        return 41
+
+    with _make_session() as session:
+        first = allocate_sequence_block(session, "DOC", 3, initial=initial)
+        second = next_sequence(session, "DOC", initial=initial)
+        other = next_sequence(session, "OTHER")
+        session.commit()
+
+        assert list(first) == [42, 43, 44]
+        assert second == 45
+        assert other == 1
+        assert calls == ["initial"]
+        assert session.get(AppSequenceCounter, "DOC").last_seq == 45
+
+
+def test_existing_counter_is_advanced_with_single_statement() -> None:
+    with _make_session() as session:
+        next_sequence(session, "DOC")
+        session.commit()
+
+        with capture_queries() as stats:
+            block = allocate_sequence_block(session, "DOC", 500)
+
+        assert (block.start, block.stop) == (2, 502)
+        assert stats.statement_count == 1
+
+
+def test_rolled_back_allocation_is_reissued() -> None:
+    with _make_session() as session:
+        next_sequence(session, "DOC")
+        session.commit()
+        assert next_sequence(session, "DOC") == 2
+        session.rollback()
+
+        assert next_sequence(session, "DOC") == 2
+
+
+def test_max_suffix_seq_compares_by_length_and_skips_non_numeric() -> None:
+    now = datetime.now(timezone.utc)
+    with _make_session() as session:
+        session.add(OrgDepartment(id=1, code="HQ", name="HQ"))
+        for index, employee_no in enumerate(("EMP-099999", "EMP-1000000", "EMP-ABCDEFGH", "EMP-000007"), start=1):
+            session.add(
+                HrEmployee(
+                    id=index,
+                    user_id=index,
+                    employee_no=employee_no,
+                    department_id=1,
+                    position_title="Staff",
+                    hire_date=date(2024, 1, 1),
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        session.commit()
+
+        assert max_suffix_seq(session, HrEmployee.employee_no, "EMP-") == 1000000
+        assert max_suffix_seq(session, HrEmployee.employee_no, "NONE-") == 0
+
+
+def test_generate_employee_numbers_continues_from_existing_numbers() -> None:
+    now = datetime.now(timezone.utc)
+    with _make_session() as session:
+        session.add(
+            HrRecruitFinalist(
+                candidate_no="RC-SEED-0",
+                full_name="기존",
+                employee_no="EMP-000120",
+                status_code="ready",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        for index in range(1, 4):
+            session.add(
+                HrRecruitFinalist(
+                    candidate_no=f"RC-SEED-{index}",
+                    full_name=f"신규{index}",
+                    status_code="draft",
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        session.commit()
+        ids = [row.id for row in session.exec(select(HrRecruitFinalist).where(HrRecruitFinalist.employee_no.is_(None))).all()]
+
+        assert generate_employee_numbers(session, ids[:2]) == (2, 0)
+        assert generate_employee_numbers(session, ids) == (1, 2)
+
+        numbers = session.exec(select(HrRecruitFinalist.employee_no).order_by(HrRecruitFinalist.id)).all()
+        assert numbers == ["EMP-000120", "EMP-000121", "EMP-000122", "EMP-000123"]
+
+        # 직접 생성/최초 로그인 경로도 같은 카운터를 이어 쓴다.
+        assert generate_employee_no(session) == "EMP-000124"
+
+
+def test_appointment_numbers_continue_from_existing_orders() -> None:
+    prefix = f"APT-{datetime.now(timezone.utc):%Y%m%d}-"
+    with _make_session() as session:
+        session.add(HrAppointmentOrder(appointment_no=f"{prefix}0007", title="기존", effective_date=date(2026, 1, 1)))
+        session.commit()
+
+        assert _next_appointment_no(session) == f"{prefix}0008"
+        with capture_queries() as stats:
+            assert _next_appointment_no(session) == f"{prefix}0009"
+        assert stats.statement_count == 1
@@ -1,18 +1,25 @@
 from datetime import date, datetime, timezone
 
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from app.models import (
     AuthUser,
     HrEmployee,
     OrgDepartment,
     TimDepartmentScheduleAssignment,
+    TimEmployeeDailySchedule,
     TimEmployeeScheduleException,
     TimSchedulePattern,
+    TimSchedulePatternDay,
+)
+from app.schemas.tim_schedule import (
+    TimDepartmentScheduleAssignmentBatchRequest,
+    TimDepartmentScheduleAssignmentUpsertRequest,
+    TimScheduleGenerateRequest,
 )
-from app.schemas.tim_schedule import TimDepartmentScheduleAssignmentBatchRequest, TimDepartmentScheduleAssignmentUpsertRequest
 from app.services.tim_schedule_service import (
     batch_save_department_schedule_assignments,
+    generate_employee_daily_schedules,
     list_department_schedule_assignments,
     list_employee_schedule_exceptions,
 )
@@ -202,3 +209,55 @@ def test_list_employee_schedule_exceptions_includes_employee_and_pattern_metadat
         assert items[0].department_name == "인사본부"
         assert items[0].pattern_code == "PTN_SHIFT_1300"
         assert items[0].pattern_name == "후반조"
+
+
+def test_generate_employee_daily_schedules_resolves_exception_then_department_then_default() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(OrgDepartment(id=1, code="HQ-HR", name="인사본부"))
+        session.add(OrgDepartment(id=2, code="HQ-OPS", name="운영본부"))
+        session.add(TimSchedulePattern(id=1, code="PTN_STD", name="기본 주간"))
+        session.add(TimSchedulePattern(id=2, code="PTN_SHIFT_1300", name="후반조"))
+        session.add(TimSchedulePattern(id=3, code="PTN_FLEX", name="유연근무"))
+        # 2026-03-02 는 월요일(weekday 0)
+        session.add(TimSchedulePatternDay(pattern_id=2, weekday=0, start_time="13:00", end_time="22:00", expected_minutes=480))
+        session.add(TimSchedulePatternDay(pattern_id=3, weekday=0, start_time="10:00", end_time="19:00", expected_minutes=480))
+        for employee_id, department_id in ((1, 1), (2, 1), (3, 2)):
+            session.add(
+                HrEmployee(
+                    id=employee_id,
+                    user_id=employee_id,
+                    employee_no=f"EMP-{employee_id:04d}",
+                    department_id=department_id,
+                    position_title="사원",
+                    hire_date=date(2026, 1, 1),
+                )
+            )
+        session.add(TimDepartmentScheduleAssignment(department_id=1, pattern_id=3, effective_from=date(2026, 1, 1)))
+        session.add(
+            TimEmployeeScheduleException(
+                employee_id=1, pattern_id=2, effective_from=date(2026, 3, 2), effective_to=date(2026, 3, 2)
+            )
+        )
+        session.commit()
+
+        result = generate_employee_daily_schedules(
+            session, TimScheduleGenerateRequest(date_from=date(2026, 3, 2), date_to=date(2026, 3, 3))
+        )
+
+        assert (result.created_count, result.updated_count, result.skipped_count) == (6, 0, 0)
+        rows = session.exec(
+            select(TimEmployeeDailySchedule).order_by(TimEmployeeDailySchedule.employee_id, TimEmployeeDailySchedule.work_date)
+        ).all()
+        assert [(row.employee_id, row.work_date.day, row.schedule_source, row.pattern_id) for row in rows] == [
+            (1, 2, "employee_exception", 2),
+            (1, 3, "department_default", 3),
+            (2, 2, "department_default", 3),
+            (2, 3, "department_default", 3),
+            (3, 2, "company_default", 1),
+            (3, 3, "company_default", 1),
+        ]
+        # 요일 설정이 있으면 그 시각을, 없으면 09:00~18:00 기본값을 쓴다(UTC 저장).
+        assert [row.planned_start_at.hour for row in rows] == [4, 0, 1, 0, 0, 0]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import HrEmployee, OrgDepartment
+from app.models.tra import TraCourse, TraCyberUpload, TraEvent, TraHistory, TraOrganization
+from app.services.tra_service import apply_cyber_results
+
+
+def _make_session(employee_count: int = 3) -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="HQ"))
+    for index in range(1, employee_count + 1):
+        session.add(
+            HrEmployee(
+                id=index,
+                user_id=index,
+                employee_no=f"E{index:04d}",
+                department_id=1,
+                position_title="Staff",
+                hire_date=date(2024, 1, 1),
+            )
+        )
+    session.commit()
+    return session
+
+
+def _upload(employee_no: str | None, course_name: str, **overrides) -> TraCyberUpload:
+    values = {
+        "upload_ym": "202603",
+        "employee_no": employee_no,
+        "course_name": course_name,
+        "organization_name": "사이버연수원",
+        "start_date": date(2026, 3, 2),
+        "end_date": date(2026, 3, 20),
+        "reward_hour": 4,
+        "edu_hour": 8,
+        "confirm_type": "1",
+    }
+    values.update(overrides)
+    return TraCyberUpload(**values)
+
+
+def test_apply_resolves_and_creates_masters_once_per_key() -> None:
+    now = datetime.now(timezone.utc)
+    with _make_session() as session:
+        session.add(TraOrganization(id=7, code="TRORG00007", name="사이버연수원", created_at=now, updated_at=now))
+        session.add(TraCourse(id=3, course_code="TRAC00003", course_name="정보보호", created_at=now, updated_at=now))
+        session.add(
+            TraHistory(id=5, employee_id=1, course_id=3, event_id=None, confirm_type="0", created_at=now, updated_at=now)
+        )
+        session.add(TraEvent(id=11, course_id=3, event_code="20260302", event_name="정보보호 3월", created_at=now, updated_at=now))
+        session.add(
+            TraHistory(id=6, employee_id=1, course_id=3, event_id=11, confirm_type="0", created_at=now, updated_at=now)
+        )
+        session.add(_upload("E0001", "정보보호", reward_hour=6))
+        session.add(_upload("E0002", "정보보호"))
+        session.add(_upload("E0002", "개인정보", organization_name="외부기관", business_no="123", start_date=None))
+        session.add(_upload("E0003", "개인정보", organization_name="외부기관", start_date=None, note="late"))
+        session.add(_upload("E0003", "개인정보", organization_name="외부기관", start_date=None, note="final"))
+        session.add(_upload("UNKNOWN", "정보보호"))
+        session.commit()
+
+        result = apply_cyber_results(session, "202603")
+
+        assert (result.processed, result.chunk_count, result.has_more) == (6, 1, False)
+        organizations = session.exec(select(TraOrganization).order_by(TraOrganization.id)).all()
+        assert [(row.code, row.name, row.business_no) for row in organizations] == [
+            ("TRORG00007", "사이버연수원", None),
+            ("TRORG00008", "외부기관", "123"),
+        ]
+        new_course = session.exec(select(TraCourse).where(TraCourse.course_name == "개인정보")).one()
+        assert new_course.course_code == "TRAC00004"
+        assert new_course.in_out_type == "EXTERNAL"
+        assert new_course.organization_id == organizations[1].id
+        new_event = session.exec(select(TraEvent).where(TraEvent.course_id == new_course.id)).one()
+        assert (new_event.event_code, new_event.event_name, new_event.status_code) == ("20260301", "개인정보(20260301)", "open")
+        assert new_event.currency_code == "KRW"
+
+        histories = {
+            (row.employee_id, row.course_id, row.event_id): row for row in session.exec(select(TraHistory)).all()
+        }
+        assert len(histories) == 5
+        assert histories[(1, 3, 11)].id == 6
+        assert histories[(1, 3, 11)].app_point == 6
+        assert histories[(1, 3, None)].confirm_type == "0"
+        assert histories[(3, new_course.id, new_event.id)].note == "final"
+
+        uploads = session.exec(select(TraCyberUpload).order_by(TraCyberUpload.id)).all()
+        assert all(row.close_yn for row in uploads)
+        assert uploads[0].applied_history_id == 6
+        assert uploads[3].applied_history_id == uploads[4].applied_history_id
+        assert uploads[3].employee_id == 3
+        assert (uploads[5].employee_id, uploads[5].applied_history_id, uploads[5].applied_event_id) == (None, None, 11)
+
+
+def test_statement_count_does_not_grow_with_rows() -> None:
+    def statements_for(row_count: int) -> int:
+        with _make_session(employee_count=row_count) as session:
+            for index in range(1, row_count + 1):
+                session.add(
+                    _upload(f"E{index:04d}", f"과정{index % 5}", organization_name=f"기관{index % 3}", start_date=date(2026, 3, index % 7 + 1))
+                )
+            session.commit()
+            with capture_queries() as stats:
+                assert apply_cyber_results(session).processed == row_count
+            return stats.statement_count
+
+    assert statements_for(10) == statements_for(60)
+
+
+def test_max_chunks_commits_partial_progress_and_resumes() -> None:
+    with _make_session() as session:
+        for index in range(5):
+            session.add(_upload(f"E{index % 3 + 1:04d}", f"과정{index}"))
+        session.commit()
+        upload_ids = session.exec(select(TraCyberUpload.id).order_by(TraCyberUpload.id)).all()
+
+        first = apply_cyber_results(session, chunk_size=2, max_chunks=1)
+        assert (first.processed, first.chunk_count, first.last_upload_id, first.has_more) == (2, 1, upload_ids[1], True)
+        session.rollback()
+        open_ids = session.exec(select(TraCyberUpload.id).where(TraCyberUpload.close_yn.is_(False))).all()
+        assert sorted(open_ids) == upload_ids[2:]
+
+        rest = apply_cyber_results(session, chunk_size=2)
+        assert (rest.processed, rest.chunk_count, rest.last_upload_id, rest.has_more) == (3, 2, upload_ids[-1], False)
+        assert apply_cyber_results(session).processed == 0
+        course_codes = session.exec(select(TraCourse.course_code).order_by(TraCourse.id)).all()
+        assert course_codes == [f"TRAC{seq:05d}" for seq in range(1, 6)]
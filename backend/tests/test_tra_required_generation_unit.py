@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import HrEmployee, OrgDepartment
+from app.models.tra import TraCourse, TraEvent, TraRequiredRule, TraRequiredTarget
+from app.services.tra_service import generate_required_events, generate_required_targets
+
+
+def _make_session(employee_count: int = 3) -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="HQ"))
+    for index in range(1, employee_count + 1):
+        session.add(
+            HrEmployee(
+                id=index,
+                user_id=index,
+                employee_no=f"E{index:04d}",
+                department_id=1,
+                position_title="Staff",
+                hire_date=date(2024, 1, 1),
+                employment_status="resigned" if index == employee_count else "active",
+            )
+        )
+    session.add(TraCourse(id=1, course_code="TRAC00001", course_name="정보보호"))
+    session.add(TraCourse(id=2, course_code="TRAC00002", course_name=""))
+    session.add(TraRequiredRule(id=1, year=2026, rule_code="SEC", course_id=1, start_month=11, end_month=14, job_code="DEV"))
+    session.add(TraRequiredRule(id=2, year=2026, rule_code="SEC", order_seq=2, course_id=1, start_month=12, end_month=12))
+    session.add(TraRequiredRule(id=3, year=2026, rule_code="ETH", course_id=2, entry_month=3, start_month=0, end_month=0, edu_level="L1"))
+    session.add(TraRequiredRule(id=4, year=2026, rule_code="OFF", course_id=2, is_active=False))
+    session.add(TraRequiredRule(id=5, year=2025, rule_code="OLD", course_id=2))
+    session.commit()
+    return session
+
+
+def test_generate_required_events_creates_each_rule_month_once() -> None:
+    with _make_session() as session:
+        session.add(TraEvent(course_id=1, event_code="202611", event_name="기존"))
+        session.commit()
+
+        with capture_queries() as stats:
+            assert generate_required_events(session, 2026) == 2
+        assert stats.statement_count == 1
+        assert generate_required_events(session, 2026) == 0
+
+        events = session.exec(select(TraEvent).order_by(TraEvent.course_id, TraEvent.event_code)).all()
+        assert [(row.course_id, row.event_code, row.event_name) for row in events] == [
+            (1, "202611", "기존"),
+            (1, "202612", "정보보호(2026-12)"),
+            (2, "202601", "Course-2(2026-01)"),
+        ]
+        december = events[1]
+        assert (december.start_date, december.end_date) == (date(2026, 12, 1), date(2026, 12, 31))
+        assert (december.appl_start_date, december.appl_end_date) == (date(2026, 1, 1), date(2026, 11, 30))
+        assert (december.status_code, december.result_app_skip_yn, december.max_person) == ("open", True, 999)
+        assert (december.currency_code, december.is_active) == ("KRW", True)
+
+
+def test_generate_required_targets_inserts_missing_keys_in_one_statement() -> None:
+    with _make_session(employee_count=4) as session:
+        session.add(TraRequiredTarget(year=2026, employee_id=1, rule_code="SEC", course_id=1, edu_month="202611"))
+        session.commit()
+
+        with capture_queries() as stats:
+            assert generate_required_targets(session, 2026) == 8
+        assert stats.statement_count == 1
+        assert generate_required_targets(session, 2026) == 0
+
+        keys = session.exec(
+            select(TraRequiredTarget.employee_id, TraRequiredTarget.rule_code, TraRequiredTarget.edu_month)
+            .order_by(TraRequiredTarget.rule_code, TraRequiredTarget.employee_id, TraRequiredTarget.edu_month)
+        ).all()
+        assert keys == [
+            (1, "ETH", "202603"),
+            (2, "ETH", "202603"),
+            (3, "ETH", "202603"),
+            (1, "SEC", "202611"),
+            (1, "SEC", "202612"),
+            (2, "SEC", "202611"),
+            (2, "SEC", "202612"),
+            (3, "SEC", "202611"),
+            (3, "SEC", "202612"),
+        ]
+        eth = session.exec(select(TraRequiredTarget).where(TraRequiredTarget.rule_code == "ETH")).first()
+        assert (eth.standard_rule_id, eth.edu_level, eth.completion_status) == (3, "L1", "pending")
+
+
+def test_generators_filter_rules_by_job_and_level() -> None:
+    with _make_session() as session:
+        assert generate_required_targets(session, 2026, job_code="DEV") == 2
+        assert generate_required_targets(session, 2026, edu_level="L1") == 2
+        assert generate_required_targets(session, 2026, rule_code="SEC", edu_level="L1") == 0
+        assert generate_required_events(session, 2026, job_code="DEV") == 2
+        assert session.exec(select(TraEvent.event_code).order_by(TraEvent.event_code)).all() == ["202611", "202612"]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.query_metrics import capture_queries, install_query_hooks
+from app.models import HrEmployee, OrgDepartment
+from app.models.tra import TraCourse, TraEvent, TraHistory, TraOrganization
+from app.services.tra_service import build_tra_resource_query, iter_tra_resource_export, list_tra_resource
+
+
+def _make_session() -> Session:
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(OrgDepartment(id=1, code="HQ", name="HQ"))
+    for index in (1, 2):
+        session.add(
+            HrEmployee(
+                id=index,
+                user_id=index,
+                employee_no=f"E{index:04d}",
+                department_id=1,
+                position_title="Staff",
+                hire_date=date(2024, 1, 1),
+            )
+        )
+    session.add(TraOrganization(id=1, code="TRORG00001", name="연수원"))
+    session.add(TraCourse(id=1, course_code="TRAC00001", course_name="정보보호", organization_id=1))
+    session.add(TraEvent(id=1, course_id=1, event_code="202603", event_name="정보보호 3월"))
+    completed = [date(2026, 3, 5), None, date(2025, 12, 1), date(2026, 3, 5), None, date(2026, 1, 9), None]
+    for index, completed_at in enumerate(completed, start=1):
+        session.add(
+            TraHistory(
+                id=index,
+                employee_id=1 if index % 2 else 2,
+                course_id=1,
+                event_id=1 if index <= 3 else None,
+                confirm_type="1",
+                completed_at=completed_at,
+                note="쉼표, 포함" if index == 1 else None,
+            )
+        )
+    session.commit()
+    return session
+
+
+def test_list_projects_default_fields_with_lookups_in_one_query() -> None:
+    with _make_session() as session:
+        with capture_queries() as stats:
+            items, total_count, next_cursor = list_tra_resource(session, "histories", filters={"employee_id": "1"})
+
+        assert stats.statement_count == 1
+        assert (total_count, next_cursor) == (4, None)
+        assert items[0] == {
+            "id": 3,
+            "employee_id": 1,
+            "employee_no": "E0001",
+            "course_id": 1,
+            "course_name": "정보보호",
+            "event_id": 1,
+            "event_name": "정보보호 3월",
+            "confirm_type": "1",
+            "completed_at": date(2025, 12, 1),
+            "app_point": None,
+            "unconfirm_reason": None,
+            "note": None,
+        }
+        assert [item["id"] for item in items] == [3, 1, 5, 7]
+
+        courses, _, _ = list_tra_resource(session, "courses", fields=["course_code", "organization_name"])
+        assert courses == [{"course_code": "TRAC00001", "organization_name": "연수원"}]
+
+
+def test_keyset_pages_walk_nullable_sort_keys_in_both_directions() -> None:
+    with _make_session() as session:
+        for sort in ("completed_at", "-completed_at"):
+            expected = [item["id"] for item in list_tra_resource(session, "histories", sort=sort)[0]]
+            seen: list[int] = []
+            cursor = None
+            while True:
+                items, total_count, cursor = list_tra_resource(session, "histories", sort=sort, limit=2, cursor=cursor)
+                assert total_count == 7
+                seen.extend(item["id"] for item in items)
+                if cursor is None:
+                    break
+            assert seen == expected
+        assert expected[:3] == [2, 5, 7]
+
+
+def test_filters_and_projection_are_validated() -> None:
+    with _make_session() as session:
+        items, _, _ = list_tra_resource(
+            session, "histories", filters={"completed_at_from": "2026-01-01", "completed_at_to": "2026-03-31"}, fields=["id"]
+        )
+        assert items == [{"id": 6}, {"id": 1}, {"id": 4}]
+
+    for kwargs in ({"filters": {"app_point": "1"}}, {"fields": ["password"]}, {"sort": "note"}, {"filters": {"employee_id": "x"}}):
+        with pytest.raises(HTTPException) as error:
+            build_tra_resource_query("histories", **kwargs)
+        assert error.value.status_code == 400
+
+
+def test_export_streams_ndjson_and_csv() -> None:
+    with _make_session() as session:
+        query = build_tra_resource_query("histories", fields=["id", "completed_at", "note"], sort="id")
+
+        lines = "".join(iter_tra_resource_export(session, query, "ndjson")).splitlines()
+        assert len(lines) == 7
+        assert json.loads(lines[0]) == {"id": 1, "completed_at": "2026-03-05", "note": "쉼표, 포함"}
+
+        text = "".join(iter_tra_resource_export(session, query, "csv"))
+        assert text.startswith("\ufeff")
+        rows = list(csv.reader(io.StringIO(text.lstrip("\ufeff"))))
+        assert rows[0] == ["id", "completed_at", "note"]
+        assert rows[1] == ["1", "2026-03-05", "쉼표, 포함"]
+        assert rows[2] == ["2", "", ""]
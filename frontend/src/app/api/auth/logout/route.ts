@@ -1,4 +1,7 @@
-import { NextResponse } from "next/server";
+import { NextRequest, NextResponse } from "next/server";
+
+const API_BASE_URL =
+  process.env.API_BASE_URL ?? process.env.NEXT_PUBLIC_API_BASE_URL ?? "http://localhost:8000";
 
 const AUTH_COOKIE_NAME = "vibe_hr_token";
 const ENTER_CD_COOKIE = "vibe_hr_enter_cd";
@@ -7,7 +10,16 @@ const REFRESH_THRESHOLD_COOKIE = "vibe_hr_refresh_threshold_min";
 const SHOW_COUNTDOWN_COOKIE = "vibe_hr_show_countdown";
 const REMEMBER_ENABLED_COOKIE = "vibe_hr_remember_enabled";
 
-export async function POST() {
+export async function POST(request: NextRequest) {
+  const accessToken = request.cookies.get(AUTH_COOKIE_NAME)?.value;
+  if (accessToken) {
+    await fetch(`${API_BASE_URL}/api/v1/auth/logout`, {
+      method: "POST",
+      headers: { Authorization: `Bearer ${accessToken}` },
+      cache: "no-store",
+    }).catch(() => null);
+  }
+
   const response = NextResponse.json({ ok: true }, { status: 200 });
   for (const cookieName of [AUTH_COOKIE_NAME, ENTER_CD_COOKIE, ACCESS_TTL_COOKIE, REFRESH_THRESHOLD_COOKIE, SHOW_COUNTDOWN_COOKIE, REMEMBER_ENABLED_COOKIE]) {
     response.cookies.set({